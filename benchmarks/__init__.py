@@ -0,0 +1,6 @@
+"""Benchmarks de desempenho do SCEE.
+
+Cada módulo pode ser executado diretamente, por exemplo:
+
+    python -m benchmarks.order_creation
+"""
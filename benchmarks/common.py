@@ -0,0 +1,121 @@
+"""Utilitários compartilhados pelos benchmarks."""
+import math
+import os
+import shutil
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Sequence
+
+# Permite executar os benchmarks a partir da raiz do projeto
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from src.config.database import DatabaseConnection
+from src.config.database_initializer import DatabaseInitializer
+from src.config.database_seeder import DatabaseSeeder
+from src.config.settings import Config
+from src.config.synthetic_seeder import SyntheticDataSeeder
+
+
+def _resetar_conexao():
+    """Fecha e descarta o singleton de conexão."""
+    instancia = DatabaseConnection._instance
+    if instancia is not None and getattr(instancia, '_conn', None):
+        instancia._conn.close()
+        instancia._conn = None
+    DatabaseConnection._instance = None
+
+
+@contextmanager
+def banco_temporario(seed: bool = True):
+    """Aponta o sistema para um banco SQLite temporário durante o bloco.
+
+    Args:
+        seed: Se True, popula o banco com os dados do DatabaseSeeder
+
+    Yields:
+        Conexão sqlite3 ativa do DatabaseConnection
+    """
+    caminho_original = Config.DB_PATH
+    with tempfile.TemporaryDirectory() as diretorio:
+        _resetar_conexao()
+        Config.DB_PATH = os.path.join(diretorio, "benchmark_scee.db")
+        try:
+            db = DatabaseConnection()
+            DatabaseInitializer(db).initialize_database()
+            if seed:
+                DatabaseSeeder(db).seed_all()
+            yield db.get_connection()
+        finally:
+            _resetar_conexao()
+            Config.DB_PATH = caminho_original
+
+
+@contextmanager
+def banco_sintetico(escala: str = "pequena", semente: int = 42, origem: Optional[str] = None):
+    """Como banco_temporario, mas com o volume do SyntheticDataSeeder.
+
+    Args:
+        escala: Escala de SyntheticDataSeeder.ESCALAS
+        semente: Semente da geração (mesma semente, mesmos dados)
+        origem: Banco já gerado (ex.: por benchmarks.synthetic_dataset). É
+            copiado, então o arquivo original não é alterado pelo benchmark.
+
+    Yields:
+        Conexão sqlite3 ativa do DatabaseConnection
+    """
+    caminho_original = Config.DB_PATH
+    with tempfile.TemporaryDirectory() as diretorio:
+        _resetar_conexao()
+        Config.DB_PATH = os.path.join(diretorio, "benchmark_scee.db")
+        try:
+            db = DatabaseConnection()
+            if origem:
+                shutil.copyfile(origem, Config.DB_PATH)
+                DatabaseInitializer(db).migrate_schema()
+            else:
+                DatabaseInitializer(db).initialize_database()
+                SyntheticDataSeeder(db, semente=semente).seed_escala(escala)
+            yield db.get_connection()
+        finally:
+            _resetar_conexao()
+            Config.DB_PATH = caminho_original
+
+
+def percentis(amostras: Sequence[float], pontos: Iterable[int] = (50, 90, 99)) -> Dict[str, float]:
+    """Percentis pelo método do posto mais próximo (ex.: {'p50': ..., 'p99': ...})."""
+    ordenadas = sorted(amostras)
+    if not ordenadas:
+        return {f"p{p}": 0.0 for p in pontos}
+    return {
+        f"p{p}": ordenadas[min(len(ordenadas) - 1, max(0, math.ceil(p / 100 * len(ordenadas)) - 1))]
+        for p in pontos
+    }
+
+
+class ContadorSQL:
+    """Registra as instruções SQL executadas em uma conexão (via trace callback).
+
+    Cada linha de um ``executemany`` aparece como uma instrução separada no
+    trace; por isso os contadores mais úteis são os de ``SELECT`` e ``COMMIT``.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.instrucoes = []
+
+    def contar(self, prefixo: str) -> int:
+        """Conta as instruções que começam com o prefixo (ex.: 'SELECT')."""
+        prefixo = prefixo.upper()
+        return sum(1 for sql in self.instrucoes if sql.lstrip().upper().startswith(prefixo))
+
+    def __enter__(self):
+        self.instrucoes = []
+        self.conn.set_trace_callback(self.instrucoes.append)
+        return self
+
+    def __exit__(self, *exc):
+        self.conn.set_trace_callback(None)
+        return False
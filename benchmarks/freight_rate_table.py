@@ -0,0 +1,87 @@
+"""Benchmark da tabela binária de frete (faixas de CEP x faixas de peso).
+
+Gera um CSV sintético com o volume de uma tabela real de transportadora,
+constrói o arquivo binário e mede abertura, consultas e memória residente.
+
+Uso:
+    python -m benchmarks.freight_rate_table [--faixas 100000] [--consultas 200000]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.common import root_dir  # noqa: F401 (ajusta o sys.path)
+from src.integration.shipping.rate_table import TabelaFrete, construir_tabela
+
+PESOS_KG = [0.3, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0]
+
+
+def _memoria_residente_kb() -> int:
+    """RSS atual em KB (Linux); 0 quando /proc não está disponível."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError):
+        return 0
+
+
+def _gerar_csv(caminho: str, faixas: int, rng: random.Random) -> None:
+    largura = 100_000_000 // faixas
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        arquivo.write("cep_inicio,cep_fim,peso_max_kg,valor,prazo_dias\n")
+        for i in range(faixas):
+            inicio = i * largura
+            fim = inicio + largura - 1
+            base = rng.uniform(12, 40)
+            prazo = rng.randint(2, 12)
+            for peso in PESOS_KG:
+                arquivo.write(
+                    f"{inicio:08d},{fim:08d},{peso},{base + peso * 1.7:.2f},{prazo + int(peso // 10)}\n"
+                )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--faixas", type=int, default=100_000, help="Faixas de CEP")
+    parser.add_argument("--consultas", type=int, default=200_000, help="Consultas medidas")
+    args = parser.parse_args()
+    rng = random.Random(42)
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        csv_path = os.path.join(diretorio, "tabela.csv")
+        bin_path = os.path.join(diretorio, "tabela.bin")
+
+        _gerar_csv(csv_path, args.faixas, rng)
+        inicio = time.perf_counter()
+        construir_tabela(csv_path, bin_path)
+        construcao = time.perf_counter() - inicio
+
+        ceps = [f"{rng.randrange(100_000_000):08d}" for _ in range(args.consultas)]
+        pesos = [rng.uniform(0.1, 30.0) for _ in range(args.consultas)]
+
+        rss_antes = _memoria_residente_kb()
+        inicio = time.perf_counter()
+        tabela = TabelaFrete(bin_path)
+        abertura = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        for cep, peso in zip(ceps, pesos):
+            tabela.buscar(cep, peso)
+        consultas = time.perf_counter() - inicio
+        rss_depois = _memoria_residente_kb()
+        tabela.fechar()
+
+        print(f"Linhas no CSV:        {args.faixas * len(PESOS_KG):,}")
+        print(f"Tamanho do binário:   {os.path.getsize(bin_path) / 1024:,.0f} KB "
+              f"(CSV: {os.path.getsize(csv_path) / 1024:,.0f} KB)")
+        print(f"Construção:           {construcao:.2f} s")
+        print(f"Abertura (mmap):      {abertura * 1e6:.0f} µs")
+        print(f"Consulta:             {consultas / args.consultas * 1e6:.2f} µs")
+        print(f"RSS após consultas:   {rss_depois - rss_antes:+,} KB "
+              "(páginas do mmap tocadas pelas consultas)")
+
+
+if __name__ == "__main__":
+    main()
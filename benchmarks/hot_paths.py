@@ -0,0 +1,348 @@
+"""Micro-benchmarks dos caminhos críticos de repositórios, serviços e login.
+
+Mede cada caso sobre um banco gerado pelo SyntheticDataSeeder, informa
+percentis de latência e memória alocada por chamada, e pode salvar o
+resultado como baseline JSON ou compará-lo com uma baseline anterior,
+apontando regressões acima do limite (código de saída 1).
+
+Uso:
+    python -m benchmarks.hot_paths [--escala pequena] [--banco dados.db]
+        [--repeticoes 200] [--tempo-max 5] [--casos login,carrinho.adicionar_item]
+        [--salvar base.json] [--comparar base.json] [--limite 0.15] [--perfil-sql]
+
+Com --perfil-sql as instruções SQL executadas pelos casos são perfiladas
+(src/utils/sql_profiler.py) e as piores aparecem no final; o perfil tem
+custo próprio, então não salve nem compare baselines nesse modo.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.common import banco_sintetico, percentis
+from src.config.settings import Config
+from src.controllers.admin_controller import AdminController
+from src.integration.payment.credit_card_gateway import CreditCardGateway
+from src.integration.shipping.correios_calculator import CorreiosCalculator
+from src.repositories.address_repository import EnderecoRepository
+from src.repositories.cart_repository import CarrinhoRepository
+from src.repositories.email_outbox_repository import EmailOutboxRepository
+from src.repositories.order_repository import PedidoRepository
+from src.repositories.product_repository import ProductRepository
+from src.repositories.user_repository import UsuarioRepository
+from src.services.auth_service import AuthService
+from src.services.cart_service import CarrinhoService
+from src.services.catalog_service import CatalogService
+from src.services.checkout_service import CheckoutService
+from src.services.email_service import EmailService
+from src.utils.sql_profiler import perfil_sql
+
+# Chamadas descartadas antes de medir (caches do SQLite e do Python)
+AQUECIMENTO = 3
+# Mínimo de amostras mesmo quando o caso estoura --tempo-max
+MIN_AMOSTRAS = 5
+# Chamadas medidas com tracemalloc (lento demais para todas as amostras)
+AMOSTRAS_MEMORIA = 5
+# Produtos com estoque "infinito" usados por carrinho e checkout
+PRODUTOS_BENCHMARK = 20
+# Regressões de memória menores que isso são ruído
+TOLERANCIA_MEMORIA_KB = 64
+
+
+class Contexto:
+    """Objetos e IDs compartilhados pelos casos, criados uma vez por execução."""
+
+    def __init__(self, conn, semente: int):
+        self.conn = conn
+        self.rng = random.Random(semente)
+
+        self.produto_repo = ProductRepository()
+        self.carrinho_repo = CarrinhoRepository()
+        self.pedido_repo = PedidoRepository()
+        self.usuario_repo = UsuarioRepository()
+        self.email_service = EmailService(outbox=EmailOutboxRepository())
+
+        self.carrinho_service = CarrinhoService(self.carrinho_repo, self.produto_repo)
+        self.checkout_service = CheckoutService(
+            carrinho_repo=self.carrinho_repo,
+            pedido_repo=self.pedido_repo,
+            produto_repo=self.produto_repo,
+            user_repo=self.usuario_repo,
+            email_service=self.email_service,
+            pagamento_gateway=CreditCardGateway(),
+            frete_calculator=CorreiosCalculator(),
+        )
+        self.catalogo = CatalogService()
+        self.admin = AdminController(None)
+        self.auth = AuthService()
+
+        # Cliente comprador: o último cliente gerado, com seu endereço principal
+        self.cliente = conn.execute(
+            "SELECT id, email FROM usuarios WHERE tipo = 'cliente' ORDER BY id DESC LIMIT 1"
+        ).fetchone()
+        self.endereco = EnderecoRepository().buscar_por_id(conn.execute(
+            "SELECT id FROM enderecos WHERE usuario_id = ? ORDER BY principal DESC LIMIT 1",
+            (self.cliente["id"],)
+        ).fetchone()[0])
+        self.carrinho_id = self.carrinho_service.obter_ou_criar_carrinho(self.cliente["id"])["id"]
+
+        self.produto_ids = [row[0] for row in conn.execute(
+            "SELECT id FROM produtos WHERE ativo = 1 ORDER BY id LIMIT ?", (PRODUTOS_BENCHMARK,)
+        )]
+        conn.execute(
+            f"UPDATE produtos SET estoque = 1000000000 WHERE id IN ({','.join('?' * len(self.produto_ids))})",
+            self.produto_ids,
+        )
+        conn.commit()
+
+        self.max_pedido_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM pedidos").fetchone()[0]
+
+    def carrinho_vazio(self) -> None:
+        self.carrinho_repo.limpar(self.carrinho_id)
+
+    def carrinho_com_itens(self, quantidade: int = 3) -> None:
+        self.carrinho_vazio()
+        for produto_id in self.rng.sample(self.produto_ids, quantidade):
+            preco = self.produto_repo.buscar_por_id(produto_id)["preco"]
+            self.carrinho_repo.adicionar_item(self.carrinho_id, produto_id, 1, preco)
+
+
+class Caso:
+    """Um caminho medido: ``preparar`` roda fora da medição e devolve os argumentos de ``executar``."""
+
+    def __init__(
+        self,
+        nome: str,
+        executar: Callable[[Contexto, Any], Any],
+        preparar: Optional[Callable[[Contexto], Any]] = None,
+    ):
+        self.nome = nome
+        self.executar = executar
+        self.preparar = preparar or (lambda ctx: None)
+
+
+def _adicionar_item_preparar(ctx: Contexto):
+    ctx.carrinho_vazio()
+    return ctx.rng.choice(ctx.produto_ids)
+
+
+def _checkout_preparar(ctx: Contexto):
+    ctx.carrinho_com_itens()
+
+
+CASOS = [
+    Caso("produto_repo.listar", lambda ctx, _: ctx.produto_repo.listar()),
+    Caso("catalogo.listar_produtos", lambda ctx, _: ctx.catalogo.listar_produtos()),
+    Caso(
+        "carrinho.adicionar_item",
+        lambda ctx, produto_id: ctx.carrinho_service.adicionar_item(ctx.cliente["id"], produto_id, 1),
+        _adicionar_item_preparar,
+    ),
+    Caso(
+        "checkout.processar_compra",
+        lambda ctx, _: ctx.checkout_service.processar_compra(
+            ctx.carrinho_id, {"numero_cartao": "4111111111111111"}, ctx.endereco, "cartao"
+        ),
+        _checkout_preparar,
+    ),
+    Caso(
+        "pedido_repo.buscar_completo",
+        lambda ctx, pedido_id: ctx.pedido_repo.buscar_completo(pedido_id),
+        lambda ctx: ctx.rng.randint(1, max(1, ctx.max_pedido_id)),
+    ),
+    Caso("admin.dashboard_stats", lambda ctx, _: ctx.admin.get_dashboard_stats()),
+    Caso("auth.login", lambda ctx, _: ctx.auth.login(ctx.cliente["email"], "cliente123")),
+]
+
+
+def medir(caso: Caso, ctx: Contexto, repeticoes: int, tempo_max: float) -> Dict[str, float]:
+    """Latência (ms) e memória (KB) de um caso."""
+    for _ in range(AQUECIMENTO):
+        caso.executar(ctx, caso.preparar(ctx))
+
+    amostras: List[float] = []
+    prazo = time.perf_counter() + tempo_max
+    while len(amostras) < repeticoes and (len(amostras) < MIN_AMOSTRAS or time.perf_counter() < prazo):
+        argumento = caso.preparar(ctx)
+        inicio = time.perf_counter_ns()
+        caso.executar(ctx, argumento)
+        amostras.append((time.perf_counter_ns() - inicio) / 1e6)
+
+    picos, retidos = [], []
+    tracemalloc.start()
+    try:
+        for _ in range(AMOSTRAS_MEMORIA):
+            argumento = caso.preparar(ctx)
+            tracemalloc.reset_peak()
+            antes, _ = tracemalloc.get_traced_memory()
+            caso.executar(ctx, argumento)
+            # O retorno já foi descartado: o que sobra é cache ou vazamento
+            atual, pico = tracemalloc.get_traced_memory()
+            picos.append(pico - antes)
+            retidos.append(atual - antes)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "amostras": len(amostras),
+        "media_ms": sum(amostras) / len(amostras),
+        **{f"{chave}_ms": valor for chave, valor in percentis(amostras).items()},
+        "max_ms": max(amostras),
+        "pico_kb": max(picos) / 1024,
+        "retido_kb": sorted(retidos)[len(retidos) // 2] / 1024,
+    }
+
+
+@contextlib.contextmanager
+def _perfil_sql(ativo: bool):
+    """Liga o perfil SQL para as conexões abertas dentro do bloco."""
+    original = Config.SQL_PERFIL_ATIVO
+    Config.SQL_PERFIL_ATIVO = ativo or original
+    try:
+        yield
+    finally:
+        Config.SQL_PERFIL_ATIVO = original
+
+
+def executar(
+    escala: str = "pequena",
+    semente: int = 42,
+    banco: Optional[str] = None,
+    repeticoes: int = 200,
+    tempo_max: float = 5.0,
+    casos: Optional[List[str]] = None,
+    perfil: bool = False,
+) -> Dict[str, Any]:
+    """Roda os casos e devolve o documento de resultados (formato da baseline)."""
+    selecionados = [c for c in CASOS if not casos or c.nome in casos]
+    resultados: Dict[str, Dict[str, float]] = {}
+
+    with _perfil_sql(perfil), banco_sintetico(escala, semente, origem=banco) as conn:
+        # Volume de partida (o checkout medido cria pedidos)
+        volume = {
+            tabela: conn.execute(f"SELECT COUNT(*) FROM {tabela}").fetchone()[0]
+            for tabela in ("produtos", "usuarios", "pedidos", "itens_pedido")
+        }
+        # Gateways e serviços imprimem a cada chamada; não é isso que queremos medir
+        with contextlib.redirect_stdout(io.StringIO()):
+            ctx = Contexto(conn, semente)
+            if perfil:
+                perfil_sql.limpar()
+            for caso in selecionados:
+                resultados[caso.nome] = medir(caso, ctx, repeticoes, tempo_max)
+            ctx.carrinho_vazio()
+
+    return {
+        "meta": {
+            "escala": os.path.basename(banco) if banco else escala,
+            "semente": semente,
+            "volume": volume,
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "criado_em": datetime.now().isoformat(timespec="seconds"),
+        },
+        "casos": resultados,
+    }
+
+
+def comparar(atual: Dict[str, Any], baseline: Dict[str, Any], limite: float) -> List[str]:
+    """Lista as regressões de p50 ou de pico de memória acima de ``limite`` (fração).
+
+    A cauda (p90/p99) aparece no relatório, mas oscila demais entre
+    execuções para reprovar uma mudança sozinha.
+    """
+    regressoes = []
+    for nome, medida in atual["casos"].items():
+        base = baseline["casos"].get(nome)
+        if not base:
+            continue
+        if base["p50_ms"] > 0 and medida["p50_ms"] > base["p50_ms"] * (1 + limite):
+            regressoes.append(
+                f"{nome}: p50_ms {base['p50_ms']:.3f} -> {medida['p50_ms']:.3f} "
+                f"(+{(medida['p50_ms'] / base['p50_ms'] - 1) * 100:.0f}%)"
+            )
+        if (medida["pico_kb"] > base["pico_kb"] * (1 + limite)
+                and medida["pico_kb"] - base["pico_kb"] > TOLERANCIA_MEMORIA_KB):
+            regressoes.append(
+                f"{nome}: pico_kb {base['pico_kb']:.0f} -> {medida['pico_kb']:.0f}"
+            )
+    return regressoes
+
+
+def _imprimir(resultado: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    print(f"{'caso':<28} {'n':>5} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} "
+          f"{'max ms':>9} {'pico KB':>9} {'retido KB':>9}  {'vs base p50':>11}")
+    for nome, m in resultado["casos"].items():
+        comparacao = ""
+        base = (baseline or {}).get("casos", {}).get(nome)
+        if base and base["p50_ms"] > 0:
+            comparacao = f"{(m['p50_ms'] / base['p50_ms'] - 1) * 100:+.0f}%"
+        print(f"{nome:<28} {m['amostras']:>5} {m['p50_ms']:>9.3f} {m['p90_ms']:>9.3f} "
+              f"{m['p99_ms']:>9.3f} {m['max_ms']:>9.3f} {m['pico_kb']:>9.1f} "
+              f"{m['retido_kb']:>9.1f}  {comparacao:>11}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--escala", default="pequena", help="Escala do SyntheticDataSeeder")
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--banco", help="Banco já gerado (copiado; usa-o no lugar de --escala)")
+    parser.add_argument("--repeticoes", type=int, default=200, help="Máximo de amostras por caso")
+    parser.add_argument("--tempo-max", type=float, default=5.0, help="Segundos por caso (aprox.)")
+    parser.add_argument("--casos", help="Nomes dos casos, separados por vírgula (padrão: todos)")
+    parser.add_argument("--salvar", help="Salva o resultado como baseline JSON")
+    parser.add_argument("--comparar", help="Baseline JSON de uma execução anterior")
+    parser.add_argument("--limite", type=float, default=0.15,
+                        help="Piora tolerada antes de acusar regressão (fração; padrão 0.15)")
+    parser.add_argument("--perfil-sql", action="store_true",
+                        help="Perfila as instruções SQL e lista as piores no final")
+    args = parser.parse_args()
+    if args.perfil_sql and (args.salvar or args.comparar):
+        parser.error("--perfil-sql distorce as latências; não use com --salvar/--comparar")
+
+    baseline = None
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as arquivo:
+            baseline = json.load(arquivo)
+
+    resultado = executar(
+        escala=args.escala,
+        semente=args.semente,
+        banco=args.banco,
+        repeticoes=args.repeticoes,
+        tempo_max=args.tempo_max,
+        casos=args.casos.split(",") if args.casos else None,
+        perfil=args.perfil_sql,
+    )
+    _imprimir(resultado, baseline)
+    if args.perfil_sql:
+        print("\nInstruções SQL (por tempo total):")
+        print(perfil_sql.formatar_relatorio())
+
+    if args.salvar:
+        with open(args.salvar, "w", encoding="utf-8") as arquivo:
+            json.dump(resultado, arquivo, indent=2, ensure_ascii=False)
+        print(f"\nBaseline salva em {args.salvar}")
+
+    if baseline:
+        if baseline["meta"].get("volume") != resultado["meta"]["volume"]:
+            print("\nAviso: a baseline foi medida com outro volume de dados.")
+        regressoes = comparar(resultado, baseline, args.limite)
+        if regressoes:
+            print(f"\nRegressões acima de {args.limite:.0%}:")
+            for linha in regressoes:
+                print(f"  {linha}")
+            return 1
+        print(f"\nNenhuma regressão acima de {args.limite:.0%}.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
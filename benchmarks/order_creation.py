@@ -0,0 +1,110 @@
+"""Benchmark da criação de pedidos em lote (PedidoService.criar_pedido).
+
+Compara o caminho atual (nomes em uma consulta, ``executemany`` e um único
+commit) com o caminho antigo de uma ida ao banco por item, variando a
+quantidade de itens por pedido.
+
+Uso:
+    python -m benchmarks.order_creation [--pedidos 200] [--itens 1,5,20,50]
+"""
+import argparse
+import time
+from typing import Dict, List
+
+from benchmarks.common import ContadorSQL, banco_temporario
+from src.repositories.order_repository import PedidoRepository
+from src.repositories.product_repository import ProductRepository
+from src.repositories.user_repository import UsuarioRepository
+from src.services.order_service import PedidoService
+
+ESTOQUE_BENCHMARK = 10_000_000
+
+
+def _preparar_produtos(conn, quantidade: int) -> List[int]:
+    """Garante `quantidade` produtos com estoque suficiente para o benchmark."""
+    conn.executemany(
+        """INSERT INTO produtos (nome, descricao, preco, sku, categoria_id, estoque, ativo)
+           VALUES (?, ?, ?, ?, ?, ?, 1)""",
+        [
+            (f"Produto Bench {i}", "Benchmark", 10.0 + i, f"BENCH-{i:05d}", 1, ESTOQUE_BENCHMARK)
+            for i in range(quantidade)
+        ],
+    )
+    conn.execute("UPDATE produtos SET estoque = ?", (ESTOQUE_BENCHMARK,))
+    conn.commit()
+    return [row[0] for row in conn.execute("SELECT id FROM produtos ORDER BY id")]
+
+
+def _itens(produto_ids: List[int], quantidade: int) -> List[Dict]:
+    return [
+        {"produto_id": produto_ids[i % len(produto_ids)], "quantidade": 1, "preco_unitario": 10.0}
+        for i in range(quantidade)
+    ]
+
+
+def _criar_pedido_por_item(service: PedidoService, itens: List[Dict]) -> None:
+    """Caminho anterior: salva o pedido e faz uma ida ao banco por item."""
+    pedido = service.pedido_repo.salvar({
+        "usuario_id": 2, "endereco_id": 1, "subtotal": 0.0, "frete": 0.0,
+        "total": 0.0, "status": "PENDENTE", "tipo_pagamento": "PIX",
+    })
+    for item in itens:
+        prod = service.produto_repo.buscar_por_id(item["produto_id"])
+        service.pedido_repo.adicionar_item(
+            pedido["id"], item["produto_id"], prod["nome"],
+            item["quantidade"], item["preco_unitario"],
+        )
+
+
+def _criar_pedido_em_lote(service: PedidoService, itens: List[Dict]) -> None:
+    service.criar_pedido(usuario_id=2, endereco_id=1, itens=itens, tipo_pagamento="PIX")
+
+
+def _medir(conn, funcao, service, itens, pedidos: int) -> Dict[str, float]:
+    funcao(service, itens)  # aquecimento
+    with ContadorSQL(conn) as contador:
+        funcao(service, itens)
+
+    inicio = time.perf_counter()
+    for _ in range(pedidos):
+        funcao(service, itens)
+    duracao = time.perf_counter() - inicio
+
+    return {
+        "ms_por_pedido": duracao / pedidos * 1000,
+        "selects": contador.contar("SELECT"),
+        "commits": contador.contar("COMMIT"),
+    }
+
+
+def executar(pedidos: int, tamanhos: List[int]) -> List[Dict[str, float]]:
+    resultados = []
+    with banco_temporario() as conn:
+        produto_ids = _preparar_produtos(conn, max(tamanhos))
+        service = PedidoService(PedidoRepository(), ProductRepository(), UsuarioRepository())
+
+        for tamanho in tamanhos:
+            itens = _itens(produto_ids, tamanho)
+            antigo = _medir(conn, _criar_pedido_por_item, service, itens, pedidos)
+            lote = _medir(conn, _criar_pedido_em_lote, service, itens, pedidos)
+            resultados.append({"itens": tamanho, "por_item": antigo, "lote": lote})
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pedidos", type=int, default=200, help="Pedidos por medição")
+    parser.add_argument("--itens", default="1,5,20,50", help="Itens por pedido (lista)")
+    args = parser.parse_args()
+    tamanhos = [int(t) for t in args.itens.split(",")]
+
+    print(f"{'itens':>6} | {'por item ms':>11} {'SELECT':>6} {'COMMIT':>6} | "
+          f"{'lote ms':>8} {'SELECT':>6} {'COMMIT':>6}")
+    for r in executar(args.pedidos, tamanhos):
+        a, b = r["por_item"], r["lote"]
+        print(f"{r['itens']:>6} | {a['ms_por_pedido']:>11.3f} {a['selects']:>6} {a['commits']:>6} | "
+              f"{b['ms_por_pedido']:>8.3f} {b['selects']:>6} {b['commits']:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,351 @@
+"""Teste de carga com compradores simultâneos, um processo por comprador.
+
+Cada processo abre sua própria conexão com o mesmo arquivo SQLite e repete
+sessões de compra (navegar, adicionar ao carrinho, finalizar, consultar
+pedidos) usando CarrinhoService, CheckoutService e PedidoService. Os
+produtos comprados saem de um conjunto pequeno e com estoque limitado, para
+provocar disputa. No final o relatório mostra vazão, percentis de latência
+por operação, erros de bloqueio do banco e violações de consistência do
+estoque (estoque que não bate com os itens vendidos).
+
+Uso:
+    python -m benchmarks.shopper_load [--processos 8] [--duracao 20] [--escala pequena]
+        [--banco dados.db] [--pensar-ms 0] [--disputados 30] [--estoque 200] [--wal]
+        [--perfil-sql]
+
+Com --perfil-sql cada comprador perfila as próprias instruções SQL
+(src/utils/sql_profiler.py) e o relatório junta os perfis de todos os
+processos, listando as instruções que mais custaram durante a carga.
+"""
+import argparse
+import contextlib
+import multiprocessing
+import os
+import random
+import sqlite3
+import time
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Tuple
+
+from benchmarks.common import banco_sintetico, percentis
+from src.utils.sql_profiler import PerfilSQL
+
+# Chance de uma sessão terminar em compra (as demais abandonam o carrinho)
+CHANCE_CHECKOUT = 0.6
+# Itens distintos colocados no carrinho por sessão
+ITENS_POR_SESSAO = (1, 3)
+# Clientes reservados para cada processo (um carrinho por cliente)
+CLIENTES_POR_PROCESSO = 20
+# Folga para todos os processos subirem antes do início sincronizado
+ATRASO_INICIO_SEGUNDOS = 2.0
+# Mensagens de exemplo guardadas por tipo de erro
+MAX_EXEMPLOS = 3
+
+
+def _classificar_erro(erro: Exception) -> str:
+    """Agrupa os erros: disputa pelo banco, falta de estoque (esperado) ou outros."""
+    mensagem = str(erro).lower()
+    if isinstance(erro, sqlite3.OperationalError) or "locked" in mensagem or "busy" in mensagem:
+        return "bloqueio" if ("locked" in mensagem or "busy" in mensagem) else "sqlite"
+    if "estoque" in mensagem:
+        return "sem_estoque"
+    return "outros"
+
+
+def _comprador(
+    db_path: str,
+    indice: int,
+    inicio_em: float,
+    duracao: float,
+    semente: int,
+    clientes: List[Tuple[int, int]],
+    disputados: List[int],
+    total_produtos: int,
+    pensar_s: float,
+    perfil: bool = False,
+) -> Dict[str, Any]:
+    """Processo comprador: repete sessões até o fim da duração e devolve as medições."""
+    from src.config.settings import Config
+    Config.DB_PATH = db_path
+    Config.SQL_PERFIL_ATIVO = perfil
+
+    from src.integration.payment.credit_card_gateway import CreditCardGateway
+    from src.integration.shipping.correios_calculator import CorreiosCalculator
+    from src.repositories.address_repository import EnderecoRepository
+    from src.repositories.cart_repository import CarrinhoRepository
+    from src.repositories.email_outbox_repository import EmailOutboxRepository
+    from src.repositories.order_repository import PedidoRepository
+    from src.repositories.product_repository import ProductRepository
+    from src.repositories.user_repository import UsuarioRepository
+    from src.services.cart_service import CarrinhoService
+    from src.services.checkout_service import CheckoutService
+    from src.services.email_service import EmailService
+    from src.services.order_service import PedidoService
+    from src.utils.sql_profiler import perfil_sql
+
+    rng = random.Random(semente * 1000 + indice)
+    produto_repo = ProductRepository()
+    carrinho_repo = CarrinhoRepository()
+    pedido_repo = PedidoRepository()
+    usuario_repo = UsuarioRepository()
+    carrinho_service = CarrinhoService(carrinho_repo, produto_repo)
+    checkout_service = CheckoutService(
+        carrinho_repo=carrinho_repo,
+        pedido_repo=pedido_repo,
+        produto_repo=produto_repo,
+        user_repo=usuario_repo,
+        email_service=EmailService(outbox=EmailOutboxRepository()),
+        pagamento_gateway=CreditCardGateway(),
+        frete_calculator=CorreiosCalculator(),
+    )
+    pedido_service = PedidoService(pedido_repo, produto_repo, usuario_repo)
+    enderecos = {uid: EnderecoRepository().buscar_por_id(eid) for uid, eid in clientes}
+
+    latencias: Dict[str, List[float]] = defaultdict(list)
+    erros: Counter = Counter()
+    exemplos: Dict[str, List[str]] = defaultdict(list)
+    compras: Counter = Counter()
+    pedidos: List[int] = []
+    sessoes = 0
+
+    def medir(operacao: str, funcao, *args):
+        """Executa e cronometra uma operação; devolve (ok, resultado)."""
+        inicio = time.perf_counter()
+        try:
+            resultado = funcao(*args)
+        except Exception as e:
+            tipo = _classificar_erro(e)
+            erros[f"{operacao}:{tipo}"] += 1
+            if len(exemplos[tipo]) < MAX_EXEMPLOS:
+                exemplos[tipo].append(f"{operacao}: {e}")
+            return False, None
+        latencias[operacao].append((time.perf_counter() - inicio) * 1000)
+        return True, resultado
+
+    perfil_sql.limpar()
+    time.sleep(max(0.0, inicio_em - time.time()))
+    fim = inicio_em + duracao
+
+    # Gateway e serviços imprimem a cada chamada
+    with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+        while time.time() < fim:
+            usuario_id, _ = rng.choice(clientes)
+            sessoes += 1
+
+            # 1. Navegar: uma página do catálogo e alguns produtos
+            medir("navegar", produto_repo.listar, 20, rng.randrange(max(1, total_produtos - 20)))
+            for _ in range(2):
+                medir("ver_produto", produto_repo.buscar_por_id, rng.choice(disputados))
+
+            # 2. Carrinho: começa vazio e recebe itens disputados
+            ok, carrinho = medir("obter_carrinho", carrinho_service.obter_ou_criar_carrinho, usuario_id)
+            if not ok:
+                continue
+            carrinho_repo.limpar(carrinho["id"])
+            for produto_id in rng.sample(disputados, rng.randint(*ITENS_POR_SESSAO)):
+                medir("adicionar_item", carrinho_service.adicionar_item, usuario_id, produto_id, rng.randint(1, 2))
+
+            # 3. Finalizar a compra (ou abandonar o carrinho)
+            if rng.random() < CHANCE_CHECKOUT:
+                itens = carrinho_repo.listar_itens(carrinho["id"])
+                if itens:
+                    ok, pedido = medir(
+                        "checkout", checkout_service.processar_compra,
+                        carrinho["id"], {"numero_cartao": "4111111111111111"},
+                        enderecos[usuario_id], "cartao",
+                    )
+                    if ok:
+                        pedidos.append(pedido.id)
+                        for item in itens:
+                            compras[item["produto_id"]] += item["quantidade"]
+
+            # 4. Consultar os próprios pedidos
+            medir("meus_pedidos", pedido_service.listar_pedidos_usuario, usuario_id)
+
+            if pensar_s:
+                time.sleep(rng.uniform(0, 2 * pensar_s))
+
+    return {
+        "sessoes": sessoes,
+        "latencias": dict(latencias),
+        "erros": dict(erros),
+        "exemplos": dict(exemplos),
+        "compras": dict(compras),
+        "pedidos": pedidos,
+        "perfil_sql": perfil_sql.exportar() if perfil else {},
+    }
+
+
+def _preparar(conn, processos: int, disputados: int, estoque: int) -> Dict[str, Any]:
+    """Escolhe clientes e produtos disputados e fixa o estoque inicial destes."""
+    clientes = conn.execute(
+        """SELECT u.id, MIN(e.id) FROM usuarios u JOIN enderecos e ON e.usuario_id = u.id
+           WHERE u.tipo = 'cliente' GROUP BY u.id ORDER BY u.id DESC LIMIT ?""",
+        (processos * CLIENTES_POR_PROCESSO,),
+    ).fetchall()
+    produtos = [row[0] for row in conn.execute(
+        "SELECT id FROM produtos WHERE ativo = 1 ORDER BY id LIMIT ?", (disputados,)
+    )]
+    conn.executemany("UPDATE produtos SET estoque = ? WHERE id = ?", [(estoque, p) for p in produtos])
+    conn.commit()
+    return {
+        "clientes": [tuple(row) for row in clientes],
+        "produtos": produtos,
+        "total_produtos": conn.execute("SELECT COUNT(*) FROM produtos").fetchone()[0],
+        "ultimo_pedido": conn.execute("SELECT COALESCE(MAX(id), 0) FROM pedidos").fetchone()[0],
+        "estoque": estoque,
+    }
+
+
+def _verificar_estoque(conn, preparo: Dict[str, Any], compras: Counter, pedidos: List[int]) -> List[str]:
+    """Confere o estoque final com os itens vendidos, segundo o banco e segundo os compradores."""
+    violacoes = []
+    produtos = preparo["produtos"]
+    marcadores = ",".join("?" * len(produtos))
+    finais = dict(conn.execute(
+        f"SELECT id, estoque FROM produtos WHERE id IN ({marcadores})", produtos
+    ).fetchall())
+    vendidos = dict(conn.execute(
+        f"""SELECT produto_id, SUM(quantidade) FROM itens_pedido
+            WHERE pedido_id > ? AND produto_id IN ({marcadores}) GROUP BY produto_id""",
+        [preparo["ultimo_pedido"], *produtos],
+    ).fetchall())
+
+    for produto_id in produtos:
+        vendido = vendidos.get(produto_id, 0)
+        baixado = preparo["estoque"] - finais[produto_id]
+        if finais[produto_id] < 0:
+            violacoes.append(f"produto {produto_id}: estoque negativo ({finais[produto_id]})")
+        if baixado != vendido:
+            violacoes.append(
+                f"produto {produto_id}: estoque baixou {baixado}, itens vendidos somam {vendido}"
+            )
+        if compras.get(produto_id, 0) != vendido:
+            violacoes.append(
+                f"produto {produto_id}: compradores confirmaram {compras.get(produto_id, 0)}, "
+                f"banco tem {vendido}"
+            )
+
+    no_banco = conn.execute(
+        "SELECT COUNT(*) FROM pedidos WHERE id > ?", (preparo["ultimo_pedido"],)
+    ).fetchone()[0]
+    if no_banco != len(pedidos):
+        violacoes.append(f"pedidos: compradores confirmaram {len(pedidos)}, banco tem {no_banco}")
+    return violacoes
+
+
+def executar(
+    processos: int = 8,
+    duracao: float = 20.0,
+    escala: str = "pequena",
+    semente: int = 42,
+    banco: str = None,
+    pensar_ms: float = 0.0,
+    disputados: int = 30,
+    estoque: int = 200,
+    wal: bool = False,
+    perfil: bool = False,
+) -> Dict[str, Any]:
+    """Roda a carga e devolve o resumo agregado dos processos."""
+    with banco_sintetico(escala, semente, origem=banco) as conn:
+        if wal:
+            conn.execute("PRAGMA journal_mode = WAL")
+        preparo = _preparar(conn, processos, disputados, estoque)
+        from src.config.settings import Config
+        db_path = Config.DB_PATH
+
+        inicio_em = time.time() + ATRASO_INICIO_SEGUNDOS
+        argumentos = [
+            (db_path, i, inicio_em, duracao, semente, preparo["clientes"][i::processos],
+             preparo["produtos"], preparo["total_produtos"], pensar_ms / 1000, perfil)
+            for i in range(processos)
+        ]
+        contexto = multiprocessing.get_context("spawn")
+        with contexto.Pool(processos) as pool:
+            parciais = pool.starmap(_comprador, argumentos)
+
+        latencias: Dict[str, List[float]] = defaultdict(list)
+        erros: Counter = Counter()
+        exemplos: Dict[str, List[str]] = defaultdict(list)
+        compras: Counter = Counter()
+        pedidos: List[int] = []
+        perfil_total = PerfilSQL()
+        for parcial in parciais:
+            perfil_total.mesclar(parcial["perfil_sql"])
+            for operacao, valores in parcial["latencias"].items():
+                latencias[operacao].extend(valores)
+            erros.update(parcial["erros"])
+            compras.update(parcial["compras"])
+            pedidos.extend(parcial["pedidos"])
+            for tipo, mensagens in parcial["exemplos"].items():
+                exemplos[tipo].extend(mensagens[:MAX_EXEMPLOS - len(exemplos[tipo])])
+
+        violacoes = _verificar_estoque(conn, preparo, compras, pedidos)
+
+    return {
+        "processos": processos,
+        "duracao": duracao,
+        "sessoes": sum(p["sessoes"] for p in parciais),
+        "latencias": latencias,
+        "erros": erros,
+        "exemplos": exemplos,
+        "pedidos": len(pedidos),
+        "violacoes": violacoes,
+        "perfil_sql": perfil_total if perfil else None,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processos", type=int, default=8, help="Compradores simultâneos")
+    parser.add_argument("--duracao", type=float, default=20.0, help="Segundos de carga")
+    parser.add_argument("--escala", default="pequena", help="Escala do SyntheticDataSeeder")
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--banco", help="Banco já gerado (copiado; usa-o no lugar de --escala)")
+    parser.add_argument("--pensar-ms", type=float, default=0.0, help="Pausa média entre sessões")
+    parser.add_argument("--disputados", type=int, default=30, help="Produtos disputados")
+    parser.add_argument("--estoque", type=int, default=200, help="Estoque inicial de cada disputado")
+    parser.add_argument("--wal", action="store_true", help="Usa journal_mode=WAL no banco")
+    parser.add_argument("--perfil-sql", action="store_true",
+                        help="Perfila as instruções SQL dos compradores e lista as piores")
+    args = parser.parse_args()
+
+    r = executar(
+        processos=args.processos, duracao=args.duracao, escala=args.escala,
+        semente=args.semente, banco=args.banco, pensar_ms=args.pensar_ms,
+        disputados=args.disputados, estoque=args.estoque, wal=args.wal,
+        perfil=args.perfil_sql,
+    )
+
+    operacoes = sum(len(v) for v in r["latencias"].values())
+    print(f"{r['processos']} processos, {r['duracao']:.0f} s: {r['sessoes']} sessões "
+          f"({r['sessoes'] / r['duracao']:.1f}/s), {operacoes / r['duracao']:.0f} operações/s, "
+          f"{r['pedidos'] / r['duracao']:.1f} pedidos/s")
+    print(f"\n{'operação':<16} {'n':>7} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for operacao, valores in sorted(r["latencias"].items()):
+        p = percentis(valores)
+        print(f"{operacao:<16} {len(valores):>7} {p['p50']:>9.2f} {p['p90']:>9.2f} "
+              f"{p['p99']:>9.2f} {max(valores):>9.2f}")
+
+    print("\nErros:" if r["erros"] else "\nErros: nenhum")
+    for chave, quantidade in sorted(r["erros"].items()):
+        print(f"  {chave:<32} {quantidade:>7}")
+    for tipo, mensagens in sorted(r["exemplos"].items()):
+        for mensagem in mensagens:
+            print(f"    [{tipo}] {mensagem[:120]}")
+
+    if r["perfil_sql"]:
+        print("\nInstruções SQL de todos os compradores (por tempo total):")
+        print(r["perfil_sql"].formatar_relatorio())
+
+    if r["violacoes"]:
+        print(f"\nViolações de consistência do estoque: {len(r['violacoes'])}")
+        for violacao in r["violacoes"][:20]:
+            print(f"  {violacao}")
+        return 1
+    print("\nEstoque consistente com os pedidos gravados.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,94 @@
+"""Benchmark de envio em massa pelo transporte SMTP.
+
+Compara uma conexão nova por email (EHLO + AUTH a cada mensagem) com o
+``PoolSMTP`` reusando conexões persistentes, com 1 e com N conexões. O
+servidor é o ``SMTPSinkLocal``, rodando em outro processo para não
+disputar o GIL com o cliente.
+
+Uso:
+    python -m benchmarks.smtp_bulk [--mensagens 2000] [--conexoes 4]
+"""
+import argparse
+import multiprocessing
+import smtplib
+import time
+from email.message import EmailMessage
+from typing import Dict, List
+
+from benchmarks.common import root_dir  # noqa: F401 (ajusta o sys.path)
+from src.integration.email.smtp_sink import SMTPSinkLocal
+from src.integration.email.smtp_transport import PoolSMTP
+
+USUARIO = "bench"
+SENHA = "bench"
+REMETENTE = "noreply@scee.com.br"
+
+
+def _servir(canal) -> None:
+    with SMTPSinkLocal(usuario=USUARIO, senha=SENHA) as sink:
+        canal.send(sink.port)
+        canal.recv()  # aguarda o pedido de parada
+
+
+def _mensagens(quantidade: int) -> List[EmailMessage]:
+    mensagens = []
+    for i in range(quantidade):
+        mensagem = EmailMessage()
+        mensagem["From"] = REMETENTE
+        mensagem["To"] = f"cliente{i}@test.com"
+        mensagem["Subject"] = f"Pedido #{i} enviado!"
+        mensagem.set_content("Olá,\n\nSeu pedido foi enviado!\nAtenciosamente,\nEquipe SCEE\n" * 4)
+        mensagens.append(mensagem)
+    return mensagens
+
+
+def _reconectando(porta: int, mensagens: List[EmailMessage]) -> None:
+    for mensagem in mensagens:
+        with smtplib.SMTP("127.0.0.1", porta) as smtp:
+            smtp.login(USUARIO, SENHA)
+            smtp.sendmail(REMETENTE, [mensagem["To"]], mensagem.as_bytes())
+
+
+def _pool(porta: int, mensagens: List[EmailMessage], conexoes: int) -> None:
+    with PoolSMTP("127.0.0.1", porta, usuario=USUARIO, senha=SENHA, max_conexoes=conexoes) as pool:
+        erros = pool.enviar_lote((REMETENTE, [m["To"]], m) for m in mensagens)
+    if any(erros):
+        raise RuntimeError(f"{sum(1 for e in erros if e)} mensagens falharam")
+
+
+def executar(quantidade: int, conexoes: int) -> Dict[str, float]:
+    mensagens = _mensagens(quantidade)
+    canal, canal_filho = multiprocessing.Pipe()
+    servidor = multiprocessing.Process(target=_servir, args=(canal_filho,), daemon=True)
+    servidor.start()
+    porta = canal.recv()
+
+    cenarios = {
+        "conexão por email": lambda: _reconectando(porta, mensagens),
+        "pool, 1 conexão": lambda: _pool(porta, mensagens, 1),
+        f"pool, {conexoes} conexões": lambda: _pool(porta, mensagens, conexoes),
+    }
+    resultados = {}
+    try:
+        for nome, cenario in cenarios.items():
+            inicio = time.perf_counter()
+            cenario()
+            resultados[nome] = quantidade / (time.perf_counter() - inicio)
+    finally:
+        canal.send("parar")
+        servidor.join(5)
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mensagens", type=int, default=2000, help="Mensagens por cenário")
+    parser.add_argument("--conexoes", type=int, default=4, help="Tamanho do pool")
+    args = parser.parse_args()
+
+    for nome, taxa in executar(args.mensagens, args.conexoes).items():
+        print(f"{nome:>20}: {taxa:8.0f} msg/s")
+
+
+if __name__ == "__main__":
+    main()
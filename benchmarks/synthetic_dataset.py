@@ -0,0 +1,66 @@
+"""Gera um banco SQLite com volume realista de dados sintéticos.
+
+O banco gerado serve de base para os demais benchmarks e para testes
+manuais de desempenho (basta apontar SCEE_DB_NAME/DB_PATH para ele).
+
+Uso:
+    python -m benchmarks.synthetic_dataset --saida /tmp/scee_grande.db [--escala completa]
+    python -m benchmarks.synthetic_dataset --saida /tmp/x.db --produtos 10000 --clientes 2000 --pedidos 50000
+"""
+import argparse
+import os
+import time
+
+from benchmarks.common import _resetar_conexao
+from src.config.database import DatabaseConnection
+from src.config.database_initializer import DatabaseInitializer
+from src.config.settings import Config
+from src.config.synthetic_seeder import SyntheticDataSeeder
+
+
+def gerar(saida: str, escala: str, semente: int, produtos=None, clientes=None, pedidos=None):
+    """Cria o banco em ``saida`` e o popula. Retorna (linhas por tabela, segundos)."""
+    if os.path.exists(saida):
+        os.remove(saida)
+
+    caminho_original = Config.DB_PATH
+    _resetar_conexao()
+    Config.DB_PATH = os.path.abspath(saida)
+    try:
+        db = DatabaseConnection()
+        DatabaseInitializer(db).initialize_database()
+        seeder = SyntheticDataSeeder(db, semente=semente)
+
+        padrao = SyntheticDataSeeder.ESCALAS[escala]
+        volume = [valor if valor is not None else base
+                  for valor, base in zip((produtos, clientes, pedidos), padrao)]
+
+        inicio = time.perf_counter()
+        contagens = seeder.seed_volume(*volume)
+        return contagens, time.perf_counter() - inicio
+    finally:
+        _resetar_conexao()
+        Config.DB_PATH = caminho_original
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--saida", required=True, help="Arquivo SQLite a criar (sobrescrito)")
+    parser.add_argument("--escala", default="pequena", choices=sorted(SyntheticDataSeeder.ESCALAS))
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--produtos", type=int, help="Sobrescreve o volume da escala")
+    parser.add_argument("--clientes", type=int, help="Sobrescreve o volume da escala")
+    parser.add_argument("--pedidos", type=int, help="Sobrescreve o volume da escala")
+    args = parser.parse_args()
+
+    contagens, segundos = gerar(
+        args.saida, args.escala, args.semente, args.produtos, args.clientes, args.pedidos
+    )
+    for tabela, linhas in contagens.items():
+        print(f"{tabela:>14}: {linhas:>10,}")
+    print(f"Gerado em {segundos:.1f} s -> {args.saida} "
+          f"({os.path.getsize(args.saida) / 1_048_576:.0f} MB)")
+
+
+if __name__ == "__main__":
+    main()
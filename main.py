@@ -15,6 +15,11 @@ from src.views.main_window import MainWindow
 from src.config.database import DatabaseConnection
 from src.config.database_initializer import DatabaseInitializer
 from src.config.database_seeder import DatabaseSeeder
+from src.services.email_service import EmailService
+from src.services.email_dispatcher import EmailDispatcher
+from src.utils.task_runner import executor_tarefas
+from src.utils.thumbnail_cache import executor_miniaturas
+from src.utils.ui_watchdog import monitor_travamentos
 
 def main():
     """Função principal que inicia a aplicação."""
@@ -26,15 +31,29 @@ def main():
         # Verifica se o banco precisa ser criado
         if not initializer.check_database_exists():
             initializer.initialize_database()
+        else:
+            initializer.migrate_schema()
         
         # 2. Popula o banco com dados iniciais se necessário
         seeder = DatabaseSeeder(db)
         if not seeder.check_if_seeded():
             seeder.seed_all()
         
-        # 3. Inicia a Interface Gráfica
-        app = MainWindow()
-        app.mainloop()
+        # 3. Envio de emails em segundo plano (caixa de saída)
+        email_service = EmailService.da_configuracao()
+        dispatcher = EmailDispatcher(email_service)
+        dispatcher.iniciar()
+        
+        # 4. Inicia a Interface Gráfica
+        try:
+            app = MainWindow()
+            app.mainloop()
+        finally:
+            monitor_travamentos.encerrar()
+            executor_tarefas.encerrar()
+            executor_miniaturas.encerrar()
+            dispatcher.encerrar()
+            email_service.fechar()
         
     except Exception as e:
         print(f"Erro fatal ao iniciar a aplicação: {e}")
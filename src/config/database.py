@@ -1,5 +1,6 @@
 import sqlite3
 import os
+import threading
 from src.config.settings import Config
 
 class DatabaseConnection:
@@ -14,26 +15,36 @@ class DatabaseConnection:
         if cls._instance is None:
             cls._instance = super(DatabaseConnection, cls).__new__(cls)
             cls._instance._conn = None
+            cls._instance._thread_dono = None
+            cls._instance._locais = threading.local()
         return cls._instance
 
     def get_connection(self):
         """
         Retorna a conexão ativa com o banco de dados.
         Cria uma nova se não existir.
+
+        A conexão principal pertence à thread que a criou (a do Tkinter);
+        chamadas vindas de outras threads (ex.: tarefas em segundo plano dos
+        controllers) recebem uma conexão própria daquela thread.
         """
+        if self._conn is not None and threading.get_ident() != self._thread_dono:
+            return self._conexao_da_thread()
+
         if self._conn is None:
             # Garante que a pasta 'data' existe antes de conectar
             os.makedirs(os.path.dirname(Config.DB_PATH), exist_ok=True)
             
             try:
                 # Conecta ao arquivo definido no settings
-                self._conn = sqlite3.connect(Config.DB_PATH)
+                self._conn = sqlite3.connect(Config.DB_PATH, factory=self._fabrica())
                 
                 # Habilita o acesso às colunas pelo nome (ex: row['email'])
                 self._conn.row_factory = sqlite3.Row
                 
                 # Habilita chaves estrangeiras (Foreign Keys) no SQLite
                 self._conn.execute("PRAGMA foreign_keys = ON")
+                self._thread_dono = threading.get_ident()
                 
             except sqlite3.Error as e:
                 print(f"Erro crítico ao conectar ao banco de dados: {e}")
@@ -41,6 +52,34 @@ class DatabaseConnection:
                 
         return self._conn
 
+    def create_connection(self, timeout: float = 5.0):
+        """
+        Abre uma conexão nova e independente, configurada como a principal.
+        Use em threads de segundo plano: conexões sqlite3 não podem ser
+        compartilhadas entre threads.
+        """
+        os.makedirs(os.path.dirname(Config.DB_PATH), exist_ok=True)
+        conn = sqlite3.connect(Config.DB_PATH, timeout=timeout, factory=self._fabrica())
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+    def _conexao_da_thread(self):
+        """Conexão da thread atual, reaberta se o banco configurado mudou."""
+        local = self._locais
+        if getattr(local, "conn", None) is None or local.caminho != Config.DB_PATH:
+            local.conn = self.create_connection()
+            local.caminho = Config.DB_PATH
+        return local.conn
+
+    @staticmethod
+    def _fabrica():
+        """Classe da conexão: perfilada quando Config.SQL_PERFIL_ATIVO."""
+        if Config.SQL_PERFIL_ATIVO:
+            from src.utils.sql_profiler import ConexaoPerfilada
+            return ConexaoPerfilada
+        return sqlite3.Connection
+
     def close_connection(self):
         """Fecha a conexão se estiver aberta."""
         if self._conn:
@@ -123,6 +123,10 @@ class DatabaseInitializer:
                     categoria_id INTEGER,
                     estoque INTEGER DEFAULT 0 CHECK(estoque >= 0),
                     ativo INTEGER DEFAULT 1,
+                    peso_kg REAL DEFAULT 1.0 CHECK(peso_kg >= 0),
+                    altura_cm REAL DEFAULT 10.0 CHECK(altura_cm >= 0),
+                    largura_cm REAL DEFAULT 10.0 CHECK(largura_cm >= 0),
+                    comprimento_cm REAL DEFAULT 10.0 CHECK(comprimento_cm >= 0),
                     criado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     atualizado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     FOREIGN KEY (categoria_id) REFERENCES categorias(id) ON DELETE SET NULL
@@ -133,6 +137,10 @@ class DatabaseInitializer:
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_produtos_categoria_id ON produtos(categoria_id);")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_produtos_nome ON produtos(nome);")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_produtos_ativo ON produtos(ativo);")
+            # Ordenação das tabelas paginadas (ProductRepository.listar_pagina)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_produtos_preco ON produtos(preco);")
+            # Ordenação paginada: estoque aceita NULL e é ordenado como 0
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_produtos_estoque_ordem ON produtos(COALESCE(estoque, 0));")
             
             # Imagens dos produtos
             cursor.execute("""
@@ -141,6 +149,8 @@ class DatabaseInitializer:
                     produto_id INTEGER NOT NULL,
                     url TEXT NOT NULL,
                     prioridade INTEGER DEFAULT 0,
+                    variante TEXT NOT NULL DEFAULT 'original',
+                    hash TEXT,
                     criado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     FOREIGN KEY (produto_id) REFERENCES produtos(id) ON DELETE CASCADE
                 );
@@ -201,6 +211,10 @@ class DatabaseInitializer:
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_pedidos_usuario_id ON pedidos(usuario_id);")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_pedidos_status ON pedidos(status);")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_pedidos_criado_em ON pedidos(criado_em);")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_pedidos_total ON pedidos(total);")
+            # Ordenação paginada: criado_em e status aceitam NULL, ordenados como ''
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_pedidos_criado_em_ordem ON pedidos(COALESCE(criado_em, ''));")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_pedidos_status_ordem ON pedidos(COALESCE(status, ''));")
             
             # Itens do pedido
             cursor.execute("""
@@ -221,6 +235,50 @@ class DatabaseInitializer:
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_itens_pedido_pedido_id ON itens_pedido(pedido_id);")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_itens_pedido_produto_id ON itens_pedido(produto_id);")
             
+            # Caixa de saída de emails (drenada pelo EmailDispatcher)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS email_outbox (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    destinatario TEXT NOT NULL,
+                    assunto TEXT NOT NULL,
+                    corpo TEXT NOT NULL,
+                    copias TEXT,
+                    prioridade INTEGER NOT NULL DEFAULT 5,
+                    status TEXT NOT NULL DEFAULT 'PENDENTE' CHECK(status IN ('PENDENTE', 'ENVIANDO', 'ENVIADO', 'FALHOU')),
+                    tentativas INTEGER NOT NULL DEFAULT 0,
+                    proxima_tentativa_em REAL NOT NULL DEFAULT 0,
+                    ultimo_erro TEXT,
+                    chave_agrupamento TEXT,
+                    metadados TEXT,
+                    criado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    enviado_em TIMESTAMP
+                );
+            """)
+            
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_email_outbox_fila ON email_outbox(status, prioridade, proxima_tentativa_em);")
+            
+            # Tentativas de login malsucedidas (chave = email ou origem)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS tentativas_login (
+                    chave TEXT PRIMARY KEY,
+                    janela_inicio REAL NOT NULL,
+                    falhas_atual INTEGER NOT NULL DEFAULT 0,
+                    falhas_anterior INTEGER NOT NULL DEFAULT 0,
+                    bloqueado_ate REAL NOT NULL DEFAULT 0,
+                    bloqueios INTEGER NOT NULL DEFAULT 0,
+                    atualizado_em REAL NOT NULL
+                );
+            """)
+            
+            # Versão dos dados por tabela (incrementada pelos triggers de versão);
+            # as telas comparam versões para saber se precisam recarregar
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS versoes_dados (
+                    tabela TEXT PRIMARY KEY,
+                    versao INTEGER NOT NULL DEFAULT 0
+                );
+            """)
+            
             self.conn.commit()
             
         except sqlite3.Error as e:
@@ -341,7 +399,9 @@ class DatabaseInitializer:
                     p.*,
                     c.nome AS categoria_nome,
                     c.descricao AS categoria_descricao,
-                    (SELECT url FROM imagens_produto WHERE produto_id = p.id ORDER BY prioridade LIMIT 1) AS imagem_principal
+                    (SELECT url FROM imagens_produto WHERE produto_id = p.id AND variante = 'original' ORDER BY prioridade, id LIMIT 1) AS imagem_principal,
+                    (SELECT url FROM imagens_produto WHERE produto_id = p.id AND variante = 'card' ORDER BY prioridade, id LIMIT 1) AS imagem_card,
+                    (SELECT url FROM imagens_produto WHERE produto_id = p.id AND variante = 'detalhe' ORDER BY prioridade, id LIMIT 1) AS imagem_detalhe
                 FROM produtos p
                 LEFT JOIN categorias c ON p.categoria_id = c.id;
             """)
@@ -401,11 +461,102 @@ class DatabaseInitializer:
             print(f"Erro ao criar views: {e}")
             raise
     
+    # Colunas adicionadas após a criação original das tabelas: (tabela, coluna, definição)
+    COLUNAS_MIGRACAO = [
+        ("produtos", "peso_kg", "REAL DEFAULT 1.0 CHECK(peso_kg >= 0)"),
+        ("produtos", "altura_cm", "REAL DEFAULT 10.0 CHECK(altura_cm >= 0)"),
+        ("produtos", "largura_cm", "REAL DEFAULT 10.0 CHECK(largura_cm >= 0)"),
+        ("produtos", "comprimento_cm", "REAL DEFAULT 10.0 CHECK(comprimento_cm >= 0)"),
+        ("email_outbox", "chave_agrupamento", "TEXT"),
+        ("email_outbox", "metadados", "TEXT"),
+        ("imagens_produto", "variante", "TEXT NOT NULL DEFAULT 'original'"),
+        ("imagens_produto", "hash", "TEXT"),
+    ]
+    
+    # Índices sobre colunas de COLUNAS_MIGRACAO (criados depois delas)
+    INDICES_MIGRACAO = [
+        "CREATE INDEX IF NOT EXISTS idx_email_outbox_agrupamento ON email_outbox(chave_agrupamento) WHERE status = 'PENDENTE';",
+        "CREATE INDEX IF NOT EXISTS idx_imagens_produto_hash ON imagens_produto(hash) WHERE hash IS NOT NULL;",
+        "CREATE INDEX IF NOT EXISTS idx_produtos_preco ON produtos(preco);",
+        "DROP INDEX IF EXISTS idx_produtos_estoque;",
+        "CREATE INDEX IF NOT EXISTS idx_pedidos_total ON pedidos(total);",
+    ]
+    
+    # Views que dependem de colunas novas: recriadas a cada migração
+    VIEWS_MIGRACAO = ["vw_produtos_completos"]
+    
+    # Tabelas cujas alterações incrementam versoes_dados
+    TABELAS_VERSIONADAS = [
+        "produtos", "imagens_produto", "categorias",
+        "carrinhos", "itens_carrinho", "pedidos", "itens_pedido",
+    ]
+    
+    def create_version_triggers(self):
+        """
+        Cria os triggers que incrementam versoes_dados a cada INSERT/UPDATE/DELETE
+        nas TABELAS_VERSIONADAS (inclusive alterações feitas por outras conexões).
+        """
+        cursor = self.conn.cursor()
+        
+        try:
+            for tabela in self.TABELAS_VERSIONADAS:
+                cursor.execute(
+                    "INSERT OR IGNORE INTO versoes_dados (tabela, versao) VALUES (?, 0);", (tabela,)
+                )
+                for operacao in ("INSERT", "UPDATE", "DELETE"):
+                    cursor.execute(f"""
+                        CREATE TRIGGER IF NOT EXISTS versao_{tabela}_{operacao.lower()}
+                        AFTER {operacao} ON {tabela}
+                        BEGIN
+                            UPDATE versoes_dados SET versao = versao + 1 WHERE tabela = '{tabela}';
+                        END;
+                    """)
+            
+            self.conn.commit()
+            
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            print(f"Erro ao criar triggers de versão: {e}")
+            raise
+    
+    def migrate_schema(self):
+        """
+        Adiciona a bancos já existentes as tabelas e colunas criadas depois da versão original.
+        Pode ser executado várias vezes (idempotente).
+        """
+        # Tabelas e índices novos (CREATE ... IF NOT EXISTS)
+        self.create_schema()
+        
+        cursor = self.conn.cursor()
+        
+        try:
+            for tabela, coluna, definicao in self.COLUNAS_MIGRACAO:
+                cursor.execute(f"PRAGMA table_info({tabela});")
+                existentes = {row[1] for row in cursor.fetchall()}
+                if coluna not in existentes:
+                    cursor.execute(f"ALTER TABLE {tabela} ADD COLUMN {coluna} {definicao};")
+            
+            for indice in self.INDICES_MIGRACAO:
+                cursor.execute(indice)
+            
+            for view in self.VIEWS_MIGRACAO:
+                cursor.execute(f"DROP VIEW IF EXISTS {view};")
+            
+            self.conn.commit()
+            
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            print(f"Erro ao migrar schema: {e}")
+            raise
+        
+        self.create_views()
+        self.create_version_triggers()
+    
     def initialize_database(self):
         """
         Executa a inicialização completa do banco de dados.
         """
-        self.create_schema()
+        self.migrate_schema()
         self.create_triggers()
         self.create_views()
     
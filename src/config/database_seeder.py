@@ -74,6 +74,20 @@ class DatabaseSeeder:
                VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
             produtos
         )
+        
+        # Peso (kg) e dimensões da embalagem (altura, largura, comprimento em cm)
+        dimensoes = [
+            (0.35, 8, 18, 20, 1), (0.20, 5, 8, 14, 2), (1.10, 5, 15, 45, 3),
+            (0.25, 8, 8, 12, 4), (0.20, 3, 25, 30, 5), (0.70, 5, 30, 35, 6),
+            (0.60, 6, 30, 35, 7), (0.80, 4, 17, 24, 8), (0.90, 4, 19, 24, 9),
+            (1.20, 5, 18, 23, 10), (1.00, 15, 20, 40, 11), (1.50, 5, 42, 62, 12),
+            (0.45, 8, 8, 30, 13), (1.20, 12, 12, 62, 14), (10.5, 12, 20, 30, 15)
+        ]
+        cursor.executemany(
+            """UPDATE produtos SET peso_kg = ?, altura_cm = ?, largura_cm = ?, comprimento_cm = ?
+               WHERE id = ?""",
+            dimensoes
+        )
         self.conn.commit()
     
     def seed_imagens_produto(self):
@@ -18,9 +18,88 @@ class Config:
     DB_NAME = os.getenv("DB_NAME", "scee_loja.db")
     DB_PATH = os.path.join(BASE_DIR, "database_sqlite", DB_NAME)
     
+    # --- Frete ---
+    # Tempo máximo (s) para aguardar as transportadoras em uma cotação
+    FRETE_TIMEOUT_SEGUNDOS = float(os.getenv("FRETE_TIMEOUT_SEGUNDOS", "2.0"))
+    # Validade (s) de uma cotação em cache (por prefixo de CEP e faixa de peso)
+    FRETE_CACHE_TTL_SEGUNDOS = float(os.getenv("FRETE_CACHE_TTL_SEGUNDOS", "600"))
+    # Tabela binária de frete por faixa de CEP (gerada por integration/shipping/rate_table.py)
+    FRETE_TABELA_PATH = os.getenv(
+        "FRETE_TABELA_PATH", os.path.join(BASE_DIR, "database_sqlite", "tabela_frete.bin")
+    )
+    
+    # --- Senhas ---
+    # Algoritmo para novos hashes: "pbkdf2_sha256" ou "scrypt". Hashes com
+    # algoritmo/custo diferentes são regravados no próximo login.
+    SENHA_ALGORITMO = os.getenv("SENHA_ALGORITMO", "pbkdf2_sha256")
+    SENHA_PBKDF2_ITERACOES = int(os.getenv("SENHA_PBKDF2_ITERACOES", "100000"))
+    SENHA_SCRYPT_N = int(os.getenv("SENHA_SCRYPT_N", "16384"))
+    SENHA_SCRYPT_R = int(os.getenv("SENHA_SCRYPT_R", "8"))
+    SENHA_SCRYPT_P = int(os.getenv("SENHA_SCRYPT_P", "1"))
+    # Threads dedicadas à verificação de senhas (fora da thread da interface)
+    SENHA_HASH_WORKERS = int(os.getenv("SENHA_HASH_WORKERS", "2"))
+    
+    # --- Tarefas em segundo plano das telas (src/utils/task_runner.py) ---
+    TAREFAS_THREADS = int(os.getenv("TAREFAS_THREADS", "4"))
+    # Intervalo com que a thread do Tkinter busca resultados prontos
+    TAREFAS_INTERVALO_MS = int(os.getenv("TAREFAS_INTERVALO_MS", "15"))
+    
+    # Limite de tentativas de login: falhas permitidas na janela deslizante
+    LOGIN_MAX_FALHAS = int(os.getenv("LOGIN_MAX_FALHAS", "5"))
+    LOGIN_JANELA_SEGUNDOS = float(os.getenv("LOGIN_JANELA_SEGUNDOS", "300"))
+    # Bloqueio após estourar o limite: base * 2^(bloqueios anteriores), até o máximo
+    LOGIN_BLOQUEIO_BASE_SEGUNDOS = float(os.getenv("LOGIN_BLOQUEIO_BASE_SEGUNDOS", "30"))
+    LOGIN_BLOQUEIO_MAX_SEGUNDOS = float(os.getenv("LOGIN_BLOQUEIO_MAX_SEGUNDOS", "3600"))
+    # Intervalo entre as limpezas das chaves inativas em tentativas_login
+    LOGIN_LIMPEZA_INTERVALO_SEGUNDOS = float(os.getenv("LOGIN_LIMPEZA_INTERVALO_SEGUNDOS", "3600"))
+    
+    # --- Diagnóstico ---
+    # Cronometra as ações dos controllers (painel de diagnóstico do admin)
+    METRICAS_ATIVAS = os.getenv("METRICAS_ATIVAS", "1") == "1"
+    # Ações a partir deste tempo entram no log de ações lentas
+    METRICAS_LIMITE_LENTO_MS = float(os.getenv("METRICAS_LIMITE_LENTO_MS", "250"))
+    # Perfil das instruções SQL (src/utils/sql_profiler.py); tem custo, desligado por padrão
+    SQL_PERFIL_ATIVO = os.getenv("SQL_PERFIL_ATIVO", "0") == "1"
+    # Instruções a partir deste tempo têm o EXPLAIN QUERY PLAN capturado
+    SQL_PERFIL_LIMITE_MS = float(os.getenv("SQL_PERFIL_LIMITE_MS", "20"))
+    # Monitor de travamentos da interface (src/utils/ui_watchdog.py): intervalo do
+    # batimento no loop do Tkinter e atraso a partir do qual conta como travamento
+    MONITOR_UI_ATIVO = os.getenv("MONITOR_UI_ATIVO", "1") == "1"
+    MONITOR_UI_INTERVALO_MS = float(os.getenv("MONITOR_UI_INTERVALO_MS", "20"))
+    MONITOR_UI_LIMITE_MS = float(os.getenv("MONITOR_UI_LIMITE_MS", "150"))
+    
+    # --- Email (SMTP) ---
+    # Sem SMTP_HOST o EmailService roda em modo mock
+    SMTP_HOST = os.getenv("SMTP_HOST", "")
+    SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
+    SMTP_USER = os.getenv("SMTP_USER", "")
+    SMTP_PASSWORD = os.getenv("SMTP_PASSWORD", "")
+    SMTP_TLS = os.getenv("SMTP_TLS", "1") == "1"
+    # Conexões persistentes mantidas com o servidor
+    SMTP_MAX_CONEXOES = int(os.getenv("SMTP_MAX_CONEXOES", "4"))
+    # Limite de mensagens/s do servidor (0 = sem limite)
+    SMTP_MENSAGENS_POR_SEGUNDO = float(os.getenv("SMTP_MENSAGENS_POR_SEGUNDO", "0"))
+    
+    # Avisos de status do mesmo pedido dentro desta janela (s) viram um único email
+    EMAIL_JANELA_AGRUPAMENTO_SEGUNDOS = float(os.getenv("EMAIL_JANELA_AGRUPAMENTO_SEGUNDOS", "120"))
+    
     # --- Interface Gráfica (UI/Tkinter) ---
     APP_NAME = "SCEE - Eletrônicos"
     WINDOW_SIZE = "1024x768"
+    # Imagens enviadas para os produtos (src/services/image_pipeline.py):
+    # variantes WebP geradas no upload e processos usados em lotes
+    IMAGENS_PRODUTO_DIR = os.getenv("IMAGENS_PRODUTO_DIR", os.path.join(BASE_DIR, "uploads", "produtos"))
+    IMAGENS_QUALIDADE = int(os.getenv("IMAGENS_QUALIDADE", "85"))
+    IMAGENS_PROCESSOS = int(os.getenv("IMAGENS_PROCESSOS", str(min(4, os.cpu_count() or 1))))
+    # Miniaturas das imagens de produto (src/utils/thumbnail_cache.py)
+    MINIATURAS_DIR = os.getenv("MINIATURAS_DIR", os.path.join(BASE_DIR, "uploads", "cache_miniaturas"))
+    MINIATURAS_MEMORIA_MB = int(os.getenv("MINIATURAS_MEMORIA_MB", "32"))
+    # Threads que geram/decodificam as miniaturas dos cards em segundo plano
+    MINIATURAS_THREADS = int(os.getenv("MINIATURAS_THREADS", "2"))
+    # Telas mantidas vivas (ocultas) para a navegação não recriá-las
+    VIEWS_EM_CACHE = int(os.getenv("VIEWS_EM_CACHE", "4"))
+    # Pausa na digitação (ms) antes de aplicar a busca do catálogo
+    BUSCA_ATRASO_MS = int(os.getenv("BUSCA_ATRASO_MS", "250"))
     
     # Paleta de Cores (Tema Escuro Profissional)
     COLOR_PRIMARY = "#2C3E50"      # Azul Petróleo (Menus)
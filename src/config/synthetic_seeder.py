@@ -0,0 +1,421 @@
+import bisect
+import itertools
+import math
+import random
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src.config.database import DatabaseConnection
+from src.config.database_seeder import DatabaseSeeder
+from src.utils.security.password_hasher import PasswordHasher
+
+
+class SyntheticDataSeeder(DatabaseSeeder):
+    """
+    Gera volumes realistas de dados sintéticos para testes de desempenho.
+
+    A geração é determinística para uma mesma semente. A popularidade dos
+    produtos segue uma distribuição de Zipf (poucos produtos concentram a
+    maior parte das vendas) e os pedidos se concentram nos meses, dias da
+    semana e horários de maior movimento.
+
+    Para carregar milhões de linhas em minutos, os índices secundários e os
+    triggers das tabelas carregadas são removidos antes da carga e recriados
+    no final, e as inserções usam ``executemany`` em transações grandes.
+    """
+
+    # Volumes pré-definidos: (produtos, clientes, pedidos)
+    ESCALAS = {
+        "pequena": (1_000, 500, 5_000),
+        "media": (50_000, 20_000, 250_000),
+        "completa": (500_000, 200_000, 5_000_000),
+    }
+
+    # Linhas por executemany/commit
+    TAMANHO_LOTE = 100_000
+
+    # Tabelas cujos índices e triggers ficam desligados durante a carga
+    TABELAS_CARGA = (
+        "categorias", "produtos", "usuarios", "clientes_info",
+        "enderecos", "pedidos", "itens_pedido",
+    )
+
+    # Expoentes de Zipf: popularidade dos produtos e frequência de compra dos clientes
+    ZIPF_PRODUTOS = 1.0
+    ZIPF_CLIENTES = 0.6
+
+    # Peso relativo de cada mês (jan..dez): Black Friday e Natal em destaque
+    PESO_MES = (0.8, 0.7, 0.85, 0.85, 1.0, 0.9, 0.95, 0.9, 0.9, 1.0, 1.6, 2.0)
+    # Peso relativo de cada dia da semana (seg..dom)
+    PESO_DIA_SEMANA = (1.1, 1.05, 1.0, 1.0, 1.05, 0.85, 0.8)
+    # Peso relativo de cada hora do dia (picos no almoço e à noite)
+    PESO_HORA = (
+        0.2, 0.1, 0.05, 0.05, 0.05, 0.1, 0.3, 0.6, 0.9, 1.0, 1.1, 1.3,
+        1.5, 1.3, 1.1, 1.0, 1.0, 1.1, 1.3, 1.6, 1.9, 1.8, 1.2, 0.6,
+    )
+
+    STATUS_PEDIDO = ("ENTREGUE", "ENVIADO", "PROCESSANDO", "PENDENTE", "CANCELADO")
+    PESO_STATUS = (70, 10, 6, 6, 8)
+    TIPOS_PAGAMENTO = ("PIX", "CARTAO", "BOLETO")
+    PESO_PAGAMENTO = (45, 45, 10)
+    # Quantidade de itens distintos por pedido (1..6)
+    PESO_ITENS_POR_PEDIDO = (45, 25, 14, 8, 5, 3)
+
+    NOMES = (
+        "Ana", "Bruno", "Carla", "Daniel", "Eduarda", "Felipe", "Gabriela", "Heitor",
+        "Isabela", "João", "Larissa", "Marcos", "Natália", "Otávio", "Paula", "Rafael",
+        "Sofia", "Thiago", "Vitória", "William",
+    )
+    SOBRENOMES = (
+        "Silva", "Santos", "Oliveira", "Souza", "Rodrigues", "Ferreira", "Alves",
+        "Pereira", "Lima", "Gomes", "Costa", "Ribeiro", "Martins", "Carvalho", "Almeida",
+    )
+    CIDADES = (
+        ("São Paulo", "SP", "01"), ("Rio de Janeiro", "RJ", "20"), ("Belo Horizonte", "MG", "30"),
+        ("Curitiba", "PR", "80"), ("Porto Alegre", "RS", "90"), ("Salvador", "BA", "40"),
+        ("Recife", "PE", "50"), ("Fortaleza", "CE", "60"), ("Brasília", "DF", "70"),
+        ("Manaus", "AM", "69"),
+    )
+    ADJETIVOS = (
+        "Básico", "Premium", "Compacto", "Profissional", "Clássico", "Moderno",
+        "Ultra", "Essencial", "Deluxe", "Slim",
+    )
+    SUBSTANTIVOS = (
+        "Fone", "Mouse", "Teclado", "Camiseta", "Calça", "Livro", "Luminária",
+        "Garrafa", "Tapete", "Mochila", "Relógio", "Caneca", "Cadeira", "Tênis", "Panela",
+    )
+
+    def __init__(
+        self,
+        db_connection: Optional[DatabaseConnection] = None,
+        semente: int = 42,
+        data_final: str = "2025-12-31",
+        dias_historico: int = 730,
+    ):
+        """
+        Inicializa o gerador.
+
+        Args:
+            db_connection: Instância de DatabaseConnection (opcional).
+            semente: Semente do gerador pseudoaleatório (mesma semente, mesmos dados).
+            data_final: Data do pedido mais recente possível (AAAA-MM-DD). Fixa,
+                para que a geração não dependa do dia em que roda.
+            dias_historico: Quantos dias antes de data_final os pedidos podem ter.
+        """
+        super().__init__(db_connection)
+        self.semente = semente
+        self.rng = random.Random(semente)
+        self.data_final = datetime.strptime(data_final, "%Y-%m-%d")
+        self.dias_historico = dias_historico
+
+    # --- API pública ---
+
+    def seed_volume(
+        self,
+        produtos: int,
+        clientes: int,
+        pedidos: int,
+        categorias: int = 40,
+    ) -> Dict[str, int]:
+        """
+        Popula o banco com os dados básicos do DatabaseSeeder e mais o volume pedido.
+
+        Returns:
+            Quantidade de linhas inseridas por tabela
+        """
+        self.rng.seed(self.semente)
+        self.seed_all()
+
+        indices, triggers = self._desligar_indices_e_triggers()
+        self._configurar_carga(True)
+        try:
+            categoria_ids = self.seed_categorias_sinteticas(categorias)
+            precos = self.seed_produtos_sinteticos(produtos, categoria_ids)
+            enderecos = self.seed_clientes_sinteticos(clientes)
+            total_itens = self.seed_pedidos_sinteticos(pedidos, precos, enderecos)
+        finally:
+            self._configurar_carga(False)
+            self._religar_indices_e_triggers(indices, triggers)
+
+        self.conn.execute("ANALYZE")
+        self.conn.commit()
+        return {
+            "categorias": len(categoria_ids),
+            "produtos": len(precos),
+            "clientes": len(enderecos),
+            "pedidos": pedidos,
+            "itens_pedido": total_itens,
+        }
+
+    def seed_escala(self, escala: str) -> Dict[str, int]:
+        """Popula o banco com uma das escalas de ESCALAS ('pequena', 'media', 'completa')."""
+        if escala not in self.ESCALAS:
+            raise ValueError(f"Escala desconhecida: {escala}. Use uma de {sorted(self.ESCALAS)}")
+        produtos, clientes, pedidos = self.ESCALAS[escala]
+        return self.seed_volume(produtos, clientes, pedidos)
+
+    def seed_categorias_sinteticas(self, quantidade: int) -> List[int]:
+        """Insere categorias e retorna os IDs de todas as categorias ativas."""
+        inicio = self._proximo_id("categorias")
+        self.conn.executemany(
+            "INSERT INTO categorias (id, nome, descricao, ativo) VALUES (?, ?, ?, 1)",
+            [
+                (inicio + i, f"Categoria {inicio + i}", "Categoria gerada para testes de volume")
+                for i in range(quantidade)
+            ],
+        )
+        self.conn.commit()
+        return [row[0] for row in self.conn.execute("SELECT id FROM categorias WHERE ativo = 1")]
+
+    def seed_produtos_sinteticos(self, quantidade: int, categoria_ids: Sequence[int]) -> Dict[int, float]:
+        """
+        Insere produtos com preços log-normais.
+
+        Returns:
+            Preço de cada produto (existente ou novo), indexado pelo ID
+        """
+        inicio = self._proximo_id("produtos")
+        rng = self.rng
+
+        def linhas() -> Iterator[Tuple]:
+            for produto_id in range(inicio, inicio + quantidade):
+                nome = f"{rng.choice(self.SUBSTANTIVOS)} {rng.choice(self.ADJETIVOS)} {produto_id}"
+                preco = round(min(5000.0, math.exp(rng.gauss(4.2, 0.9))), 2)
+                yield (
+                    produto_id, nome, f"Descrição de {nome}", preco, f"SINT-{produto_id:08d}",
+                    rng.choice(categoria_ids), rng.randint(0, 500), int(rng.random() > 0.03),
+                    round(rng.uniform(0.1, 15.0), 2), rng.randint(2, 60),
+                    rng.randint(5, 60), rng.randint(5, 80),
+                )
+
+        self._inserir_em_lotes(
+            """INSERT INTO produtos
+               (id, nome, descricao, preco, sku, categoria_id, estoque, ativo,
+                peso_kg, altura_cm, largura_cm, comprimento_cm)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            linhas(),
+        )
+        return {row[0]: row[1] for row in self.conn.execute("SELECT id, preco FROM produtos")}
+
+    def seed_clientes_sinteticos(self, quantidade: int) -> Dict[int, List[int]]:
+        """
+        Insere clientes (usuário, dados de cliente e 1 a 3 endereços).
+        Todos usam a senha 'cliente123' (um único hash, reaproveitado).
+
+        Returns:
+            IDs de endereço de cada cliente novo, indexados pelo ID do usuário
+        """
+        rng = self.rng
+        senha_hash = PasswordHasher.hash_password("cliente123")
+        primeiro_usuario = self._proximo_id("usuarios")
+        proximo_endereco = self._proximo_id("enderecos")
+        ids = range(primeiro_usuario, primeiro_usuario + quantidade)
+
+        self._inserir_em_lotes(
+            """INSERT INTO usuarios (id, nome, email, senha_hash, tipo)
+               VALUES (?, ?, ?, ?, 'cliente')""",
+            (
+                (uid, f"{rng.choice(self.NOMES)} {rng.choice(self.SOBRENOMES)}",
+                 f"cliente{uid}@exemplo.com", senha_hash)
+                for uid in ids
+            ),
+        )
+        self._inserir_em_lotes(
+            """INSERT INTO clientes_info (usuario_id, cpf, telefone, data_nascimento)
+               VALUES (?, ?, ?, ?)""",
+            (
+                (uid, self._cpf(uid), f"({rng.randint(11, 99)}) 9{rng.randint(0, 99999999):08d}",
+                 f"{rng.randint(1950, 2006)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}")
+                for uid in ids
+            ),
+        )
+
+        enderecos: Dict[int, List[int]] = {}
+
+        def linhas_endereco() -> Iterator[Tuple]:
+            nonlocal proximo_endereco
+            for uid in ids:
+                quantidade_enderecos = rng.choices((1, 2, 3), cum_weights=(70, 95, 100))[0]
+                enderecos[uid] = list(range(proximo_endereco, proximo_endereco + quantidade_enderecos))
+                for ordem, endereco_id in enumerate(enderecos[uid]):
+                    cidade, estado, prefixo_cep = rng.choice(self.CIDADES)
+                    yield (
+                        endereco_id, uid, f"Rua {rng.choice(self.SOBRENOMES)}", str(rng.randint(1, 3000)),
+                        None, "Centro", cidade, estado,
+                        f"{prefixo_cep}{rng.randint(0, 999):03d}-{rng.randint(0, 999):03d}",
+                        int(ordem == 0),
+                    )
+                proximo_endereco += quantidade_enderecos
+
+        self._inserir_em_lotes(
+            """INSERT INTO enderecos
+               (id, usuario_id, logradouro, numero, complemento, bairro, cidade, estado, cep, principal)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            linhas_endereco(),
+        )
+        return enderecos
+
+    def seed_pedidos_sinteticos(
+        self,
+        quantidade: int,
+        precos: Dict[int, float],
+        enderecos: Dict[int, List[int]],
+    ) -> int:
+        """
+        Insere pedidos e seus itens. Produtos e clientes são sorteados por Zipf;
+        a data do pedido segue a sazonalidade de PESO_MES, PESO_DIA_SEMANA e PESO_HORA.
+
+        Returns:
+            Quantidade de itens de pedido inseridos
+        """
+        if quantidade <= 0 or not precos or not enderecos:
+            return 0
+
+        rng = self.rng
+        sortear_produto = self._sorteador_zipf(list(precos), self.ZIPF_PRODUTOS)
+        sortear_cliente = self._sorteador_zipf(list(enderecos), self.ZIPF_CLIENTES)
+        sortear_data = self._sorteador_datas()
+        nomes = {row[0]: row[1] for row in self.conn.execute("SELECT id, nome FROM produtos")}
+        primeiro_pedido = self._proximo_id("pedidos")
+        # Pesos acumulados calculados uma vez (random.choices refaria a soma a cada sorteio)
+        acum_itens = list(itertools.accumulate(self.PESO_ITENS_POR_PEDIDO))
+        acum_status = list(itertools.accumulate(self.PESO_STATUS))
+        acum_pagamento = list(itertools.accumulate(self.PESO_PAGAMENTO))
+        itens: List[Tuple] = []
+        total_itens = 0
+
+        def linhas_pedido() -> Iterator[Tuple]:
+            nonlocal total_itens
+            for pedido_id in range(primeiro_pedido, primeiro_pedido + quantidade):
+                usuario_id = sortear_cliente()
+                n_itens = rng.choices(range(1, 7), cum_weights=acum_itens)[0]
+                produtos = {sortear_produto() for _ in range(n_itens)}
+                subtotal = 0.0
+                for produto_id in produtos:
+                    qtd = rng.choices((1, 2, 3), cum_weights=(85, 97, 100))[0]
+                    preco = precos[produto_id]
+                    subtotal += preco * qtd
+                    itens.append((pedido_id, produto_id, nomes[produto_id], qtd, preco, round(preco * qtd, 2)))
+                total_itens += len(produtos)
+                subtotal = round(subtotal, 2)
+                frete = 0.0 if subtotal >= 299 else round(rng.uniform(12, 45), 2)
+                criado_em = sortear_data()
+                yield (
+                    pedido_id, usuario_id, rng.choice(enderecos[usuario_id]), subtotal, frete,
+                    round(subtotal + frete, 2), rng.choices(self.STATUS_PEDIDO, cum_weights=acum_status)[0],
+                    rng.choices(self.TIPOS_PAGAMENTO, cum_weights=acum_pagamento)[0], criado_em, criado_em,
+                )
+
+        consulta_pedido = """INSERT INTO pedidos
+               (id, usuario_id, endereco_id, subtotal, frete, total, status, tipo_pagamento,
+                criado_em, atualizado_em)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+        consulta_item = """INSERT INTO itens_pedido
+               (pedido_id, produto_id, nome_produto, quantidade, preco_unitario, subtotal)
+               VALUES (?, ?, ?, ?, ?, ?)"""
+
+        gerador = linhas_pedido()
+        while True:
+            lote = list(itertools.islice(gerador, self.TAMANHO_LOTE))
+            if not lote:
+                break
+            self.conn.executemany(consulta_pedido, lote)
+            self.conn.executemany(consulta_item, itens)
+            self.conn.commit()
+            itens.clear()
+
+        return total_itens
+
+    # --- Métodos privados ---
+
+    def _inserir_em_lotes(self, consulta: str, linhas: Iterable[Tuple]) -> int:
+        """Executa ``consulta`` com executemany, um commit a cada TAMANHO_LOTE linhas."""
+        total = 0
+        iterador = iter(linhas)
+        while True:
+            lote = list(itertools.islice(iterador, self.TAMANHO_LOTE))
+            if not lote:
+                break
+            self.conn.executemany(consulta, lote)
+            self.conn.commit()
+            total += len(lote)
+        return total
+
+    def _proximo_id(self, tabela: str) -> int:
+        return self.conn.execute(f"SELECT COALESCE(MAX(id), 0) + 1 FROM {tabela}").fetchone()[0]
+
+    @staticmethod
+    def _cpf(usuario_id: int) -> str:
+        """CPF fictício e único derivado do ID (não passa na validação de dígitos)."""
+        digitos = f"{usuario_id:011d}"
+        return f"{digitos[:3]}.{digitos[3:6]}.{digitos[6:9]}-{digitos[9:]}"
+
+    def _sorteador_zipf(self, ids: List[int], expoente: float):
+        """Sorteia IDs com probabilidade ∝ 1/rank^expoente; o rank de cada ID é embaralhado."""
+        ids = list(ids)
+        self.rng.shuffle(ids)
+        acumulado = list(itertools.accumulate(1.0 / (rank ** expoente) for rank in range(1, len(ids) + 1)))
+        total = acumulado[-1]
+        aleatorio = self.rng.random
+
+        def sortear() -> int:
+            return ids[bisect.bisect(acumulado, aleatorio() * total)]
+
+        return sortear
+
+    def _sorteador_datas(self):
+        """Sorteia datas/horas de pedido ponderadas por mês, dia da semana e hora."""
+        inicio = self.data_final - timedelta(days=self.dias_historico - 1)
+        dias = [inicio + timedelta(days=d) for d in range(self.dias_historico)]
+        acumulado_dias = list(itertools.accumulate(
+            self.PESO_MES[dia.month - 1] * self.PESO_DIA_SEMANA[dia.weekday()] for dia in dias
+        ))
+        acumulado_horas = list(itertools.accumulate(self.PESO_HORA))
+        rng = self.rng
+
+        def sortear() -> str:
+            dia = dias[bisect.bisect(acumulado_dias, rng.random() * acumulado_dias[-1])]
+            hora = bisect.bisect(acumulado_horas, rng.random() * acumulado_horas[-1])
+            momento = dia + timedelta(hours=hora, seconds=rng.randrange(3600))
+            return momento.strftime("%Y-%m-%d %H:%M:%S")
+
+        return sortear
+
+    def _desligar_indices_e_triggers(self) -> Tuple[List[str], List[str]]:
+        """Remove índices secundários e triggers das tabelas de carga, devolvendo seu SQL."""
+        marcadores = ",".join("?" * len(self.TABELAS_CARGA))
+        linhas = self.conn.execute(
+            f"""SELECT type, name, sql FROM sqlite_master
+                WHERE type IN ('index', 'trigger') AND sql IS NOT NULL
+                AND tbl_name IN ({marcadores})""",
+            self.TABELAS_CARGA,
+        ).fetchall()
+
+        indices = [sql for tipo, _, sql in linhas if tipo == "index"]
+        triggers = [sql for tipo, _, sql in linhas if tipo == "trigger"]
+        for tipo, nome, _ in linhas:
+            self.conn.execute(f"DROP {'INDEX' if tipo == 'index' else 'TRIGGER'} IF EXISTS {nome}")
+        self.conn.commit()
+        return indices, triggers
+
+    def _religar_indices_e_triggers(self, indices: List[str], triggers: List[str]) -> None:
+        try:
+            for sql in indices + triggers:
+                self.conn.execute(sql)
+            self.conn.commit()
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            print(f"Erro ao recriar índices e triggers: {e}")
+            raise
+
+    def _configurar_carga(self, ligar: bool) -> None:
+        """Troca a durabilidade por velocidade durante a carga (e desfaz no final)."""
+        if ligar:
+            self.conn.execute("PRAGMA foreign_keys = OFF")
+            self.conn.execute("PRAGMA synchronous = OFF")
+            self.conn.execute("PRAGMA cache_size = -200000")
+        else:
+            self.conn.execute("PRAGMA synchronous = FULL")
+            self.conn.execute("PRAGMA cache_size = -2000")
+            self.conn.execute("PRAGMA foreign_keys = ON")
@@ -2,11 +2,19 @@
 AdminController - Controlador do Administrador
 """
 
+import logging
 from typing import Dict, Any
 from src.controllers.base_controller import BaseController
 from src.repositories.product_repository import ProductRepository
 from src.repositories.order_repository import PedidoRepository
 from src.repositories.category_repository import CategoryRepository
+from src.repositories.email_outbox_repository import EmailOutboxRepository
+from src.services.email_service import EmailService
+from src.services.catalog_service import CatalogService
+from src.utils.action_metrics import metricas
+from src.utils.ui_watchdog import monitor_travamentos
+
+logger = logging.getLogger(__name__)
 
 
 class AdminController(BaseController):
@@ -16,6 +24,8 @@ class AdminController(BaseController):
         self.product_repo = ProductRepository()
         self.order_repo = PedidoRepository()
         self.category_repo = CategoryRepository()
+        self.email_service = EmailService(outbox=EmailOutboxRepository())
+        self.catalog_service = CatalogService()
         self.current_admin_id = None
 
     def set_current_admin(self, admin_id: int) -> None:
@@ -26,8 +36,7 @@ class AdminController(BaseController):
         try:
             total_vendas = self.order_repo.calcular_total_vendas()
             pendentes = self.order_repo.contar_por_status("PROCESSANDO")
-            todos_produtos = self.product_repo.listar()
-            qtd_produtos = len(todos_produtos)
+            qtd_produtos = self.product_repo.contar()
 
             stats = {
                 "total_vendas": total_vendas,
@@ -55,13 +64,45 @@ class AdminController(BaseController):
         except Exception as e:
             return self._error_response("Erro ao listar pedidos", e)
 
+    def count_orders(self) -> Dict[str, Any]:
+        try:
+            return self._success_response("Total de pedidos", self.order_repo.contar())
+        except Exception as e:
+            return self._error_response("Erro ao contar pedidos", e)
+
+    def list_orders_page(self, inicio: int, quantidade: int, ordenar_por: str = None,
+                         decrescente: bool = True, apos: Dict[str, Any] = None,
+                         antes: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Janela de pedidos para a tabela paginada (ordenada no banco; apos/antes = keyset)."""
+        try:
+            pedidos = self.order_repo.listar_pagina(
+                inicio, quantidade, ordenar_por or "criado_em", decrescente, apos, antes
+            )
+            return self._success_response("Pedidos listados", pedidos)
+        except Exception as e:
+            return self._error_response("Erro ao listar pedidos", e)
+
     def update_order_status(self, pedido_id: int, novo_status: str) -> Dict[str, Any]:
         try:
             self.order_repo.atualizar_status(pedido_id, novo_status)
+            self._notificar_status(pedido_id, novo_status)
             return self._success_response(f"Status atualizado para {novo_status}")
         except Exception as e:
             return self._error_response("Erro ao atualizar status", e)
 
+    def _notificar_status(self, pedido_id: int, novo_status: str) -> None:
+        """Enfileira o aviso ao cliente; falhas não desfazem a mudança de status."""
+        try:
+            pedido = self.order_repo.buscar_completo(pedido_id)
+            if pedido and pedido.get("cliente_email"):
+                self.email_service.enfileirar_atualizacao_pedido(
+                    {"nome": pedido["cliente_nome"], "email": pedido["cliente_email"]},
+                    pedido,
+                    novo_status,
+                )
+        except Exception as e:
+            logger.warning(f"Falha ao enfileirar aviso do pedido {pedido_id}: {e}")
+
     # --- CATEGORIAS ---
 
     def list_all_categories(self) -> Dict[str, Any]:
@@ -126,3 +167,51 @@ class AdminController(BaseController):
             return self._success_response("Detalhes", pedido)
         except Exception as e:
             return self._error_response("Erro", e)
+
+    # --- Imagens ---
+
+    def collect_orphan_images(self) -> Dict[str, Any]:
+        """Apaga os arquivos de imagem que nenhum produto referencia."""
+        try:
+            removidas = self.catalog_service.coletar_imagens_orfas()
+            return self._success_response(f"{removidas} imagem(ns) sem uso removida(s)", removidas)
+        except OSError as e:
+            return self._error_response("Erro ao remover imagens sem uso", e)
+
+    # --- Diagnóstico (métricas das ações dos controllers) ---
+
+    def get_action_metrics(self) -> Dict[str, Any]:
+        """Resumo por ação e log de ações lentas."""
+        return self._success_response("Métricas", {
+            "ativo": metricas.ativo,
+            "limite_lento_ms": metricas.limite_lento_ms,
+            "acoes": metricas.resumo(),
+            "lentas": metricas.lentas(),
+        })
+
+    def set_metrics_enabled(self, ativo: bool) -> Dict[str, Any]:
+        metricas.ativo = bool(ativo)
+        return self._success_response("Coleta ativada" if ativo else "Coleta desativada")
+
+    def reset_action_metrics(self) -> Dict[str, Any]:
+        metricas.limpar()
+        return self._success_response("Métricas zeradas")
+
+    def get_ui_stalls(self) -> Dict[str, Any]:
+        """Responsividade do loop de eventos e piores travamentos por tela."""
+        return self._success_response("Travamentos", {
+            "geral": monitor_travamentos.responsividade(),
+            "vistas": monitor_travamentos.resumo(),
+            "piores": monitor_travamentos.piores(),
+        })
+
+    def reset_ui_stalls(self) -> Dict[str, Any]:
+        monitor_travamentos.limpar()
+        return self._success_response("Travamentos zerados")
+
+    def export_action_metrics(self, caminho: str) -> Dict[str, Any]:
+        try:
+            metricas.exportar_json(caminho)
+            return self._success_response(f"Métricas exportadas para {caminho}")
+        except OSError as e:
+            return self._error_response("Erro ao exportar métricas", e)
@@ -7,6 +7,7 @@ Gerencia autenticação, registro e logout de usuários.
 from typing import Dict, Any
 from src.controllers.base_controller import BaseController
 from src.services.auth_service import AuthService
+from src.services.login_throttle_service import LoginBloqueadoError
 from src.repositories.user_repository import UsuarioRepository
 from src.models.users.client_model import Cliente
 from src.models.users.admin_model import Administrador
@@ -71,6 +72,9 @@ class AuthController(BaseController):
             else:
                 return self._error_response('Email ou senha incorretos')
         
+        except LoginBloqueadoError as e:
+            return self._error_response(str(e), e)
+        
         except Exception as e:
             return self._error_response(
                 'Erro ao processar login',
@@ -4,8 +4,13 @@ BaseController - Controlador Base Abstrato
 
 Classe abstrata que define o contrato para todos os controllers.
 """
+import inspect
 from abc import ABC
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, Optional
+
+from src.repositories.data_version_repository import VersaoDadosRepository
+from src.utils.action_metrics import metricas
+from src.utils.task_runner import Tarefa, executor_tarefas
 
 
 class BaseController(ABC):
@@ -16,8 +21,20 @@ class BaseController(ABC):
     - Gerenciar referência à MainWindow (navegação)
     - Padronizar formato de respostas
     - Fornecer métodos utilitários comuns
+    - Cronometrar as ações públicas (ver src/utils/action_metrics.py)
+    - Rodar trabalho pesado fora da thread do Tkinter (run_in_background)
+    - Informar a versão dos dados às views persistentes (data_versions)
     """
     
+    def __init_subclass__(cls, **kwargs):
+        """Instrumenta os métodos públicos definidos na subclasse."""
+        super().__init_subclass__(**kwargs)
+        for nome, atributo in list(vars(cls).items()):
+            if (nome.startswith('_') or not inspect.isfunction(atributo)
+                    or hasattr(atributo, '_acao_instrumentada')):
+                continue
+            setattr(cls, nome, metricas.instrumentar(f"{cls.__name__}.{nome}")(atributo))
+    
     def __init__(self, main_window):
         """
         Inicializa o controller com referência à janela principal.
@@ -92,6 +109,50 @@ class BaseController(ABC):
             return f"{field_name} deve ter pelo menos {min_length} caracteres"
         return None
     
+    def run_in_background(
+        self,
+        view,
+        func: Callable,
+        *args,
+        on_success: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        on_loading: Optional[Callable[[bool], None]] = None,
+        **kwargs,
+    ) -> Tarefa:
+        """
+        Executa func(*args, **kwargs) num pool de threads, sem travar a tela.
+        
+        Os callbacks rodam na thread do Tkinter. Se a view for destruída
+        antes do fim, a tarefa é cancelada e nenhum callback é chamado.
+        
+        Args:
+            view: Widget dono da tarefa
+            func: Trabalho a executar (consultas, serviços, hash)
+            on_success: Recebe o retorno de func
+            on_error: Recebe a exceção lançada por func
+            on_loading: Chamado com True ao iniciar e False ao terminar
+            
+        Returns:
+            Tarefa (permite cancelar)
+        """
+        return executor_tarefas.submeter(
+            view, func, *args,
+            ao_concluir=on_success, ao_falhar=on_error, carregando=on_loading,
+            **kwargs
+        )
+    
+    def cancel_background(self, view) -> None:
+        """Cancela as tarefas em segundo plano da view."""
+        executor_tarefas.cancelar_do_dono(view)
+    
+    def data_versions(self, *tabelas: str) -> Dict[str, int]:
+        """
+        Versões atuais das tabelas (incrementadas a cada alteração).
+        Views persistentes comparam com as versões da última carga para
+        decidir se precisam recarregar ao voltar a ser exibidas.
+        """
+        return VersaoDadosRepository().versoes(tabelas)
+    
     def navigate_to(self, view_name: str, data: Optional[Any] = None) -> None:
         """
         Navega para outra view.
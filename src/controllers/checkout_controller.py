@@ -3,6 +3,7 @@ CheckoutController - Controlador de Checkout
 ===========================================
 Gerencia o processo de finalização de compra e cadastro de endereços.
 """
+import os
 from typing import Dict, Any
 from src.controllers.base_controller import BaseController
 from src.services.checkout_service import CheckoutService
@@ -11,10 +12,15 @@ from src.repositories.order_repository import PedidoRepository
 from src.repositories.product_repository import ProductRepository
 from src.repositories.address_repository import EnderecoRepository
 from src.repositories.user_repository import UsuarioRepository 
+from src.repositories.email_outbox_repository import EmailOutboxRepository
 from src.services.email_service import EmailService
 from src.integration.payment.credit_card_gateway import CreditCardGateway
 from src.integration.payment.pix_gateway import PixGateway
 from src.integration.shipping.correios_calculator import CorreiosCalculator
+from src.integration.shipping.transportadora_calculator import TransportadoraCalculator
+from src.integration.shipping.rate_table import TabelaFreteCalculator
+from src.services.freight_quote_service import CotacaoFreteService
+from src.config.settings import Config
 
 
 class CheckoutController(BaseController):
@@ -22,6 +28,20 @@ class CheckoutController(BaseController):
     Controller para operações de checkout e endereço.
     """
     
+    # Compartilhado entre instâncias: o cache de cotações sobrevive às
+    # re-renderizações da CheckoutView
+    _cotacao_frete = None
+    
+    @classmethod
+    def _get_cotacao_frete(cls) -> CotacaoFreteService:
+        if cls._cotacao_frete is None:
+            calculadoras = [CorreiosCalculator(), TransportadoraCalculator()]
+            # A tabela só é mapeada na primeira consulta (sem custo de startup)
+            if os.path.exists(Config.FRETE_TABELA_PATH):
+                calculadoras.append(TabelaFreteCalculator(Config.FRETE_TABELA_PATH))
+            cls._cotacao_frete = CotacaoFreteService(calculadoras)
+        return cls._cotacao_frete
+    
     def __init__(self, main_window):
         super().__init__(main_window)
         self.carrinho_repo = CarrinhoRepository()
@@ -29,9 +49,9 @@ class CheckoutController(BaseController):
         self.product_repo = ProductRepository()
         self.address_repo = EnderecoRepository()
         self.user_repo = UsuarioRepository() 
-        self.email_service = EmailService()
+        self.email_service = EmailService(outbox=EmailOutboxRepository())
         self.current_usuario_id = None
-        self.frete_calculator = CorreiosCalculator()
+        self.frete_calculator = self._get_cotacao_frete()
     
     def set_current_user(self, usuario_id: int) -> None:
         self.current_usuario_id = usuario_id
@@ -78,6 +98,27 @@ class CheckoutController(BaseController):
         except Exception as e:
             return self._error_response("Erro ao salvar endereço", e)
     
+    def get_shipping_quote(self, endereco_id: int) -> Dict[str, Any]:
+        """Cota o frete do carrinho atual para o endereço informado."""
+        if not self.current_usuario_id:
+            return self._error_response('Usuário não autenticado')
+        
+        try:
+            endereco = self.address_repo.buscar_por_id(endereco_id)
+            if not endereco:
+                return self._error_response('Endereço não encontrado')
+            
+            carrinho = self.carrinho_repo.buscar_por_usuario(self.current_usuario_id)
+            itens = self.carrinho_repo.listar_itens(carrinho['id']) if carrinho else []
+            if not itens:
+                return self._error_response('Carrinho vazio')
+            
+            peso_total = CheckoutService.calcular_peso_total(itens)
+            cotacao = self.frete_calculator.cotar(endereco['cep'], peso_total)
+            return self._success_response('Frete cotado', cotacao)
+        except Exception as e:
+            return self._error_response('Erro ao cotar frete', e)
+    
     def process_order(
         self,
         endereco_id: int,
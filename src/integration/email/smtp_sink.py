@@ -0,0 +1,198 @@
+"""Servidor SMTP local (asyncio) que guarda as mensagens em memória.
+
+Usado em testes e benchmarks do transporte SMTP: aceita EHLO com
+PIPELINING, AUTH PLAIN opcional, MAIL/RCPT/DATA/RSET/NOOP/QUIT e
+contabiliza conexões, para verificar o reuso pelo pool.
+
+Exemplo::
+
+    with SMTPSinkLocal(usuario="app", senha="segredo") as sink:
+        pool = PoolSMTP(sink.host, sink.port, usuario="app", senha="segredo")
+        ...
+        assert len(sink.mensagens) == 10
+"""
+import asyncio
+import base64
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class SMTPSinkLocal:
+    """Servidor SMTP mínimo rodando em uma thread com loop asyncio próprio."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        usuario: Optional[str] = None,
+        senha: Optional[str] = None,
+        recusar: Iterable[str] = (),
+    ):
+        """
+        Args:
+            host: Endereço de escuta
+            port: Porta (0 = escolhida pelo sistema; veja ``self.port`` após iniciar)
+            usuario: Exige AUTH PLAIN com esse usuário (None = sem autenticação)
+            senha: Senha esperada no AUTH
+            recusar: Destinatários recusados no RCPT TO (550)
+        """
+        self.host = host
+        self.port = port
+        self.usuario = usuario
+        self.senha = senha
+        self.recusar = set(recusar)
+
+        self.mensagens: List[Dict[str, Any]] = []
+        self.conexoes = 0
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._servidor: Optional[asyncio.AbstractServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pronto = threading.Event()
+
+    # --- Ciclo de vida ---
+
+    def iniciar(self) -> "SMTPSinkLocal":
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._executar, name="smtp-sink", daemon=True)
+        self._thread.start()
+        self._pronto.wait()
+        return self
+
+    def parar(self) -> None:
+        if self._loop is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop = None
+
+    def __enter__(self) -> "SMTPSinkLocal":
+        return self.iniciar()
+
+    def __exit__(self, *exc) -> None:
+        self.parar()
+
+    def _executar(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._servidor = self._loop.run_until_complete(
+            asyncio.start_server(self._atender, self.host, self.port)
+        )
+        self.port = self._servidor.sockets[0].getsockname()[1]
+        self._pronto.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            # Encerra as sessões ainda abertas antes de fechar o servidor
+            pendentes = asyncio.all_tasks(self._loop)
+            for tarefa in pendentes:
+                tarefa.cancel()
+            self._loop.run_until_complete(asyncio.gather(*pendentes, return_exceptions=True))
+            self._servidor.close()
+            self._loop.run_until_complete(self._servidor.wait_closed())
+            self._loop.close()
+
+    # --- Protocolo ---
+
+    async def _atender(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.conexoes += 1
+        autenticado = self.usuario is None
+        remetente: Optional[str] = None
+        destinatarios: List[str] = []
+
+        def responder(linha: str) -> None:
+            writer.write(linha.encode() + b"\r\n")
+
+        responder("220 scee-sink ESMTP")
+        try:
+            while True:
+                await writer.drain()
+                linha = await reader.readline()
+                if not linha:
+                    break
+                comando = linha.decode("utf-8", "replace").rstrip("\r\n")
+                verbo, _, argumento = comando.partition(" ")
+                verbo = verbo.upper()
+
+                if verbo == "EHLO":
+                    responder("250-scee-sink")
+                    responder("250-PIPELINING")
+                    responder("250-8BITMIME")
+                    if self.usuario is not None:
+                        responder("250-AUTH PLAIN")
+                    responder("250 SIZE 10485760")
+                elif verbo == "HELO":
+                    responder("250 scee-sink")
+                elif verbo == "AUTH":
+                    autenticado = self._autenticar(argumento)
+                    responder("235 Autenticado" if autenticado else "535 Credenciais invalidas")
+                elif verbo == "MAIL":
+                    if not autenticado:
+                        responder("530 Autenticacao necessaria")
+                        continue
+                    remetente = self._endereco(argumento)
+                    destinatarios = []
+                    responder("250 OK")
+                elif verbo == "RCPT":
+                    if remetente is None:
+                        responder("503 MAIL primeiro")
+                        continue
+                    destinatario = self._endereco(argumento)
+                    if destinatario in self.recusar:
+                        responder("550 Destinatario recusado")
+                        continue
+                    destinatarios.append(destinatario)
+                    responder("250 OK")
+                elif verbo == "DATA":
+                    if not destinatarios:
+                        responder("503 RCPT primeiro")
+                        continue
+                    responder("354 Termine com <CRLF>.<CRLF>")
+                    await writer.drain()
+                    dados = await self._ler_dados(reader)
+                    self.mensagens.append(
+                        {"remetente": remetente, "destinatarios": destinatarios, "dados": dados}
+                    )
+                    remetente, destinatarios = None, []
+                    responder("250 OK mensagem aceita")
+                elif verbo == "RSET":
+                    remetente, destinatarios = None, []
+                    responder("250 OK")
+                elif verbo == "NOOP":
+                    responder("250 OK")
+                elif verbo == "QUIT":
+                    responder("221 Tchau")
+                    await writer.drain()
+                    break
+                else:
+                    responder("502 Comando nao implementado")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def _autenticar(self, argumento: str) -> bool:
+        mecanismo, _, credencial = argumento.partition(" ")
+        if mecanismo.upper() != "PLAIN" or not credencial:
+            return False
+        try:
+            _, usuario, senha = base64.b64decode(credencial).decode().split("\0")
+        except ValueError:
+            return False
+        return usuario == self.usuario and senha == (self.senha or "")
+
+    @staticmethod
+    def _endereco(argumento: str) -> str:
+        _, _, endereco = argumento.partition(":")
+        return endereco.strip().strip("<>")
+
+    @staticmethod
+    async def _ler_dados(reader: asyncio.StreamReader) -> bytes:
+        linhas = []
+        while True:
+            linha = await reader.readline()
+            if not linha or linha == b".\r\n":
+                break
+            if linha.startswith(b".."):
+                linha = linha[1:]
+            linhas.append(linha)
+        return b"".join(linhas)
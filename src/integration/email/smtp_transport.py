@@ -0,0 +1,281 @@
+"""Transporte SMTP com pool de conexões persistentes.
+
+Mantém até ``max_conexoes`` sessões SMTP abertas e autenticadas, reusadas
+entre envios (sem novo handshake TCP/TLS/AUTH por email). Quando o
+servidor anuncia PIPELINING (RFC 2920), o envelope de cada mensagem
+(MAIL FROM, RCPT TO..., DATA) é enviado de uma vez e as respostas são
+lidas em seguida, economizando uma ida e volta por comando. Um limitador
+token bucket respeita a taxa máxima de mensagens aceita pelo servidor.
+"""
+import logging
+import queue
+import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.message import EmailMessage
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SMTPTransportError(Exception):
+    """Erro de envio pelo transporte SMTP."""
+
+    pass
+
+
+# (remetente, destinatários, mensagem)
+Envio = Tuple[str, Sequence[str], EmailMessage]
+
+
+class LimitadorTaxa:
+    """Token bucket: no máximo ``taxa`` mensagens/s, com rajadas de até ``rajada``."""
+
+    def __init__(self, taxa: float, rajada: int = 1, relogio=time.monotonic, dormir=time.sleep):
+        if taxa <= 0:
+            raise ValueError("A taxa deve ser positiva")
+        self.taxa = taxa
+        self.rajada = max(1, rajada)
+        self._relogio = relogio
+        self._dormir = dormir
+        self._fichas = float(self.rajada)
+        self._ultima = relogio()
+        self._lock = threading.Lock()
+
+    def aguardar(self) -> None:
+        """Bloqueia até haver uma ficha disponível e a consome."""
+        with self._lock:
+            agora = self._relogio()
+            self._fichas = min(self.rajada, self._fichas + (agora - self._ultima) * self.taxa)
+            self._ultima = agora
+            self._fichas -= 1
+            espera = -self._fichas / self.taxa if self._fichas < 0 else 0.0
+        if espera > 0:
+            self._dormir(espera)
+
+
+class _ConexaoSMTP:
+    """Uma sessão SMTP autenticada, reaberta sob demanda."""
+
+    def __init__(self, pool: "PoolSMTP"):
+        self._pool = pool
+        self._smtp: Optional[smtplib.SMTP] = None
+        self.enviadas = 0
+
+    def _abrir(self) -> smtplib.SMTP:
+        pool = self._pool
+        smtp = smtplib.SMTP(pool.host, pool.port, timeout=pool.timeout)
+        smtp.ehlo()
+        if pool.usar_tls:
+            smtp.starttls()
+            smtp.ehlo()
+        if pool.usuario:
+            smtp.login(pool.usuario, pool.senha or "")
+        self.enviadas = 0
+        return smtp
+
+    def fechar(self) -> None:
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                self._smtp.close()
+            self._smtp = None
+
+    def enviar(self, remetente: str, destinatarios: Sequence[str], dados: bytes) -> None:
+        if self.enviadas >= self._pool.max_mensagens_por_conexao:
+            self.fechar()
+
+        for tentativa in range(2):
+            if self._smtp is None:
+                self._smtp = self._abrir()
+            try:
+                if self._smtp.has_extn("pipelining"):
+                    self._enviar_pipeline(remetente, destinatarios, dados)
+                else:
+                    self._smtp.sendmail(remetente, list(destinatarios), dados)
+                self.enviadas += 1
+                return
+            except smtplib.SMTPServerDisconnected:
+                # Conexão ociosa derrubada pelo servidor: reabre uma vez
+                self._smtp = None
+                if tentativa:
+                    raise
+
+    def _enviar_pipeline(self, remetente: str, destinatarios: Sequence[str], dados: bytes) -> None:
+        smtp = self._smtp
+        smtp.putcmd("mail", f"FROM:<{remetente}>")
+        for destinatario in destinatarios:
+            smtp.putcmd("rcpt", f"TO:<{destinatario}>")
+        smtp.putcmd("data")
+
+        codigo, resposta = smtp.getreply()
+        respostas_rcpt = [smtp.getreply() for _ in destinatarios]
+        codigo_data, resposta_data = smtp.getreply()
+
+        if codigo != 250:
+            self._abortar(codigo_data)
+            raise smtplib.SMTPSenderRefused(codigo, resposta, remetente)
+        recusados = {
+            dest: resp for dest, resp in zip(destinatarios, respostas_rcpt) if resp[0] not in (250, 251)
+        }
+        if len(recusados) == len(destinatarios):
+            self._abortar(codigo_data)
+            raise smtplib.SMTPRecipientsRefused(recusados)
+        if codigo_data != 354:
+            raise smtplib.SMTPDataError(codigo_data, resposta_data)
+
+        # Normaliza as quebras de linha para CRLF e duplica pontos no início de linha
+        corpo = smtplib.bCRLF.join(
+            (b"." + linha if linha.startswith(b".") else linha)
+            for linha in dados.replace(b"\r\n", b"\n").split(b"\n")
+        )
+        if not corpo.endswith(smtplib.bCRLF):
+            corpo += smtplib.bCRLF
+        smtp.send(corpo + b"." + smtplib.bCRLF)
+
+        codigo, resposta = smtp.getreply()
+        if codigo != 250:
+            raise smtplib.SMTPDataError(codigo, resposta)
+        if recusados:
+            # Entregue aos demais; reenviar duplicaria a mensagem
+            logger.warning(f"Destinatários recusados: {', '.join(recusados)}")
+
+    def _abortar(self, codigo_data: int) -> None:
+        """Descarta uma transação cujo envelope foi recusado."""
+        if codigo_data == 354:
+            # O servidor aceitou o DATA: encerra a mensagem vazia antes do RSET
+            self._smtp.send(b"." + smtplib.bCRLF)
+            self._smtp.getreply()
+        self._smtp.rset()
+
+
+class PoolSMTP:
+    """Pool de conexões SMTP persistentes com envio em lote."""
+
+    # Reabre a conexão após esse número de mensagens (limite comum em servidores)
+    MAX_MENSAGENS_POR_CONEXAO = 1000
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 25,
+        usuario: Optional[str] = None,
+        senha: Optional[str] = None,
+        usar_tls: bool = False,
+        max_conexoes: int = 4,
+        mensagens_por_segundo: Optional[float] = None,
+        timeout: float = 30.0,
+    ):
+        """
+        Args:
+            host: Servidor SMTP
+            port: Porta do servidor
+            usuario: Usuário para AUTH (None = sem autenticação)
+            senha: Senha para AUTH
+            usar_tls: Usa STARTTLS após o EHLO
+            max_conexoes: Conexões simultâneas abertas no servidor
+            mensagens_por_segundo: Taxa máxima aceita pelo servidor (None = sem limite)
+            timeout: Timeout de socket (s)
+        """
+        if max_conexoes < 1:
+            raise ValueError("max_conexoes deve ser ao menos 1")
+        self.host = host
+        self.port = port
+        self.usuario = usuario
+        self.senha = senha
+        self.usar_tls = usar_tls
+        self.max_conexoes = max_conexoes
+        self.timeout = timeout
+        self.max_mensagens_por_conexao = self.MAX_MENSAGENS_POR_CONEXAO
+        self._limitador = (
+            LimitadorTaxa(mensagens_por_segundo, rajada=max_conexoes)
+            if mensagens_por_segundo else None
+        )
+
+        self._livres: "queue.LifoQueue[_ConexaoSMTP]" = queue.LifoQueue()
+        for _ in range(max_conexoes):
+            self._livres.put(_ConexaoSMTP(self))
+        self._todas: List[_ConexaoSMTP] = list(self._livres.queue)
+
+    def enviar(self, remetente: str, destinatarios: Sequence[str], mensagem: EmailMessage) -> None:
+        """Envia uma mensagem por uma das conexões do pool.
+
+        Raises:
+            SMTPTransportError: Se o servidor recusar ou a conexão falhar
+        """
+        conexao = self._livres.get()
+        try:
+            self._enviar_por(conexao, remetente, destinatarios, mensagem)
+        finally:
+            self._livres.put(conexao)
+
+    def enviar_lote(self, envios: Iterable[Envio]) -> List[Optional[Exception]]:
+        """Envia várias mensagens distribuindo-as entre as conexões do pool.
+
+        Cada conexão envia sua parte em sequência, sem reconectar.
+
+        Returns:
+            Lista alinhada com ``envios``: None para sucesso ou o erro da mensagem
+        """
+        envios = list(envios)
+        resultados: List[Optional[Exception]] = [None] * len(envios)
+        if not envios:
+            return resultados
+
+        pendentes: "queue.SimpleQueue[int]" = queue.SimpleQueue()
+        for indice in range(len(envios)):
+            pendentes.put(indice)
+
+        def trabalhar():
+            conexao = self._livres.get()
+            try:
+                while True:
+                    try:
+                        indice = pendentes.get_nowait()
+                    except queue.Empty:
+                        return
+                    try:
+                        self._enviar_por(conexao, *envios[indice])
+                    except SMTPTransportError as e:
+                        resultados[indice] = e
+            finally:
+                self._livres.put(conexao)
+
+        trabalhadores = min(self.max_conexoes, len(envios))
+        with ThreadPoolExecutor(trabalhadores, thread_name_prefix="smtp") as executor:
+            for futuro in [executor.submit(trabalhar) for _ in range(trabalhadores)]:
+                futuro.result()
+        return resultados
+
+    def fechar(self) -> None:
+        """Encerra (QUIT) todas as conexões abertas."""
+        for conexao in self._todas:
+            conexao.fechar()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+    def _enviar_por(
+        self, conexao: _ConexaoSMTP, remetente: str, destinatarios: Sequence[str], mensagem: EmailMessage
+    ) -> None:
+        if self._limitador:
+            self._limitador.aguardar()
+        try:
+            conexao.enviar(remetente, destinatarios, mensagem.as_bytes())
+        except smtplib.SMTPRecipientsRefused as e:
+            raise SMTPTransportError(f"Destinatários recusados: {', '.join(e.recipients)}") from e
+        except (smtplib.SMTPResponseException, smtplib.SMTPSenderRefused) as e:
+            # Erro na transação: a sessão segue válida, mas reinicia o estado
+            try:
+                conexao._smtp.rset()
+            except (smtplib.SMTPException, OSError, AttributeError):
+                conexao.fechar()
+            raise SMTPTransportError(f"Servidor recusou a mensagem: {e}") from e
+        except (smtplib.SMTPException, OSError) as e:
+            conexao.fechar()
+            raise SMTPTransportError(f"Falha na conexão SMTP com {self.host}: {e}") from e
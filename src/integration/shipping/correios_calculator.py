@@ -1,7 +1,14 @@
 from .shipping_calculator import ShippingCalculator
 
 class CorreiosCalculator(ShippingCalculator):
+    nome = "Correios"
+
     def calcular(self, cep_destino: str, peso_total: float) -> float:
         # Simulação: Taxa fixa R$ 15.00 + R$ 2.00 por kg
         custo = 15.00 + (peso_total * 2.00)
-        return round(custo, 2)
\ No newline at end of file
+        return round(custo, 2)
+
+    def prazo_dias(self, cep_destino: str, peso_total: float) -> int:
+        # Simulação: região de SP (CEP 0xxxx/1xxxx) entrega mais rápido
+        regiao = cep_destino.strip()[:1]
+        return 3 if regiao in ("0", "1") else 6
@@ -0,0 +1,181 @@
+"""Cubagem e escolha de caixas para o frete do carrinho.
+
+Calcula peso real, volume e peso cubado do carrinho inteiro em uma única
+passada colunar (sem dependências externas) e distribui as unidades em
+caixas padrão com uma heurística First-Fit Decreasing por volume.
+O peso taxável de cada caixa é o maior entre o peso real e o peso cubado.
+"""
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Divisor de cubagem usado pelas transportadoras (cm³ por kg)
+DIVISOR_CUBAGEM = 6000
+
+# Fração do volume interno da caixa aproveitável (itens não encaixam perfeitamente)
+TAXA_OCUPACAO = 0.85
+
+# Valores assumidos para produtos sem peso/dimensões cadastrados
+PESO_PADRAO_KG = 1.0
+DIMENSOES_PADRAO_CM = (10.0, 10.0, 10.0)
+
+# Caixas disponíveis, da menor para a maior: (nome, (A, L, C) em cm, peso máximo kg)
+CAIXAS_PADRAO: Tuple[Tuple[str, Tuple[float, float, float], float], ...] = (
+    ("P", (10.0, 15.0, 20.0), 5.0),
+    ("M", (20.0, 25.0, 30.0), 10.0),
+    ("G", (30.0, 30.0, 40.0), 20.0),
+    ("GG", (40.0, 50.0, 60.0), 30.0),
+)
+
+
+def _coluna(itens: Sequence[Dict[str, Any]], campo: str, padrao: float) -> List[float]:
+    """Valores de ``campo``; só os ausentes (None) usam o padrão, 0 é válido."""
+    return [float(padrao if i.get(campo) is None else i[campo]) for i in itens]
+
+
+def _colunas(itens: Sequence[Dict[str, Any]]):
+    """Extrai as colunas (quantidade, peso, altura, largura, comprimento)."""
+    qtds = [int(i.get("quantidade", 1)) for i in itens]
+    pesos = _coluna(itens, "peso_kg", PESO_PADRAO_KG)
+    alturas = _coluna(itens, "altura_cm", DIMENSOES_PADRAO_CM[0])
+    larguras = _coluna(itens, "largura_cm", DIMENSOES_PADRAO_CM[1])
+    comprimentos = _coluna(itens, "comprimento_cm", DIMENSOES_PADRAO_CM[2])
+    return qtds, pesos, alturas, larguras, comprimentos
+
+
+def _cabe(dimensoes_item: Sequence[float], dimensoes_caixa: Sequence[float]) -> bool:
+    """O item cabe na caixa em alguma rotação ortogonal."""
+    return all(i <= c for i, c in zip(sorted(dimensoes_item), sorted(dimensoes_caixa)))
+
+
+def _volume(dimensoes: Sequence[float]) -> float:
+    return dimensoes[0] * dimensoes[1] * dimensoes[2]
+
+
+def _menor_caixa(volume: float, peso: float, maior_item: Sequence[float], caixas) -> Optional[int]:
+    for indice, (_, dimensoes, peso_max) in enumerate(caixas):
+        if (
+            volume <= _volume(dimensoes) * TAXA_OCUPACAO
+            and peso <= peso_max
+            and _cabe(maior_item, dimensoes)
+        ):
+            return indice
+    return None
+
+
+def empacotar(itens: Sequence[Dict[str, Any]], caixas=CAIXAS_PADRAO) -> List[Dict[str, Any]]:
+    """Distribui as unidades do carrinho em caixas (First-Fit Decreasing).
+
+    Unidades iguais são alocadas em bloco, então o custo depende do número
+    de linhas do carrinho, não da quantidade de unidades. Itens maiores que
+    a maior caixa seguem como volume avulso (caixa ``None``).
+
+    Args:
+        itens: Dicts com quantidade, peso_kg, altura_cm, largura_cm, comprimento_cm
+        caixas: Tipos de caixa disponíveis, do menor para o maior
+
+    Returns:
+        Lista de caixas com 'caixa', 'dimensoes_cm', 'peso_kg' e 'volume_ocupado_cm3'
+    """
+    qtds, pesos, alturas, larguras, comprimentos = _colunas(itens)
+    linhas = sorted(
+        (
+            (alt * larg * comp, peso, (alt, larg, comp), qtd)
+            for qtd, peso, alt, larg, comp in zip(qtds, pesos, alturas, larguras, comprimentos)
+            if qtd > 0
+        ),
+        key=lambda linha: linha[0],
+        reverse=True,
+    )
+
+    abertas: List[Dict[str, Any]] = []
+    avulsos: List[Dict[str, Any]] = []
+    maior_tipo = len(caixas) - 1
+    # Enquanto abertas, todas as caixas têm a capacidade do maior tipo
+    _, dim_caixa, peso_max = caixas[maior_tipo]
+    capacidade = _volume(dim_caixa) * TAXA_OCUPACAO
+
+    for volume_un, peso_un, dimensoes, restante in linhas:
+        if not _cabe(dimensoes, dim_caixa) or peso_un > peso_max:
+            avulsos.extend(
+                {"caixa": None, "dimensoes_cm": dimensoes, "peso_kg": peso_un,
+                 "volume_ocupado_cm3": volume_un}
+                for _ in range(restante)
+            )
+            continue
+
+        for caixa in abertas:
+            if restante == 0:
+                break
+            cabem = min(
+                int((capacidade - caixa["volume_ocupado_cm3"]) // volume_un) if volume_un else restante,
+                int((peso_max - caixa["peso_kg"]) // peso_un) if peso_un else restante,
+                restante,
+            )
+            if cabem > 0:
+                caixa["volume_ocupado_cm3"] += cabem * volume_un
+                caixa["peso_kg"] += cabem * peso_un
+                caixa["_maior_item"] = tuple(
+                    max(a, b) for a, b in zip(caixa["_maior_item"], sorted(dimensoes))
+                )
+                restante -= cabem
+
+        while restante > 0:
+            cabem = max(1, min(
+                int(capacidade // volume_un) if volume_un else restante,
+                int(peso_max // peso_un) if peso_un else restante,
+                restante,
+            ))
+            abertas.append({
+                "volume_ocupado_cm3": cabem * volume_un,
+                "peso_kg": cabem * peso_un,
+                "_maior_item": tuple(sorted(dimensoes)),
+            })
+            restante -= cabem
+
+    # Reduz cada caixa ao menor tipo que comporta o conteúdo
+    resultado = []
+    for caixa in abertas:
+        indice = _menor_caixa(
+            caixa["volume_ocupado_cm3"], caixa["peso_kg"], caixa["_maior_item"], caixas
+        )
+        if indice is None:
+            indice = maior_tipo
+        nome, dimensoes, _ = caixas[indice]
+        resultado.append({
+            "caixa": nome,
+            "dimensoes_cm": dimensoes,
+            "peso_kg": round(caixa["peso_kg"], 3),
+            "volume_ocupado_cm3": round(caixa["volume_ocupado_cm3"], 1),
+        })
+    return resultado + avulsos
+
+
+def calcular_carga(itens: Sequence[Dict[str, Any]], caixas=CAIXAS_PADRAO) -> Dict[str, Any]:
+    """Resumo de frete do carrinho: pesos, volume, caixas e peso taxável.
+
+    Args:
+        itens: Itens do carrinho (ver ``empacotar``)
+        caixas: Tipos de caixa disponíveis
+
+    Returns:
+        Dict com peso_real_kg, volume_cm3, peso_cubado_kg, peso_taxavel_kg e caixas
+    """
+    qtds, pesos, alturas, larguras, comprimentos = _colunas(itens)
+    peso_real = math.fsum(q * p for q, p in zip(qtds, pesos))
+    volume = math.fsum(
+        q * a * l * c for q, a, l, c in zip(qtds, alturas, larguras, comprimentos)
+    )
+
+    embalagens = empacotar(itens, caixas)
+    peso_taxavel = math.fsum(
+        max(caixa["peso_kg"], _volume(caixa["dimensoes_cm"]) / DIVISOR_CUBAGEM)
+        for caixa in embalagens
+    )
+
+    return {
+        "peso_real_kg": round(peso_real, 3),
+        "volume_cm3": round(volume, 1),
+        "peso_cubado_kg": round(volume / DIVISOR_CUBAGEM, 3),
+        "peso_taxavel_kg": round(peso_taxavel, 3),
+        "caixas": embalagens,
+    }
@@ -0,0 +1,242 @@
+"""Tabela de frete pré-computada por faixas de CEP e de peso.
+
+A tabela é gerada a partir de um CSV da transportadora e gravada em um
+formato binário compacto, que é mapeado em memória (mmap) na primeira
+consulta. A busca é binária sobre as faixas de CEP ordenadas, então o
+custo é O(log n) e só as páginas tocadas são lidas do disco.
+
+Formato do CSV (uma linha por faixa de CEP x faixa de peso)::
+
+    cep_inicio,cep_fim,peso_max_kg,valor,prazo_dias
+    01000000,05999999,1.0,18.50,3
+
+Layout do arquivo binário (little-endian)::
+
+    cabeçalho   8s magic | H versão | H reservado | I n_linhas | I n_pesos | I reservado
+    pesos       n_pesos   x uint32  (limite superior da faixa, em gramas)
+    chaves      n_linhas  x uint32  (cep_inicio, ordenado)
+    registros   n_linhas  x (uint32 cep_fim | n_pesos x uint32 célula)
+
+Cada célula guarda o prazo nos 8 bits altos e o valor em centavos nos 24
+bits baixos (até R$ 167.772,15).
+
+Uso pela linha de comando::
+
+    python -m src.integration.shipping.rate_table entrada.csv saida.bin
+"""
+import csv
+import mmap
+import os
+import struct
+import sys
+import threading
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Tuple
+
+from .shipping_calculator import ShippingCalculator
+
+
+class TabelaFreteError(Exception):
+    """Erro de formato ou de consulta na tabela de frete."""
+
+    pass
+
+
+MAGIC = b"SCEEFRT1"
+VERSAO = 1
+_CABECALHO = struct.Struct("<8sHHIII")
+_UINT32 = 4
+_CELULA = struct.Struct("<I")
+_BITS_VALOR = 24
+_MAX_CENTAVOS = (1 << _BITS_VALOR) - 1
+_MAX_PRAZO = 0xFF
+
+
+def _cep_para_int(cep) -> int:
+    digitos = "".join(ch for ch in str(cep) if ch.isdigit())
+    if not digitos or len(digitos) > 8:
+        raise TabelaFreteError(f"CEP inválido: {cep}")
+    return int(digitos.ljust(8, "0"))
+
+
+def construir_tabela(caminho_csv: str, caminho_saida: str) -> int:
+    """Gera o arquivo binário a partir do CSV da transportadora.
+
+    Args:
+        caminho_csv: CSV com cep_inicio, cep_fim, peso_max_kg, valor, prazo_dias
+        caminho_saida: Caminho do arquivo binário a gerar
+
+    Returns:
+        Quantidade de faixas de CEP gravadas
+
+    Raises:
+        TabelaFreteError: Se faixas se sobrepõem ou faltam faixas de peso
+    """
+    faixas: Dict[Tuple[int, int], Dict[int, int]] = {}
+    pesos = set()
+
+    with open(caminho_csv, newline="", encoding="utf-8") as arquivo:
+        for linha in csv.DictReader(arquivo):
+            chave = (_cep_para_int(linha["cep_inicio"]), _cep_para_int(linha["cep_fim"]))
+            gramas = int(round(float(linha["peso_max_kg"]) * 1000))
+            centavos = int(round(float(linha["valor"]) * 100))
+            prazo = int(linha["prazo_dias"])
+            if not 0 <= centavos <= _MAX_CENTAVOS or not 0 <= prazo <= _MAX_PRAZO:
+                raise TabelaFreteError(f"Valor ou prazo fora do limite na faixa {chave}")
+            pesos.add(gramas)
+            faixas.setdefault(chave, {})[gramas] = (prazo << _BITS_VALOR) | centavos
+
+    pesos_ordenados = sorted(pesos)
+    linhas = sorted(faixas.items())
+
+    # Valida tudo antes de abrir o arquivo temporário
+    fim_anterior = -1
+    for (inicio, fim), valores in linhas:
+        if inicio > fim:
+            raise TabelaFreteError(f"Faixa de CEP invertida: {inicio}-{fim}")
+        if inicio <= fim_anterior:
+            raise TabelaFreteError(f"Faixa de CEP sobreposta a partir de {inicio}")
+        faltando = [g for g in pesos_ordenados if g not in valores]
+        if faltando:
+            raise TabelaFreteError(
+                f"Faixa {inicio}-{fim} sem valor para peso até {faltando[0] / 1000} kg"
+            )
+        fim_anterior = fim
+
+    registro = struct.Struct(f"<I{len(pesos_ordenados)}I")
+    temporario = f"{caminho_saida}.tmp"
+    try:
+        with open(temporario, "wb") as saida:
+            saida.write(_CABECALHO.pack(MAGIC, VERSAO, 0, len(linhas), len(pesos_ordenados), 0))
+            saida.write(struct.pack(f"<{len(pesos_ordenados)}I", *pesos_ordenados))
+            saida.write(struct.pack(f"<{len(linhas)}I", *(inicio for (inicio, _), _ in linhas)))
+            for (inicio, fim), valores in linhas:
+                saida.write(registro.pack(fim, *(valores[g] for g in pesos_ordenados)))
+        os.replace(temporario, caminho_saida)
+    except BaseException:
+        # Não deixa um .tmp pela metade no disco
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        raise
+    return len(linhas)
+
+
+# memoryview.cast("I") usa a ordem de bytes e o tamanho de unsigned int nativos
+_NATIVO_LITTLE_UINT32 = sys.byteorder == "little" and struct.calcsize("I") == _UINT32
+
+
+class _VetorUint32LE:
+    """Sequência de uint32 little-endian (para bisect) em hosts big-endian."""
+
+    def __init__(self, trecho: memoryview):
+        self._trecho = trecho
+
+    def __len__(self) -> int:
+        return len(self._trecho) // _UINT32
+
+    def __getitem__(self, indice: int) -> int:
+        if not 0 <= indice < len(self):
+            raise IndexError(indice)
+        return _CELULA.unpack_from(self._trecho, indice * _UINT32)[0]
+
+    def release(self) -> None:
+        self._trecho.release()
+
+
+class TabelaFrete:
+    """Leitura por mmap de uma tabela gerada por ``construir_tabela``."""
+
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        with open(caminho, "rb") as arquivo:
+            self._mmap = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, versao, _, self.n_linhas, self.n_pesos, _ = _CABECALHO.unpack_from(self._mmap, 0)
+        if magic != MAGIC or versao != VERSAO:
+            self._mmap.close()
+            raise TabelaFreteError(f"Arquivo de tabela de frete inválido: {caminho}")
+
+        inicio_pesos = _CABECALHO.size
+        inicio_chaves = inicio_pesos + self.n_pesos * _UINT32
+        self._inicio_registros = inicio_chaves + self.n_linhas * _UINT32
+        self._tamanho_registro = (1 + self.n_pesos) * _UINT32
+
+        self._visao = memoryview(self._mmap)
+        self._pesos = self._vetor(self._visao[inicio_pesos:inicio_chaves])
+        self._chaves = self._vetor(self._visao[inicio_chaves:self._inicio_registros])
+
+    @staticmethod
+    def _vetor(trecho: memoryview):
+        """uint32 little-endian do arquivo; cast direto só se o nativo for igual."""
+        if _NATIVO_LITTLE_UINT32:
+            return trecho.cast("I")
+        return _VetorUint32LE(trecho)
+
+    def buscar(self, cep, peso_kg: float) -> Optional[Tuple[float, int]]:
+        """Retorna (valor, prazo_dias) ou None se o CEP/peso não estiver coberto."""
+        cep_int = _cep_para_int(cep)
+        linha = bisect_right(self._chaves, cep_int) - 1
+        if linha < 0:
+            return None
+
+        deslocamento = self._inicio_registros + linha * self._tamanho_registro
+        (cep_fim,) = _CELULA.unpack_from(self._mmap, deslocamento)
+        if cep_int > cep_fim:
+            return None
+
+        faixa = bisect_left(self._pesos, int(round(peso_kg * 1000)))
+        if faixa >= self.n_pesos:
+            return None
+
+        (celula,) = _CELULA.unpack_from(self._mmap, deslocamento + (1 + faixa) * _UINT32)
+        return (celula & _MAX_CENTAVOS) / 100, celula >> _BITS_VALOR
+
+    def fechar(self) -> None:
+        self._pesos.release()
+        self._chaves.release()
+        self._visao.release()
+        self._mmap.close()
+
+
+class TabelaFreteCalculator(ShippingCalculator):
+    """Calculadora de frete baseada em uma tabela binária (aberta sob demanda)."""
+
+    def __init__(self, caminho: str, nome: str = "Tabela"):
+        self.caminho = caminho
+        self.nome = nome
+        self._tabela: Optional[TabelaFrete] = None
+        self._lock = threading.Lock()
+
+    def _obter_tabela(self) -> TabelaFrete:
+        if self._tabela is None:
+            with self._lock:
+                if self._tabela is None:
+                    self._tabela = TabelaFrete(self.caminho)
+        return self._tabela
+
+    def _buscar(self, cep_destino: str, peso_total: float) -> Tuple[float, int]:
+        resultado = self._obter_tabela().buscar(cep_destino, peso_total)
+        if resultado is None:
+            raise TabelaFreteError(
+                f"Sem tarifa para CEP {cep_destino} e peso {peso_total:.2f} kg"
+            )
+        return resultado
+
+    def calcular(self, cep_destino: str, peso_total: float) -> float:
+        return self._buscar(cep_destino, peso_total)[0]
+
+    def prazo_dias(self, cep_destino: str, peso_total: float) -> int:
+        return self._buscar(cep_destino, peso_total)[1]
+
+
+def main(argv: List[str]) -> int:
+    if len(argv) != 2:
+        print("Uso: python -m src.integration.shipping.rate_table entrada.csv saida.bin")
+        return 1
+    total = construir_tabela(argv[0], argv[1])
+    print(f"Tabela gerada com {total} faixas de CEP: {argv[1]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
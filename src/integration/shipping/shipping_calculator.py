@@ -3,6 +3,13 @@ from abc import ABC, abstractmethod
 class ShippingCalculator(ABC):
     """Interface (Strategy) para cálculo de frete."""
     
+    # Nome exibido nas cotações
+    nome = "Transportadora"
+    
     @abstractmethod
     def calcular(self, cep_destino: str, peso_total: float) -> float:
-        pass
\ No newline at end of file
+        pass
+    
+    def prazo_dias(self, cep_destino: str, peso_total: float) -> int:
+        """Prazo estimado de entrega em dias úteis (padrão: 7)."""
+        return 7
@@ -0,0 +1,13 @@
+from .shipping_calculator import ShippingCalculator
+
+class TransportadoraCalculator(ShippingCalculator):
+    nome = "Transportadora"
+
+    def calcular(self, cep_destino: str, peso_total: float) -> float:
+        # Simulação: Taxa fixa R$ 25.00 + R$ 1.20 por kg (compensa em cargas pesadas)
+        custo = 25.00 + (peso_total * 1.20)
+        return round(custo, 2)
+
+    def prazo_dias(self, cep_destino: str, peso_total: float) -> int:
+        regiao = cep_destino.strip()[:1]
+        return 5 if regiao in ("0", "1") else 9
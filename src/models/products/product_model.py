@@ -23,6 +23,10 @@ class Produto(BaseModel):
             str
         ] = None,
         id: Optional[int] = None,
+        peso_kg: float = 1.0,
+        altura_cm: float = 10.0,
+        largura_cm: float = 10.0,
+        comprimento_cm: float = 10.0,
     ):
         self._id: Optional[int] = id
         self._nome: str | None = None
@@ -32,6 +36,8 @@ class Produto(BaseModel):
         self._estoque: int = 0
         self._descricao: str = ""
         self._imagem_principal: str | None = None
+        self._peso_kg: float = 1.0
+        self._dimensoes_cm: tuple[float, float, float] = (10.0, 10.0, 10.0)
 
         # Setters com validação
         self.nome = nome
@@ -41,6 +47,8 @@ class Produto(BaseModel):
         self.estoque = estoque
         self.descricao = descricao
         self.imagem_principal = imagem_principal
+        self.peso_kg = peso_kg
+        self.dimensoes_cm = (altura_cm, largura_cm, comprimento_cm)
 
     @property
     def id(self) -> Optional[int]:
@@ -115,6 +123,29 @@ class Produto(BaseModel):
     def imagem_principal(self, valor: Optional[str]) -> None:
         self._imagem_principal = valor
 
+    @property
+    def peso_kg(self) -> float:
+        return self._peso_kg
+
+    @peso_kg.setter
+    def peso_kg(self, valor: float) -> None:
+        valor = float(valor)
+        if valor < 0:
+            raise ValueError(f"Peso inválido: {valor}")
+        self._peso_kg = valor
+
+    @property
+    def dimensoes_cm(self) -> tuple[float, float, float]:
+        """Dimensões da embalagem (altura, largura, comprimento) em cm."""
+        return self._dimensoes_cm
+
+    @dimensoes_cm.setter
+    def dimensoes_cm(self, valor: tuple[float, float, float]) -> None:
+        altura, largura, comprimento = (float(v) for v in valor)
+        if min(altura, largura, comprimento) < 0:
+            raise ValueError(f"Dimensões inválidas: {valor}")
+        self._dimensoes_cm = (altura, largura, comprimento)
+
     # --- Métodos auxiliares ---
 
     def tem_estoque(self, quantidade: int = 1) -> bool:
@@ -143,6 +174,10 @@ class Produto(BaseModel):
             "imagem_principal": self._imagem_principal,
             "categoria_id": self._categoria.id if self._categoria else None,
             "categoria_nome": self._categoria.nome if self._categoria else None,
+            "peso_kg": self._peso_kg,
+            "altura_cm": self._dimensoes_cm[0],
+            "largura_cm": self._dimensoes_cm[1],
+            "comprimento_cm": self._dimensoes_cm[2],
         }
 
     def __str__(self) -> str:
@@ -14,4 +14,7 @@ __all__ = [
     "ImagemProdutoRepository",
     "CarrinhoRepository",
     "PedidoRepository",
+    "EmailOutboxRepository",
+    "TentativaLoginRepository",
+    "VersaoDadosRepository",
 ]
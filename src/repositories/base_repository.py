@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, List, Optional
+from typing import Any, Dict, Generic, TypeVar, List, Optional
 from src.config.database import DatabaseConnection
 
 T = TypeVar('T')
@@ -49,4 +49,58 @@ class BaseRepository(ABC, Generic[T]):
                 conexao.rollback()
             except Exception:
                 pass
-            # conexao.close()  <-- REMOVIDO
\ No newline at end of file
+            # conexao.close()  <-- REMOVIDO
+
+    def _consultar_pagina(
+        self, select: str, coluna: str, campo: str, decrescente: bool, inicio: int,
+        quantidade: int, apos: Optional[Dict[str, Any]] = None,
+        antes: Optional[Dict[str, Any]] = None, chave: str = "p.id", nulo: Any = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Executa `select` (sem WHERE/ORDER BY) devolvendo uma janela ordenada
+        por `coluna` com `chave` como desempate.
+        
+        Com `apos` (ou `antes`), a janela começa logo depois (ou termina logo
+        antes) dessa linha já lida, por comparação (coluna, id) no índice em
+        vez de OFFSET. Se a coluna aceita NULL, `coluna` deve ser o COALESCE
+        com `nulo`, usado também no valor da vizinha. Sem vizinha, ou se o
+        valor dela ficar NULL, pula `inicio` linhas.
+        """
+        ancora = apos if apos is not None else antes
+        valor = None
+        if ancora is not None:
+            valor = ancora.get(campo)
+            if valor is None:
+                valor = nulo
+        keyset = valor is not None
+        para_tras = keyset and apos is None
+        # Para trás: percorre na ordem inversa e desvira o resultado
+        inverso = decrescente != para_tras
+        direcao = "DESC" if inverso else "ASC"
+
+        where = ""
+        params: List[Any] = []
+        if keyset:
+            operador = "<" if inverso else ">"
+            if coluna == chave:
+                where = f"WHERE {chave} {operador} ?"
+                params = [ancora["id"]]
+            else:
+                # (coluna, id) > (?, ?) escrito por extenso: a forma de row value
+                # não faz busca no índice quando a coluna é uma expressão
+                where = (
+                    f"WHERE {coluna} {operador}= ? "
+                    f"AND ({coluna} {operador} ? OR {chave} {operador} ?)"
+                )
+                params = [valor, valor, ancora["id"]]
+        desempate = "" if coluna == chave else f", {chave} {direcao}"
+        params += [quantidade, 0 if keyset else inicio]
+
+        query = f"{select} {where} ORDER BY {coluna} {direcao}{desempate} LIMIT ? OFFSET ?"
+        with self._conn_factory() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            linhas = [dict(row) for row in cursor.fetchall()]
+        if para_tras:
+            linhas.reverse()
+        return linhas
@@ -221,7 +221,11 @@ class CarrinhoRepository(BaseRepository[Dict[str, Any]]):
                 p.nome as produto_nome,
                 p.descricao as produto_descricao,
                 p.sku,
-                p.estoque
+                p.estoque,
+                p.peso_kg,
+                p.altura_cm,
+                p.largura_cm,
+                p.comprimento_cm
             FROM itens_carrinho ic
             INNER JOIN produtos p ON ic.produto_id = p.id
             WHERE ic.carrinho_id = ?
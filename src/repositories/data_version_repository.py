@@ -0,0 +1,38 @@
+"""Repositório das versões dos dados (tabela versoes_dados).
+
+As versões são mantidas por triggers (ver DatabaseInitializer.create_version_triggers):
+cada INSERT/UPDATE/DELETE numa tabela versionada incrementa a versão dela.
+Comparar versões é uma consulta trivial, bem mais barata que recarregar a tela.
+"""
+from typing import Any, Dict, Iterable, List
+
+from src.config.database import DatabaseConnection
+
+
+class VersaoDadosRepository:
+    """
+    Leitura das versões por tabela. Não é um BaseRepository: a escrita é
+    feita só pelos triggers, então não há salvar/deletar.
+    """
+
+    def __init__(self):
+        self._conn_factory = DatabaseConnection().get_connection
+
+    def versoes(self, tabelas: Iterable[str]) -> Dict[str, int]:
+        """Versão atual de cada tabela (0 para tabelas sem registro)."""
+        tabelas = list(tabelas)
+        marcadores = ", ".join("?" for _ in tabelas)
+        with self._conn_factory() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"SELECT tabela, versao FROM versoes_dados WHERE tabela IN ({marcadores})", tabelas
+            )
+            encontradas = {row[0]: row[1] for row in cursor.fetchall()}
+        return {tabela: encontradas.get(tabela, 0) for tabela in tabelas}
+
+    def listar(self) -> List[Dict[str, Any]]:
+        """Todas as tabelas com versão registrada."""
+        with self._conn_factory() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT tabela, versao FROM versoes_dados ORDER BY tabela")
+            return [dict(row) for row in cursor.fetchall()]
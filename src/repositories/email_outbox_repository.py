@@ -0,0 +1,249 @@
+"""Repositório da caixa de saída de emails.
+
+Persiste os emails enfileirados na tabela email_outbox até que o
+EmailDispatcher consiga enviá-los. Os horários de agendamento
+(proxima_tentativa_em) são timestamps Unix.
+"""
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from .base_repository import BaseRepository
+
+
+class EmailOutboxRepository(BaseRepository[Dict[str, Any]]):
+    """Fila durável de emails, ordenada por prioridade e agendamento."""
+
+    PENDENTE = "PENDENTE"
+    ENVIANDO = "ENVIANDO"
+    ENVIADO = "ENVIADO"
+    FALHOU = "FALHOU"
+
+    def __init__(self, conn_factory: Optional[Callable] = None):
+        """
+        Args:
+            conn_factory: Fábrica de conexões alternativa (ex.: conexão
+                dedicada da thread do dispatcher). Padrão: conexão da aplicação.
+        """
+        super().__init__()
+        if conn_factory is not None:
+            self._conn_factory = conn_factory
+
+    def salvar(self, obj: Dict[str, Any]) -> Dict[str, Any]:
+        """Enfileira um email.
+
+        Args:
+            obj: Dicionário com destinatario, assunto, corpo e opcionalmente
+                copias, prioridade (menor = mais urgente), proxima_tentativa_em,
+                chave_agrupamento e metadados
+
+        Returns:
+            Email salvo com ID atribuído
+        """
+        query = """
+            INSERT INTO email_outbox
+            (destinatario, assunto, corpo, copias, prioridade, proxima_tentativa_em,
+             chave_agrupamento, metadados)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """
+
+        with self._conn_factory() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                query,
+                (
+                    obj['destinatario'],
+                    obj['assunto'],
+                    obj['corpo'],
+                    json.dumps(obj.get('copias') or []),
+                    obj.get('prioridade', 5),
+                    obj.get('proxima_tentativa_em', 0),
+                    obj.get('chave_agrupamento'),
+                    json.dumps(obj['metadados']) if obj.get('metadados') is not None else None,
+                )
+            )
+            conn.commit()
+            obj['id'] = cursor.lastrowid
+
+        return obj
+
+    def buscar_por_id(self, id: int) -> Optional[Dict[str, Any]]:
+        """Busca um email da fila por ID."""
+        with self._conn_factory() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM email_outbox WHERE id = ?", (id,))
+            row = cursor.fetchone()
+            return self._adaptar(row) if row else None
+
+    def listar(self, status: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Lista emails da fila, opcionalmente filtrando por status."""
+        query = "SELECT * FROM email_outbox"
+        params: List[Any] = []
+        if status:
+            query += " WHERE status = ?"
+            params.append(status)
+        query += " ORDER BY id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._conn_factory() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, tuple(params))
+            return [self._adaptar(row) for row in cursor.fetchall()]
+
+    def deletar(self, id: int) -> bool:
+        """Remove um email da fila."""
+        with self._conn_factory() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM email_outbox WHERE id = ?", (id,))
+            conn.commit()
+            return cursor.rowcount > 0
+
+    def buscar_pendente_por_chave(self, chave: str) -> Optional[Dict[str, Any]]:
+        """Email ainda não reservado para envio com a chave de agrupamento dada."""
+        query = """
+            SELECT * FROM email_outbox
+            WHERE chave_agrupamento = ? AND status = ?
+            ORDER BY id DESC LIMIT 1
+        """
+        with self._conn_factory() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, (chave, self.PENDENTE))
+            row = cursor.fetchone()
+            return self._adaptar(row) if row else None
+
+    def substituir_conteudo(
+        self, id: int, assunto: str, corpo: str, metadados: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """Troca assunto/corpo de um email pendente, mantendo o agendamento.
+
+        Returns:
+            False se o email já foi reservado pelo dispatcher (não há mais o que mesclar)
+        """
+        with self._conn_factory() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                UPDATE email_outbox SET assunto = ?, corpo = ?, metadados = ?
+                WHERE id = ? AND status = ?
+                """,
+                (assunto, corpo, json.dumps(metadados) if metadados is not None else None,
+                 id, self.PENDENTE)
+            )
+            conn.commit()
+            return cursor.rowcount > 0
+
+    def reservar_lote(self, limite: int, agora: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Reserva os próximos emails vencidos para envio.
+
+        Os emails retornados passam para ENVIANDO, então outro dispatcher
+        não os pega de novo. A busca usa o índice (status, prioridade,
+        proxima_tentativa_em).
+
+        Args:
+            limite: Máximo de emails no lote
+            agora: Timestamp Unix de referência (padrão: time.time())
+
+        Returns:
+            Emails reservados, do mais urgente para o menos urgente
+        """
+        agora = time.time() if agora is None else agora
+        query = """
+            SELECT * FROM email_outbox
+            WHERE status = ? AND proxima_tentativa_em <= ?
+            ORDER BY prioridade, proxima_tentativa_em
+            LIMIT ?
+        """
+
+        with self._conn_factory() as conn:
+            cursor = conn.cursor()
+            # Trava de escrita desde a leitura: um email não pode ser mesclado
+            # (substituir_conteudo) entre o SELECT e a reserva
+            if not conn.in_transaction:
+                cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute(query, (self.PENDENTE, agora, limite))
+            lote = [self._adaptar(row) for row in cursor.fetchall()]
+            if lote:
+                cursor.executemany(
+                    "UPDATE email_outbox SET status = ? WHERE id = ? AND status = ?",
+                    [(self.ENVIANDO, email['id'], self.PENDENTE) for email in lote]
+                )
+            conn.commit()
+
+        return lote
+
+    def marcar_enviado(self, id: int) -> None:
+        """Registra o envio bem-sucedido."""
+        with self._conn_factory() as conn:
+            conn.execute(
+                """
+                UPDATE email_outbox
+                SET status = ?, tentativas = tentativas + 1, ultimo_erro = NULL,
+                    enviado_em = CURRENT_TIMESTAMP
+                WHERE id = ?
+                """,
+                (self.ENVIADO, id)
+            )
+            conn.commit()
+
+    def marcar_falha(self, id: int, erro: str, proxima_tentativa_em: Optional[float]) -> None:
+        """Registra uma tentativa sem sucesso.
+
+        Args:
+            id: ID do email
+            erro: Mensagem do erro
+            proxima_tentativa_em: Quando tentar de novo; None desiste do email
+        """
+        status = self.FALHOU if proxima_tentativa_em is None else self.PENDENTE
+        with self._conn_factory() as conn:
+            conn.execute(
+                """
+                UPDATE email_outbox
+                SET status = ?, tentativas = tentativas + 1, ultimo_erro = ?,
+                    proxima_tentativa_em = COALESCE(?, proxima_tentativa_em)
+                WHERE id = ?
+                """,
+                (status, erro[:500], proxima_tentativa_em, id)
+            )
+            conn.commit()
+
+    def liberar_reservas(self) -> int:
+        """Devolve à fila emails que ficaram em ENVIANDO (ex.: app encerrado no meio do envio)."""
+        with self._conn_factory() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "UPDATE email_outbox SET status = ? WHERE status = ?",
+                (self.PENDENTE, self.ENVIANDO)
+            )
+            conn.commit()
+            return cursor.rowcount
+
+    def limpar_enviados(self, dias: int) -> int:
+        """Remove emails enviados há mais de ``dias`` dias.
+
+        Returns:
+            Quantidade de registros removidos
+        """
+        with self._conn_factory() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "DELETE FROM email_outbox WHERE status = ? AND enviado_em < datetime('now', ?)",
+                (self.ENVIADO, f"-{int(dias)} days")
+            )
+            conn.commit()
+            return cursor.rowcount
+
+    def contar_por_status(self) -> Dict[str, int]:
+        """Quantidade de emails em cada status."""
+        with self._conn_factory() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT status, COUNT(*) FROM email_outbox GROUP BY status")
+            return {row[0]: row[1] for row in cursor.fetchall()}
+
+    @staticmethod
+    def _adaptar(row) -> Dict[str, Any]:
+        email = dict(row)
+        email['copias'] = json.loads(email['copias']) if email.get('copias') else []
+        email['metadados'] = json.loads(email['metadados']) if email.get('metadados') else None
+        return email
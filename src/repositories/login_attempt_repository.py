@@ -0,0 +1,78 @@
+"""Repositório das tentativas de login malsucedidas.
+
+Implementa operações CRUD para a tabela tentativas_login, usada pelo
+TentativasLoginService para manter bloqueios entre execuções.
+"""
+from typing import Any, Dict, List, Optional
+
+from .base_repository import BaseRepository
+
+
+class TentativaLoginRepository(BaseRepository[Dict[str, Any]]):
+    """Estado do limitador de login por chave (email ou origem)."""
+
+    def salvar(self, obj: Dict[str, Any]) -> Dict[str, Any]:
+        """Insere ou substitui o estado de uma chave."""
+        query = """
+            INSERT INTO tentativas_login
+            (chave, janela_inicio, falhas_atual, falhas_anterior, bloqueado_ate, bloqueios, atualizado_em)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(chave) DO UPDATE SET
+                janela_inicio = excluded.janela_inicio,
+                falhas_atual = excluded.falhas_atual,
+                falhas_anterior = excluded.falhas_anterior,
+                bloqueado_ate = excluded.bloqueado_ate,
+                bloqueios = excluded.bloqueios,
+                atualizado_em = excluded.atualizado_em
+        """
+
+        with self._conn_factory() as conn:
+            conn.execute(
+                query,
+                (
+                    obj['chave'],
+                    obj['janela_inicio'],
+                    obj['falhas_atual'],
+                    obj['falhas_anterior'],
+                    obj['bloqueado_ate'],
+                    obj['bloqueios'],
+                    obj['atualizado_em'],
+                )
+            )
+            conn.commit()
+
+        return obj
+
+    def buscar_por_id(self, id: str) -> Optional[Dict[str, Any]]:
+        """Busca o estado de uma chave."""
+        with self._conn_factory() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM tentativas_login WHERE chave = ?", (id,))
+            row = cursor.fetchone()
+            return dict(row) if row else None
+
+    def listar(self) -> List[Dict[str, Any]]:
+        """Lista todas as chaves com falhas ou bloqueio registrados."""
+        with self._conn_factory() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM tentativas_login ORDER BY atualizado_em DESC")
+            return [dict(row) for row in cursor.fetchall()]
+
+    def deletar(self, id: str) -> bool:
+        """Remove o estado de uma chave."""
+        with self._conn_factory() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM tentativas_login WHERE chave = ?", (id,))
+            conn.commit()
+            return cursor.rowcount > 0
+
+    def limpar_inativos(self, antes_de: float) -> int:
+        """Remove chaves sem bloqueio ativo e sem atividade desde ``antes_de``."""
+        with self._conn_factory() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "DELETE FROM tentativas_login WHERE atualizado_em < ? AND bloqueado_ate < ?",
+                (antes_de, antes_de)
+            )
+            conn.commit()
+            return cursor.rowcount
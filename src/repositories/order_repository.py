@@ -36,6 +36,88 @@ class PedidoRepository(BaseRepository[Dict[str, Any]]):
             obj['id'] = cursor.lastrowid
         return obj
 
+    def salvar_com_itens(
+        self, obj: Dict[str, Any], itens: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Salva um pedido e todos os seus itens em uma única transação.
+
+        Os nomes dos produtos são buscados em uma só consulta e os itens
+        inseridos com ``executemany``, com um único commit ao final.
+
+        Args:
+            obj: Dicionário com dados do pedido
+            itens: Lista de dicts com produto_id, quantidade e preco_unitario
+
+        Returns:
+            Pedido salvo com ID atribuído
+        """
+        query = """
+            INSERT INTO pedidos 
+            (usuario_id, endereco_id, subtotal, frete, total, status, tipo_pagamento, observacoes)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """
+
+        with self._conn_factory() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                query,
+                (
+                    obj['usuario_id'],
+                    obj['endereco_id'],
+                    obj['subtotal'],
+                    obj['frete'],
+                    obj['total'],
+                    obj.get('status', 'PENDENTE'),
+                    obj['tipo_pagamento'],
+                    obj.get('observacoes')
+                )
+            )
+            obj['id'] = cursor.lastrowid
+
+            self._inserir_itens(
+                cursor,
+                obj['id'],
+                [
+                    (item['produto_id'], item['quantidade'], item['preco_unitario'])
+                    for item in itens
+                ],
+            )
+            conn.commit()
+        return obj
+
+    def adicionar_item(
+        self,
+        pedido_id: int,
+        produto_id: int,
+        nome_produto: str,
+        quantidade: int,
+        preco_unitario: float
+    ) -> Dict[str, Any]:
+        """Adiciona um único item a um pedido existente."""
+        query = """
+            INSERT INTO itens_pedido 
+            (pedido_id, produto_id, nome_produto, quantidade, preco_unitario, subtotal)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """
+        subtotal = quantidade * preco_unitario
+
+        with self._conn_factory() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                query,
+                (pedido_id, produto_id, nome_produto, quantidade, preco_unitario, subtotal)
+            )
+            conn.commit()
+            return {
+                'id': cursor.lastrowid,
+                'pedido_id': pedido_id,
+                'produto_id': produto_id,
+                'nome_produto': nome_produto,
+                'quantidade': quantidade,
+                'preco_unitario': preco_unitario,
+                'subtotal': subtotal
+            }
+
     def salvar_pedido_e_itens(self, pedido: Pedido, conexao) -> None:
         """Salva o Pedido e seus Itens usando uma conexão de transação JÁ ABERTA."""
         cursor = conexao.cursor()
@@ -70,24 +152,51 @@ class PedidoRepository(BaseRepository[Dict[str, Any]]):
         if hasattr(pedido, '_id'):
             pedido._id = pedido_id
 
+        itens = [
+            (item.produto.id, item.quantidade, item.preco_unitario)
+            for item in pedido.itens
+        ]
+        self._inserir_itens(cursor, pedido_id, itens)
+
+    # Limite seguro de parâmetros por consulta no SQLite (SQLITE_MAX_VARIABLE_NUMBER)
+    _MAX_PARAMETROS_IN = 900
+
+    def _buscar_nomes_produtos(self, cursor, produto_ids: List[int]) -> Dict[int, str]:
+        """Busca os nomes de vários produtos com uma consulta IN por bloco."""
+        ids = list(dict.fromkeys(produto_ids))
+        nomes: Dict[int, str] = {}
+        for inicio in range(0, len(ids), self._MAX_PARAMETROS_IN):
+            bloco = ids[inicio:inicio + self._MAX_PARAMETROS_IN]
+            marcadores = ", ".join("?" * len(bloco))
+            cursor.execute(
+                f"SELECT id, nome FROM produtos WHERE id IN ({marcadores})", bloco
+            )
+            nomes.update({row[0]: row[1] for row in cursor.fetchall()})
+        return nomes
+
+    def _inserir_itens(self, cursor, pedido_id: int, itens: List[tuple]) -> None:
+        """Insere os itens (produto_id, quantidade, preco_unitario) com executemany."""
+        nomes = self._buscar_nomes_produtos(cursor, [item[0] for item in itens])
+
         query_item = """
             INSERT INTO itens_pedido 
             (pedido_id, produto_id, nome_produto, quantidade, preco_unitario, subtotal)
             VALUES (?, ?, ?, ?, ?, ?)
         """
-        
-        for item in pedido.itens:
-            prod_id = item.produto.id
-            cursor.execute("SELECT nome FROM produtos WHERE id = ?", (prod_id,))
-            row = cursor.fetchone()
-            nome_produto = row[0] if row else "Produto Desconhecido"
-            
-            subtotal_item = item.quantidade * item.preco_unitario
-            
-            cursor.execute(query_item, (
-                pedido_id, prod_id, nome_produto,
-                item.quantidade, item.preco_unitario, subtotal_item
-            ))
+        cursor.executemany(
+            query_item,
+            [
+                (
+                    pedido_id,
+                    produto_id,
+                    nomes.get(produto_id, "Produto Desconhecido"),
+                    quantidade,
+                    preco_unitario,
+                    quantidade * preco_unitario,
+                )
+                for produto_id, quantidade, preco_unitario in itens
+            ],
+        )
 
     # --- MÉTODOS DE LEITURA (CORRIGIDOS PARA USAR VIEW) ---
 
@@ -114,6 +223,47 @@ class PedidoRepository(BaseRepository[Dict[str, Any]]):
             rows = cursor.fetchall()
             return [dict(row) for row in rows]
     
+    # Colunas aceitas em listar_pagina -> expressão do ORDER BY (todas indexadas).
+    # Colunas que aceitam NULL ordenam pelo COALESCE com o valor de NULOS_ORDENACAO.
+    COLUNAS_ORDENACAO = {
+        "id": "p.id",
+        "criado_em": "COALESCE(p.criado_em, '')",
+        "status": "COALESCE(p.status, '')",
+        "total": "p.total",
+    }
+    NULOS_ORDENACAO = {"criado_em": "", "status": ""}
+    
+    def contar(self) -> int:
+        """Total de pedidos."""
+        with self._conn_factory() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM pedidos")
+            return cursor.fetchone()[0]
+    
+    def listar_pagina(
+        self, inicio: int, quantidade: int, ordenar_por: str = "criado_em", decrescente: bool = True,
+        apos: Optional[Dict[str, Any]] = None, antes: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Janela de pedidos (com cliente e quantidade de itens) para tabelas
+        paginadas. Ordena no banco, só por colunas de COLUNAS_ORDENACAO.
+        Com apos/antes (linha vizinha já lida) a janela vem por keyset, sem OFFSET.
+        """
+        coluna = self.COLUNAS_ORDENACAO.get(ordenar_por)
+        if coluna is None:
+            raise ValueError(f"Não é possível ordenar pedidos por '{ordenar_por}'.")
+        select = """
+            SELECT p.id, p.usuario_id, p.status, p.total, p.criado_em,
+                   u.nome AS cliente_nome,
+                   (SELECT COUNT(*) FROM itens_pedido WHERE pedido_id = p.id) AS total_itens
+            FROM pedidos p
+            INNER JOIN usuarios u ON u.id = p.usuario_id
+        """
+        return self._consultar_pagina(
+            select, coluna, ordenar_por, decrescente, inicio, quantidade, apos, antes,
+            nulo=self.NULOS_ORDENACAO.get(ordenar_por)
+        )
+    
     def listar_por_status(self, status: str, limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
         """Lista pedidos por status usando a VIEW detalhada."""
         query = "SELECT * FROM vw_pedidos_detalhados WHERE status = ? ORDER BY criado_em DESC"
@@ -1,6 +1,6 @@
 """Repositório para gerenciamento de produtos e suas imagens."""
 
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Set, Union
 from src.repositories.base_repository import BaseRepository
 from src.models.products.product_model import Produto
 
@@ -25,6 +25,10 @@ class ProductRepository(BaseRepository[Dict[str, Any]]):
             "categoria_id": obj.categoria.id if obj.categoria else None,
             "descricao": getattr(obj, "descricao", ""),
             "ativo": 1,
+            "peso_kg": obj.peso_kg,
+            "altura_cm": obj.dimensoes_cm[0],
+            "largura_cm": obj.dimensoes_cm[1],
+            "comprimento_cm": obj.dimensoes_cm[2],
         }
 
     def salvar(self, obj_entrada: Union[Produto, Dict]) -> Dict[str, Any]:
@@ -33,8 +37,9 @@ class ProductRepository(BaseRepository[Dict[str, Any]]):
 
         query = """
             INSERT INTO produtos 
-            (nome, descricao, preco, sku, categoria_id, estoque, ativo)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
+            (nome, descricao, preco, sku, categoria_id, estoque, ativo,
+             peso_kg, altura_cm, largura_cm, comprimento_cm)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """
 
         with self._conn_factory() as conn:
@@ -49,6 +54,10 @@ class ProductRepository(BaseRepository[Dict[str, Any]]):
                     obj.get("categoria_id"),
                     obj.get("estoque", 0),
                     obj.get("ativo", 1),
+                    self._ou_padrao(obj.get("peso_kg"), 1.0),
+                    self._ou_padrao(obj.get("altura_cm"), 10.0),
+                    self._ou_padrao(obj.get("largura_cm"), 10.0),
+                    self._ou_padrao(obj.get("comprimento_cm"), 10.0),
                 ),
             )
             conn.commit()
@@ -59,21 +68,66 @@ class ProductRepository(BaseRepository[Dict[str, Any]]):
 
         return obj
 
+    @staticmethod
+    def _ou_padrao(valor, padrao):
+        """Peso/dimensão não informados (None) usam o padrão; 0 é mantido."""
+        return padrao if valor is None else valor
+
     def salvar_imagem(self, produto_id: int, caminho_imagem: str, prioridade: int = 0):
         """Salva o caminho/URL de uma imagem vinculada ao produto."""
-        query = """
-            INSERT INTO imagens_produto (produto_id, url, prioridade)
-            VALUES (?, ?, ?)
+        self.salvar_variantes_imagem(produto_id, {"original": caminho_imagem}, prioridade)
+
+    def salvar_variantes_imagem(self, produto_id: int, variantes: Dict[str, str], prioridade: int = 0,
+                                chave: Optional[str] = None):
+        """Salva as variantes (card, detalhe, original) de uma imagem, numa transação."""
+        with self._conn_factory() as conn:
+            self._inserir_variantes(conn.cursor(), produto_id, variantes, prioridade, chave)
+            conn.commit()
+
+    def substituir_imagens(self, produto_id: int, variantes: Dict[str, str], chave: str) -> List[str]:
+        """
+        Troca as imagens do produto pela imagem ``chave`` (numa transação).
+        Retorna os hashes que o produto referenciava antes.
         """
         with self._conn_factory() as conn:
             cursor = conn.cursor()
-            cursor.execute(query, (produto_id, caminho_imagem, prioridade))
+            cursor.execute(
+                "SELECT DISTINCT hash FROM imagens_produto WHERE produto_id = ? AND hash IS NOT NULL",
+                (produto_id,),
+            )
+            anteriores = [row[0] for row in cursor.fetchall()]
+            cursor.execute("DELETE FROM imagens_produto WHERE produto_id = ?", (produto_id,))
+            self._inserir_variantes(cursor, produto_id, variantes, 0, chave)
             conn.commit()
+        return anteriores
+
+    def hashes_do_produto(self, produto_id: int) -> List[str]:
+        """Hashes das imagens (armazenamento por conteúdo) do produto."""
+        query = "SELECT DISTINCT hash FROM imagens_produto WHERE produto_id = ? AND hash IS NOT NULL"
+        with self._conn_factory() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, (produto_id,))
+            return [row[0] for row in cursor.fetchall()]
+
+    def contar_referencias(self, chave: str) -> int:
+        """Quantas linhas de imagens_produto apontam para o hash."""
+        with self._conn_factory() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM imagens_produto WHERE hash = ?", (chave,))
+            return cursor.fetchone()[0]
+
+    def hashes_referenciados(self) -> Set[str]:
+        """Todos os hashes com pelo menos uma referência."""
+        with self._conn_factory() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT DISTINCT hash FROM imagens_produto WHERE hash IS NOT NULL")
+            return {row[0] for row in cursor.fetchall()}
 
     def buscar_imagens(self, produto_id: int) -> List[str]:
-        """Retorna lista de URLs/Caminhos das imagens do produto."""
+        """Retorna lista de URLs/Caminhos das imagens do produto (originais)."""
         query = (
-            "SELECT url FROM imagens_produto WHERE produto_id = ? ORDER BY prioridade"
+            "SELECT url FROM imagens_produto WHERE produto_id = ? AND variante = 'original' "
+            "ORDER BY prioridade, id"
         )
         with self._conn_factory() as conn:
             cursor = conn.cursor()
@@ -81,6 +135,16 @@ class ProductRepository(BaseRepository[Dict[str, Any]]):
             rows = cursor.fetchall()
             return [row[0] for row in rows]
 
+    @staticmethod
+    def _inserir_variantes(cursor, produto_id, variantes, prioridade, chave) -> None:
+        cursor.executemany(
+            """
+            INSERT INTO imagens_produto (produto_id, url, prioridade, variante, hash)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            [(produto_id, url, prioridade, variante, chave) for variante, url in variantes.items()],
+        )
+
     def buscar_por_id(self, id: int) -> Optional[Dict[str, Any]]:
         """Busca um produto por ID, incluindo suas imagens."""
         query = "SELECT * FROM produtos WHERE id = ?"
@@ -113,6 +177,51 @@ class ProductRepository(BaseRepository[Dict[str, Any]]):
             rows = cursor.fetchall()
             return [dict(row) for row in rows]
 
+    # Colunas aceitas em listar_pagina -> expressão do ORDER BY (todas indexadas).
+    # Colunas que aceitam NULL ordenam pelo COALESCE com o valor de NULOS_ORDENACAO,
+    # senão as linhas NULL sumiriam da comparação do keyset.
+    COLUNAS_ORDENACAO = {
+        "id": "p.id",
+        "sku": "p.sku",
+        "nome": "p.nome",
+        "preco": "p.preco",
+        "estoque": "COALESCE(p.estoque, 0)",
+    }
+    NULOS_ORDENACAO = {"estoque": 0}
+
+    def contar(self) -> int:
+        """Total de produtos cadastrados."""
+        with self._conn_factory() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM produtos")
+            return cursor.fetchone()[0]
+
+    def listar_pagina(
+        self, inicio: int, quantidade: int, ordenar_por: str = "id", decrescente: bool = False,
+        apos: Optional[Dict[str, Any]] = None, antes: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Janela de produtos (com o nome da categoria) para tabelas paginadas.
+        A ordenação é feita no banco, só por colunas de COLUNAS_ORDENACAO; o id
+        desempata para a ordem ser estável entre janelas.
+        
+        apos/antes: linha vizinha já lida; a janela é buscada a partir dela
+        (keyset) em vez de pular `inicio` linhas com OFFSET.
+        """
+        coluna = self.COLUNAS_ORDENACAO.get(ordenar_por)
+        if coluna is None:
+            raise ValueError(f"Não é possível ordenar produtos por '{ordenar_por}'.")
+        select = """
+            SELECT p.id, p.sku, p.nome, p.preco, p.estoque, p.ativo, p.categoria_id,
+                   c.nome AS categoria_nome
+            FROM produtos p
+            LEFT JOIN categorias c ON c.id = p.categoria_id
+        """
+        return self._consultar_pagina(
+            select, coluna, ordenar_por, decrescente, inicio, quantidade, apos, antes,
+            nulo=self.NULOS_ORDENACAO.get(ordenar_por)
+        )
+
     def atualizar(self, obj_entrada: Union[Produto, Dict]) -> Dict[str, Any]:
         """Atualiza um produto."""
         obj = self._adaptar_para_dict(obj_entrada)
@@ -120,10 +229,15 @@ class ProductRepository(BaseRepository[Dict[str, Any]]):
         if "id" not in obj or not obj["id"]:
             raise ValueError("Produto deve ter um ID para ser atualizado")
 
+        # Peso e dimensões ausentes no dicionário mantêm o valor atual
         query = """
             UPDATE produtos
             SET nome = ?, descricao = ?, preco = ?, sku = ?,
-                categoria_id = ?, estoque = ?, ativo = ?
+                categoria_id = ?, estoque = ?, ativo = ?,
+                peso_kg = COALESCE(?, peso_kg),
+                altura_cm = COALESCE(?, altura_cm),
+                largura_cm = COALESCE(?, largura_cm),
+                comprimento_cm = COALESCE(?, comprimento_cm)
             WHERE id = ?
         """
 
@@ -139,6 +253,10 @@ class ProductRepository(BaseRepository[Dict[str, Any]]):
                     obj.get("categoria_id"),
                     obj.get("estoque", 0),
                     obj.get("ativo", 1),
+                    obj.get("peso_kg"),
+                    obj.get("altura_cm"),
+                    obj.get("largura_cm"),
+                    obj.get("comprimento_cm"),
                     obj["id"],
                 ),
             )
@@ -196,3 +196,19 @@ class UsuarioRepository(BaseRepository[Usuario]):
         except Exception as e:
             conn.rollback()
             raise ValueError(f"Erro ao deletar usuário: {e}")
+
+    def atualizar_senha_hash(self, id: int, senha_hash: str) -> bool:
+        """Grava um novo hash de senha (ex.: rehash após mudança de política)."""
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute(
+                "UPDATE usuarios SET senha_hash = ?, atualizado_em = CURRENT_TIMESTAMP WHERE id = ?",
+                (senha_hash, id)
+            )
+            conn.commit()
+            return cursor.rowcount > 0
+        except Exception as e:
+            conn.rollback()
+            raise ValueError(f"Erro ao atualizar senha: {e}")
@@ -1,6 +1,8 @@
+from concurrent.futures import Future
 from typing import Optional
 from src.models.users.user_model import Usuario
 from src.repositories.user_repository import UsuarioRepository
+from src.services.login_throttle_service import TentativasLoginService
 from src.utils.security.password_hasher import PasswordHasher
 
 class AuthService:
@@ -9,30 +11,71 @@ class AuthService:
     Faz a ponte entre a Tela de Login e o Banco de Dados.
     """
 
-    def __init__(self):
+    def __init__(self, tentativas: Optional[TentativasLoginService] = None):
         self.repo = UsuarioRepository()
+        self.tentativas = tentativas or TentativasLoginService()
         self.usuario_logado: Optional[Usuario] = None
 
-    def login(self, email: str, senha_plana: str) -> bool:
+    def login(self, email: str, senha_plana: str, origem: str = "local") -> bool:
         """
-        Tenta autenticar um usuário.
+        Tenta autenticar um usuário (bloqueia até a verificação da senha).
         :return: True se sucesso, False se falhar.
+        :raises LoginBloqueadoError: Excesso de tentativas para o email ou a origem
         """
+        return self.concluir_login(self.iniciar_login(email, senha_plana, origem))
+
+    def iniciar_login(self, email: str, senha_plana: str, origem: str = "local") -> Future:
+        """
+        Busca o usuário e dispara a verificação da senha no pool de hashing,
+        sem bloquear. Quando o Future terminar, passe-o para concluir_login
+        na mesma thread (a conexão SQLite é da thread que a criou).
+        :raises LoginBloqueadoError: Antes de qualquer cálculo de hash
+        """
+        # 0. Tentativas bloqueadas não gastam CPU com hash
+        self.tentativas.verificar(email, origem)
+
         # 1. Busca o usuário no banco pelo email
         usuario = self.repo.buscar_por_email(email)
-        
-        if not usuario:
+
+        # 2. Verifica a senha fora desta thread (mesmo custo se o email não existir)
+        verificacao = PasswordHasher.verify_and_update_async(
+            usuario.senha_hash if usuario else None, senha_plana
+        )
+
+        tentativa: Future = Future()
+
+        def _repassar(futuro: Future):
+            try:
+                confere, novo_hash = futuro.result()
+                tentativa.set_result((email, origem, usuario, confere, novo_hash))
+            except Exception as e:
+                tentativa.set_exception(e)
+
+        verificacao.add_done_callback(_repassar)
+        return tentativa
+
+    def concluir_login(self, tentativa: Future) -> bool:
+        """
+        Finaliza um login iniciado por iniciar_login.
+        Se a política de hash mudou, regrava o hash da senha.
+        :return: True se sucesso, False se falhar.
+        """
+        email, origem, usuario, confere, novo_hash = tentativa.result()
+        if not usuario or not confere:
+            self.tentativas.registrar_falha(email, origem)
             return False
-            
-        # 2. Verifica a senha usando o Hasher
-        if PasswordHasher.verify_password(usuario.senha_hash, senha_plana):
-            self.usuario_logado = usuario
-            return True
-            
-        return False
+
+        self.tentativas.registrar_sucesso(email, origem)
+
+        if novo_hash:
+            self.repo.atualizar_senha_hash(usuario.id, novo_hash)
+            usuario.senha_hash = novo_hash
+
+        self.usuario_logado = usuario
+        return True
 
     def logout(self):
         self.usuario_logado = None
 
     def get_usuario_atual(self):
-        return self.usuario_logado
\ No newline at end of file
+        return self.usuario_logado
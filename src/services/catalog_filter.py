@@ -0,0 +1,83 @@
+from typing import Any, List, Optional, Tuple
+
+
+class FiltroCatalogo:
+    """
+    Filtro em memória do catálogo (busca por nome, categoria e faixa de preço).
+
+    Os campos usados na busca são extraídos uma vez, na criação. Quando o
+    termo novo contém o anterior (o usuário continuou digitando) e os demais
+    filtros não mudaram, o resultado é refinado a partir do anterior em vez
+    de percorrer o catálogo inteiro.
+    """
+
+    TODAS = "Todas"
+    # Rótulo do filtro de preço -> (mínimo, máximo, inclui o mínimo)
+    FAIXAS_PRECO = {
+        "Todos": (None, None, True),
+        "Até R$ 50": (None, 50, True),
+        "R$ 50 - R$ 100": (50, 100, True),
+        "R$ 100 - R$ 300": (100, 300, True),
+        "Acima de R$ 300": (300, None, False),
+    }
+
+    def __init__(self, produtos: List[Any]):
+        self.produtos = produtos
+        self._indice = [self._extrair(p) for p in produtos]
+        # Última busca: (termo, categoria, faixa, posições no índice, produtos)
+        self._ultima: Optional[Tuple[str, str, str, List[int], List[Any]]] = None
+
+    def filtrar(self, termo: str = "", categoria: str = "", faixa_preco: str = "") -> List[Any]:
+        """
+        Produtos ativos que atendem aos filtros, na ordem original.
+        Para a mesma busca repetida devolve a mesma lista (mesmo objeto).
+        """
+        termo = termo.lower().strip()
+        categoria = "" if categoria in ("", self.TODAS) else categoria
+        faixa_preco = "" if faixa_preco == "Todos" else faixa_preco
+
+        ultima = self._ultima
+        if ultima and ultima[1:3] == (categoria, faixa_preco):
+            if ultima[0] == termo:
+                return ultima[4]
+            if ultima[0] in termo:
+                # Refina: só quem casou com o termo anterior pode casar com este
+                posicoes = [i for i in ultima[3] if termo in self._indice[i][0]]
+                return self._guardar(termo, categoria, faixa_preco, posicoes)
+
+        minimo, maximo, inclui_minimo = self.FAIXAS_PRECO.get(faixa_preco or "Todos", (None, None, True))
+        posicoes = []
+        for i, (nome, cat_nome, preco, ativo) in enumerate(self._indice):
+            if not ativo or termo not in nome:
+                continue
+            if categoria and cat_nome != categoria:
+                continue
+            if minimo is not None and (preco < minimo or (preco == minimo and not inclui_minimo)):
+                continue
+            if maximo is not None and preco > maximo:
+                continue
+            posicoes.append(i)
+        return self._guardar(termo, categoria, faixa_preco, posicoes)
+
+    # --- Métodos privados ---
+
+    def _guardar(self, termo, categoria, faixa_preco, posicoes) -> List[Any]:
+        resultado = [self.produtos[i] for i in posicoes]
+        self._ultima = (termo, categoria, faixa_preco, posicoes, resultado)
+        return resultado
+
+    @staticmethod
+    def _extrair(produto) -> Tuple[str, str, float, bool]:
+        """(nome em minúsculas, nome da categoria, preço, ativo) de um produto."""
+        if isinstance(produto, dict):
+            nome = produto.get("nome", "")
+            cat_nome = produto.get("categoria_nome") or ""
+            preco = produto.get("preco", 0.0)
+            ativo = produto.get("ativo", 1)
+        else:
+            nome = getattr(produto, "nome", "")
+            cat = getattr(produto, "categoria", None)
+            cat_nome = cat.nome if cat and hasattr(cat, "nome") else ""
+            preco = getattr(produto, "preco", 0.0)
+            ativo = getattr(produto, "ativo", 1)
+        return (nome or "").lower(), cat_nome, float(preco or 0.0), bool(ativo)
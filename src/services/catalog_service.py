@@ -1,13 +1,10 @@
-import os
-import shutil
-import uuid
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 from src.models.products.product_model import Produto
 from src.models.products.category_model import Categoria
 from src.repositories.product_repository import ProductRepository
 from src.repositories.category_repository import CategoryRepository 
-from src.config.settings import Config
+from src.services.image_pipeline import PipelineImagens
 
 class CatalogService:
     """
@@ -18,8 +15,8 @@ class CatalogService:
         self.product_repo = ProductRepository()
         self.category_repo = CategoryRepository()
         
-        self.upload_dir = os.path.join(Config.BASE_DIR, 'uploads', 'produtos')
-        os.makedirs(self.upload_dir, exist_ok=True)
+        self.pipeline = PipelineImagens()
+        self.upload_dir = self.pipeline.diretorio
 
     def listar_categorias(self) -> List[Categoria]:
         dados_brutos = self.category_repo.listar()
@@ -59,17 +56,38 @@ class CatalogService:
                 prod.descricao = dado['descricao']
             if 'imagem_principal' in dado:
                 prod.imagem_principal = dado['imagem_principal']
+            # Variantes já no tamanho do card e do modal (uploads processados)
+            prod.imagem_card = dado.get('imagem_card')
+            prod.imagem_detalhe = dado.get('imagem_detalhe')
             if 'imagens' in dado:
                 prod.imagens = dado['imagens']
             if 'ativo' in dado:
                 prod.ativo = dado['ativo']
+            if dado.get('peso_kg') is not None:
+                prod.peso_kg = dado['peso_kg']
+            dimensoes = (dado.get('altura_cm'), dado.get('largura_cm'), dado.get('comprimento_cm'))
+            if None not in dimensoes:
+                prod.dimensoes_cm = dimensoes
             
             lista_produtos.append(prod)
                 
         return lista_produtos
 
+    def contar_produtos(self) -> int:
+        return self.product_repo.contar()
+
+    def listar_produtos_pagina(self, inicio: int, quantidade: int, ordenar_por: Optional[str] = None,
+                               decrescente: bool = False, apos: Optional[Dict[str, Any]] = None,
+                               antes: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Janela de produtos (dicts com categoria_nome) para tabelas paginadas."""
+        return self.product_repo.listar_pagina(
+            inicio, quantidade, ordenar_por or "id", decrescente, apos, antes
+        )
+
     def cadastrar_produto(self, nome: str, sku: str, preco: float, estoque: int, 
-                          nome_categoria: str, descricao: str = "", imagem_path: Optional[str] = None):
+                          nome_categoria: str, descricao: str = "", imagem_path: Optional[str] = None,
+                          peso_kg: Optional[float] = None, altura_cm: Optional[float] = None,
+                          largura_cm: Optional[float] = None, comprimento_cm: Optional[float] = None):
         
         categoria_selecionada = self._buscar_categoria_por_nome(nome_categoria)
 
@@ -80,18 +98,22 @@ class CatalogService:
             'estoque': int(estoque),
             'categoria_id': categoria_selecionada.id,
             'descricao': descricao,
-            'ativo': 1
+            'ativo': 1,
+            **self._medidas(peso_kg, altura_cm, largura_cm, comprimento_cm)
         }
 
         novo_produto = self.product_repo.salvar(produto_dict)
         produto_id = novo_produto['id']
 
         if imagem_path:
-            caminho_final = self._salvar_arquivo_em_disco(imagem_path)
-            self.product_repo.salvar_imagem(produto_id, caminho_final)
+            chave, variantes = self._salvar_arquivo_em_disco(imagem_path)
+            self.product_repo.salvar_variantes_imagem(produto_id, variantes, chave=chave)
 
     def atualizar_produto(self, produto_id: int, nome: str, sku: str, preco: float, 
-                          estoque: int, nome_categoria: str, descricao: str = "", imagem_path: Optional[str] = None):
+                          estoque: int, nome_categoria: str, descricao: str = "", imagem_path: Optional[str] = None,
+                          peso_kg: Optional[float] = None, altura_cm: Optional[float] = None,
+                          largura_cm: Optional[float] = None, comprimento_cm: Optional[float] = None):
+        """Medidas não informadas (None) mantêm os valores salvos."""
         
         categoria_selecionada = self._buscar_categoria_por_nome(nome_categoria)
 
@@ -103,20 +125,59 @@ class CatalogService:
             'estoque': int(estoque),
             'categoria_id': categoria_selecionada.id,
             'descricao': descricao,
-            'ativo': 1
+            'ativo': 1,
+            **self._medidas(peso_kg, altura_cm, largura_cm, comprimento_cm)
         }
 
         self.product_repo.atualizar(produto_dict)
 
         if imagem_path:
-            caminho_final = self._salvar_arquivo_em_disco(imagem_path)
-            self.product_repo.salvar_imagem(produto_id, caminho_final)
+            # Troca a imagem do produto em vez de acumular uma linha por edição
+            chave, variantes = self._salvar_arquivo_em_disco(imagem_path)
+            anteriores = self.product_repo.substituir_imagens(produto_id, variantes, chave)
+            self._liberar_imagens(anteriores)
+
+    def importar_imagens(self, imagens: Dict[int, str]) -> Dict[int, Dict[str, str]]:
+        """
+        Processa e vincula imagens a vários produtos de uma vez
+        (produto_id -> arquivo). As variantes são geradas num pool de processos.
+        """
+        produto_ids = list(imagens)
+        lote = self.pipeline.processar_lote([imagens[pid] for pid in produto_ids])
+        for produto_id, (chave, variantes) in zip(produto_ids, lote):
+            self.product_repo.salvar_variantes_imagem(produto_id, variantes, chave=chave)
+        return {pid: variantes for pid, (_, variantes) in zip(produto_ids, lote)}
 
     def remover_produto(self, id_produto: int):
-        return self.product_repo.deletar(id_produto)
+        anteriores = self.product_repo.hashes_do_produto(id_produto)
+        removido = self.product_repo.deletar(id_produto)
+        if removido:
+            self._liberar_imagens(anteriores)
+        return removido
+
+    def coletar_imagens_orfas(self) -> int:
+        """Apaga do disco as imagens sem nenhuma referência. Retorna quantas."""
+        return self.pipeline.coletar_lixo(self.product_repo.hashes_referenciados())
 
     # --- Métodos Privados ---
 
+    @staticmethod
+    def _medidas(peso_kg, altura_cm, largura_cm, comprimento_cm) -> Dict[str, Optional[float]]:
+        """Peso e dimensões usados no frete; None = não informado."""
+        medidas = {
+            'peso_kg': peso_kg,
+            'altura_cm': altura_cm,
+            'largura_cm': largura_cm,
+            'comprimento_cm': comprimento_cm,
+        }
+        for campo, valor in medidas.items():
+            if valor is None:
+                continue
+            medidas[campo] = float(valor)
+            if medidas[campo] < 0:
+                raise ValueError(f"Valor inválido para {campo}: {valor}")
+        return medidas
+
     def _buscar_categoria_por_nome(self, nome: str) -> Categoria:
         categorias = self.listar_categorias()
         categoria = next((c for c in categorias if c.nome == nome), None)
@@ -124,13 +185,18 @@ class CatalogService:
             raise ValueError(f"Categoria '{nome}' inválida.")
         return categoria
 
-    def _salvar_arquivo_em_disco(self, caminho_origem: str) -> str:
-        if not os.path.exists(caminho_origem):
-            raise FileNotFoundError("Arquivo de imagem não encontrado.")
-
-        extensao = os.path.splitext(caminho_origem)[1]
-        nome_arquivo = f"{uuid.uuid4()}{extensao}"
-        caminho_destino = os.path.join(self.upload_dir, nome_arquivo)
-
-        shutil.copy2(caminho_origem, caminho_destino)
-        return os.path.join('uploads', 'produtos', nome_arquivo)
\ No newline at end of file
+    def _salvar_arquivo_em_disco(self, caminho_origem: str) -> Tuple[str, Dict[str, str]]:
+        """
+        Guarda a imagem enviada (variantes WebP, nomeadas pelo hash do conteúdo).
+        Retorna (hash, variante -> caminho).
+        """
+        return self.pipeline.processar(caminho_origem)
+
+    def _liberar_imagens(self, chaves: List[str]) -> None:
+        """
+        Apaga os arquivos dos hashes que ficaram sem referência. Os gravados
+        ou reaproveitados há pouco ficam para a coleta de órfãs.
+        """
+        for chave in set(chaves):
+            if self.product_repo.contar_referencias(chave) == 0:
+                self.pipeline.remover_sem_uso(chave)
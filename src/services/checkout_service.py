@@ -2,6 +2,7 @@ from typing import Dict, Any
 from src.models.enums import StatusPedido, StatusPagamento
 from src.integration.payment.payment_gateway import PaymentGateway
 from src.integration.shipping.shipping_calculator import ShippingCalculator
+from src.integration.shipping.packing import calcular_carga
 from src.repositories.cart_repository import CarrinhoRepository
 from src.repositories.order_repository import PedidoRepository
 from src.repositories.product_repository import ProductRepository
@@ -41,6 +42,11 @@ class CheckoutService:
         self.pagamento_gateway = pagamento_gateway
         self.frete_calculator = frete_calculator
 
+    @staticmethod
+    def calcular_peso_total(itens) -> float:
+        """Peso taxável da carga em kg (maior entre real e cubado, por caixa)."""
+        return calcular_carga(itens)['peso_taxavel_kg']
+
     def processar_compra(self, 
                          carrinho_id: int, 
                          dados_pagamento: Dict[str, Any], 
@@ -57,7 +63,7 @@ class CheckoutService:
             raise ValueError("O carrinho está vazio.")
         
         # 2. CALCULAR FRETE
-        peso_total = sum([item['quantidade'] * 1.0 for item in itens])
+        peso_total = self.calcular_peso_total(itens)
         cep_destino = endereco_entrega.get('cep', '00000-000')
         valor_frete = self.frete_calculator.calcular(cep_destino, peso_total)
 
@@ -141,7 +147,7 @@ class CheckoutService:
             
             usuario = self.user_repo.buscar_por_id(cliente_id)
             if usuario:
-                self.email_service.enviar_confirmacao_pedido(usuario.to_dict(), novo_pedido.to_dict())
+                self.email_service.enfileirar_confirmacao_pedido(usuario.to_dict(), novo_pedido.to_dict())
 
             return novo_pedido
 
@@ -0,0 +1,182 @@
+"""Envio em segundo plano dos emails da caixa de saída.
+
+O ``EmailDispatcher`` roda em uma thread própria, com conexão SQLite
+dedicada, e drena a tabela email_outbox em lotes. Os emails reservados
+ficam em um heap por (prioridade, agendamento), reabastecido a cada meio
+lote, para que um email urgente enfileirado durante o envio de um lote
+grande passe na frente dos menos urgentes. Falhas são reagendadas com
+backoff exponencial até ``max_tentativas``.
+"""
+
+import heapq
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.config.database import DatabaseConnection
+from src.repositories.email_outbox_repository import EmailOutboxRepository
+from src.services.email_service import EmailService
+
+
+logger = logging.getLogger(__name__)
+
+
+class EmailDispatcher:
+    """Thread que envia os emails persistidos pelo EmailService."""
+
+    # Emails reservados por ida ao banco
+    TAMANHO_LOTE = 20
+
+    # Espera (s) entre varreduras quando a fila está vazia
+    INTERVALO_SEGUNDOS = 1.0
+
+    # Backoff entre tentativas: base * 2^(tentativas - 1), limitado ao máximo
+    BACKOFF_BASE_SEGUNDOS = 30.0
+    BACKOFF_MAX_SEGUNDOS = 3600.0
+
+    # Emails enviados são apagados da caixa de saída após esse período
+    RETENCAO_DIAS = 30
+    LIMPEZA_A_CADA_SEGUNDOS = 3600.0
+
+    def __init__(
+        self,
+        email_service: EmailService,
+        outbox: Optional[EmailOutboxRepository] = None,
+        max_tentativas: Optional[int] = None,
+        relogio: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            email_service: Serviço usado para o envio efetivo
+            outbox: Repositório a drenar. Se omitido, a thread abre o seu
+                próprio, com conexão dedicada.
+            max_tentativas: Tentativas antes de desistir (padrão: EmailService.MAX_TENTATIVAS)
+            relogio: Fonte de tempo (timestamp Unix)
+        """
+        self.email_service = email_service
+        self.outbox = outbox
+        self.max_tentativas = max_tentativas or EmailService.MAX_TENTATIVAS
+        self._relogio = relogio
+
+        self._heap: List[Tuple[int, float, int, Dict[str, Any]]] = []
+        self._parar = threading.Event()
+        self._acordar = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # --- Ciclo de vida ---
+
+    def iniciar(self) -> None:
+        """Inicia a thread de envio (sem efeito se já estiver rodando)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._parar.clear()
+        self._thread = threading.Thread(
+            target=self._executar, name="email-dispatcher", daemon=True
+        )
+        self._thread.start()
+
+    def notificar(self) -> None:
+        """Antecipa a próxima varredura (ex.: logo após enfileirar um email)."""
+        self._acordar.set()
+
+    def encerrar(self, timeout: float = 5.0) -> None:
+        """Para a thread; emails reservados e não enviados voltam para a fila."""
+        self._parar.set()
+        self._acordar.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    # --- Envio ---
+
+    def drenar(
+        self, outbox: Optional[EmailOutboxRepository] = None, limite: Optional[int] = None
+    ) -> Dict[str, int]:
+        """Envia os emails vencidos da caixa de saída.
+
+        Args:
+            outbox: Repositório a usar (padrão: o informado no construtor)
+            limite: Máximo de emails a processar nesta chamada
+
+        Returns:
+            Dict com 'enviados', 'reagendados' e 'desistidos'
+        """
+        outbox = outbox or self.outbox
+        resultado = {"enviados": 0, "reagendados": 0, "desistidos": 0}
+        processados = 0
+
+        while not self._parar.is_set() and (limite is None or processados < limite):
+            if len(self._heap) <= self.TAMANHO_LOTE // 2:
+                self._reabastecer(outbox)
+            if not self._heap:
+                break
+
+            _, _, _, email = heapq.heappop(self._heap)
+            processados += 1
+            resultado[self._enviar(outbox, email)] += 1
+
+        return resultado
+
+    def _reabastecer(self, outbox: EmailOutboxRepository) -> None:
+        vagas = self.TAMANHO_LOTE - len(self._heap)
+        for email in outbox.reservar_lote(vagas, self._relogio()):
+            heapq.heappush(
+                self._heap,
+                (email["prioridade"], email["proxima_tentativa_em"], email["id"], email),
+            )
+
+    def _enviar(self, outbox: EmailOutboxRepository, email: Dict[str, Any]) -> str:
+        try:
+            self.email_service.despachar(email)
+        except Exception as e:
+            tentativas = email["tentativas"] + 1
+            if tentativas >= self.max_tentativas:
+                logger.error(
+                    f"Email {email['id']} descartado após {tentativas} tentativas: {e}"
+                )
+                outbox.marcar_falha(email["id"], str(e), None)
+                return "desistidos"
+
+            proxima = self._relogio() + self._atraso(tentativas)
+            logger.warning(f"Falha ao enviar email {email['id']} (tentativa {tentativas}): {e}")
+            outbox.marcar_falha(email["id"], str(e), proxima)
+            return "reagendados"
+
+        outbox.marcar_enviado(email["id"])
+        return "enviados"
+
+    def _atraso(self, tentativas: int) -> float:
+        return min(
+            self.BACKOFF_MAX_SEGUNDOS, self.BACKOFF_BASE_SEGUNDOS * 2 ** (tentativas - 1)
+        )
+
+    # --- Thread ---
+
+    def _executar(self) -> None:
+        conexao = None
+        outbox = self.outbox
+        if outbox is None:
+            conexao = DatabaseConnection().create_connection()
+            outbox = EmailOutboxRepository(conn_factory=lambda: conexao)
+
+        ultima_limpeza = 0.0
+        try:
+            outbox.liberar_reservas()
+            while not self._parar.is_set():
+                try:
+                    self.drenar(outbox)
+                    if self._relogio() - ultima_limpeza >= self.LIMPEZA_A_CADA_SEGUNDOS:
+                        outbox.limpar_enviados(self.RETENCAO_DIAS)
+                        ultima_limpeza = self._relogio()
+                except Exception:
+                    logger.exception("Erro ao drenar a caixa de saída de emails")
+                self._acordar.wait(self.INTERVALO_SEGUNDOS)
+                self._acordar.clear()
+        finally:
+            self._heap.clear()
+            try:
+                outbox.liberar_reservas()
+            finally:
+                if conexao is not None:
+                    conexao.close()
@@ -1,16 +1,29 @@
 """Serviço de envio de emails.
 
 Implementa lógica de negócio para envio de emails com templates,
-validações, retry logic e filas (simuladas).
+validações, retry logic e filas. Com um ``EmailOutboxRepository`` os
+emails enfileirados são persistidos e enviados em segundo plano pelo
+``EmailDispatcher``; sem ele, a fila fica em memória.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
+import heapq
+import itertools
 import re
 import logging
-from datetime import datetime
+import time
+from collections import deque
+from datetime import datetime, timedelta
 from decimal import Decimal
+from email.message import EmailMessage
 from enum import Enum
 
+from src.config.settings import Config
+from src.integration.email.smtp_transport import PoolSMTP
+
+if TYPE_CHECKING:
+    from src.repositories.email_outbox_repository import EmailOutboxRepository
+
 
 # Configurar logger
 logger = logging.getLogger(__name__)
@@ -66,6 +79,13 @@ class EmailService:
     # Limite de emails por lote
     MAX_EMAILS_POR_LOTE = 50
 
+    # Retenção do histórico em memória
+    MAX_HISTORICO = 500
+    RETENCAO_HISTORICO = timedelta(days=1)
+
+    # Prioridade de emails transacionais (menor = mais urgente)
+    PRIORIDADE_TRANSACIONAL = 1
+
     def __init__(
         self,
         smtp_host: Optional[str] = None,
@@ -74,6 +94,9 @@ class EmailService:
         smtp_password: Optional[str] = None,
         remetente: str = "noreply@scee.com.br",
         modo_mock: bool = True,
+        outbox: Optional["EmailOutboxRepository"] = None,
+        usar_tls: bool = False,
+        transporte: Optional[PoolSMTP] = None,
     ):
         self.smtp_host = smtp_host
         self.smtp_port = smtp_port
@@ -81,9 +104,33 @@ class EmailService:
         self.smtp_password = smtp_password
         self.remetente = remetente
         self.modo_mock = modo_mock
+        self.usar_tls = usar_tls
+        self._transporte = transporte
+
+        self.outbox = outbox
+
+        # Heap de (prioridade, sequência, email): inserção O(log n), FIFO na mesma prioridade
+        self._fila: List[tuple] = []
+        self._sequencia = itertools.count()
+        self.historico: deque = deque(maxlen=self.MAX_HISTORICO)
+
+    @classmethod
+    def da_configuracao(cls, **kwargs) -> "EmailService":
+        """Cria o serviço com o SMTP de ``Config`` (modo mock se SMTP_HOST vazio)."""
+        return cls(
+            smtp_host=Config.SMTP_HOST or None,
+            smtp_port=Config.SMTP_PORT,
+            smtp_user=Config.SMTP_USER or None,
+            smtp_password=Config.SMTP_PASSWORD or None,
+            modo_mock=not Config.SMTP_HOST,
+            usar_tls=Config.SMTP_TLS,
+            **kwargs,
+        )
 
-        self.fila_emails: List[Dict[str, Any]] = []
-        self.historico: List[Dict[str, Any]] = []
+    @property
+    def fila_emails(self) -> List[Dict[str, Any]]:
+        """Emails da fila em memória, na ordem de envio."""
+        return [email for _, _, email in sorted(self._fila)]
 
     def enviar_email(
         self,
@@ -138,35 +185,34 @@ class EmailService:
         self, usuario: Dict[str, Any], pedido: Dict[str, Any]
     ) -> bool:
         """Envia email de confirmação de pedido."""
-        valor_total = pedido.get("valor_total", pedido.get("total", 0.0))
-
         return self.enviar_email_template(
             destinatario=usuario["email"],
             tipo=TipoEmail.CONFIRMACAO_PEDIDO,
-            dados={
-                "nome": usuario["nome"],
-                "pedido_id": pedido["id"],
-                "total": valor_total,  # Passa para o template como 'total'
-                "itens": pedido.get("itens", []),
-            },
+            dados=self._dados_confirmacao_pedido(usuario, pedido),
+        )
+
+    def enfileirar_confirmacao_pedido(
+        self, usuario: Dict[str, Any], pedido: Dict[str, Any]
+    ) -> Any:
+        """Enfileira o email de confirmação de pedido sem enviá-lo.
+
+        Returns:
+            ID do email na fila
+        """
+        assunto, corpo = self._gerar_email_template(
+            TipoEmail.CONFIRMACAO_PEDIDO, self._dados_confirmacao_pedido(usuario, pedido)
+        )
+        return self.enfileirar_email(
+            usuario["email"], assunto, corpo, prioridade=self.PRIORIDADE_TRANSACIONAL
         )
 
     def enviar_atualizacao_pedido(
         self, usuario: Dict[str, Any], pedido: Dict[str, Any], novo_status: str
     ) -> bool:
         """Envia email de atualização de status do pedido."""
-        if novo_status == "ENVIADO":
-            tipo = TipoEmail.PEDIDO_ENVIADO
-        elif novo_status == "ENTREGUE":
-            tipo = TipoEmail.PEDIDO_ENTREGUE
-        elif novo_status == "CANCELADO":
-            tipo = TipoEmail.PEDIDO_CANCELADO
-        else:
-            tipo = TipoEmail.ATUALIZACAO_PEDIDO
-
         return self.enviar_email_template(
             destinatario=usuario["email"],
-            tipo=tipo,
+            tipo=self._tipo_por_status(novo_status),
             dados={
                 "nome": usuario["nome"],
                 "pedido_id": pedido["id"],
@@ -174,6 +220,61 @@ class EmailService:
             },
         )
 
+    def enfileirar_atualizacao_pedido(
+        self,
+        usuario: Dict[str, Any],
+        pedido: Dict[str, Any],
+        novo_status: str,
+        janela_segundos: Optional[float] = None,
+    ) -> Any:
+        """Enfileira o aviso de mudança de status, agrupando avisos próximos.
+
+        Com outbox, o aviso só sai após ``janela_segundos``; novos status do
+        mesmo pedido e destinatário nesse intervalo são mesclados no mesmo
+        email, que mostra o status mais recente e a sequência percorrida.
+        Sem outbox, vai para a fila em memória sem agrupamento.
+
+        Returns:
+            ID do email na fila
+        """
+        self._validar_email(usuario["email"])
+        if janela_segundos is None:
+            janela_segundos = Config.EMAIL_JANELA_AGRUPAMENTO_SEGUNDOS
+
+        if self.outbox is None:
+            assunto, corpo = self._gerar_atualizacao_pedido(usuario, pedido, [novo_status])
+            return self.adicionar_a_fila(
+                usuario["email"], assunto, corpo, self.PRIORIDADE_TRANSACIONAL
+            )
+
+        chave = f"pedido:{pedido['id']}:{usuario['email'].lower()}"
+        pendente = self.outbox.buscar_pendente_por_chave(chave)
+        if pendente:
+            sequencia = list((pendente["metadados"] or {}).get("status", []))
+            if not sequencia or sequencia[-1] != novo_status:
+                sequencia.append(novo_status)
+            assunto, corpo = self._gerar_atualizacao_pedido(usuario, pedido, sequencia)
+            if self.outbox.substituir_conteudo(
+                pendente["id"], assunto, corpo, {"status": sequencia}
+            ):
+                logger.info(f"Aviso do pedido {pedido['id']} mesclado no email {pendente['id']}")
+                return pendente["id"]
+            # Já reservado pelo dispatcher: os status anteriores seguem nele
+
+        assunto, corpo = self._gerar_atualizacao_pedido(usuario, pedido, [novo_status])
+        salvo = self.outbox.salvar(
+            {
+                "destinatario": usuario["email"],
+                "assunto": assunto,
+                "corpo": corpo,
+                "prioridade": self.PRIORIDADE_TRANSACIONAL,
+                "proxima_tentativa_em": time.time() + janela_segundos,
+                "chave_agrupamento": chave,
+                "metadados": {"status": [novo_status]},
+            }
+        )
+        return salvo["id"]
+
     def enviar_resetar_senha(self, usuario: Dict[str, Any], token: str) -> bool:
         return self.enviar_email_template(
             destinatario=usuario["email"],
@@ -195,6 +296,9 @@ class EmailService:
                 f"Máximo de {self.MAX_EMAILS_POR_LOTE} emails por lote"
             )
 
+        if not self.modo_mock:
+            return self._enviar_lote_smtp(destinatarios, assunto, corpo)
+
         sucessos = 0
         falhas = 0
         erros = []
@@ -216,23 +320,56 @@ class EmailService:
             "erros": erros,
         }
 
-    def adicionar_a_fila(
-        self, destinatario: str, assunto: str, corpo: str, prioridade: int = 5
-    ) -> str:
-        email_id = self._gerar_id_email()
-        self.fila_emails.append(
+    def enfileirar_email(
+        self,
+        destinatario: str,
+        assunto: str,
+        corpo: str,
+        copias: Optional[List[str]] = None,
+        prioridade: int = 5,
+    ) -> Any:
+        """Valida e enfileira um email para envio posterior.
+
+        Com outbox configurado o email é persistido (o envio fica com o
+        EmailDispatcher); caso contrário vai para a fila em memória.
+
+        Returns:
+            ID do email na fila
+        """
+        self._validar_email(destinatario)
+        for email in copias or []:
+            self._validar_email(email)
+
+        if self.outbox is None:
+            return self.adicionar_a_fila(destinatario, assunto, corpo, prioridade)
+
+        salvo = self.outbox.salvar(
             {
-                "id": email_id,
                 "destinatario": destinatario,
                 "assunto": assunto,
                 "corpo": corpo,
+                "copias": copias or [],
                 "prioridade": prioridade,
-                "tentativas": 0,
-                "criado_em": datetime.now(),
-                "enviado": False,
             }
         )
-        self.fila_emails.sort(key=lambda x: x["prioridade"])
+        logger.info(f"Email {salvo['id']} adicionado à caixa de saída")
+        return salvo["id"]
+
+    def adicionar_a_fila(
+        self, destinatario: str, assunto: str, corpo: str, prioridade: int = 5
+    ) -> str:
+        email_id = self._gerar_id_email()
+        email_data = {
+            "id": email_id,
+            "destinatario": destinatario,
+            "assunto": assunto,
+            "corpo": corpo,
+            "prioridade": prioridade,
+            "tentativas": 0,
+            "criado_em": datetime.now(),
+            "enviado": False,
+        }
+        heapq.heappush(self._fila, (prioridade, next(self._sequencia), email_data))
         logger.info(f"Email {email_id} adicionado à fila")
         return email_id
 
@@ -240,31 +377,49 @@ class EmailService:
         processados = 0
         sucessos = 0
         falhas = 0
-        emails_a_processar = self.fila_emails[:limite] if limite else self.fila_emails
 
-        for email_data in emails_a_processar:
+        while self._fila and (not limite or processados < limite):
+            _, _, email_data = heapq.heappop(self._fila)
             processados += 1
             if self._enviar_com_retry(email_data):
                 sucessos += 1
-                self.fila_emails.remove(email_data)
             else:
                 falhas += 1
-                if email_data["tentativas"] >= self.MAX_TENTATIVAS:
-                    self.fila_emails.remove(email_data)
 
         return {
             "processados": processados,
             "sucessos": sucessos,
             "falhas": falhas,
-            "restantes_na_fila": len(self.fila_emails),
+            "restantes_na_fila": len(self._fila),
         }
 
+    def despachar(self, email_data: Dict[str, Any]) -> bool:
+        """Faz uma única tentativa de envio, sem retry.
+
+        Usado pelo EmailDispatcher, que controla o reagendamento.
+
+        Raises:
+            EnvioEmailError: Se o envio falhar
+        """
+        try:
+            enviado = self._enviar_real(email_data)
+        except Exception as e:
+            raise EnvioEmailError(str(e)) from e
+        if not enviado:
+            raise EnvioEmailError(f"Envio para {email_data['destinatario']} recusado")
+
+        self._registrar_envio(email_data)
+        return True
+
+    def fechar(self) -> None:
+        """Encerra as conexões SMTP abertas."""
+        if self._transporte is not None:
+            self._transporte.fechar()
+
     def obter_historico(self, limite: Optional[int] = None) -> List[Dict[str, Any]]:
-        historico = sorted(
-            self.historico,
-            key=lambda x: x.get("enviado_em", datetime.min),
-            reverse=True,
-        )
+        """Emails enviados recentemente, do mais novo para o mais antigo."""
+        self._expirar_historico()
+        historico = list(reversed(self.historico))
         if limite:
             return historico[:limite]
         return historico
@@ -280,17 +435,59 @@ class EmailService:
     def _gerar_id_email(self) -> str:
         return f"email_{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
 
+    @staticmethod
+    def _dados_confirmacao_pedido(
+        usuario: Dict[str, Any], pedido: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return {
+            "nome": usuario["nome"],
+            "pedido_id": pedido["id"],
+            # Passa para o template como 'total'
+            "total": pedido.get("valor_total", pedido.get("total", 0.0)),
+            "itens": pedido.get("itens", []),
+        }
+
+    @staticmethod
+    def _tipo_por_status(status: str) -> TipoEmail:
+        if status == "ENVIADO":
+            return TipoEmail.PEDIDO_ENVIADO
+        if status == "ENTREGUE":
+            return TipoEmail.PEDIDO_ENTREGUE
+        if status == "CANCELADO":
+            return TipoEmail.PEDIDO_CANCELADO
+        return TipoEmail.ATUALIZACAO_PEDIDO
+
+    def _gerar_atualizacao_pedido(
+        self, usuario: Dict[str, Any], pedido: Dict[str, Any], sequencia: List[str]
+    ) -> tuple[str, str]:
+        """Assunto e corpo do aviso de status; lista a sequência se houver mais de um."""
+        assunto, corpo = self._gerar_email_template(
+            self._tipo_por_status(sequencia[-1]),
+            {"nome": usuario["nome"], "pedido_id": pedido["id"], "status": sequencia[-1]},
+        )
+        if len(sequencia) > 1:
+            corpo += f"\n\nAtualizações do pedido: {' → '.join(sequencia)}"
+        return assunto, corpo
+
+    def _registrar_envio(self, email_data: Dict[str, Any]) -> None:
+        email_data["enviado"] = True
+        email_data["enviado_em"] = datetime.now()
+        self.historico.append(dict(email_data))
+        self._expirar_historico()
+        logger.info(f"Email enviado com sucesso para {email_data['destinatario']}")
+
+    def _expirar_historico(self) -> None:
+        """Descarta do histórico os envios mais antigos que a retenção."""
+        limite = datetime.now() - self.RETENCAO_HISTORICO
+        while self.historico and self.historico[0].get("enviado_em", limite) < limite:
+            self.historico.popleft()
+
     def _enviar_com_retry(self, email_data: Dict[str, Any]) -> bool:
         while email_data["tentativas"] < self.MAX_TENTATIVAS:
             email_data["tentativas"] += 1
             try:
                 if self._enviar_real(email_data):
-                    email_data["enviado"] = True
-                    email_data["enviado_em"] = datetime.now()
-                    self.historico.append(dict(email_data))
-                    logger.info(
-                        f"Email enviado com sucesso para {email_data['destinatario']}"
-                    )
+                    self._registrar_envio(email_data)
                     return True
             except Exception as e:
                 logger.warning(
@@ -307,8 +504,81 @@ class EmailService:
             print(f"Assunto: {email_data['assunto']}")
             print("-" * 30)
             return True
-        else:
-            raise NotImplementedError("Envio real de email não implementado ainda")
+
+        self._obter_transporte().enviar(
+            self.remetente,
+            [email_data["destinatario"], *email_data.get("copias", [])],
+            self._montar_mensagem(email_data),
+        )
+        return True
+
+    def _enviar_lote_smtp(
+        self, destinatarios: List[str], assunto: str, corpo: str
+    ) -> Dict[str, Any]:
+        """Envia o lote pelas conexões do pool, sem reconectar por email."""
+        erros = []
+        validos = []
+        for destinatario in destinatarios:
+            try:
+                self._validar_email(destinatario)
+                validos.append(destinatario)
+            except EmailInvalidoError as e:
+                erros.append({"destinatario": destinatario, "erro": str(e)})
+
+        emails = [
+            {
+                "id": self._gerar_id_email(),
+                "destinatario": destinatario,
+                "assunto": assunto,
+                "corpo": corpo,
+                "copias": [],
+                "tentativas": 1,
+                "criado_em": datetime.now(),
+            }
+            for destinatario in validos
+        ]
+        resultados = self._obter_transporte().enviar_lote(
+            (self.remetente, [email["destinatario"]], self._montar_mensagem(email))
+            for email in emails
+        )
+
+        for email, erro in zip(emails, resultados):
+            if erro is None:
+                self._registrar_envio(email)
+            else:
+                erros.append({"destinatario": email["destinatario"], "erro": str(erro)})
+
+        return {
+            "total": len(destinatarios),
+            "sucessos": len(destinatarios) - len(erros),
+            "falhas": len(erros),
+            "erros": erros,
+        }
+
+    def _obter_transporte(self) -> PoolSMTP:
+        if self._transporte is None:
+            if not self.smtp_host:
+                raise EnvioEmailError("Servidor SMTP não configurado")
+            self._transporte = PoolSMTP(
+                self.smtp_host,
+                self.smtp_port or 25,
+                usuario=self.smtp_user,
+                senha=self.smtp_password,
+                usar_tls=self.usar_tls,
+                max_conexoes=Config.SMTP_MAX_CONEXOES,
+                mensagens_por_segundo=Config.SMTP_MENSAGENS_POR_SEGUNDO or None,
+            )
+        return self._transporte
+
+    def _montar_mensagem(self, email_data: Dict[str, Any]) -> EmailMessage:
+        mensagem = EmailMessage()
+        mensagem["From"] = self.remetente
+        mensagem["To"] = email_data["destinatario"]
+        if email_data.get("copias"):
+            mensagem["Cc"] = ", ".join(email_data["copias"])
+        mensagem["Subject"] = email_data["assunto"]
+        mensagem.set_content(email_data["corpo"])
+        return mensagem
 
     def _gerar_email_template(
         self, tipo: TipoEmail, dados: Dict[str, Any]
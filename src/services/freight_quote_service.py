@@ -0,0 +1,219 @@
+"""Serviço de cotação de frete com múltiplas transportadoras.
+
+Consulta todas as calculadoras registradas em paralelo, respeitando um
+prazo máximo por cotação, e guarda os resultados em cache por prefixo de
+CEP e faixa de peso.
+"""
+
+import copy
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.config.settings import Config
+from src.integration.shipping.shipping_calculator import ShippingCalculator
+
+
+logger = logging.getLogger(__name__)
+
+
+class CotacaoFreteError(Exception):
+    """Nenhuma transportadora respondeu à cotação."""
+
+    pass
+
+
+class CotacaoFreteService(ShippingCalculator):
+    """Cotação de frete concorrente entre transportadoras, com cache TTL.
+
+    Também implementa ``ShippingCalculator``: ``calcular`` devolve o valor da
+    opção mais barata, então o serviço pode ser injetado no
+    ``CheckoutService`` no lugar de uma calculadora única.
+    """
+
+    nome = "Cotação"
+
+    # Dígitos do CEP usados na chave do cache (região/sub-região/setor)
+    PREFIXO_CEP = 5
+
+    # Largura das faixas de peso (kg); cada faixa é cotada pelo seu limite superior
+    FAIXA_PESO_KG = 0.5
+
+    # Limite de entradas no cache (LRU)
+    MAX_ENTRADAS_CACHE = 1024
+
+    # Threads do pool por transportadora: chamadas travadas não podem ser
+    # interrompidas, então sobra folga para as cotações seguintes
+    THREADS_POR_CALCULADORA = 4
+
+    def __init__(
+        self,
+        calculadoras: List[ShippingCalculator],
+        prazo_limite: Optional[float] = None,
+        ttl: Optional[float] = None,
+        relogio: Callable[[], float] = time.monotonic,
+    ):
+        if not calculadoras:
+            raise ValueError("Informe ao menos uma calculadora de frete")
+
+        self.calculadoras = list(calculadoras)
+        self.prazo_limite = (
+            prazo_limite if prazo_limite is not None else Config.FRETE_TIMEOUT_SEGUNDOS
+        )
+        self.ttl = ttl if ttl is not None else Config.FRETE_CACHE_TTL_SEGUNDOS
+        self._relogio = relogio
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self.calculadoras) * self.THREADS_POR_CALCULADORA,
+            thread_name_prefix="cotacao-frete",
+        )
+        # Chamadas ainda em execução: futuro -> (índice da calculadora, início)
+        self._em_andamento: Dict[Future, Tuple[int, float]] = {}
+        self._cache: "OrderedDict[Tuple[str, int], Tuple[float, Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    # --- API pública ---
+
+    def cotar(self, cep_destino: str, peso_total: float) -> Dict[str, Any]:
+        """Cota o frete em todas as transportadoras.
+
+        Args:
+            cep_destino: CEP de entrega (com ou sem máscara)
+            peso_total: Peso total da carga em kg
+
+        Returns:
+            Dict com 'cotacoes' (ordenadas por valor), 'mais_barata',
+            'mais_rapida' e 'sem_resposta' (transportadoras que falharam
+            ou estouraram o prazo)
+
+        Raises:
+            CotacaoFreteError: Se nenhuma transportadora responder
+        """
+        cep = self._normalizar_cep(cep_destino)
+        faixa = self._faixa_peso(peso_total)
+        chave = (cep[: self.PREFIXO_CEP], faixa)
+
+        em_cache = self._ler_cache(chave)
+        if em_cache is not None:
+            return em_cache
+
+        resultado = self._cotar_em_paralelo(cep, faixa * self.FAIXA_PESO_KG)
+        self._gravar_cache(chave, resultado)
+        return copy.deepcopy(resultado)
+
+    def calcular(self, cep_destino: str, peso_total: float) -> float:
+        """Valor da opção mais barata (compatível com ShippingCalculator)."""
+        return self.cotar(cep_destino, peso_total)["mais_barata"]["valor"]
+
+    def prazo_dias(self, cep_destino: str, peso_total: float) -> int:
+        """Prazo da opção mais rápida."""
+        return self.cotar(cep_destino, peso_total)["mais_rapida"]["prazo_dias"]
+
+    def limpar_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def encerrar(self) -> None:
+        """Libera as threads do pool sem aguardar cotações pendentes."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # --- Métodos privados ---
+
+    def _cotar_em_paralelo(self, cep: str, peso: float) -> Dict[str, Any]:
+        cotacoes = []
+        sem_resposta = []
+        travadas = self._calculadoras_travadas()
+
+        futuros = {}
+        for indice, calc in enumerate(self.calculadoras):
+            if indice in travadas:
+                # A chamada anterior passou do prazo e segue ocupando uma thread;
+                # não empilha outra atrás dela
+                logger.warning(f"Cotação de {calc.nome} ignorada: chamada anterior sem resposta")
+                sem_resposta.append(calc.nome)
+                continue
+            futuro = self._executor.submit(self._cotar_uma, calc, cep, peso)
+            with self._lock:
+                self._em_andamento[futuro] = (indice, time.monotonic())
+            futuro.add_done_callback(self._concluir)
+            futuros[futuro] = calc
+
+        concluidos, pendentes = wait(futuros, timeout=self.prazo_limite)
+
+        for futuro, calc in futuros.items():
+            if futuro in pendentes:
+                futuro.cancel()
+                logger.warning(f"Cotação de {calc.nome} excedeu {self.prazo_limite}s")
+                sem_resposta.append(calc.nome)
+                continue
+            try:
+                cotacoes.append(futuro.result())
+            except Exception as e:
+                logger.warning(f"Falha na cotação de {calc.nome}: {e}")
+                sem_resposta.append(calc.nome)
+
+        if not cotacoes:
+            raise CotacaoFreteError("Nenhuma transportadora respondeu à cotação")
+
+        cotacoes.sort(key=lambda c: (c["valor"], c["prazo_dias"]))
+        return {
+            "cotacoes": cotacoes,
+            "mais_barata": cotacoes[0],
+            "mais_rapida": min(cotacoes, key=lambda c: (c["prazo_dias"], c["valor"])),
+            "sem_resposta": sem_resposta,
+        }
+
+    def _calculadoras_travadas(self) -> set:
+        """Índices das calculadoras com chamada rodando além do prazo limite."""
+        agora = time.monotonic()
+        with self._lock:
+            return {
+                indice
+                for indice, inicio in self._em_andamento.values()
+                if agora - inicio >= self.prazo_limite
+            }
+
+    def _concluir(self, futuro: Future) -> None:
+        with self._lock:
+            self._em_andamento.pop(futuro, None)
+
+    @staticmethod
+    def _cotar_uma(calc: ShippingCalculator, cep: str, peso: float) -> Dict[str, Any]:
+        return {
+            "transportadora": calc.nome,
+            "valor": round(float(calc.calcular(cep, peso)), 2),
+            "prazo_dias": int(calc.prazo_dias(cep, peso)),
+        }
+
+    def _ler_cache(self, chave: Tuple[str, int]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entrada = self._cache.get(chave)
+            if entrada is None:
+                return None
+            expira_em, resultado = entrada
+            if self._relogio() >= expira_em:
+                del self._cache[chave]
+                return None
+            self._cache.move_to_end(chave)
+            return copy.deepcopy(resultado)
+
+    def _gravar_cache(self, chave: Tuple[str, int], resultado: Dict[str, Any]) -> None:
+        with self._lock:
+            self._cache[chave] = (self._relogio() + self.ttl, resultado)
+            self._cache.move_to_end(chave)
+            while len(self._cache) > self.MAX_ENTRADAS_CACHE:
+                self._cache.popitem(last=False)
+
+    @staticmethod
+    def _normalizar_cep(cep: str) -> str:
+        return "".join(ch for ch in (cep or "") if ch.isdigit()).ljust(8, "0")
+
+    def _faixa_peso(self, peso: float) -> int:
+        """Índice da faixa de peso (mínimo 1)."""
+        return max(1, math.ceil(max(peso, 0.0) / self.FAIXA_PESO_KG - 1e-9))
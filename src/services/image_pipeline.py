@@ -0,0 +1,233 @@
+"""Processamento das imagens de produto no momento do upload.
+
+Cada imagem enviada vira três arquivos WebP em ``Config.IMAGENS_PRODUTO_DIR``:
+
+- ``card`` (até 160px): usada pelos cards do catálogo
+- ``detalhe`` (até 350px): usada no modal de detalhes
+- ``original``: resolução original, recomprimida
+
+A orientação EXIF é aplicada aos pixels e os metadados (EXIF, ICC, XMP) não
+são copiados. Assim a interface lê arquivos pequenos, já no tamanho certo,
+em vez de reduzir a original a cada exibição.
+
+O armazenamento é endereçado por conteúdo: os arquivos se chamam
+``<sha256>_<variante>.webp`` e ficam na subpasta com os dois primeiros
+caracteres do hash. A mesma imagem enviada para vários produtos (ou de novo
+a cada edição) é processada e gravada uma vez só. Quantas linhas de
+``imagens_produto`` apontam para um hash é a contagem de referências; sem
+referências, os arquivos podem ser apagados (``remover``/``coletar_lixo``).
+
+Lotes de imagens são processados num pool de processos (o redimensionamento
+é CPU-bound e, em threads, ficaria preso ao GIL).
+"""
+import hashlib
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from PIL import Image, ImageOps
+
+from src.config.settings import Config
+
+FORMATO = "WEBP"
+EXTENSAO = ".webp"
+
+# Variante -> maior lado em pixels (None = mantém o tamanho original)
+VARIANTES: Dict[str, Optional[int]] = {
+    "card": 160,
+    "detalhe": 350,
+    "original": None,
+}
+
+# Nome dos arquivos do armazenamento: <sha256>_<variante>.webp
+_PADRAO_ARQUIVO = re.compile(r"^([0-9a-f]{64})_(%s)\%s$" % ("|".join(VARIANTES), EXTENSAO))
+
+
+# Tamanho dos pedaços lidos ao calcular o hash (o arquivo não é lido inteiro)
+_BLOCO_HASH = 1024 * 1024
+
+
+def hash_arquivo(caminho: str) -> str:
+    """SHA-256 do conteúdo do arquivo (chave no armazenamento)."""
+    digest = hashlib.sha256()
+    with open(caminho, "rb") as arquivo:
+        for bloco in iter(lambda: arquivo.read(_BLOCO_HASH), b""):
+            digest.update(bloco)
+    return digest.hexdigest()
+
+
+def processar_imagem(caminho_origem: str, diretorio: str, nome_base: str, qualidade: int) -> Dict[str, str]:
+    """
+    Gera as variantes de uma imagem. Função de módulo para poder rodar num
+    processo do pool.
+
+    :return: Variante -> caminho absoluto do arquivo gerado
+    :raises OSError: Imagem ilegível (arquivo corrompido, formato desconhecido)
+    """
+    with Image.open(caminho_origem) as original:
+        imagem = ImageOps.exif_transpose(original)
+        modo = "RGBA" if "A" in imagem.getbands() or "transparency" in imagem.info else "RGB"
+        imagem = imagem.convert(modo)
+    # Sem info, nada de EXIF/ICC/XMP vai para os arquivos gerados
+    imagem.info = {}
+
+    os.makedirs(diretorio, exist_ok=True)
+    arquivos = {}
+    for variante, lado in VARIANTES.items():
+        copia = imagem
+        if lado is not None:
+            copia = imagem.copy()
+            copia.thumbnail((lado, lado), Image.Resampling.LANCZOS)
+
+        destino = os.path.join(diretorio, f"{nome_base}_{variante}{EXTENSAO}")
+        temporario = f"{destino}.{os.getpid()}.tmp"
+        copia.save(temporario, FORMATO, quality=qualidade, method=4)
+        os.replace(temporario, destino)
+        arquivos[variante] = destino
+    return arquivos
+
+
+class PipelineImagens:
+    """Gera as variantes das imagens enviadas e as guarda por hash do conteúdo."""
+
+    # Arquivos mais novos que isso não são coletados (o upload pode ainda
+    # não ter gravado as linhas de imagens_produto)
+    IDADE_MINIMA_COLETA_S = 300
+
+    def __init__(self, diretorio: Optional[str] = None, max_processos: Optional[int] = None,
+                 qualidade: Optional[int] = None):
+        self.diretorio = diretorio or Config.IMAGENS_PRODUTO_DIR
+        self.max_processos = max_processos or Config.IMAGENS_PROCESSOS
+        self.qualidade = qualidade or Config.IMAGENS_QUALIDADE
+        self.estatisticas: Dict[str, int] = {"processadas": 0, "reaproveitadas": 0, "removidas": 0}
+
+    def processar(self, caminho_origem: str) -> Tuple[str, Dict[str, str]]:
+        """
+        Gera (ou reaproveita) as variantes de uma imagem.
+
+        :return: (hash do conteúdo, variante -> caminho para gravar em ``imagens_produto``)
+        :raises FileNotFoundError: Arquivo de origem inexistente
+        :raises OSError: Imagem ilegível
+        """
+        return self.processar_lote([caminho_origem])[0]
+
+    def processar_lote(self, caminhos: List[str]) -> List[Tuple[str, Dict[str, str]]]:
+        """
+        Gera as variantes de várias imagens; as que ainda não estão no
+        armazenamento são processadas em paralelo (pool de processos).
+        O resultado segue a ordem de ``caminhos``.
+        """
+        for caminho in caminhos:
+            self._validar(caminho)
+        chaves = [hash_arquivo(caminho) for caminho in caminhos]
+
+        # Uma origem por hash novo: repetidas no lote ou já armazenadas não reprocessam
+        novas = {}
+        for chave, caminho in zip(chaves, caminhos):
+            if chave in novas:
+                continue
+            if self._armazenada(chave):
+                self._renovar(chave)
+            else:
+                novas[chave] = caminho
+        self.estatisticas["reaproveitadas"] += len(chaves) - len(novas)
+        self.estatisticas["processadas"] += len(novas)
+
+        argumentos = (
+            list(novas.values()),
+            [self._pasta(chave) for chave in novas],
+            list(novas),
+            [self.qualidade] * len(novas),
+        )
+        if len(novas) < 2 or self.max_processos < 2:
+            list(map(processar_imagem, *argumentos))
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.max_processos, len(novas))) as pool:
+                list(pool.map(processar_imagem, *argumentos))
+
+        return [(chave, self._para_urls(self.arquivos(chave))) for chave in chaves]
+
+    def arquivos(self, chave: str) -> Dict[str, str]:
+        """Variante -> caminho absoluto dos arquivos de um hash."""
+        return {
+            variante: os.path.join(self._pasta(chave), f"{chave}_{variante}{EXTENSAO}")
+            for variante in VARIANTES
+        }
+
+    def remover(self, chave: str) -> bool:
+        """Apaga os arquivos de um hash (chame quando não houver mais referências)."""
+        removido = False
+        for caminho in self.arquivos(chave).values():
+            try:
+                os.remove(caminho)
+                removido = True
+            except FileNotFoundError:
+                pass
+        if removido:
+            self.estatisticas["removidas"] += 1
+        return removido
+
+    def remover_sem_uso(self, chave: str, idade_minima_s: Optional[float] = None) -> bool:
+        """
+        Como ``remover``, mas respeita a carência de ``IDADE_MINIMA_COLETA_S``:
+        se algum arquivo do hash foi gravado ou reaproveitado há pouco, outro
+        upload do mesmo conteúdo pode estar prestes a gravar as linhas, e o
+        hash fica para ``coletar_lixo``.
+        """
+        idade_minima_s = self.IDADE_MINIMA_COLETA_S if idade_minima_s is None else idade_minima_s
+        limite = time.time() - idade_minima_s
+        for caminho in self.arquivos(chave).values():
+            try:
+                if os.path.getmtime(caminho) >= limite:
+                    return False
+            except FileNotFoundError:
+                pass
+        return self.remover(chave)
+
+    def coletar_lixo(self, referenciadas: Iterable[str], idade_minima_s: Optional[float] = None) -> int:
+        """
+        Apaga os arquivos cujo hash não está em ``referenciadas``. Cobre o que
+        ``remover`` não alcançou (falhas no meio de uma operação, exclusões
+        feitas direto no banco). Retorna quantos hashes foram removidos.
+        """
+        referenciadas = set(referenciadas)
+        idade_minima_s = self.IDADE_MINIMA_COLETA_S if idade_minima_s is None else idade_minima_s
+        limite = time.time() - idade_minima_s
+        orfas = set()
+        for raiz, _, nomes in os.walk(self.diretorio):
+            for nome in nomes:
+                caminho = os.path.join(raiz, nome)
+                casamento = _PADRAO_ARQUIVO.match(nome)
+                if casamento and casamento.group(1) not in referenciadas and os.path.getmtime(caminho) < limite:
+                    orfas.add(casamento.group(1))
+        return sum(1 for chave in orfas if self.remover(chave))
+
+    # --- Métodos privados ---
+
+    def _pasta(self, chave: str) -> str:
+        return os.path.join(self.diretorio, chave[:2])
+
+    def _armazenada(self, chave: str) -> bool:
+        return all(os.path.exists(caminho) for caminho in self.arquivos(chave).values())
+
+    def _renovar(self, chave: str) -> None:
+        """Atualiza o mtime de um hash reaproveitado para a coleta não o pegar."""
+        for caminho in self.arquivos(chave).values():
+            os.utime(caminho)
+
+    @staticmethod
+    def _validar(caminho_origem: str) -> None:
+        if not os.path.exists(caminho_origem):
+            raise FileNotFoundError("Arquivo de imagem não encontrado.")
+
+    @staticmethod
+    def _para_urls(arquivos: Dict[str, str]) -> Dict[str, str]:
+        """Caminhos dentro de BASE_DIR ficam relativos (como 'uploads/produtos/...')."""
+        base = os.path.abspath(Config.BASE_DIR)
+        urls = {}
+        for variante, caminho in arquivos.items():
+            caminho = os.path.abspath(caminho)
+            urls[variante] = os.path.relpath(caminho, base) if caminho.startswith(base + os.sep) else caminho
+        return urls
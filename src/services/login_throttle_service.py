@@ -0,0 +1,198 @@
+"""Limite de tentativas de login.
+
+Conta falhas por email e por origem em uma janela deslizante (aproximada
+por duas janelas fixas, a atual e a anterior ponderada pelo tempo
+restante). A origem "local" (o app desktop, que não informa origem) não
+tem chave própria: seria uma chave compartilhada por todos os usuários, e
+falhas em emails quaisquer bloqueariam o login de todo mundo. Ao estourar ``LOGIN_MAX_FALHAS`` a chave fica bloqueada por
+um período que dobra a cada novo bloqueio. O AuthService consulta o
+bloqueio antes de qualquer cálculo de hash, então tentativas em massa não
+consomem CPU com PBKDF2.
+
+O estado fica em um cache em memória (LRU) com escrita imediata na
+tabela tentativas_login, para sobreviver a reinícios da aplicação. Chaves
+inativas (ex.: emails inventados) são apagadas da tabela periodicamente.
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from src.config.settings import Config
+from src.repositories.login_attempt_repository import TentativaLoginRepository
+
+
+class LoginBloqueadoError(Exception):
+    """Login temporariamente bloqueado por excesso de tentativas."""
+
+    def __init__(self, segundos_restantes: float):
+        self.segundos_restantes = segundos_restantes
+        super().__init__(
+            f"Muitas tentativas de login. Tente novamente em {math.ceil(segundos_restantes)} s."
+        )
+
+
+class TentativasLoginService:
+    """Janela deslizante de falhas com bloqueio exponencial por chave."""
+
+    # Limite de chaves mantidas em memória (as demais são relidas do banco)
+    MAX_ENTRADAS_CACHE = 10000
+    # Origem das tentativas feitas no próprio app (sem chave por origem)
+    ORIGEM_LOCAL = "local"
+
+    def __init__(
+        self,
+        repo: Optional[TentativaLoginRepository] = None,
+        relogio: Callable[[], float] = time.time,
+    ):
+        self.repo = repo or TentativaLoginRepository()
+        self._relogio = relogio
+        self._cache: "OrderedDict[str, Optional[Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # A primeira falha após iniciar já limpa as chaves inativas
+        self._proxima_limpeza = 0.0
+
+    # --- API pública ---
+
+    def verificar(self, email: str, origem: str = "local") -> None:
+        """Rejeita a tentativa se o email ou a origem estiverem bloqueados.
+
+        Raises:
+            LoginBloqueadoError: Com os segundos restantes do bloqueio mais longo
+        """
+        agora = self._relogio()
+        with self._lock:
+            restante = max(
+                self._restante(self._obter(chave), agora) for chave in self._chaves(email, origem)
+            )
+        if restante > 0:
+            raise LoginBloqueadoError(restante)
+
+    def registrar_falha(self, email: str, origem: str = "local") -> None:
+        """Conta uma falha para o email e para a origem."""
+        agora = self._relogio()
+        with self._lock:
+            self._limpar_inativos(agora)
+            for chave in self._chaves(email, origem):
+                estado = self._obter(chave) or self._novo_estado(chave, agora)
+                self._avancar_janela(estado, agora)
+                estado["falhas_atual"] += 1
+                if self._estimativa(estado, agora) >= Config.LOGIN_MAX_FALHAS:
+                    self._bloquear(estado, agora)
+                estado["atualizado_em"] = agora
+                self._gravar(chave, estado)
+
+    def registrar_sucesso(self, email: str, origem: str = "local") -> None:
+        """
+        Zera o histórico do email e reduz à metade as falhas da origem (sem
+        zerá-las: uma conta válida não pode servir para liberar a origem).
+        """
+        agora = self._relogio()
+        chave_email, *chave_origem = self._chaves(email, origem)
+        with self._lock:
+            if self._obter(chave_email) is not None:
+                self.repo.deletar(chave_email)
+            self._guardar_em_cache(chave_email, None)
+
+            for chave in chave_origem:
+                estado = self._obter(chave)
+                if estado is None:
+                    continue
+                self._avancar_janela(estado, agora)
+                estado["falhas_atual"] //= 2
+                estado["falhas_anterior"] //= 2
+                estado["atualizado_em"] = agora
+                self._gravar(chave, estado)
+
+    def limpar_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    # --- Métodos privados ---
+
+    @classmethod
+    def _chaves(cls, email: str, origem: str):
+        chave_email = f"email:{(email or '').strip().lower()}"
+        if not origem or origem == cls.ORIGEM_LOCAL:
+            return (chave_email,)
+        return (chave_email, f"origem:{origem}")
+
+    def _limpar_inativos(self, agora: float) -> None:
+        """
+        Apaga do banco, no máximo a cada LOGIN_LIMPEZA_INTERVALO_SEGUNDOS, as
+        chaves sem falhas na janela, sem bloqueio e já sem efeito na
+        progressão exponencial (chamado com o lock).
+        """
+        if agora < self._proxima_limpeza:
+            return
+        self._proxima_limpeza = agora + Config.LOGIN_LIMPEZA_INTERVALO_SEGUNDOS
+        antes_de = agora - max(2 * Config.LOGIN_JANELA_SEGUNDOS, Config.LOGIN_BLOQUEIO_MAX_SEGUNDOS)
+        if self.repo.limpar_inativos(antes_de):
+            self._cache.clear()
+
+    def _obter(self, chave: str) -> Optional[Dict[str, Any]]:
+        if chave in self._cache:
+            self._cache.move_to_end(chave)
+            return self._cache[chave]
+        estado = self.repo.buscar_por_id(chave)
+        self._guardar_em_cache(chave, estado)
+        return estado
+
+    def _guardar_em_cache(self, chave: str, estado: Optional[Dict[str, Any]]) -> None:
+        self._cache[chave] = estado
+        self._cache.move_to_end(chave)
+        while len(self._cache) > self.MAX_ENTRADAS_CACHE:
+            self._cache.popitem(last=False)
+
+    def _gravar(self, chave: str, estado: Dict[str, Any]) -> None:
+        self.repo.salvar(estado)
+        self._guardar_em_cache(chave, estado)
+
+    @staticmethod
+    def _novo_estado(chave: str, agora: float) -> Dict[str, Any]:
+        return {
+            "chave": chave,
+            "janela_inicio": agora,
+            "falhas_atual": 0,
+            "falhas_anterior": 0,
+            "bloqueado_ate": 0.0,
+            "bloqueios": 0,
+            "atualizado_em": agora,
+        }
+
+    @staticmethod
+    def _restante(estado: Optional[Dict[str, Any]], agora: float) -> float:
+        if not estado:
+            return 0.0
+        return max(0.0, estado["bloqueado_ate"] - agora)
+
+    @staticmethod
+    def _avancar_janela(estado: Dict[str, Any], agora: float) -> None:
+        janela = Config.LOGIN_JANELA_SEGUNDOS
+        decorridas = int((agora - estado["janela_inicio"]) // janela)
+        if decorridas >= 1:
+            estado["falhas_anterior"] = estado["falhas_atual"] if decorridas == 1 else 0
+            estado["falhas_atual"] = 0
+            estado["janela_inicio"] += decorridas * janela
+
+    @staticmethod
+    def _estimativa(estado: Dict[str, Any], agora: float) -> float:
+        """Falhas nos últimos LOGIN_JANELA_SEGUNDOS (janela deslizante aproximada)."""
+        fracao_restante = 1 - (agora - estado["janela_inicio"]) / Config.LOGIN_JANELA_SEGUNDOS
+        return estado["falhas_anterior"] * max(0.0, fracao_restante) + estado["falhas_atual"]
+
+    @staticmethod
+    def _bloquear(estado: Dict[str, Any], agora: float) -> None:
+        # Um período longo sem bloqueios zera a progressão exponencial
+        if agora - estado["bloqueado_ate"] > Config.LOGIN_BLOQUEIO_MAX_SEGUNDOS:
+            estado["bloqueios"] = 0
+        duracao = min(
+            Config.LOGIN_BLOQUEIO_MAX_SEGUNDOS,
+            Config.LOGIN_BLOQUEIO_BASE_SEGUNDOS * 2 ** estado["bloqueios"],
+        )
+        estado["bloqueado_ate"] = agora + duracao
+        estado["bloqueios"] += 1
+        estado["falhas_atual"] = 0
+        estado["falhas_anterior"] = 0
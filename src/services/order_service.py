@@ -90,7 +90,8 @@ class PedidoService:
         total = subtotal + Decimal(str(frete))
 
         try:
-            pedido = self.pedido_repo.salvar(
+            # Pedido e itens em uma única transação (nomes em lote + executemany)
+            pedido = self.pedido_repo.salvar_com_itens(
                 {
                     "usuario_id": usuario_id,
                     "endereco_id": endereco_id,
@@ -100,21 +101,10 @@ class PedidoService:
                     "status": self.STATUS_PENDENTE,
                     "tipo_pagamento": tipo_pagamento,
                     "observacoes": observacoes,
-                }
+                },
+                itens,
             )
 
-            # Adicionar itens
-            for item in itens:
-                prod = self.produto_repo.buscar_por_id(item["produto_id"])
-                nome_prod = prod["nome"] if prod else "Produto"
-                self.pedido_repo.adicionar_item(
-                    pedido["id"],
-                    item["produto_id"],
-                    nome_prod,
-                    item["quantidade"],
-                    item["preco_unitario"],
-                )
-
             return pedido
         except Exception as e:
             raise PedidoServiceError(f"Erro ao criar pedido: {str(e)}")
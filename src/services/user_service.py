@@ -5,7 +5,7 @@ permissões e validações de usuários.
 """
 from typing import List, Dict, Any, Optional
 import re
-from passlib.hash import bcrypt
+from src.utils.security.password_hasher import PasswordHasher
 from src.repositories.user_repository import UsuarioRepository
 from src.repositories.address_repository import EnderecoRepository
 
@@ -194,18 +194,18 @@ class UsuarioService:
             raise UsuarioNaoEncontradoError(f"Usuário {usuario_id} não encontrado")
         
         # Verificar senha atual
-        if not bcrypt.verify(senha_atual, usuario['senha_hash']):
+        if not PasswordHasher.verify_password(usuario['senha_hash'], senha_atual):
             raise UsuarioServiceError("Senha atual incorreta")
         
         # Validar nova senha
         self._validar_senha(nova_senha)
         
         # Verificar se nova senha é diferente da atual
-        if bcrypt.verify(nova_senha, usuario['senha_hash']):
+        if PasswordHasher.verify_password(usuario['senha_hash'], nova_senha):
             raise UsuarioServiceError("Nova senha deve ser diferente da atual")
         
         # Atualizar senha
-        usuario['senha_hash'] = bcrypt.hash(nova_senha)
+        usuario['senha_hash'] = PasswordHasher.hash_password(nova_senha)
         self.usuario_repo.atualizar(usuario)
         
         return True
@@ -243,7 +243,7 @@ class UsuarioService:
         self._validar_senha(nova_senha)
         
         # Atualizar senha
-        usuario['senha_hash'] = bcrypt.hash(nova_senha)
+        usuario['senha_hash'] = PasswordHasher.hash_password(nova_senha)
         self.usuario_repo.atualizar(usuario)
         
         return True
@@ -370,9 +370,13 @@ class UsuarioService:
         if not usuario:
             return None
         
-        # Verificar senha
-        if not bcrypt.verify(senha, usuario['senha_hash']):
+        # Verificar senha (e regravar o hash se a política mudou)
+        confere, novo_hash = PasswordHasher.verify_and_update(usuario['senha_hash'], senha)
+        if not confere:
             return None
+        if novo_hash:
+            usuario['senha_hash'] = novo_hash
+            self.usuario_repo.atualizar(usuario)
         
         return self._remover_dados_sensiveis(usuario)
     
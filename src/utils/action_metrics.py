@@ -0,0 +1,177 @@
+"""Métricas de latência das ações dos controllers.
+
+Todo método público de uma subclasse de BaseController é cronometrado
+(ver ``BaseController.__init_subclass__``). Para cada ação ficam
+guardados contagens, respostas de falha (``success=False``), exceções e
+um histograma de latência com faixas fixas; chamadas acima de
+``Config.METRICAS_LIMITE_LENTO_MS`` vão para o log de ações lentas.
+
+Com a coleta desligada o custo é um teste de atributo por chamada.
+"""
+import bisect
+import functools
+import json
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from src.config.settings import Config
+
+logger = logging.getLogger(__name__)
+
+
+class _EstatisticaAcao:
+    """Acumuladores de uma ação."""
+
+    __slots__ = ("chamadas", "falhas", "erros", "total_ms", "max_ms", "faixas")
+
+    def __init__(self, quantidade_faixas: int):
+        self.chamadas = 0
+        self.falhas = 0
+        self.erros = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.faixas = [0] * quantidade_faixas
+
+
+class MetricasAcoes:
+    """Histogramas de latência, contadores de erro e log de ações lentas."""
+
+    # Limites superiores (ms) das faixas do histograma; a última faixa é "acima de 5000"
+    LIMITES_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+    # Ações lentas mantidas em memória (as mais antigas são descartadas)
+    MAX_LENTAS = 200
+
+    def __init__(self, ativo: Optional[bool] = None, limite_lento_ms: Optional[float] = None):
+        self.ativo = Config.METRICAS_ATIVAS if ativo is None else ativo
+        self.limite_lento_ms = (
+            Config.METRICAS_LIMITE_LENTO_MS if limite_lento_ms is None else limite_lento_ms
+        )
+        self._acoes: Dict[str, _EstatisticaAcao] = {}
+        self._lentas: Deque[Dict[str, Any]] = deque(maxlen=self.MAX_LENTAS)
+        self._lock = threading.Lock()
+        self._desde = datetime.now()
+
+    # --- Coleta ---
+
+    def registrar(self, acao: str, duracao_ms: float, falha: bool = False, erro: bool = False) -> None:
+        """Conta uma execução da ação.
+
+        Args:
+            acao: Nome da ação (ex.: 'CartController.add_to_cart')
+            duracao_ms: Tempo de execução
+            falha: A ação respondeu com success=False
+            erro: A ação lançou exceção
+        """
+        with self._lock:
+            estatistica = self._acoes.get(acao)
+            if estatistica is None:
+                estatistica = self._acoes[acao] = _EstatisticaAcao(len(self.LIMITES_MS) + 1)
+            estatistica.chamadas += 1
+            estatistica.falhas += falha
+            estatistica.erros += erro
+            estatistica.total_ms += duracao_ms
+            estatistica.max_ms = max(estatistica.max_ms, duracao_ms)
+            estatistica.faixas[bisect.bisect_left(self.LIMITES_MS, duracao_ms)] += 1
+
+            if duracao_ms >= self.limite_lento_ms:
+                self._lentas.append({
+                    "acao": acao,
+                    "duracao_ms": round(duracao_ms, 2),
+                    "quando": datetime.now().isoformat(timespec="seconds"),
+                    "resultado": "erro" if erro else "falha" if falha else "ok",
+                })
+        if duracao_ms >= self.limite_lento_ms:
+            logger.warning(f"Ação lenta: {acao} levou {duracao_ms:.0f} ms")
+
+    def instrumentar(self, acao: str) -> Callable:
+        """Decorador que cronometra a função como ``acao``."""
+        def decorador(funcao: Callable) -> Callable:
+            @functools.wraps(funcao)
+            def cronometrada(*args, **kwargs):
+                if not self.ativo:
+                    return funcao(*args, **kwargs)
+                inicio = time.perf_counter()
+                try:
+                    resultado = funcao(*args, **kwargs)
+                except Exception:
+                    self.registrar(acao, (time.perf_counter() - inicio) * 1000, erro=True)
+                    raise
+                falha = isinstance(resultado, dict) and resultado.get("success") is False
+                self.registrar(acao, (time.perf_counter() - inicio) * 1000, falha=falha)
+                return resultado
+
+            cronometrada._acao_instrumentada = acao
+            return cronometrada
+        return decorador
+
+    # --- Consulta ---
+
+    def resumo(self) -> List[Dict[str, Any]]:
+        """Uma linha por ação, da mais lenta (p90) para a mais rápida."""
+        with self._lock:
+            linhas = [self._resumir(acao, est) for acao, est in self._acoes.items()]
+        return sorted(linhas, key=lambda linha: linha["p90_ms"], reverse=True)
+
+    def lentas(self) -> List[Dict[str, Any]]:
+        """Ações lentas registradas, da mais recente para a mais antiga."""
+        with self._lock:
+            return list(reversed(self._lentas))
+
+    def exportar(self) -> Dict[str, Any]:
+        """Documento completo (resumo, histogramas e ações lentas) para salvar em JSON."""
+        return {
+            "desde": self._desde.isoformat(timespec="seconds"),
+            "gerado_em": datetime.now().isoformat(timespec="seconds"),
+            "ativo": self.ativo,
+            "limite_lento_ms": self.limite_lento_ms,
+            "faixas_ms": list(self.LIMITES_MS),
+            "acoes": self.resumo(),
+            "lentas": self.lentas(),
+        }
+
+    def exportar_json(self, caminho: str) -> None:
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            json.dump(self.exportar(), arquivo, indent=2, ensure_ascii=False)
+
+    def limpar(self) -> None:
+        with self._lock:
+            self._acoes.clear()
+            self._lentas.clear()
+            self._desde = datetime.now()
+
+    # --- Métodos privados ---
+
+    def _resumir(self, acao: str, est: _EstatisticaAcao) -> Dict[str, Any]:
+        rotulos = [f"<={limite}" for limite in self.LIMITES_MS] + [f">{self.LIMITES_MS[-1]}"]
+        return {
+            "acao": acao,
+            "chamadas": est.chamadas,
+            "falhas": est.falhas,
+            "erros": est.erros,
+            "media_ms": round(est.total_ms / est.chamadas, 3) if est.chamadas else 0.0,
+            "p50_ms": self._percentil(est, 0.50),
+            "p90_ms": self._percentil(est, 0.90),
+            "p99_ms": self._percentil(est, 0.99),
+            "max_ms": round(est.max_ms, 3),
+            "histograma": dict(zip(rotulos, est.faixas)),
+        }
+
+    def _percentil(self, est: _EstatisticaAcao, fracao: float) -> float:
+        """Limite superior da faixa que contém o percentil (o máximo, na última faixa)."""
+        alvo = fracao * est.chamadas
+        acumulado = 0
+        for indice, quantidade in enumerate(est.faixas):
+            acumulado += quantidade
+            if quantidade and acumulado >= alvo:
+                if indice < len(self.LIMITES_MS):
+                    return float(min(self.LIMITES_MS[indice], round(est.max_ms, 3)))
+                break
+        return round(est.max_ms, 3)
+
+
+# Instância usada pelos controllers e pelo painel de diagnóstico
+metricas = MetricasAcoes()
@@ -1,53 +1,183 @@
 import hashlib
+import hmac
 import secrets
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Tuple
+
+from src.config.settings import Config
+
 
 class PasswordHasher:
     """
     Responsável pela criptografia e verificação de senhas.
-    Utiliza PBKDF2 (padrão robusto) com SHA256 e Salt aleatório.
+
+    Os hashes são autodescritivos: algoritmo, custo e salt ficam junto do
+    hash, então mudar o algoritmo ou o custo em ``Config`` não exige
+    migração — hashes antigos continuam válidos e são regravados no
+    próximo login (``needs_rehash``).
+
+    Formatos aceitos:
+        pbkdf2_sha256$<iteracoes>$<salt>$<hash_hex>
+        scrypt$<n>,<r>,<p>$<salt>$<hash_hex>
+        <salt>$<hash_hex>   (legado: PBKDF2-SHA256 com 100.000 iterações)
+        $2b$...             (bcrypt, se passlib estiver instalado)
     """
 
+    PBKDF2 = "pbkdf2_sha256"
+    SCRYPT = "scrypt"
+    ITERACOES_LEGADO = 100000
+
+    _executor: Optional[ThreadPoolExecutor] = None
+    _hash_ficticio: Optional[str] = None
+
     @staticmethod
     def hash_password(password: str) -> str:
         """
-        Cria um hash seguro da senha com um salt aleatório.
+        Cria um hash seguro da senha com um salt aleatório, usando o
+        algoritmo e o custo configurados.
         :param password: Senha em texto plano
-        :return: String no formato 'salt$hash_hex'
+        :return: String autodescritiva (ver formatos da classe)
         """
-        # Gera um salt aleatório de 16 bytes
         salt = secrets.token_hex(16)
-        
-        # Cria o hash usando PBKDF2 (100.000 iterações)
-        hash_obj = hashlib.pbkdf2_hmac(
-            'sha256',
-            password.encode('utf-8'),
-            salt.encode('utf-8'),
-            100000
-        )
-        
-        # Retorna salt e hash juntos separados por $
-        return f"{salt}${hash_obj.hex()}"
+
+        if Config.SENHA_ALGORITMO == PasswordHasher.SCRYPT:
+            n, r, p = Config.SENHA_SCRYPT_N, Config.SENHA_SCRYPT_R, Config.SENHA_SCRYPT_P
+            digest = PasswordHasher._scrypt(password, salt, n, r, p)
+            return f"{PasswordHasher.SCRYPT}${n},{r},{p}${salt}${digest}"
+
+        iteracoes = Config.SENHA_PBKDF2_ITERACOES
+        digest = PasswordHasher._pbkdf2(password, salt, iteracoes)
+        return f"{PasswordHasher.PBKDF2}${iteracoes}${salt}${digest}"
 
     @staticmethod
     def verify_password(stored_password: str, provided_password: str) -> bool:
         """
         Verifica se a senha fornecida bate com o hash armazenado.
-        :param stored_password: O hash completo salvo no banco (salt$hash)
+        :param stored_password: O hash completo salvo no banco
         :param provided_password: A senha que o usuário digitou no login
         :return: True se conferir
         """
         try:
-            salt, stored_hash = stored_password.split('$')
-            
-            # Recalcula o hash com o mesmo salt e senha fornecida
-            new_hash = hashlib.pbkdf2_hmac(
-                'sha256',
-                provided_password.encode('utf-8'),
-                salt.encode('utf-8'),
-                100000
-            )
-            
-            # Compara os hashes de forma segura
-            return secrets.compare_digest(stored_hash, new_hash.hex())
+            algoritmo, parametros, salt, stored_hash = PasswordHasher._decompor(stored_password)
+        except ValueError:
+            return False
+
+        if algoritmo == "bcrypt":
+            return PasswordHasher._verificar_bcrypt(stored_password, provided_password)
+        if algoritmo == PasswordHasher.SCRYPT:
+            new_hash = PasswordHasher._scrypt(provided_password, salt, *parametros)
+        else:
+            new_hash = PasswordHasher._pbkdf2(provided_password, salt, parametros[0])
+
+        # Compara os hashes de forma segura
+        return hmac.compare_digest(stored_hash, new_hash)
+
+    @staticmethod
+    def needs_rehash(stored_password: str) -> bool:
+        """
+        Indica se o hash foi gerado com algoritmo ou custo diferente do configurado.
+        """
+        try:
+            algoritmo, parametros, _, _ = PasswordHasher._decompor(stored_password)
+        except ValueError:
+            return True
+
+        if algoritmo != Config.SENHA_ALGORITMO or stored_password.count("$") != 3:
+            return True
+        if algoritmo == PasswordHasher.SCRYPT:
+            return parametros != (Config.SENHA_SCRYPT_N, Config.SENHA_SCRYPT_R, Config.SENHA_SCRYPT_P)
+        return parametros[0] != Config.SENHA_PBKDF2_ITERACOES
+
+    @staticmethod
+    def verify_and_update(stored_password: Optional[str], provided_password: str) -> Tuple[bool, Optional[str]]:
+        """
+        Verifica a senha e, se ela conferir e o hash estiver desatualizado,
+        gera um novo hash com a política atual.
+        :param stored_password: Hash salvo (None para usuário inexistente)
+        :return: (senha confere, novo hash ou None)
+        """
+        if stored_password is None:
+            # Gasta o mesmo tempo de um usuário real (não revela quais emails existem)
+            PasswordHasher.verify_password(PasswordHasher._obter_hash_ficticio(), provided_password)
+            return False, None
+
+        if not PasswordHasher.verify_password(stored_password, provided_password):
+            return False, None
+        if PasswordHasher.needs_rehash(stored_password):
+            return True, PasswordHasher.hash_password(provided_password)
+        return True, None
+
+    @staticmethod
+    def verify_and_update_async(stored_password: Optional[str], provided_password: str) -> Future:
+        """
+        Executa ``verify_and_update`` no pool de threads de hashing.
+        hashlib libera o GIL durante o PBKDF2/scrypt, então a thread da
+        interface continua respondendo.
+        :return: Future com (senha confere, novo hash ou None)
+        """
+        return PasswordHasher._obter_executor().submit(
+            PasswordHasher.verify_and_update, stored_password, provided_password
+        )
+
+    # --- Métodos privados ---
+
+    @staticmethod
+    def _decompor(stored_password: str):
+        """Retorna (algoritmo, parâmetros, salt, hash) ou lança ValueError."""
+        if not stored_password:
+            raise ValueError("Hash vazio")
+        if stored_password.startswith("$2"):
+            return "bcrypt", (), "", ""
+
+        partes = stored_password.split("$")
+        if len(partes) == 2:
+            salt, digest = partes
+            return PasswordHasher.PBKDF2, (PasswordHasher.ITERACOES_LEGADO,), salt, digest
+        if len(partes) != 4:
+            raise ValueError("Formato de hash desconhecido")
+
+        algoritmo, parametros, salt, digest = partes
+        if algoritmo == PasswordHasher.PBKDF2:
+            return algoritmo, (int(parametros),), salt, digest
+        if algoritmo == PasswordHasher.SCRYPT:
+            n, r, p = (int(valor) for valor in parametros.split(","))
+            return algoritmo, (n, r, p), salt, digest
+        raise ValueError(f"Algoritmo de hash desconhecido: {algoritmo}")
+
+    @staticmethod
+    def _pbkdf2(password: str, salt: str, iteracoes: int) -> str:
+        return hashlib.pbkdf2_hmac(
+            'sha256', password.encode('utf-8'), salt.encode('utf-8'), iteracoes
+        ).hex()
+
+    @staticmethod
+    def _scrypt(password: str, salt: str, n: int, r: int, p: int) -> str:
+        return hashlib.scrypt(
+            password.encode('utf-8'), salt=salt.encode('utf-8'),
+            n=n, r=r, p=p, maxmem=256 * n * r * p, dklen=32
+        ).hex()
+
+    @staticmethod
+    def _verificar_bcrypt(stored_password: str, provided_password: str) -> bool:
+        try:
+            from passlib.hash import bcrypt
+        except ImportError:
+            return False
+        try:
+            return bcrypt.verify(provided_password, stored_password)
         except ValueError:
-            return False
\ No newline at end of file
+            return False
+
+    @staticmethod
+    def _obter_hash_ficticio() -> str:
+        if PasswordHasher._hash_ficticio is None or PasswordHasher.needs_rehash(PasswordHasher._hash_ficticio):
+            PasswordHasher._hash_ficticio = PasswordHasher.hash_password(secrets.token_hex(8))
+        return PasswordHasher._hash_ficticio
+
+    @staticmethod
+    def _obter_executor() -> ThreadPoolExecutor:
+        if PasswordHasher._executor is None:
+            PasswordHasher._executor = ThreadPoolExecutor(
+                max_workers=Config.SENHA_HASH_WORKERS, thread_name_prefix="hash-senha"
+            )
+        return PasswordHasher._executor
@@ -0,0 +1,331 @@
+"""Perfil das instruções SQL executadas pelos repositórios.
+
+Com ``Config.SQL_PERFIL_ATIVO`` as conexões criadas por DatabaseConnection
+usam ``ConexaoPerfilada``, cujo cursor cronometra cada instrução (execução
+e leitura das linhas) e acumula os números por instrução normalizada:
+literais viram ``?`` e listas ``IN (?, ?, ...)`` colapsam, de modo que a
+mesma consulta com valores diferentes cai na mesma linha do relatório.
+
+Quando uma execução passa de ``Config.SQL_PERFIL_LIMITE_MS`` o plano
+(``EXPLAIN QUERY PLAN``) é capturado uma vez por instrução, e varreduras
+completas de tabela ficam marcadas no relatório.
+
+Uso típico (ver benchmarks/hot_paths.py e benchmarks/shopper_load.py):
+
+    Config.SQL_PERFIL_ATIVO = True   # antes de abrir a conexão
+    ...
+    print(perfil_sql.formatar_relatorio())
+"""
+import functools
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from src.config.settings import Config
+
+_LITERAL_TEXTO = re.compile(r"'(?:[^']|'')*'")
+_LITERAL_NUMERO = re.compile(r"\b\d+(?:\.\d+)?\b")
+_LISTA_IN = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)+\s*\)", re.IGNORECASE)
+_ESPACOS = re.compile(r"\s+")
+
+# Instruções que admitem EXPLAIN QUERY PLAN
+_COM_PLANO = ("SELECT", "WITH", "UPDATE", "DELETE", "INSERT", "REPLACE")
+
+
+@functools.lru_cache(maxsize=2048)
+def normalizar_sql(sql: str) -> str:
+    """Forma canônica da instrução: sem literais e com espaços colapsados."""
+    sql = _LITERAL_TEXTO.sub("?", sql)
+    sql = _LITERAL_NUMERO.sub("?", sql)
+    sql = _ESPACOS.sub(" ", sql).strip().rstrip(";").strip()
+    return _LISTA_IN.sub("IN (?, ...)", sql)
+
+
+def varreduras_completas(plano: List[str]) -> List[str]:
+    """Linhas do plano que leem a tabela inteira (SCAN sem índice)."""
+    return [
+        linha for linha in plano
+        if linha.startswith("SCAN ") and "USING" not in linha
+        and "CONSTANT ROW" not in linha and "SUBQUERY" not in linha.upper()
+    ]
+
+
+class _EstatisticaSQL:
+    """Acumuladores de uma instrução normalizada."""
+
+    __slots__ = ("execucoes", "total_ms", "max_ms", "linhas", "amostras", "plano")
+
+    def __init__(self, max_amostras: int):
+        self.execucoes = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.linhas = 0
+        self.amostras: Deque[float] = deque(maxlen=max_amostras)
+        self.plano: Optional[List[str]] = None
+
+
+class PerfilSQL:
+    """Estatísticas por instrução normalizada e planos das instruções lentas."""
+
+    # Amostras de duração guardadas por instrução (para o p95)
+    MAX_AMOSTRAS = 2000
+
+    def __init__(self, limite_ms: Optional[float] = None):
+        self.limite_ms = Config.SQL_PERFIL_LIMITE_MS if limite_ms is None else limite_ms
+        self._instrucoes: Dict[str, _EstatisticaSQL] = {}
+        self._lock = threading.Lock()
+
+    # --- Coleta (chamada pelo CursorPerfilado) ---
+
+    def estatistica(self, sql: str) -> _EstatisticaSQL:
+        chave = normalizar_sql(sql)
+        with self._lock:
+            est = self._instrucoes.get(chave)
+            if est is None:
+                est = self._instrucoes[chave] = _EstatisticaSQL(self.MAX_AMOSTRAS)
+            return est
+
+    def somar(self, est: _EstatisticaSQL, duracao_ms: float, linhas: int = 0) -> None:
+        """Tempo e linhas de uma etapa (execução ou leitura) de uma execução em andamento."""
+        with self._lock:
+            est.total_ms += duracao_ms
+            est.linhas += linhas
+
+    def concluir(self, est: _EstatisticaSQL, duracao_ms: float) -> None:
+        """Fecha uma execução com a sua duração total."""
+        with self._lock:
+            est.execucoes += 1
+            est.max_ms = max(est.max_ms, duracao_ms)
+            est.amostras.append(duracao_ms)
+
+    def capturar_plano(self, conn: sqlite3.Connection, est: _EstatisticaSQL, sql: str, parametros) -> None:
+        """Guarda o EXPLAIN QUERY PLAN da instrução, se ainda não houver um."""
+        if est.plano is not None:
+            return
+        if not sql.lstrip().upper().startswith(_COM_PLANO):
+            est.plano = []
+            return
+        try:
+            # Connection.execute da classe base: não passa pelo cursor perfilado
+            linhas = sqlite3.Connection.execute(conn, "EXPLAIN QUERY PLAN " + sql, parametros).fetchall()
+            est.plano = [linha[3] for linha in linhas]
+        except sqlite3.Error as e:
+            est.plano = [f"(plano indisponível: {e})"]
+
+    # --- Consulta ---
+
+    def relatorio(self, ordenar_por: str = "total_ms", limite: Optional[int] = 20) -> List[Dict[str, Any]]:
+        """Instruções ordenadas da pior para a melhor segundo ``ordenar_por``.
+
+        Args:
+            ordenar_por: total_ms, p95_ms, media_ms, execucoes ou linhas
+            limite: Quantidade de instruções (None = todas)
+        """
+        with self._lock:
+            linhas = [self._resumir(sql, est) for sql, est in self._instrucoes.items() if est.execucoes]
+        linhas.sort(key=lambda linha: linha[ordenar_por], reverse=True)
+        return linhas[:limite] if limite else linhas
+
+    def formatar_relatorio(self, ordenar_por: str = "total_ms", limite: Optional[int] = 20) -> str:
+        """Relatório em texto: tabela das piores instruções e os planos com varredura."""
+        linhas = self.relatorio(ordenar_por, limite)
+        if not linhas:
+            return "Nenhuma instrução SQL registrada."
+
+        saida = [f"{'#':>3} {'exec':>8} {'total ms':>10} {'média ms':>9} {'p95 ms':>8} "
+                 f"{'linhas/exec':>11}  instrução"]
+        for posicao, linha in enumerate(linhas, 1):
+            marca = " [SCAN]" if linha["varredura"] else ""
+            saida.append(
+                f"{posicao:>3} {linha['execucoes']:>8} {linha['total_ms']:>10.1f} "
+                f"{linha['media_ms']:>9.3f} {linha['p95_ms']:>8.3f} "
+                f"{linha['linhas'] / linha['execucoes']:>11.1f}  {linha['sql'][:100]}{marca}"
+            )
+
+        lentas = [(posicao, linha) for posicao, linha in enumerate(linhas, 1) if linha["plano"]]
+        if lentas:
+            saida.append(f"\nPlanos das instruções acima de {self.limite_ms:.0f} ms:")
+            for posicao, linha in lentas:
+                saida.append(f"  #{posicao} {linha['sql'][:100]}")
+                for passo in linha["plano"]:
+                    alerta = "   <- varredura completa" if passo in varreduras_completas([passo]) else ""
+                    saida.append(f"      {passo}{alerta}")
+        return "\n".join(saida)
+
+    def exportar(self) -> Dict[str, Dict[str, Any]]:
+        """Estado bruto (com as amostras), serializável; ver ``mesclar``."""
+        with self._lock:
+            return {
+                sql: {
+                    "execucoes": est.execucoes,
+                    "total_ms": est.total_ms,
+                    "max_ms": est.max_ms,
+                    "linhas": est.linhas,
+                    "amostras": list(est.amostras),
+                    "plano": est.plano,
+                }
+                for sql, est in self._instrucoes.items()
+            }
+
+    def mesclar(self, exportado: Dict[str, Dict[str, Any]]) -> None:
+        """Soma o estado exportado por outro processo (ex.: compradores do teste de carga)."""
+        with self._lock:
+            for sql, dados in exportado.items():
+                est = self._instrucoes.get(sql)
+                if est is None:
+                    est = self._instrucoes[sql] = _EstatisticaSQL(self.MAX_AMOSTRAS)
+                est.execucoes += dados["execucoes"]
+                est.total_ms += dados["total_ms"]
+                est.max_ms = max(est.max_ms, dados["max_ms"])
+                est.linhas += dados["linhas"]
+                est.amostras.extend(dados["amostras"])
+                if est.plano is None:
+                    est.plano = dados["plano"]
+
+    def limpar(self) -> None:
+        with self._lock:
+            self._instrucoes.clear()
+
+    # --- Métodos privados ---
+
+    def _resumir(self, sql: str, est: _EstatisticaSQL) -> Dict[str, Any]:
+        amostras = sorted(est.amostras)
+        p95 = amostras[min(len(amostras) - 1, int(0.95 * len(amostras)))] if amostras else 0.0
+        plano = est.plano or []
+        return {
+            "sql": sql,
+            "execucoes": est.execucoes,
+            "total_ms": round(est.total_ms, 3),
+            "media_ms": round(est.total_ms / est.execucoes, 3),
+            "p95_ms": round(p95, 3),
+            "max_ms": round(est.max_ms, 3),
+            "linhas": est.linhas,
+            "plano": plano,
+            "varredura": bool(varreduras_completas(plano)),
+        }
+
+
+class CursorPerfilado(sqlite3.Cursor):
+    """Cursor que cronometra execução e leitura das linhas.
+
+    A duração de uma execução vai do ``execute`` até a leitura da última
+    linha (ou até o próximo ``execute``/``close`` do mesmo cursor).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._est: Optional[_EstatisticaSQL] = None
+        self._sql = ""
+        self._parametros: Any = ()
+        self._decorrido_ms = 0.0
+
+    def execute(self, sql, parameters=(), /):
+        self._concluir()
+        inicio = time.perf_counter()
+        super().execute(sql, parameters)
+        self._iniciar(sql, parameters, (time.perf_counter() - inicio) * 1000)
+        return self
+
+    def executemany(self, sql, seq_of_parameters, /):
+        self._concluir()
+        inicio = time.perf_counter()
+        super().executemany(sql, seq_of_parameters)
+        self._iniciar(sql, (), (time.perf_counter() - inicio) * 1000)
+        return self
+
+    def fetchone(self):
+        inicio = time.perf_counter()
+        linha = super().fetchone()
+        self._ler(inicio, 0 if linha is None else 1, fim=linha is None)
+        return linha
+
+    def fetchmany(self, size=None):
+        inicio = time.perf_counter()
+        linhas = super().fetchmany(self.arraysize if size is None else size)
+        self._ler(inicio, len(linhas), fim=not linhas)
+        return linhas
+
+    def fetchall(self):
+        inicio = time.perf_counter()
+        linhas = super().fetchall()
+        self._ler(inicio, len(linhas), fim=True)
+        return linhas
+
+    def __next__(self):
+        inicio = time.perf_counter()
+        try:
+            linha = super().__next__()
+        except StopIteration:
+            self._ler(inicio, 0, fim=True)
+            raise
+        self._ler(inicio, 1, fim=False)
+        return linha
+
+    def close(self):
+        self._concluir()
+        super().close()
+
+    def __del__(self):
+        self._concluir()
+
+    # --- Métodos privados ---
+
+    def _iniciar(self, sql: str, parametros, duracao_ms: float) -> None:
+        perfil = self.connection.perfil
+        self._est = perfil.estatistica(sql)
+        self._sql = sql
+        self._parametros = parametros
+        self._decorrido_ms = duracao_ms
+        # Instruções sem resultado (INSERT/UPDATE/DELETE) contam as linhas afetadas e terminam aqui
+        sem_resultado = self.description is None
+        perfil.somar(self._est, duracao_ms, max(self.rowcount, 0) if sem_resultado else 0)
+        self._verificar_limite(perfil)
+        if sem_resultado:
+            self._concluir()
+
+    def _ler(self, inicio: float, linhas: int, fim: bool) -> None:
+        if self._est is None:
+            return
+        duracao_ms = (time.perf_counter() - inicio) * 1000
+        perfil = self.connection.perfil
+        self._decorrido_ms += duracao_ms
+        perfil.somar(self._est, duracao_ms, linhas)
+        self._verificar_limite(perfil)
+        if fim:
+            self._concluir()
+
+    def _verificar_limite(self, perfil: PerfilSQL) -> None:
+        if self._decorrido_ms >= perfil.limite_ms and self._est.plano is None:
+            perfil.capturar_plano(self.connection, self._est, self._sql, self._parametros)
+
+    def _concluir(self) -> None:
+        est = getattr(self, "_est", None)
+        if est is None:
+            return
+        self._est = None
+        self.connection.perfil.concluir(est, self._decorrido_ms)
+
+
+class ConexaoPerfilada(sqlite3.Connection):
+    """Conexão cujos cursores alimentam ``perfil`` (por padrão, o perfil global)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.perfil = perfil_sql
+
+    def cursor(self, factory=CursorPerfilado):
+        return super().cursor(factory)
+
+    # Os atalhos da classe base criam o cursor em C, sem passar por cursor()
+    def execute(self, sql, parameters=(), /):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, parameters, /):
+        return self.cursor().executemany(sql, parameters)
+
+
+# Perfil usado pelas conexões de DatabaseConnection e pelos benchmarks
+perfil_sql = PerfilSQL()
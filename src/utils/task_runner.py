@@ -0,0 +1,194 @@
+"""Execução de tarefas em segundo plano com entrega do resultado na thread do Tk.
+
+O Tkinter só pode ser usado pela thread principal, e consultas ao banco ou
+cálculos de hash nessa thread congelam a janela. ``ExecutorTarefas`` roda a
+função num pool de threads e coloca o resultado numa fila; a thread do Tk
+esvazia a fila com ``after()`` e chama os callbacks da view.
+
+Tarefas pertencem a um widget (normalmente a view): se ele for destruído,
+as que ainda não começaram são canceladas e os resultados das demais são
+descartados em vez de chegar a widgets que não existem mais.
+
+Repositórios chamados de dentro da tarefa recebem uma conexão SQLite da
+própria thread (ver DatabaseConnection.get_connection).
+"""
+import logging
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from src.config.settings import Config
+
+logger = logging.getLogger(__name__)
+
+
+class Tarefa:
+    """Referência a uma tarefa submetida; permite cancelá-la."""
+
+    def __init__(self, dono, ao_concluir: Optional[Callable], ao_falhar: Optional[Callable],
+                 carregando: Optional[Callable]):
+        self.dono = dono
+        self.ao_concluir = ao_concluir
+        self.ao_falhar = ao_falhar
+        self.carregando = carregando
+        self.futuro: Optional[Future] = None
+        self.cancelada = False
+
+    def cancelar(self) -> None:
+        """Descarta o resultado; se a tarefa ainda não começou, ela nem roda."""
+        self.cancelada = True
+        if self.futuro is not None:
+            self.futuro.cancel()
+
+    @property
+    def concluida(self) -> bool:
+        return self.futuro is not None and self.futuro.done()
+
+
+class ExecutorTarefas:
+    """Pool de threads + fila de resultados consumida pelo loop do Tkinter."""
+
+    def __init__(self, max_threads: Optional[int] = None, intervalo_ms: Optional[int] = None,
+                 nome: str = "tarefa-view"):
+        self.max_threads = max_threads or Config.TAREFAS_THREADS
+        self.intervalo_ms = intervalo_ms or Config.TAREFAS_INTERVALO_MS
+        self.nome = nome
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._resultados: "queue.Queue[Tarefa]" = queue.Queue()
+        self._pendentes: Dict[int, List[Tarefa]] = {}  # id do widget dono -> tarefas
+        self._vinculados: Set[int] = set()  # donos com o <Destroy> já vinculado
+        self._lock = threading.Lock()
+        self._sondagem = None  # (widget raiz, id do after) enquanto há tarefas pendentes
+
+    def submeter(
+        self,
+        dono,
+        funcao: Callable,
+        *args,
+        ao_concluir: Optional[Callable[[Any], None]] = None,
+        ao_falhar: Optional[Callable[[Exception], None]] = None,
+        carregando: Optional[Callable[[bool], None]] = None,
+        **kwargs,
+    ) -> Tarefa:
+        """Roda ``funcao(*args, **kwargs)`` em segundo plano. Chame na thread do Tk.
+
+        Args:
+            dono: Widget dono da tarefa (a view); destruí-lo cancela a tarefa
+            ao_concluir: Recebe o retorno da função, na thread do Tk
+            ao_falhar: Recebe a exceção, na thread do Tk (sem ele, vai para o log)
+            carregando: Chamado com True agora e com False quando a tarefa termina
+        """
+        tarefa = Tarefa(dono, ao_concluir, ao_falhar, carregando)
+        self._registrar(tarefa)
+        if carregando:
+            carregando(True)
+
+        tarefa.futuro = self._obter_executor().submit(funcao, *args, **kwargs)
+        tarefa.futuro.add_done_callback(lambda _: self._resultados.put(tarefa))
+        self._agendar_sondagem(dono)
+        return tarefa
+
+    def cancelar_do_dono(self, dono) -> None:
+        """Cancela todas as tarefas do widget."""
+        with self._lock:
+            tarefas = self._pendentes.pop(id(dono), [])
+        for tarefa in tarefas:
+            tarefa.cancelar()
+
+    def processar_resultados(self) -> int:
+        """Entrega os resultados prontos (thread do Tk). Retorna quantos foram entregues."""
+        entregues = 0
+        while True:
+            try:
+                tarefa = self._resultados.get_nowait()
+            except queue.Empty:
+                return entregues
+            self._esquecer(tarefa)
+            if tarefa.cancelada or tarefa.futuro.cancelled() or not self._dono_existe(tarefa.dono):
+                continue
+            entregues += 1
+            self._entregar(tarefa)
+
+    def encerrar(self) -> None:
+        """Cancela o que não começou e libera as threads (fechamento da aplicação)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    # --- Métodos privados ---
+
+    def _obter_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_threads, thread_name_prefix=self.nome
+            )
+        return self._executor
+
+    def _registrar(self, tarefa: Tarefa) -> None:
+        with self._lock:
+            self._pendentes.setdefault(id(tarefa.dono), []).append(tarefa)
+            # Widgets reaproveitados (cards) submetem muitas tarefas: vincula uma vez só
+            novo_dono = id(tarefa.dono) not in self._vinculados
+            self._vinculados.add(id(tarefa.dono))
+        if novo_dono and hasattr(tarefa.dono, "bind"):
+            dono = tarefa.dono
+            dono.bind("<Destroy>", lambda e: self._ao_destruir(dono) if e.widget is dono else None, add="+")
+
+    def _ao_destruir(self, dono) -> None:
+        with self._lock:
+            self._vinculados.discard(id(dono))
+        self.cancelar_do_dono(dono)
+
+    def _esquecer(self, tarefa: Tarefa) -> None:
+        with self._lock:
+            tarefas = self._pendentes.get(id(tarefa.dono))
+            if tarefas and tarefa in tarefas:
+                tarefas.remove(tarefa)
+
+    def _entregar(self, tarefa: Tarefa) -> None:
+        try:
+            if tarefa.carregando:
+                tarefa.carregando(False)
+            erro = tarefa.futuro.exception()
+            if erro is None:
+                if tarefa.ao_concluir:
+                    tarefa.ao_concluir(tarefa.futuro.result())
+            elif tarefa.ao_falhar:
+                tarefa.ao_falhar(erro)
+            else:
+                logger.error("Tarefa em segundo plano falhou", exc_info=erro)
+        except Exception:
+            # Um callback com erro não pode parar a entrega dos demais
+            logger.exception("Erro no callback de uma tarefa em segundo plano")
+
+    def _agendar_sondagem(self, dono) -> None:
+        if self._sondagem is not None:
+            return
+        # A raiz sobrevive às views, então a sondagem não morre com o dono
+        raiz = dono.winfo_toplevel() if hasattr(dono, "winfo_toplevel") else dono
+        self._sondagem = (raiz, raiz.after(self.intervalo_ms, self._sondar))
+
+    def _sondar(self) -> None:
+        raiz, _ = self._sondagem
+        self._sondagem = None
+        self.processar_resultados()
+        with self._lock:
+            ha_pendentes = any(self._pendentes.values())
+        if ha_pendentes:
+            try:
+                self._sondagem = (raiz, raiz.after(self.intervalo_ms, self._sondar))
+            except Exception:
+                # Janela principal fechada
+                self._sondagem = None
+
+    @staticmethod
+    def _dono_existe(dono) -> bool:
+        try:
+            return not hasattr(dono, "winfo_exists") or bool(dono.winfo_exists())
+        except Exception:
+            return False
+
+
+# Executor compartilhado pelos controllers (BaseController.run_in_background)
+executor_tarefas = ExecutorTarefas()
@@ -0,0 +1,214 @@
+"""Cache de miniaturas das imagens de produto, em duas camadas.
+
+1. Disco: variantes já redimensionadas em ``Config.MINIATURAS_DIR``, com nome
+   derivado de (caminho de origem, mtime, tamanho do arquivo, dimensão). Se a
+   imagem original mudar, o nome muda e a variante antiga deixa de ser usada.
+2. Memória: LRU de ``PhotoImage`` já decodificados, limitado por um orçamento
+   de bytes (largura x altura x 4) em ``Config.MINIATURAS_MEMORIA_MB``.
+
+Redesenhar o catálogo com as imagens em memória não decodifica nenhuma
+imagem; a primeira exibição de uma imagem só decodifica a original uma vez
+(depois, lê a variante pequena do disco).
+
+``gerar_miniatura`` e ``carregar_miniatura`` usam só o Pillow e podem rodar
+em qualquer thread; ``foto`` e ``foto_de_imagem`` criam ``PhotoImage`` e devem
+ser chamadas na thread do Tkinter. Os cards do catálogo carregam as miniaturas
+em ``executor_miniaturas`` (pool próprio, para não disputar threads com as
+consultas das telas) e só trocam o quadro pela foto quando ela fica pronta.
+"""
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from PIL import Image
+
+from src.config.settings import Config
+from src.utils.task_runner import ExecutorTarefas
+
+logger = logging.getLogger(__name__)
+
+Tamanho = Tuple[int, int]
+
+# Cores dos quadros usados quando não há imagem ou ela não abre
+COR_SEM_IMAGEM = "#F3F4F6"
+COR_ERRO_IMAGEM = "#FEE2E2"
+
+
+def resolver_caminho(caminho: Optional[str]) -> Optional[str]:
+    """Caminho absoluto da imagem (relativos são relativos a BASE_DIR)."""
+    if not caminho:
+        return None
+    return caminho if os.path.isabs(caminho) else os.path.join(Config.BASE_DIR, caminho)
+
+
+def _foto_tk(imagem: Image.Image):
+    from PIL import ImageTk
+    return ImageTk.PhotoImage(imagem)
+
+
+class CacheMiniaturas:
+    """Miniaturas em disco + LRU de PhotoImage com orçamento de memória."""
+
+    def __init__(
+        self,
+        diretorio: Optional[str] = None,
+        orcamento_bytes: Optional[int] = None,
+        fabrica_foto: Callable[[Image.Image], object] = _foto_tk,
+    ):
+        self.diretorio = diretorio or Config.MINIATURAS_DIR
+        self.orcamento_bytes = (
+            orcamento_bytes if orcamento_bytes is not None
+            else Config.MINIATURAS_MEMORIA_MB * 1024 * 1024
+        )
+        self._fabrica_foto = fabrica_foto
+        self._fotos: "OrderedDict[tuple, Tuple[object, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.estatisticas: Dict[str, int] = {
+            "memoria": 0, "disco": 0, "geradas": 0, "descartadas": 0,
+        }
+
+    # --- Camada de disco (qualquer thread) ---
+
+    def gerar_miniatura(self, caminho: str, tamanho: Tamanho) -> Optional[str]:
+        """
+        Caminho da variante redimensionada de ``caminho``, criando-a se preciso.
+        Retorna None se a origem não existir.
+        :raises OSError: Imagem ilegível (arquivo corrompido, formato desconhecido)
+        """
+        chave = self._chave_disco(caminho, tamanho)
+        if chave is None:
+            return None
+        destino = os.path.join(self.diretorio, chave[:2], f"{chave}.png")
+        if os.path.exists(destino):
+            with self._lock:
+                self.estatisticas["disco"] += 1
+            return destino
+
+        with Image.open(caminho) as original:
+            original.draft("RGB", tamanho)  # JPEG: decodifica já reduzido
+            miniatura = original.copy() if original.mode in ("RGB", "RGBA", "L") else original.convert("RGBA")
+        miniatura.thumbnail(tamanho)
+
+        os.makedirs(os.path.dirname(destino), exist_ok=True)
+        # Grava num temporário e renomeia: leitores nunca veem arquivo pela metade
+        temporario = f"{destino}.{os.getpid()}.{threading.get_ident()}.tmp"
+        miniatura.save(temporario, "PNG", optimize=False)
+        os.replace(temporario, destino)
+        with self._lock:
+            self.estatisticas["geradas"] += 1
+        return destino
+
+    def carregar_miniatura(self, caminho: Optional[str], tamanho: Tamanho) -> Optional[Image.Image]:
+        """
+        Miniatura já decodificada (pixels em memória), pronta para ``foto_de_imagem``.
+        Retorna None se não houver imagem.
+        :raises OSError: Imagem ilegível
+        """
+        caminho = resolver_caminho(caminho)
+        destino = self.gerar_miniatura(caminho, tamanho) if caminho else None
+        if destino is None:
+            return None
+        with Image.open(destino) as miniatura:
+            miniatura.load()
+            return miniatura.copy()
+
+    # --- Camada de memória (thread do Tkinter) ---
+
+    def foto(self, caminho: Optional[str], tamanho: Tamanho):
+        """
+        PhotoImage da imagem em ``tamanho`` (no máximo), vindo da memória
+        sempre que possível. Sem imagem ou com erro devolve um quadro liso.
+        """
+        foto = self.foto_em_memoria(caminho, tamanho)
+        if foto is not None:
+            return foto
+        try:
+            return self.foto_de_imagem(caminho, tamanho, self.carregar_miniatura(caminho, tamanho))
+        except Exception as e:
+            logger.warning(f"Falha ao carregar a imagem {caminho}: {e}")
+            return self.quadro(tamanho, COR_ERRO_IMAGEM)
+
+    def foto_de_imagem(self, caminho: Optional[str], tamanho: Tamanho, imagem: Optional[Image.Image]):
+        """PhotoImage de uma miniatura vinda de ``carregar_miniatura``, guardada no LRU."""
+        caminho = resolver_caminho(caminho)
+        chave = self._chave_memoria(caminho, tamanho) if caminho else None
+        if imagem is None or chave is None:
+            return self.quadro(tamanho, COR_SEM_IMAGEM)
+        return self._guardar(chave, self._fabrica_foto(imagem), imagem.size)
+
+    def foto_em_memoria(self, caminho: Optional[str], tamanho: Tamanho):
+        """A PhotoImage se já estiver na memória, senão None (não lê disco)."""
+        caminho = resolver_caminho(caminho)
+        chave = self._chave_memoria(caminho, tamanho) if caminho else None
+        return self._buscar(chave) if chave else None
+
+    def quadro(self, tamanho: Tamanho, cor: str):
+        """Quadro liso (sem imagem / erro), também guardado no LRU."""
+        chave = ("quadro", cor, tamanho)
+        foto = self._buscar(chave)
+        if foto is None:
+            foto = self._guardar(chave, self._fabrica_foto(Image.new("RGB", tamanho, color=cor)), tamanho)
+        return foto
+
+    def limpar_memoria(self) -> None:
+        with self._lock:
+            self._fotos.clear()
+            self._bytes = 0
+
+    @property
+    def bytes_em_memoria(self) -> int:
+        return self._bytes
+
+    # --- Métodos privados ---
+
+    def _buscar(self, chave):
+        with self._lock:
+            entrada = self._fotos.get(chave)
+            if entrada is None:
+                return None
+            self._fotos.move_to_end(chave)
+            self.estatisticas["memoria"] += 1
+            return entrada[0]
+
+    def _guardar(self, chave, foto, dimensao: Tamanho):
+        custo = dimensao[0] * dimensao[1] * 4
+        with self._lock:
+            anterior = self._fotos.pop(chave, None)
+            if anterior is not None:
+                self._bytes -= anterior[1]
+            self._fotos[chave] = (foto, custo)
+            self._bytes += custo
+            # Remove as menos usadas até caber no orçamento (a recém-inserida fica)
+            while self._bytes > self.orcamento_bytes and len(self._fotos) > 1:
+                _, (_, custo_antigo) = self._fotos.popitem(last=False)
+                self._bytes -= custo_antigo
+                self.estatisticas["descartadas"] += 1
+        return foto
+
+    @staticmethod
+    def _chave_memoria(caminho: str, tamanho: Tamanho):
+        try:
+            info = os.stat(caminho)
+        except OSError:
+            return None
+        return (caminho, info.st_mtime_ns, info.st_size, tamanho)
+
+    @staticmethod
+    def _chave_disco(caminho: str, tamanho: Tamanho) -> Optional[str]:
+        try:
+            info = os.stat(caminho)
+        except OSError:
+            return None
+        base = f"{os.path.abspath(caminho)}|{info.st_mtime_ns}|{info.st_size}|{tamanho[0]}x{tamanho[1]}"
+        return hashlib.sha1(base.encode("utf-8")).hexdigest()
+
+
+# Cache compartilhado pelos cards e pelo modal de detalhes
+miniaturas = CacheMiniaturas()
+
+# Pool que carrega as miniaturas dos cards fora da thread do Tkinter
+executor_miniaturas = ExecutorTarefas(max_threads=Config.MINIATURAS_THREADS, nome="miniatura")
@@ -0,0 +1,277 @@
+"""Monitor de travamentos do loop de eventos do Tkinter.
+
+A MainWindow agenda um batimento (``after``) a cada
+``Config.MONITOR_UI_INTERVALO_MS``. O atraso de cada batimento em relação
+ao horário previsto é o tempo em que a thread do Tkinter ficou ocupada sem
+atender eventos; a partir de ``Config.MONITOR_UI_LIMITE_MS`` ele conta como
+travamento e é atribuído à tela exibida no momento.
+
+Enquanto a thread do Tkinter está parada, uma thread de amostragem lê a
+pilha Python dela (``sys._current_frames``) algumas vezes; o travamento
+guarda a pilha vista com mais frequência e o quadro mais interno do código
+da aplicação (``local``), que normalmente é a consulta ou o processamento
+de imagem síncrono responsável.
+
+Uso fora da interface (ex.: benchmarks):
+
+    monitor_travamentos.iniciar(raiz)
+    ...
+    print(monitor_travamentos.formatar_relatorio())
+"""
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.config.settings import Config
+
+logger = logging.getLogger(__name__)
+
+
+class _EstatisticaVista:
+    """Acumuladores dos travamentos de uma tela."""
+
+    __slots__ = ("travamentos", "total_ms", "max_ms", "piores")
+
+    def __init__(self):
+        self.travamentos = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.piores: List[Dict[str, Any]] = []
+
+
+class MonitorTravamentos:
+    """Batimento no loop do Tkinter + amostragem da pilha durante os travamentos."""
+
+    # Piores travamentos guardados (com pilha) por tela
+    MAX_PIORES_POR_VISTA = 5
+    # Quadros guardados de cada pilha (os mais internos)
+    MAX_QUADROS = 25
+
+    def __init__(self, ativo: Optional[bool] = None, intervalo_ms: Optional[float] = None,
+                 limite_ms: Optional[float] = None):
+        self.ativo = Config.MONITOR_UI_ATIVO if ativo is None else ativo
+        self.intervalo_ms = Config.MONITOR_UI_INTERVALO_MS if intervalo_ms is None else intervalo_ms
+        self.limite_ms = Config.MONITOR_UI_LIMITE_MS if limite_ms is None else limite_ms
+        # Tela exibida (a MainWindow atualiza a cada navegação)
+        self.vista = "-"
+
+        self._raiz = None
+        self._agendado = None
+        self._thread_principal: Optional[int] = None
+        self._amostrador: Optional[threading.Thread] = None
+        self._parar = threading.Event()
+        self._lock = threading.Lock()
+
+        self._ultimo = time.perf_counter()
+        self._amostras: Counter = Counter()
+        self._vista_amostrada: Optional[str] = None
+        self._vistas: Dict[str, _EstatisticaVista] = {}
+        self._batimentos = 0
+        self._soma_atraso_ms = 0.0
+        self._max_atraso_ms = 0.0
+        self._desde = datetime.now()
+
+    # --- Ciclo de vida ---
+
+    def iniciar(self, raiz) -> None:
+        """
+        Começa a monitorar o loop de ``raiz`` (um ``tk.Tk``). Deve ser chamado
+        na thread do Tkinter.
+        """
+        if not self.ativo or self._raiz is not None:
+            return
+        self._raiz = raiz
+        self._thread_principal = threading.get_ident()
+        self._ultimo = time.perf_counter()
+        self._parar.clear()
+        self._amostrador = threading.Thread(target=self._amostrar, name="monitor-ui", daemon=True)
+        self._amostrador.start()
+        self._agendado = raiz.after(int(self.intervalo_ms), self._tique)
+
+    def encerrar(self) -> None:
+        """Para o batimento e a thread de amostragem."""
+        self._parar.set()
+        if self._raiz is not None and self._agendado is not None:
+            try:
+                self._raiz.after_cancel(self._agendado)
+            except Exception:
+                pass  # janela já destruída
+        self._raiz = self._agendado = None
+        if self._amostrador is not None:
+            self._amostrador.join(timeout=1)
+            self._amostrador = None
+
+    # --- Coleta ---
+
+    def batimento(self, agora: Optional[float] = None) -> float:
+        """
+        Registra um batimento (thread do Tkinter) e devolve o atraso em ms.
+        Atrasos a partir de ``limite_ms`` viram travamentos da tela atual.
+        """
+        agora = time.perf_counter() if agora is None else agora
+        with self._lock:
+            atraso_ms = max(0.0, (agora - self._ultimo) * 1000 - self.intervalo_ms)
+            self._ultimo = agora
+            amostras, self._amostras = self._amostras, Counter()
+            vista = self._vista_amostrada or self.vista
+            self._vista_amostrada = None
+
+            self._batimentos += 1
+            self._soma_atraso_ms += atraso_ms
+            self._max_atraso_ms = max(self._max_atraso_ms, atraso_ms)
+            if atraso_ms < self.limite_ms:
+                return atraso_ms
+            travamento = self._registrar(vista, atraso_ms, amostras)
+
+        logger.warning(
+            f"Interface travada por {atraso_ms:.0f} ms em {vista}"
+            + (f" ({travamento['local']})" if travamento["local"] else "")
+        )
+        return atraso_ms
+
+    # --- Consulta ---
+
+    def responsividade(self) -> Dict[str, Any]:
+        """Números gerais do loop de eventos desde o início (ou o último ``limpar``)."""
+        with self._lock:
+            return {
+                "desde": self._desde.isoformat(timespec="seconds"),
+                "ativo": self.ativo,
+                "intervalo_ms": self.intervalo_ms,
+                "limite_ms": self.limite_ms,
+                "batimentos": self._batimentos,
+                "atraso_medio_ms": round(self._soma_atraso_ms / self._batimentos, 2) if self._batimentos else 0.0,
+                "atraso_max_ms": round(self._max_atraso_ms, 1),
+                "travamentos": sum(est.travamentos for est in self._vistas.values()),
+            }
+
+    def resumo(self) -> List[Dict[str, Any]]:
+        """Uma linha por tela, da que teve o pior travamento para a melhor."""
+        with self._lock:
+            linhas = [
+                {
+                    "vista": vista,
+                    "travamentos": est.travamentos,
+                    "total_ms": round(est.total_ms, 1),
+                    "max_ms": round(est.max_ms, 1),
+                    "piores": list(est.piores),
+                }
+                for vista, est in self._vistas.items()
+            ]
+        return sorted(linhas, key=lambda linha: linha["max_ms"], reverse=True)
+
+    def piores(self, limite: Optional[int] = 20) -> List[Dict[str, Any]]:
+        """Os piores travamentos de todas as telas, do mais longo para o mais curto."""
+        with self._lock:
+            todos = [t for est in self._vistas.values() for t in est.piores]
+        todos.sort(key=lambda t: t["duracao_ms"], reverse=True)
+        return todos[:limite] if limite else todos
+
+    def formatar_relatorio(self) -> str:
+        """Relatório em texto: travamentos por tela e a pilha de cada um dos piores."""
+        geral = self.responsividade()
+        saida = [
+            f"{geral['batimentos']} batimentos, atraso médio {geral['atraso_medio_ms']:.1f} ms, "
+            f"máximo {geral['atraso_max_ms']:.0f} ms, {geral['travamentos']} travamento(s) "
+            f"acima de {geral['limite_ms']:.0f} ms"
+        ]
+        for linha in self.resumo():
+            saida.append(
+                f"\n{linha['vista']}: {linha['travamentos']} travamento(s), "
+                f"total {linha['total_ms']:.0f} ms, pior {linha['max_ms']:.0f} ms"
+            )
+            for travamento in linha["piores"]:
+                saida.append(
+                    f"  {travamento['duracao_ms']:>7.0f} ms  {travamento['quando']}  "
+                    f"{travamento['local'] or '(sem amostra)'}"
+                )
+                for quadro in travamento["pilha"]:
+                    saida.append(f"      {quadro}")
+        return "\n".join(saida)
+
+    def limpar(self) -> None:
+        with self._lock:
+            self._vistas.clear()
+            self._batimentos = 0
+            self._soma_atraso_ms = 0.0
+            self._max_atraso_ms = 0.0
+            self._desde = datetime.now()
+
+    # --- Métodos privados ---
+
+    def _tique(self) -> None:
+        if self._raiz is None:
+            return
+        self.batimento()
+        self._agendado = self._raiz.after(int(self.intervalo_ms), self._tique)
+
+    def _amostrar(self) -> None:
+        """Thread de amostragem: lê a pilha da thread do Tkinter enquanto ela está parada."""
+        espera_s = max(self.limite_ms / 4, 5) / 1000
+        while not self._parar.wait(espera_s):
+            parado_ms = (time.perf_counter() - self._ultimo) * 1000 - self.intervalo_ms
+            if parado_ms < self.limite_ms:
+                continue
+            quadro = sys._current_frames().get(self._thread_principal)
+            if quadro is None:
+                continue
+            pilha = self._formatar_pilha(traceback.extract_stack(quadro, limit=self.MAX_QUADROS))
+            with self._lock:
+                self._amostras[pilha] += 1
+                if self._vista_amostrada is None:
+                    self._vista_amostrada = self.vista
+
+    def _registrar(self, vista: str, duracao_ms: float, amostras: Counter) -> Dict[str, Any]:
+        """Acumula o travamento na tela (chamado com o lock)."""
+        pilha: Tuple[str, ...] = ()
+        if amostras:
+            pilha = amostras.most_common(1)[0][0]
+        travamento = {
+            "vista": vista,
+            "duracao_ms": round(duracao_ms, 1),
+            "quando": datetime.now().isoformat(timespec="seconds"),
+            "local": self._local(pilha),
+            "pilha": list(pilha),
+            "amostras": sum(amostras.values()),
+        }
+
+        est = self._vistas.get(vista)
+        if est is None:
+            est = self._vistas[vista] = _EstatisticaVista()
+        est.travamentos += 1
+        est.total_ms += duracao_ms
+        est.max_ms = max(est.max_ms, duracao_ms)
+        est.piores.append(travamento)
+        est.piores.sort(key=lambda t: t["duracao_ms"], reverse=True)
+        del est.piores[self.MAX_PIORES_POR_VISTA:]
+        return travamento
+
+    @staticmethod
+    def _formatar_pilha(quadros: traceback.StackSummary) -> Tuple[str, ...]:
+        """'arquivo:linha em função' de cada quadro, do mais externo ao mais interno."""
+        base = os.path.abspath(Config.BASE_DIR) + os.sep
+        pilha = []
+        for quadro in quadros:
+            arquivo = quadro.filename
+            if arquivo.startswith(base):
+                arquivo = arquivo[len(base):]
+            pilha.append(f"{arquivo}:{quadro.lineno} em {quadro.name}")
+        return tuple(pilha)
+
+    @staticmethod
+    def _local(pilha: Tuple[str, ...]) -> str:
+        """Quadro mais interno do código da aplicação (src/), ou o mais interno de todos."""
+        for quadro in reversed(pilha):
+            if quadro.startswith("src" + os.sep):
+                return quadro
+        return pilha[-1] if pilha else ""
+
+
+# Monitor usado pela MainWindow e pelo painel de diagnóstico
+monitor_travamentos = MonitorTravamentos()
@@ -6,8 +6,12 @@ class DashboardView(tk.Frame):
     """
     Painel Principal do Administrador.
     Exibe estatísticas em tempo real e menu de navegação.
+    Persistente: ao voltar para ele, só recarrega se os dados mudaram.
     """
 
+    PERSISTENTE = True
+    TABELAS_DADOS = ("produtos", "categorias", "pedidos")
+
     def __init__(self, parent, controller, usuario_logado):
         super().__init__(parent, bg=Config.COLOR_BG)
         self.controller = controller
@@ -25,9 +29,16 @@ class DashboardView(tk.Frame):
         self._setup_sidebar()
         self._setup_content_area()
         
+        self._versoes = None  # versões dos dados da última carga
+        
         # --- Carrega os dados reais após 100ms ---
         self.after(100, self._load_statistics)
 
+    def on_show(self, data=None):
+        """Chamado pela MainWindow ao reexibir o painel."""
+        if self.admin_controller.data_versions(*self.TABELAS_DADOS) != self._versoes:
+            self._load_statistics()
+
     def _setup_sidebar(self):
         """Cria o menu lateral escuro."""
         sidebar = tk.Frame(self, bg=Config.COLOR_PRIMARY, width=250)
@@ -57,6 +68,7 @@ class DashboardView(tk.Frame):
         self._create_nav_button(sidebar, "Gerenciar Produtos", "ManageProducts")
         self._create_nav_button(sidebar, "Gerenciar Categorias", "ManageCategories")
         self._create_nav_button(sidebar, "Ver Pedidos", "ManageOrders")
+        self._create_nav_button(sidebar, "Diagnóstico", "Diagnostics")
         self._create_nav_button(sidebar, "Sair / Logout", "Logout", color=Config.COLOR_SECONDARY)
 
     def _create_nav_button(self, parent, text, action, color=None):
@@ -119,11 +131,19 @@ class DashboardView(tk.Frame):
 
     def _load_statistics(self):
         """
-        Busca dados reais do banco e atualiza a tela.
+        Busca dados reais do banco (em segundo plano) e atualiza a tela.
         """
+        self._versoes = self.admin_controller.data_versions(*self.TABELAS_DADOS)
+        self.admin_controller.run_in_background(
+            self,
+            self.admin_controller.get_dashboard_stats,
+            on_success=self._show_statistics,
+            on_error=lambda e: print(f"Erro crítico no dashboard: {e}"),
+        )
+
+    def _show_statistics(self, resultado):
+        """Atualiza os cards com as estatísticas carregadas."""
         try:
-            resultado = self.admin_controller.get_dashboard_stats()
-            
             if resultado['success']:
                 stats = resultado['data']
                 
@@ -151,5 +171,7 @@ class DashboardView(tk.Frame):
             self.controller.show_view("ManageCategories", data=self.usuario)
         elif action == "ManageOrders":
             self.controller.show_view("ManageOrders", data=self.usuario)
+        elif action == "Diagnostics":
+            self.controller.show_view("Diagnostics", data=self.usuario)
         else:
             print(f"Ação desconhecida: {action}")
\ No newline at end of file
@@ -0,0 +1,245 @@
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+from src.config.settings import Config
+from src.controllers.admin_controller import AdminController
+from src.views.components.data_table import DataTable
+
+
+class DiagnosticsView(tk.Frame):
+    """
+    Painel de diagnóstico: latência por ação dos controllers, log de ações lentas
+    e travamentos da interface (loop de eventos) por tela.
+    """
+
+    def __init__(self, parent, controller, data=None):
+        super().__init__(parent, bg=Config.COLOR_BG)
+        self.controller = controller
+        self.usuario = data
+        self.admin_controller = AdminController(controller)
+
+        if self.usuario and hasattr(self.usuario, "id"):
+            self.admin_controller.set_current_admin(self.usuario.id)
+
+        self._setup_ui()
+        self.after(100, self._load_data)
+
+    def _setup_ui(self):
+        header = tk.Frame(self, bg=Config.COLOR_WHITE, padx=20, pady=15)
+        header.pack(fill="x")
+
+        tk.Label(
+            header,
+            text="Diagnóstico de Desempenho",
+            font=Config.FONT_HEADER,
+            bg=Config.COLOR_WHITE,
+            fg=Config.COLOR_PRIMARY,
+        ).pack(side="left")
+
+        tk.Button(
+            header,
+            text="Voltar",
+            bg=Config.COLOR_BG,
+            fg=Config.COLOR_TEXT,
+            command=lambda: self.controller.show_view(
+                "AdminDashboard", data=self.usuario
+            ),
+        ).pack(side="right")
+
+        action_frame = tk.Frame(self, bg=Config.COLOR_WHITE, padx=20, pady=10)
+        action_frame.pack(fill="x")
+
+        self.var_ativo = tk.BooleanVar(value=True)
+        tk.Checkbutton(
+            action_frame,
+            text="Coletar métricas",
+            variable=self.var_ativo,
+            bg=Config.COLOR_WHITE,
+            font=Config.FONT_BODY,
+            command=self._handle_toggle,
+        ).pack(side="left")
+
+        self.lbl_limite = tk.Label(
+            action_frame, text="", bg=Config.COLOR_WHITE, fg="gray", font=Config.FONT_SMALL
+        )
+        self.lbl_limite.pack(side="left", padx=15)
+
+        for texto, comando in (
+            ("Limpar imagens sem uso", self._handle_collect_images),
+            ("Exportar JSON", self._handle_export),
+            ("Zerar", self._handle_reset),
+            ("Atualizar", self._load_data),
+        ):
+            tk.Button(
+                action_frame,
+                text=texto,
+                bg=Config.COLOR_PRIMARY,
+                fg="white",
+                font=Config.FONT_BODY,
+                command=comando,
+            ).pack(side="right", padx=(10, 0))
+
+        content = tk.Frame(self, bg=Config.COLOR_BG, padx=20, pady=20)
+        content.pack(fill="both", expand=True)
+
+        tk.Label(
+            content,
+            text="Ações (ordenadas pelo p90)",
+            bg=Config.COLOR_BG,
+            font=Config.FONT_BODY,
+        ).pack(anchor="w", pady=(0, 5))
+
+        self.tabela_acoes = DataTable(
+            content,
+            columns=[
+                {"id": "acao", "text": "Ação", "width": 260},
+                {"id": "chamadas", "text": "Chamadas", "width": 80, "anchor": "center"},
+                {"id": "falhas", "text": "Falhas", "width": 60, "anchor": "center"},
+                {"id": "erros", "text": "Erros", "width": 60, "anchor": "center"},
+                {"id": "media_ms", "text": "Média (ms)", "width": 90, "anchor": "e"},
+                {"id": "p50_ms", "text": "p50 (ms)", "width": 80, "anchor": "e"},
+                {"id": "p90_ms", "text": "p90 (ms)", "width": 80, "anchor": "e"},
+                {"id": "p99_ms", "text": "p99 (ms)", "width": 80, "anchor": "e"},
+                {"id": "max_ms", "text": "Máx (ms)", "width": 80, "anchor": "e"},
+            ],
+        )
+        # Menos linhas visíveis para caber o painel de travamentos abaixo
+        self.tabela_acoes.tree.configure(height=8)
+        self.tabela_acoes.pack(fill="both", expand=True)
+
+        tk.Label(
+            content,
+            text="Ações lentas (mais recentes primeiro)",
+            bg=Config.COLOR_BG,
+            font=Config.FONT_BODY,
+        ).pack(anchor="w", pady=(15, 5))
+
+        cols = ("Quando", "Ação", "Duração", "Resultado")
+        self.tree_lentas = ttk.Treeview(content, columns=cols, show="headings", height=6)
+        for col, largura in zip(cols, (150, 300, 100, 100)):
+            self.tree_lentas.heading(col, text=col)
+            self.tree_lentas.column(col, width=largura, anchor="w")
+        self.tree_lentas.pack(fill="x")
+
+        self.lbl_travamentos = tk.Label(
+            content,
+            text="Travamentos da interface",
+            bg=Config.COLOR_BG,
+            font=Config.FONT_BODY,
+        )
+        self.lbl_travamentos.pack(anchor="w", pady=(15, 5))
+
+        cols = ("Tela", "Duração", "Quando", "Onde")
+        self.tree_travamentos = ttk.Treeview(
+            content, columns=cols, show="headings", height=5, selectmode="browse"
+        )
+        for col, largura in zip(cols, (150, 100, 150, 400)):
+            self.tree_travamentos.heading(col, text=col)
+            self.tree_travamentos.column(col, width=largura, anchor="w")
+        self.tree_travamentos.bind("<<TreeviewSelect>>", self._on_select_travamento)
+        self.tree_travamentos.pack(fill="x")
+
+        # Pilha da thread do Tkinter amostrada durante o travamento selecionado
+        self.txt_pilha = tk.Text(content, height=7, font=Config.FONT_SMALL, wrap="none")
+        self.txt_pilha.pack(fill="x", pady=(5, 0))
+        self.txt_pilha.config(state="disabled")
+        self._travamentos = {}
+
+    def _load_data(self):
+        res = self.admin_controller.get_action_metrics()
+        if not res["success"]:
+            messagebox.showerror("Erro", res["message"])
+            return
+
+        dados = res["data"]
+        self.var_ativo.set(dados["ativo"])
+        self.lbl_limite.config(text=f"Lenta a partir de {dados['limite_lento_ms']:.0f} ms")
+        self.tabela_acoes.load_data(dados["acoes"])
+
+        for item in self.tree_lentas.get_children():
+            self.tree_lentas.delete(item)
+        for lenta in dados["lentas"]:
+            self.tree_lentas.insert(
+                "",
+                "end",
+                values=(
+                    lenta["quando"],
+                    lenta["acao"],
+                    f"{lenta['duracao_ms']:.0f} ms",
+                    lenta["resultado"],
+                ),
+            )
+
+        self._load_stalls()
+
+    def _load_stalls(self):
+        res = self.admin_controller.get_ui_stalls()
+        if not res["success"]:
+            return
+
+        geral = res["data"]["geral"]
+        self.lbl_travamentos.config(
+            text=(
+                f"Travamentos da interface (acima de {geral['limite_ms']:.0f} ms) — "
+                f"{geral['travamentos']} em {geral['batimentos']} batimentos, "
+                f"atraso médio {geral['atraso_medio_ms']:.1f} ms, máximo {geral['atraso_max_ms']:.0f} ms"
+            )
+        )
+
+        self.tree_travamentos.delete(*self.tree_travamentos.get_children())
+        self._travamentos = {}
+        for travamento in res["data"]["piores"]:
+            iid = self.tree_travamentos.insert(
+                "",
+                "end",
+                values=(
+                    travamento["vista"],
+                    f"{travamento['duracao_ms']:.0f} ms",
+                    travamento["quando"],
+                    travamento["local"] or "(sem amostra)",
+                ),
+            )
+            self._travamentos[iid] = travamento
+        self._mostrar_pilha([])
+
+    def _on_select_travamento(self, event=None):
+        selecionado = self.tree_travamentos.selection()
+        travamento = self._travamentos.get(selecionado[0]) if selecionado else None
+        self._mostrar_pilha(travamento["pilha"] if travamento else [])
+
+    def _mostrar_pilha(self, pilha):
+        self.txt_pilha.config(state="normal")
+        self.txt_pilha.delete("1.0", "end")
+        self.txt_pilha.insert("1.0", "\n".join(pilha))
+        self.txt_pilha.config(state="disabled")
+
+    def _handle_toggle(self):
+        self.admin_controller.set_metrics_enabled(self.var_ativo.get())
+
+    def _handle_reset(self):
+        if messagebox.askyesno("Confirmar", "Zerar todas as métricas coletadas?"):
+            self.admin_controller.reset_action_metrics()
+            self.admin_controller.reset_ui_stalls()
+            self._load_data()
+
+    def _handle_export(self):
+        caminho = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[("JSON", "*.json")],
+            initialfile="metricas_acoes.json",
+        )
+        if not caminho:
+            return
+        res = self.admin_controller.export_action_metrics(caminho)
+        if res["success"]:
+            messagebox.showinfo("Sucesso", res["message"])
+        else:
+            messagebox.showerror("Erro", res["message"])
+
+    def _handle_collect_images(self):
+        if not messagebox.askyesno("Confirmar", "Apagar do disco as imagens que nenhum produto usa?"):
+            return
+        res = self.admin_controller.collect_orphan_images()
+        if res["success"]:
+            messagebox.showinfo("Sucesso", res["message"])
+        else:
+            messagebox.showerror("Erro", res["message"])
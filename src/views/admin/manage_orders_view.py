@@ -2,14 +2,20 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from src.config.settings import Config
 from src.controllers.admin_controller import AdminController
+from src.views.components.data_table import DataTable, FonteFuncoes
 from src.views.components.order_details_modal import OrderDetailsModal
 
 
 class ManageOrdersView(tk.Frame):
     """
     Tela de Gestão de Pedidos para Admin.
+    Persistente: ao voltar para ela, a tabela só é relida se os pedidos mudaram.
+    A tabela é virtual (busca no banco só as linhas visíveis).
     """
 
+    PERSISTENTE = True
+    TABELAS_DADOS = ("pedidos", "itens_pedido")
+
     def __init__(self, parent, controller, data=None):
         super().__init__(parent, bg=Config.COLOR_BG)
         self.controller = controller
@@ -19,9 +25,16 @@ class ManageOrdersView(tk.Frame):
         if self.usuario and hasattr(self.usuario, "id"):
             self.admin_controller.set_current_admin(self.usuario.id)
 
+        self._versoes = None  # versões dos dados da última carga
+
         self._setup_ui()
         self.after(100, self._load_data)
 
+    def on_show(self, data=None):
+        """Chamado pela MainWindow ao reexibir a tela."""
+        if self.admin_controller.data_versions(*self.TABELAS_DADOS) != self._versoes:
+            self._load_data()
+
     def _setup_ui(self):
         header = tk.Frame(self, bg=Config.COLOR_WHITE, padx=20, pady=15)
         header.pack(fill="x")
@@ -57,29 +70,27 @@ class ManageOrdersView(tk.Frame):
             pady=(0, 10), anchor="w"
         )
 
-        cols = ("ID", "Cliente", "Data", "Status", "Total", "Itens")
-        self.tree = ttk.Treeview(
-            content, columns=cols, show="headings", selectmode="browse"
+        columns = [
+            {'id': 'id', 'text': 'ID', 'width': 50, 'anchor': 'center'},
+            {'id': 'cliente_nome', 'text': 'Cliente', 'width': 200,
+             'format': lambda v: v or "Cliente Desconhecido"},
+            {'id': 'criado_em', 'text': 'Data', 'width': 120, 'anchor': 'center'},
+            {'id': 'status', 'text': 'Status', 'width': 100, 'anchor': 'center'},
+            {'id': 'total', 'text': 'Total', 'width': 100, 'anchor': 'e',
+             'format': lambda v: f"R$ {v:.2f}"},
+            {'id': 'total_itens', 'text': 'Itens', 'width': 50, 'anchor': 'center'},
+        ]
+        fonte = FonteFuncoes(
+            self._contar_pedidos,
+            self._listar_pedidos,
+            ordenaveis=("id", "criado_em", "status", "total"),
         )
-
-        self.tree.heading("ID", text="ID")
-        self.tree.column("ID", width=50, anchor="center")
-        self.tree.heading("Cliente", text="Cliente")
-        self.tree.column("Cliente", width=200, anchor="w")
-        self.tree.heading("Data", text="Data")
-        self.tree.column("Data", width=120, anchor="center")
-        self.tree.heading("Status", text="Status")
-        self.tree.column("Status", width=100, anchor="center")
-        self.tree.heading("Total", text="Total")
-        self.tree.column("Total", width=100, anchor="e")
-        self.tree.heading("Itens", text="Itens")
-        self.tree.column("Itens", width=50, anchor="center")
-        self.tree.bind("<Double-1>", self._on_double_click)
-
-        scrollbar = ttk.Scrollbar(content, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
-        self.tree.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        self.table = DataTable(content, columns, source=fonte, on_error=self._on_load_error)
+        # Mais recentes primeiro, como a listagem do repositório
+        self.table.sort_column = "criado_em"
+        self.table.sort_reverse = True
+        self.table.tree.bind("<Double-1>", self._on_double_click)
+        self.table.pack(fill="both", expand=True)
 
         action_frame = tk.Frame(self, bg=Config.COLOR_WHITE, padx=20, pady=15)
         action_frame.pack(fill="x", side="bottom")
@@ -111,14 +122,11 @@ class ManageOrdersView(tk.Frame):
 
     def _on_double_click(self, event):
         """Abre modal de detalhes."""
-        selected = self.tree.selection()
+        selected = self.table.get_selected()
         if not selected:
             return
 
-        item = self.tree.item(selected[0])
-        pedido_id = item["values"][0]
-
-        res = self.admin_controller.get_order_details(pedido_id)
+        res = self.admin_controller.get_order_details(selected["id"])
 
         if res["success"]:
             OrderDetailsModal(self, res["data"])
@@ -126,46 +134,38 @@ class ManageOrdersView(tk.Frame):
             messagebox.showerror("Erro", res["message"])
 
     def _load_data(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        try:
-            resultado = self.admin_controller.list_all_orders()
-
-            if resultado["success"]:
-                pedidos = resultado.get("data", [])
-                if not pedidos:
-                    return
-
-                for pedido in pedidos:
-                    data_str = str(pedido.get("criado_em", "N/A"))
-
-                    self.tree.insert(
-                        "",
-                        "end",
-                        values=(
-                            pedido.get("id"),
-                            pedido.get("cliente_nome", "Cliente Desconhecido"),
-                            data_str,
-                            pedido.get("status", "N/A"),
-                            f"R$ {pedido.get('total', 0.0):.2f}",
-                            len(pedido.get("itens", [])),
-                        ),
-                    )
-            else:
-                messagebox.showerror("Erro", f"Erro: {resultado['message']}")
-        except Exception as e:
-            print(f"Erro ao carregar lista de pedidos: {e}")
-            messagebox.showerror("Erro Crítico", "Falha ao carregar lista de pedidos.")
+        """
+        Relê o total e as linhas visíveis em segundo plano (posição e seleção
+        são mantidas).
+        """
+        self._versoes = self.admin_controller.data_versions(*self.TABELAS_DADOS)
+        self.table.refresh()
+
+    def _on_load_error(self, e):
+        print(f"Erro ao carregar lista de pedidos: {e}")
+        messagebox.showerror("Erro Crítico", "Falha ao carregar lista de pedidos.")
+
+    def _contar_pedidos(self):
+        res = self.admin_controller.count_orders()
+        if not res["success"]:
+            raise RuntimeError(res["message"])
+        return res["data"]
+
+    def _listar_pedidos(self, inicio, quantidade, ordenar_por, decrescente, apos, antes):
+        res = self.admin_controller.list_orders_page(
+            inicio, quantidade, ordenar_por, decrescente, apos, antes
+        )
+        if not res["success"]:
+            raise RuntimeError(res["message"])
+        return res["data"]
 
     def _handle_update_status(self):
-        selected = self.tree.selection()
+        selected = self.table.get_selected()
         if not selected:
             messagebox.showwarning("Aviso", "Selecione um pedido na tabela.")
             return
 
-        item = self.tree.item(selected[0])
-        pedido_id = item["values"][0]
+        pedido_id = selected["id"]
         novo_status = self.combo_status.get()
 
         if messagebox.askyesno(
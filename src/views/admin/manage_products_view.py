@@ -1,7 +1,8 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import messagebox
 from src.config.settings import Config
 from src.services.catalog_service import CatalogService
+from src.views.components.data_table import DataTable, FonteFuncoes
 
 class ManageProductsView(tk.Frame):
     """
@@ -75,58 +76,30 @@ class ManageProductsView(tk.Frame):
             command=self._delete_selected
         ).pack(side="left", padx=5)
 
-        # Tabela (Treeview)
-        columns = ("id", "sku", "nome", "categoria", "preco", "estoque")
-        self.tree = ttk.Treeview(content, columns=columns, show="headings", selectmode="browse")
-        
-        # Configurar Cabeçalhos
-        self.tree.heading("id", text="ID")
-        self.tree.heading("sku", text="SKU")
-        self.tree.heading("nome", text="Nome")
-        self.tree.heading("categoria", text="Categoria")
-        self.tree.heading("preco", text="Preço")
-        self.tree.heading("estoque", text="Estoque")
-
-        # Configurar Colunas
-        self.tree.column("id", width=50, anchor="center")
-        self.tree.column("sku", width=100)
-        self.tree.column("nome", width=300)
-        self.tree.column("categoria", width=150)
-        self.tree.column("preco", width=100, anchor="e")
-        self.tree.column("estoque", width=80, anchor="center")
-
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(content, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
-        
-        self.tree.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        # Tabela virtual: só as linhas visíveis são buscadas, ordenando no banco
+        columns = [
+            {'id': 'id', 'text': 'ID', 'width': 50, 'anchor': 'center'},
+            {'id': 'sku', 'text': 'SKU', 'width': 100},
+            {'id': 'nome', 'text': 'Nome', 'width': 300},
+            {'id': 'categoria_nome', 'text': 'Categoria', 'width': 150, 'format': lambda v: v or "-"},
+            {'id': 'preco', 'text': 'Preço', 'width': 100, 'anchor': 'e', 'format': lambda v: f"R$ {v:.2f}"},
+            {'id': 'estoque', 'text': 'Estoque', 'width': 80, 'anchor': 'center'},
+        ]
+        fonte = FonteFuncoes(
+            self.service.contar_produtos,
+            self.service.listar_produtos_pagina,
+            ordenaveis=("id", "sku", "nome", "preco", "estoque"),
+        )
+        self.table = DataTable(content, columns, source=fonte, on_error=self._on_load_error)
+        self.table.pack(fill="both", expand=True)
 
     def _load_data(self):
-        """Busca dados do serviço e popula a tabela."""
-        # Limpa dados antigos
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-            
-        try:
-            produtos = self.service.listar_produtos()
-            for p in produtos:
-                # Trata a categoria (pode ser None ou Objeto)
-                cat_nome = "-"
-                if p.categoria:
-                    cat_nome = p.categoria.nome
-                
-                self.tree.insert("", "end", values=(
-                    p.id, 
-                    p.sku, 
-                    p.nome, 
-                    cat_nome, 
-                    f"R$ {p.preco:.2f}", 
-                    p.estoque
-                ))
-        except Exception as e:
-            print(f"Erro ao carregar: {e}")
-            messagebox.showerror("Erro", f"Falha ao carregar produtos: {e}")
+        """Relê o total e as linhas visíveis da tabela (em segundo plano)."""
+        self.table.refresh()
+
+    def _on_load_error(self, e):
+        print(f"Erro ao carregar: {e}")
+        messagebox.showerror("Erro", f"Falha ao carregar produtos: {e}")
 
     def _open_add_form(self):
         """Navega para a tela de formulário."""
@@ -134,13 +107,12 @@ class ManageProductsView(tk.Frame):
 
     def _edit_selected(self):
         """Abre o formulário de edição para o produto selecionado."""
-        selected = self.tree.selection()
+        selected = self.table.get_selected()
         if not selected:
             messagebox.showwarning("Atenção", "Selecione um produto para editar.")
             return
         
-        item = self.tree.item(selected[0])
-        produto_id = item['values'][0]
+        produto_id = selected['id']
         
         # Busca o produto completo
         try:
@@ -157,13 +129,12 @@ class ManageProductsView(tk.Frame):
 
     def _delete_selected(self):
         """Remove o item selecionado."""
-        selected = self.tree.selection()
+        selected = self.table.get_selected()
         if not selected:
             messagebox.showwarning("Atenção", "Selecione um produto para excluir.")
             return
             
-        item = self.tree.item(selected[0])
-        prod_id = item['values'][0]
+        prod_id = selected['id']
         
         if messagebox.askyesno("Confirmar", f"Deseja excluir o produto ID {prod_id}?"):
             try:
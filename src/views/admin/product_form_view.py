@@ -59,6 +59,14 @@ class ProductFormView(tk.Frame):
         self.ent_preco = self._create_field(row, "Preço (R$)", side="left", width=18)
         self.ent_estoque = self._create_field(row, "Estoque", side="right", width=18)
 
+        # Peso e dimensões da embalagem (cubagem do frete); vazio = padrão/valor atual
+        medidas = tk.Frame(card, bg=Config.COLOR_WHITE)
+        medidas.pack(fill="x", pady=5)
+        self.ent_peso = self._create_field(medidas, "Peso (kg)", side="left", width=8)
+        self.ent_altura = self._create_field(medidas, "Altura (cm)", side="left", width=8)
+        self.ent_largura = self._create_field(medidas, "Largura (cm)", side="left", width=8)
+        self.ent_comprimento = self._create_field(medidas, "Compr. (cm)", side="left", width=8)
+
         tk.Label(
             card, text="Categoria", bg=Config.COLOR_WHITE, font=Config.FONT_BODY
         ).pack(anchor="w")
@@ -140,6 +148,19 @@ class ProductFormView(tk.Frame):
         entry.pack(pady=(0, 10), fill="x")
         return entry
 
+    def _read_measure(self, entry, rotulo):
+        """Número não negativo do campo (aceita vírgula); vazio = None."""
+        texto = entry.get().strip().replace(",", ".")
+        if not texto:
+            return None
+        try:
+            valor = float(texto)
+        except ValueError:
+            raise ValueError(f"{rotulo} deve ser um número.")
+        if valor < 0:
+            raise ValueError(f"{rotulo} não pode ser negativo.")
+        return valor
+
     def _select_image(self):
         file_path = filedialog.askopenfilename(
             title="Selecione uma imagem",
@@ -196,6 +217,18 @@ class ProductFormView(tk.Frame):
         self.ent_estoque.delete(0, tk.END)
         self.ent_estoque.insert(0, str(get_p("estoque")))
 
+        # Peso e dimensões (objeto Produto guarda as dimensões numa tupla)
+        dimensoes = get_p("dimensoes_cm", None) or (
+            get_p("altura_cm", None), get_p("largura_cm", None), get_p("comprimento_cm", None)
+        )
+        for entry, valor in zip(
+            (self.ent_peso, self.ent_altura, self.ent_largura, self.ent_comprimento),
+            (get_p("peso_kg", None), *dimensoes),
+        ):
+            entry.delete(0, tk.END)
+            if valor is not None:
+                entry.insert(0, f"{float(valor):g}")
+
         # Descrição
         desc = get_p("descricao", "")
         self.txt_descricao.insert("1.0", desc)
@@ -234,6 +267,12 @@ class ProductFormView(tk.Frame):
             cat_nome = self.combo_categoria.get()
 
             descricao = self.txt_descricao.get("1.0", "end-1c").strip()
+            medidas = {
+                "peso_kg": self._read_measure(self.ent_peso, "Peso"),
+                "altura_cm": self._read_measure(self.ent_altura, "Altura"),
+                "largura_cm": self._read_measure(self.ent_largura, "Largura"),
+                "comprimento_cm": self._read_measure(self.ent_comprimento, "Comprimento"),
+            }
 
             if not cat_nome or cat_nome not in self.categorias_map:
                 raise ValueError("Selecione uma categoria válida.")
@@ -256,6 +295,7 @@ class ProductFormView(tk.Frame):
                     nome_categoria=cat_nome,
                     descricao=descricao,
                     imagem_path=self.imagem_path,
+                    **medidas,
                 )
                 messagebox.showinfo("Sucesso", "Produto atualizado!")
             else:
@@ -267,6 +307,7 @@ class ProductFormView(tk.Frame):
                     nome_categoria=cat_nome,
                     descricao=descricao,
                     imagem_path=self.imagem_path,
+                    **medidas,
                 )
                 messagebox.showinfo("Sucesso", "Produto cadastrado!")
 
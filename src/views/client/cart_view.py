@@ -9,8 +9,12 @@ class CartView(tk.Frame):
     """
     Tela do Carrinho de Compras.
     Exibe os itens do carrinho e permite gerenciar quantidades.
+    Persistente: ao voltar para ela, só recarrega se o carrinho mudou.
     """
 
+    PERSISTENTE = True
+    TABELAS_DADOS = ("carrinhos", "itens_carrinho", "produtos")
+
     def __init__(self, parent, controller, data=None):
         super().__init__(parent, bg=Config.COLOR_BG)
         self.controller = controller
@@ -20,10 +24,17 @@ class CartView(tk.Frame):
         if self.usuario:
             self.cart_controller.set_current_user(self.usuario.id)
         
+        self._versoes = None  # versões dos dados da última carga
+        
         self._setup_header()
         self._setup_content()
         self._load_cart()
 
+    def on_show(self, data=None):
+        """Chamado pela MainWindow ao reexibir a tela."""
+        if self.usuario and self.cart_controller.data_versions(*self.TABELAS_DADOS) != self._versoes:
+            self._reload_cart()
+
     def _setup_header(self):
         """Barra superior com título e navegação."""
         header = tk.Frame(self, bg=Config.COLOR_PRIMARY, padx=20, pady=15)
@@ -80,8 +91,26 @@ class CartView(tk.Frame):
             ).pack(pady=20)
             return
         
-        # Busca o carrinho do usuário
-        resultado = self.cart_controller.get_cart()
+        # Busca o carrinho do usuário fora da thread da interface
+        self._versoes = self.cart_controller.data_versions(*self.TABELAS_DADOS)
+        self._loading_label = tk.Label(
+            self.items_frame,
+            text="Carregando carrinho...",
+            font=Config.FONT_BODY,
+            bg=Config.COLOR_BG,
+            fg=Config.COLOR_TEXT_LIGHT
+        )
+        self._loading_label.pack(pady=20)
+        self.cart_controller.run_in_background(
+            self,
+            self.cart_controller.get_cart,
+            on_success=self._render_cart,
+            on_error=lambda e: self._render_cart({'success': False, 'message': str(e)}),
+        )
+
+    def _render_cart(self, resultado: dict):
+        """Monta a lista de itens e o resumo com o carrinho carregado."""
+        self._loading_label.destroy()
         
         if not resultado['success']:
             tk.Label(
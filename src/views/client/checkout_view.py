@@ -82,8 +82,20 @@ class CheckoutView(tk.Frame):
         if not self.usuario:
             return
 
-        # 1. Busca Carrinho
-        cart_result = self.cart_controller.get_cart()
+        # Carrinho e endereços vêm do banco fora da thread da interface
+        self.checkout_controller.run_in_background(
+            self,
+            lambda: (
+                self.cart_controller.get_cart(),
+                self.checkout_controller.get_shipping_addresses(),
+            ),
+            on_success=lambda resultados: self._render_data(*resultados),
+            on_error=lambda e: messagebox.showerror("Erro", f"Falha ao carregar dados: {e}"),
+        )
+
+    def _render_data(self, cart_result: dict, address_result: dict):
+        """Monta a tela com carrinho e endereços carregados."""
+        # 1. Carrinho
         if cart_result["success"]:
             carrinho = cart_result.get("data", {})
             # Garante float ou decimal
@@ -101,11 +113,11 @@ class CheckoutView(tk.Frame):
             widget.destroy()
 
         # 3. Monta a tela com dados atualizados
-        self._setup_address_section()
+        self._setup_address_section(address_result)
         self._setup_payment_section()
         self._setup_summary()
 
-    def _setup_address_section(self):
+    def _setup_address_section(self, result: dict):
         """Seção de seleção de endereço."""
         # Título
         tk.Label(
@@ -116,9 +128,6 @@ class CheckoutView(tk.Frame):
             fg=Config.COLOR_PRIMARY,
         ).pack(anchor="w", pady=(0, 10))
 
-        # Busca endereços
-        result = self.checkout_controller.get_shipping_addresses()
-
         # Verifica se tem endereços
         if not result["success"] or not result.get("data"):
             no_address_frame = tk.Frame(
@@ -221,6 +230,7 @@ class CheckoutView(tk.Frame):
     def _select_address(self, address_id: int):
         """Callback ao selecionar endereço."""
         self.selected_address_id = address_id
+        self._update_shipping()
 
     def _setup_payment_section(self):
         """Seção de seleção de método de pagamento."""
@@ -329,14 +339,24 @@ class CheckoutView(tk.Frame):
             bg=Config.COLOR_WHITE,
         ).pack(anchor="w", pady=5)
 
-        # Frete (simulado, deveria vir do controller)
-        frete = Decimal("15.00")
-        tk.Label(
+        # Frete (cotado pelo controller; atualizado ao trocar de endereço)
+        self.lbl_frete = tk.Label(
             self.summary_frame,
-            text=f"Frete: R$ {frete:.2f}",
+            text="Frete: --",
             font=Config.FONT_BODY,
             bg=Config.COLOR_WHITE,
-        ).pack(anchor="w", pady=5)
+        )
+        self.lbl_frete.pack(anchor="w", pady=5)
+
+        self.lbl_frete_opcoes = tk.Label(
+            self.summary_frame,
+            text="",
+            font=Config.FONT_SMALL,
+            bg=Config.COLOR_WHITE,
+            fg=Config.COLOR_TEXT_LIGHT,
+            justify="left",
+        )
+        self.lbl_frete_opcoes.pack(anchor="w")
 
         # Linha divisória
         tk.Frame(self.summary_frame, height=1, bg=Config.COLOR_BG).pack(
@@ -344,14 +364,14 @@ class CheckoutView(tk.Frame):
         )
 
         # Total
-        total = self.cart_total + frete
-        tk.Label(
+        self.lbl_total = tk.Label(
             self.summary_frame,
-            text=f"Total: R$ {total:.2f}",
+            text=f"Total: R$ {self.cart_total:.2f}",
             font=Config.FONT_TITLE,
             bg=Config.COLOR_WHITE,
             fg=Config.COLOR_PRIMARY,
-        ).pack(anchor="w", pady=(10, 20))
+        )
+        self.lbl_total.pack(anchor="w", pady=(10, 20))
 
         # Botão Finalizar
         tk.Button(
@@ -365,6 +385,51 @@ class CheckoutView(tk.Frame):
             command=self._finalize_order,
         ).pack(pady=10)
 
+        self._update_shipping()
+
+    def _update_shipping(self):
+        """Atualiza frete e total do resumo para o endereço selecionado."""
+        if not hasattr(self, "lbl_frete") or not self.selected_address_id:
+            return
+
+        # A cotação consulta as transportadoras: roda fora da thread da interface
+        endereco_id = self.selected_address_id
+        self.lbl_frete.config(text="Frete: calculando...")
+        self.lbl_frete_opcoes.config(text="")
+        self.lbl_total.config(text=f"Total: R$ {self.cart_total:.2f}")
+        self.checkout_controller.run_in_background(
+            self,
+            self.checkout_controller.get_shipping_quote,
+            endereco_id,
+            on_success=lambda result: self._render_shipping(endereco_id, result),
+            on_error=lambda e: self._render_shipping(endereco_id, {"success": False}),
+        )
+
+    def _render_shipping(self, endereco_id: int, result: dict):
+        """Mostra a cotação, se o endereço ainda for o selecionado."""
+        if endereco_id != self.selected_address_id:
+            return  # resposta de um endereço anterior
+
+        if not result["success"]:
+            self.lbl_frete.config(text="Frete: indisponível")
+            self.lbl_frete_opcoes.config(text="")
+            return
+
+        cotacao = result["data"]
+        barata = cotacao["mais_barata"]
+        rapida = cotacao["mais_rapida"]
+        frete = Decimal(str(barata["valor"]))
+
+        self.lbl_frete.config(text=f"Frete: R$ {frete:.2f} ({barata['transportadora']})")
+        self.lbl_frete_opcoes.config(
+            text=(
+                f"Mais barato: {barata['transportadora']} - {barata['prazo_dias']} dias\n"
+                f"Mais rápido: {rapida['transportadora']} - R$ {rapida['valor']:.2f}, "
+                f"{rapida['prazo_dias']} dias"
+            )
+        )
+        self.lbl_total.config(text=f"Total: R$ {self.cart_total + frete:.2f}")
+
     def _finalize_order(self):
         """Processa a finalização do pedido."""
         # Validações
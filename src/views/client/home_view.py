@@ -1,8 +1,9 @@
 import tkinter as tk
 from tkinter import messagebox, ttk
 from src.config.settings import Config
+from src.services.catalog_filter import FiltroCatalogo
 from src.services.catalog_service import CatalogService
-from src.views.components.product_card import ProductCard
+from src.views.components.virtual_grid import VirtualProductGrid
 from src.controllers.cart_controller import CartController
 from src.views.components.product_details_modal import ProductDetailsModal
 
@@ -11,8 +12,16 @@ class HomeView(tk.Frame):
     """
     Tela inicial da loja (Catálogo para o Cliente).
     Inclui Busca, Filtro de Categoria e Filtro de Preço (RF05).
+
+    Persistente: ao sair dela a tela só é ocultada. Ao voltar, o catálogo
+    só é recarregado se os dados mudaram, e a grade só redesenha os cards
+    cujos produtos mudaram.
     """
 
+    PERSISTENTE = True
+    # Tabelas cujas alterações exigem recarregar o catálogo
+    TABELAS_DADOS = ("produtos", "imagens_produto", "categorias")
+
     def __init__(self, parent, controller, data=None):
         super().__init__(parent, bg=Config.COLOR_BG)
         self.controller = controller
@@ -24,6 +33,10 @@ class HomeView(tk.Frame):
             self.cart_controller.set_current_user(self.usuario.id)
 
         self.todos_produtos = []
+        self.filtro = FiltroCatalogo([])
+        self._busca_agendada = None  # id do after() da busca pendente
+        self._exibidos = None        # lista mostrada na grade
+        self._versoes = None         # versões dos dados da última carga
 
         self._setup_header()
         self._setup_filters()
@@ -108,7 +121,7 @@ class HomeView(tk.Frame):
             filter_frame, width=25, font=Config.FONT_BODY, bg="#F5F5F5", relief="flat"
         )
         self.ent_busca.pack(side="left", padx=(5, 15), ipady=3)
-        self.ent_busca.bind("<KeyRelease>", self._aplicar_filtros)
+        self.ent_busca.bind("<KeyRelease>", self._agendar_busca)
 
         # --- Filtro por Categoria ---
         tk.Label(
@@ -162,35 +175,36 @@ class HomeView(tk.Frame):
             fg=Config.COLOR_TEXT,
         ).pack(anchor="w", padx=30, pady=(15, 10))
 
-        container = tk.Frame(self, bg=Config.COLOR_BG)
-        container.pack(fill="both", expand=True, padx=20, pady=(0, 20))
-
-        self.canvas = tk.Canvas(container, bg=Config.COLOR_BG, highlightthickness=0)
-        self.scrollbar = ttk.Scrollbar(
-            container, orient="vertical", command=self.canvas.yview
+        # Só os cards visíveis existem; são reaproveitados ao rolar e filtrar
+        self.grid = VirtualProductGrid(
+            self, on_add_cart=self._add_to_cart, on_click=self._open_product_details
         )
-
-        self.grid_frame = tk.Frame(self.canvas, bg=Config.COLOR_BG)
-
-        self.grid_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")),
-        )
-
-        self.canvas.create_window((0, 0), window=self.grid_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
-
-        self.canvas.pack(side="left", fill="both", expand=True)
-        self.scrollbar.pack(side="right", fill="y")
+        self.grid.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+        self.canvas = self.grid.canvas
 
         self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
         # Garante que remove o bind ao sair desta tela
         self.bind("<Destroy>", self._on_destroy)
 
+    def on_show(self, data=None):
+        """Chamado pela MainWindow ao reexibir a tela: recarrega só se os dados mudaram."""
+        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+        if self.cart_controller.data_versions(*self.TABELAS_DADOS) != self._versoes:
+            self._load_products(recarga=True)
+
+    def on_hide(self):
+        """Chamado pela MainWindow ao ocultar a tela."""
+        self._on_destroy(None)
+
     def _on_destroy(self, event):
-        """Limpa o bind global do mouse wheel ao destruir a view."""
+        """Limpa o bind global do mouse wheel e a busca pendente ao destruir a view."""
+        if event is not None and event.widget is not self:
+            return
         try:
             self.canvas.unbind_all("<MouseWheel>")
+            if self._busca_agendada is not None:
+                self.after_cancel(self._busca_agendada)
+                self._busca_agendada = None
         except:
             pass
 
@@ -198,22 +212,38 @@ class HomeView(tk.Frame):
         """Callback de rolagem com tratamento de erro para evitar crash no Modal."""
         try:
             if self.canvas.winfo_exists():
-                self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+                self.grid.rolar(int(-1 * (event.delta / 120)))
         except (tk.TclError, Exception):
             # Se a janela foi destruída ou não é válida (ex: modal aberto), ignoramos
             pass
 
-    def _load_products(self):
-        try:
-            self.todos_produtos = self.service.listar_produtos()
-            self._carregar_categorias_filtro()
-            self._update_grid(self.todos_produtos)
+    def _load_products(self, recarga=False):
+        # Na recarga a grade atual continua visível até os dados novos chegarem
+        if not recarga:
+            self.grid.mostrar_mensagem("Carregando catálogo...")
+        self._versoes = self.cart_controller.data_versions(*self.TABELAS_DADOS)
+        self.cart_controller.run_in_background(
+            self,
+            self.service.listar_produtos,
+            on_success=lambda produtos: self._on_products_loaded(produtos, recarga),
+            on_error=self._on_products_error,
+        )
+
+    def _on_products_loaded(self, produtos, recarga=False):
+        self.todos_produtos = produtos
+        self.filtro = FiltroCatalogo(produtos)
+        self._carregar_categorias_filtro()
+        produtos_filtrados = self.filtro.filtrar(
+            self.ent_busca.get(), self.combo_categoria.get(), self.combo_preco.get()
+        )
+        self._exibidos = produtos_filtrados
+        self.grid.set_produtos(produtos_filtrados, manter_posicao=recarga)
 
-        except Exception as e:
-            print(f"Erro home: {e}")
-            tk.Label(
-                self.grid_frame, text="Erro ao carregar catálogo.", fg="red"
-            ).pack()
+    def _on_products_error(self, e):
+        print(f"Erro home: {e}")
+        # A grade fica vazia: o próximo filtro tem de redesenhar mesmo sem mudar
+        self._exibidos = None
+        self.grid.mostrar_mensagem("Erro ao carregar catálogo.", cor="red")
 
     def _carregar_categorias_filtro(self):
         categorias = set()
@@ -230,49 +260,33 @@ class HomeView(tk.Frame):
                 categorias.add(nome_cat)
 
         lista_cats = sorted(list(categorias))
+        selecionada = self.combo_categoria.get()
         self.combo_categoria["values"] = ["Todas"] + lista_cats
-        self.combo_categoria.current(0)
+        # Mantém o filtro escolhido numa recarga, se a categoria ainda existir
+        if selecionada in lista_cats:
+            self.combo_categoria.set(selecionada)
+        else:
+            self.combo_categoria.current(0)
+
+    def _agendar_busca(self, event=None):
+        """Aplica a busca só depois de uma pausa na digitação (debounce)."""
+        if self._busca_agendada is not None:
+            self.after_cancel(self._busca_agendada)
+        self._busca_agendada = self.after(Config.BUSCA_ATRASO_MS, self._aplicar_filtros)
 
     def _aplicar_filtros(self, event=None):
         """Filtra a lista localmente (Nome, Categoria e Preço)."""
-        termo = self.ent_busca.get().lower().strip()
-        cat_selecionada = self.combo_categoria.get()
-        preco_selecionado = self.combo_preco.get()
-
-        produtos_filtrados = []
+        # Uma busca ainda agendada fica obsoleta: os filtros são lidos agora
+        if self._busca_agendada is not None:
+            self.after_cancel(self._busca_agendada)
+            self._busca_agendada = None
 
-        for p in self.todos_produtos:
-            # 1. Filtro Nome
-            nome = getattr(p, "nome", "").lower()
-            match_nome = termo in nome
-
-            # 2. Filtro Categoria
-            cat_obj = getattr(p, "categoria", None)
-            cat_nome = cat_obj.nome if cat_obj and hasattr(cat_obj, "nome") else ""
-            match_cat = (cat_selecionada == "Todas" or cat_selecionada == "") or (
-                cat_nome == cat_selecionada
-            )
-
-            # 3. Filtro Preço (Lógica Simples)
-            preco = getattr(p, "preco", 0.0)
-            match_preco = True
-
-            if preco_selecionado == "Até R$ 50":
-                match_preco = preco <= 50
-            elif preco_selecionado == "R$ 50 - R$ 100":
-                match_preco = 50 <= preco <= 100
-            elif preco_selecionado == "R$ 100 - R$ 300":
-                match_preco = 100 <= preco <= 300
-            elif preco_selecionado == "Acima de R$ 300":
-                match_preco = preco > 300
-
-            # 4. Filtro Ativo
-            ativo = getattr(p, "ativo", 1)
-
-            if match_nome and match_cat and match_preco and ativo:
-                produtos_filtrados.append(p)
-
-        self._update_grid(produtos_filtrados)
+        produtos_filtrados = self.filtro.filtrar(
+            self.ent_busca.get(), self.combo_categoria.get(), self.combo_preco.get()
+        )
+        # Mesma busca (ex.: tecla que não altera o texto): nada a redesenhar
+        if produtos_filtrados is not self._exibidos:
+            self._update_grid(produtos_filtrados)
 
     def _limpar_filtros(self):
         """Reseta todos os filtros."""
@@ -282,36 +296,8 @@ class HomeView(tk.Frame):
         self._aplicar_filtros()
 
     def _update_grid(self, produtos):
-        for widget in self.grid_frame.winfo_children():
-            widget.destroy()
-
-        if not produtos:
-            tk.Label(
-                self.grid_frame,
-                text="Nenhum produto encontrado com estes filtros.",
-                bg=Config.COLOR_BG,
-                font=Config.FONT_BODY,
-                fg="gray",
-            ).pack(pady=50)
-            return
-
-        col = 0
-        row = 0
-        MAX_COLS = 4
-
-        for prod in produtos:
-            card = ProductCard(
-                self.grid_frame,
-                prod,
-                on_add_cart=self._add_to_cart,
-                on_click=self._open_product_details,
-            )
-            card.grid(row=row, column=col, padx=15, pady=15)
-
-            col += 1
-            if col >= MAX_COLS:
-                col = 0
-                row += 1
+        self._exibidos = produtos
+        self.grid.set_produtos(produtos)
 
     def _add_to_cart(self, produto):
         if not self.usuario:
@@ -2,6 +2,7 @@ import tkinter as tk
 from tkinter import messagebox
 from src.config.settings import Config
 from src.services.auth_service import AuthService
+from src.services.login_throttle_service import LoginBloqueadoError
 
 class LoginView(tk.Frame):
     """
@@ -51,7 +52,7 @@ class LoginView(tk.Frame):
         self.entry_senha.pack(pady=(0, 20))
 
         # Botão Entrar
-        btn_login = tk.Button(
+        self.btn_login = btn_login = tk.Button(
             card, 
             text="ENTRAR", 
             font=Config.FONT_HEADER,
@@ -84,7 +85,26 @@ class LoginView(tk.Frame):
             messagebox.showwarning("Atenção", "Preencha todos os campos!")
             return
 
-        if self.auth_service.login(email, senha):
+        try:
+            tentativa = self.auth_service.iniciar_login(email, senha)
+        except LoginBloqueadoError as e:
+            messagebox.showerror("Erro", str(e))
+            return
+
+        # A verificação da senha roda em outra thread; a tela continua respondendo
+        self.btn_login.config(state="disabled", text="ENTRANDO...")
+        self._aguardar_login(tentativa)
+
+    def _aguardar_login(self, tentativa):
+        """Consulta a verificação pendente sem bloquear o loop do Tkinter."""
+        if not self.winfo_exists():
+            return
+        if not tentativa.done():
+            self.after(20, self._aguardar_login, tentativa)
+            return
+
+        self.btn_login.config(state="normal", text="ENTRAR")
+        if self.auth_service.concluir_login(tentativa):
             user = self.auth_service.get_usuario_atual()
             
             messagebox.showinfo("Sucesso", f"Bem-vindo, {user.nome}!")
@@ -32,10 +32,11 @@ from src.views.components.card import (
 )
 
 # Tabelas
-from src.views.components.data_table import DataTable, SimpleTable
+from src.views.components.data_table import DataTable, SimpleTable, FonteDados, FonteFuncoes
 
 # Produtos
 from src.views.components.product_card import ProductCard
+from src.views.components.virtual_grid import VirtualProductGrid
 
 __all__ = [
     # Botões
@@ -66,7 +67,10 @@ __all__ = [
     # Tabelas
     'DataTable',
     'SimpleTable',
+    'FonteDados',
+    'FonteFuncoes',
     
     # Produtos
-    'ProductCard'
+    'ProductCard',
+    'VirtualProductGrid'
 ]
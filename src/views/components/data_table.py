@@ -1,24 +1,95 @@
+import logging
 import tkinter as tk
+from abc import ABC, abstractmethod
+from collections import OrderedDict
 from tkinter import ttk
+from typing import Any, Callable, Dict, Iterable, List, Optional
 from src.config.settings import Config
+from src.utils.task_runner import executor_tarefas
+
+logger = logging.getLogger(__name__)
+
+
+class FonteDados(ABC):
+    """
+    Origem paginada das linhas de um DataTable em modo virtual.
+    A tabela só pede as janelas que vai exibir, sempre fora da thread do
+    Tkinter; a ordenação é da fonte (ex.: ORDER BY no banco) e só vale para
+    as colunas de ``ordenaveis``.
+    """
+
+    ordenaveis: frozenset = frozenset()
+
+    @abstractmethod
+    def total(self) -> int:
+        """Quantidade total de linhas."""
+
+    @abstractmethod
+    def linhas(self, inicio: int, quantidade: int, ordenar_por: Optional[str] = None,
+               decrescente: bool = False, apos: Optional[Dict[str, Any]] = None,
+               antes: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Linhas [inicio, inicio + quantidade) na ordem pedida.
+        ``apos``/``antes`` é a linha vizinha já lida (a última antes da janela
+        ou a primeira depois dela): a fonte pode continuar dela (keyset) em
+        vez de pular ``inicio`` linhas.
+        """
+
+
+class FonteFuncoes(FonteDados):
+    """FonteDados montada a partir de duas funções (contar e listar uma janela)."""
+
+    def __init__(self, contar: Callable[[], int],
+                 listar: Callable[..., List[Dict[str, Any]]],
+                 ordenaveis: Iterable[str] = ()):
+        self._contar = contar
+        self._listar = listar
+        self.ordenaveis = frozenset(ordenaveis)
+
+    def total(self) -> int:
+        return self._contar()
+
+    def linhas(self, inicio, quantidade, ordenar_por=None, decrescente=False, apos=None, antes=None):
+        return self._listar(inicio, quantidade, ordenar_por, decrescente, apos, antes)
+
 
 class DataTable(tk.Frame):
     """
     Tabela de dados reutilizável com ordenação, paginação e seleção.
+
+    Com ``source`` (FonteDados) a tabela fica em modo virtual: o Treeview só
+    tem as linhas visíveis (reaproveitadas ao rolar) e os dados vêm da fonte
+    em blocos de TAMANHO_BLOCO linhas, com os MAX_BLOCOS mais recentes em
+    cache. A barra de rolagem representa o total da fonte.
+
+    Total e blocos são lidos em segundo plano; enquanto um bloco não chega,
+    suas linhas aparecem como "Carregando...". Um bloco vizinho de outro já
+    em cache (rolagem contínua) é pedido a partir da linha da fronteira
+    (keyset); só saltos da barra de rolagem usam o deslocamento absoluto.
     """
+
+    TAMANHO_BLOCO = 100
+    MAX_BLOCOS = 8
+    LINHAS_POR_ROLAGEM = 3
     
     def __init__(self, parent, columns, data=None, sortable=True, 
-                 selectable=True, paginated=False, items_per_page=20):
+                 selectable=True, paginated=False, items_per_page=20,
+                 source: Optional[FonteDados] = None, key='id',
+                 on_error: Optional[Callable[[Exception], None]] = None):
         """
         Args:
             parent: Widget pai
             columns: Lista de dicionários com configuração das colunas
                      Ex: [{'id': 'nome', 'text': 'Nome', 'width': 200}]
+                     'format' (opcional) converte o valor para exibição
             data: Lista de dicionários com os dados
             sortable: Permite ordenar clicando nos cabeçalhos
             selectable: Permite selecionar linhas
             paginated: Habilita paginação
             items_per_page: Itens por página
+            source: Fonte paginada (modo virtual; ignora data/paginated)
+            key: Campo que identifica a linha (mantém a seleção ao rolar/ordenar)
+            on_error: Recebe as falhas da fonte (modo virtual; sem ele, vão para o log)
         """
         super().__init__(parent, bg=Config.COLOR_WHITE)
         
@@ -26,14 +97,29 @@ class DataTable(tk.Frame):
         self.data = data or []
         self.sortable = sortable
         self.selectable = selectable
-        self.paginated = paginated
+        self.source = source
+        self.paginated = paginated and source is None
         self.items_per_page = items_per_page
         self.current_page = 0
         self.sort_column = None
         self.sort_reverse = False
+
+        # Estado do modo virtual
+        self.key = key
+        self._total = 0
+        self._primeira = 0  # índice da primeira linha visível
+        self._blocos: "OrderedDict[int, List[Dict[str, Any]]]" = OrderedDict()
+        self._exibidas: Dict[str, Dict[str, Any]] = {}  # iid -> linha
+        self._selecionada = None  # valor de `key` da linha selecionada
+        self._selecionar_indice = None  # seleção por teclado à espera do bloco
+        self._geracao = 0  # muda ao reordenar/reler: descarta blocos antigos
+        self._pendentes = set()  # blocos sendo buscados
+        self._pedido_total = 0
+        self._total_pendente = False
+        self.on_error = on_error
         
         self._setup_ui()
-        if data:
+        if data and self.source is None:
             self.load_data(data)
     
     def _setup_ui(self):
@@ -66,12 +152,16 @@ class DataTable(tk.Frame):
                 anchor=col.get('anchor', 'w')
             )
         
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(table_container, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
+        # Scrollbar (no modo virtual, controlada pela tabela e não pelo Treeview)
+        if self.source is None:
+            self.scrollbar = ttk.Scrollbar(table_container, orient="vertical", command=self.tree.yview)
+            self.tree.configure(yscrollcommand=self.scrollbar.set)
+        else:
+            self.scrollbar = ttk.Scrollbar(table_container, orient="vertical", command=self._on_scrollbar)
+            self._setup_virtual()
         
         self.tree.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        self.scrollbar.pack(side="right", fill="y")
         
         # Paginação (se habilitada)
         if self.paginated:
@@ -125,6 +215,47 @@ class DataTable(tk.Frame):
         )
         self.btn_next.pack(side="right", padx=5)
     
+    def _setup_virtual(self):
+        """Rolagem, teclado e rodapé do modo virtual."""
+        for evento in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(evento, self._on_mousewheel)
+        self.tree.bind("<Up>", lambda e: self._mover_selecao(-1))
+        self.tree.bind("<Down>", lambda e: self._mover_selecao(1))
+        self.tree.bind("<Prior>", lambda e: self._mover_selecao(-self._linhas_visiveis()))
+        self.tree.bind("<Next>", lambda e: self._mover_selecao(self._linhas_visiveis()))
+        self.tree.bind("<Configure>", lambda e: self._render_virtual())
+        self.tree.bind("<<TreeviewSelect>>", self._on_select_virtual)
+
+        self.info_label = tk.Label(
+            self,
+            text="",
+            bg=Config.COLOR_WHITE,
+            fg="gray",
+            font=Config.FONT_SMALL,
+            anchor="w"
+        )
+        self.info_label.pack(fill="x", padx=5, pady=(5, 0))
+
+    def refresh(self):
+        """
+        Modo virtual: relê o total e descarta as linhas em cache (a posição
+        e a seleção são mantidas). Chame depois de alterar os dados. As
+        linhas atuais ficam na tela até o total novo chegar.
+        """
+        if self.source is None:
+            self._refresh_table()
+            return
+        self._pedido_total += 1
+        pedido = self._pedido_total
+        self._total_pendente = True
+        if not self._total:
+            self.info_label.config(text="Carregando...")
+        executor_tarefas.submeter(
+            self, self.source.total,
+            ao_concluir=lambda total: self._on_total(pedido, total),
+            ao_falhar=lambda e: self._on_total_error(pedido, e),
+        )
+
     def load_data(self, data):
         """Carrega dados na tabela."""
         self.data = data
@@ -147,7 +278,7 @@ class DataTable(tk.Frame):
         
         # Insere dados
         for idx, row in enumerate(display_data):
-            values = [row.get(col['id'], '') for col in self.columns]
+            values = self._valores(row)
             tag = 'evenrow' if idx % 2 == 0 else 'oddrow'
             self.tree.insert("", "end", values=values, tags=(tag,))
         
@@ -179,6 +310,10 @@ class DataTable(tk.Frame):
     
     def _sort_by_column(self, col_id):
         """Ordena dados por coluna."""
+        # No modo virtual quem ordena é a fonte, e só pelas colunas que ela aceita
+        if self.source is not None and col_id not in self.source.ordenaveis:
+            return
+
         # Alterna direção se clicar na mesma coluna
         if self.sort_column == col_id:
             self.sort_reverse = not self.sort_reverse
@@ -186,6 +321,12 @@ class DataTable(tk.Frame):
             self.sort_column = col_id
             self.sort_reverse = False
         
+        if self.source is not None:
+            self._descartar_blocos()
+            self._primeira = 0
+            self._render_virtual()
+            return
+
         # Ordena dados
         self.data.sort(key=lambda x: x.get(col_id, ''), reverse=self.sort_reverse)
         self._refresh_table()
@@ -195,6 +336,9 @@ class DataTable(tk.Frame):
         selection = self.tree.selection()
         if not selection:
             return None
+
+        if self.source is not None:
+            return self._exibidas.get(selection[0])
         
         item = self.tree.item(selection[0])
         values = item['values']
@@ -208,6 +352,10 @@ class DataTable(tk.Frame):
         results = []
         
         for item_id in selection:
+            if self.source is not None:
+                if item_id in self._exibidas:
+                    results.append(self._exibidas[item_id])
+                continue
             item = self.tree.item(item_id)
             values = item['values']
             results.append({col['id']: values[idx] for idx, col in enumerate(self.columns)})
@@ -230,6 +378,230 @@ class DataTable(tk.Frame):
         self.data = filtered
         self._refresh_table()
 
+    def _valores(self, row):
+        """Valores exibidos de uma linha (aplica o 'format' das colunas)."""
+        values = []
+        for col in self.columns:
+            valor = row.get(col['id'], '')
+            formato = col.get('format')
+            values.append(formato(valor) if formato and valor is not None else valor)
+        return values
+
+    # --- Modo virtual ---
+
+    def _linhas_visiveis(self):
+        """Quantas linhas cabem na área do Treeview (cabeçalho incluído)."""
+        altura_linha = int(ttk.Style(self).lookup("Treeview", "rowheight") or 20)
+        altura = self.tree.winfo_height()
+        if altura <= 1:  # ainda não desenhado
+            return int(self.tree.cget("height"))
+        return max(1, altura // altura_linha - 1)
+
+    def _descartar_blocos(self):
+        """Esquece os blocos em cache e ignora os que ainda estão a caminho."""
+        self._geracao += 1
+        self._blocos.clear()
+        self._pendentes.clear()
+        self._selecionar_indice = None
+
+    def _bloco(self, numero):
+        """Bloco `numero` se já estiver em cache; senão pede à fonte e devolve None."""
+        bloco = self._blocos.get(numero)
+        if bloco is None:
+            self._buscar_bloco(numero)
+        else:
+            self._blocos.move_to_end(numero)
+        return bloco
+
+    def _linha(self, indice):
+        """Linha `indice` da fonte, ou None se o bloco dela ainda não chegou."""
+        bloco = self._bloco(indice // self.TAMANHO_BLOCO)
+        posicao = indice % self.TAMANHO_BLOCO
+        return bloco[posicao] if bloco is not None and posicao < len(bloco) else None
+
+    def _buscar_bloco(self, numero):
+        if numero in self._pendentes:
+            return
+        self._pendentes.add(numero)
+
+        # Rolagem contínua: continua da fronteira do bloco vizinho já lido,
+        # sem o banco percorrer as linhas anteriores. Saltos usam o OFFSET.
+        apos = antes = None
+        anterior = self._blocos.get(numero - 1)
+        seguinte = self._blocos.get(numero + 1)
+        if anterior is not None and len(anterior) == self.TAMANHO_BLOCO:
+            apos = anterior[-1]
+        elif seguinte:
+            antes = seguinte[0]
+
+        geracao = self._geracao
+        executor_tarefas.submeter(
+            self, self.source.linhas,
+            numero * self.TAMANHO_BLOCO, self.TAMANHO_BLOCO,
+            self.sort_column, self.sort_reverse, apos, antes,
+            ao_concluir=lambda bloco: self._on_bloco(geracao, numero, bloco),
+            ao_falhar=lambda e: self._on_bloco_error(geracao, numero, e),
+        )
+
+    def _on_bloco(self, geracao, numero, bloco):
+        if geracao != self._geracao:
+            return  # pedido antes de reordenar/reler
+        self._pendentes.discard(numero)
+        self._blocos[numero] = bloco
+        while len(self._blocos) > self.MAX_BLOCOS:
+            self._blocos.popitem(last=False)
+        self._render_virtual()
+
+    def _on_bloco_error(self, geracao, numero, erro):
+        if geracao == self._geracao:
+            self._pendentes.discard(numero)  # a próxima rolagem tenta de novo
+        self._report_error(erro)
+
+    def _on_total(self, pedido, total):
+        if pedido != self._pedido_total:
+            return
+        self._total_pendente = False
+        self._total = total
+        self._descartar_blocos()
+        self._render_virtual()
+
+    def _on_total_error(self, pedido, erro):
+        if pedido == self._pedido_total:
+            self._total_pendente = False
+            self._render_virtual()
+        self._report_error(erro)
+
+    def _report_error(self, erro):
+        if self.on_error:
+            self.on_error(erro)
+        else:
+            logger.error("Falha ao buscar linhas da tabela", exc_info=erro)
+
+    def _render_virtual(self):
+        """Preenche as linhas visíveis a partir de `_primeira`, reaproveitando os itens."""
+        visiveis = self._linhas_visiveis()
+        self._primeira = max(0, min(self._primeira, self._total - visiveis))
+
+        # None = bloco ainda a caminho (vira "Carregando...")
+        linhas = []
+        for indice in range(self._primeira, min(self._primeira + visiveis, self._total)):
+            bloco = self._bloco(indice // self.TAMANHO_BLOCO)
+            if bloco is None:
+                linhas.append(None)
+                continue
+            posicao = indice % self.TAMANHO_BLOCO
+            if posicao >= len(bloco):
+                break  # bloco curto: a fonte encolheu desde o último total
+            linhas.append(bloco[posicao])
+
+        if self._selecionar_indice is not None:
+            posicao = self._selecionar_indice - self._primeira
+            if 0 <= posicao < len(linhas) and linhas[posicao] is not None:
+                self._selecionada = linhas[posicao].get(self.key)
+                self._selecionar_indice = None
+
+        self._exibidas = {}
+        selecionado = None
+        for posicao, linha in enumerate(linhas):
+            iid = f"v{posicao}"
+            indice = self._primeira + posicao
+            tag = 'evenrow' if indice % 2 == 0 else 'oddrow'
+            valores = self._valores(linha) if linha is not None else self._valores_carregando()
+            if self.tree.exists(iid):
+                self.tree.item(iid, values=valores, tags=(tag,))
+            else:
+                self.tree.insert("", "end", iid=iid, values=valores, tags=(tag,))
+            if linha is None:
+                continue
+            self._exibidas[iid] = linha
+            if self._selecionada is not None and linha.get(self.key) == self._selecionada:
+                selecionado = iid
+
+        sobrando = self.tree.get_children()[len(linhas):]
+        if sobrando:
+            self.tree.delete(*sobrando)
+
+        # A seleção acompanha a linha (pela chave), não a posição no Treeview
+        if self.selectable:
+            atual = self.tree.selection()
+            if selecionado and atual != (selecionado,):
+                self.tree.selection_set(selecionado)
+            elif not selecionado and atual:
+                self.tree.selection_remove(*atual)
+
+        if self._total:
+            self.scrollbar.set(self._primeira / self._total,
+                               (self._primeira + len(linhas)) / self._total)
+            self.info_label.config(
+                text=f"Linhas {self._primeira + 1}–{self._primeira + len(linhas)} de {self._total}"
+            )
+        else:
+            self.scrollbar.set(0, 1)
+            self.info_label.config(text="Carregando..." if self._total_pendente else "Nenhum registro")
+
+    def _valores_carregando(self):
+        """Valores da linha provisória de um bloco que ainda não chegou."""
+        valores = [''] * len(self.columns)
+        valores[min(1, len(valores) - 1)] = "Carregando..."
+        return valores
+
+    def _rolar_para(self, primeira):
+        primeira = max(0, min(int(primeira), self._total - self._linhas_visiveis()))
+        self._selecionar_indice = None
+        if primeira != self._primeira:
+            self._primeira = primeira
+            self._render_virtual()
+
+    def _on_scrollbar(self, acao, quantidade, unidade=None):
+        """Comando da scrollbar: 'moveto <fração>' ou 'scroll <n> units|pages'."""
+        if acao == "moveto":
+            self._rolar_para(float(quantidade) * self._total)
+        elif acao == "scroll":
+            passo = self._linhas_visiveis() if unidade == "pages" else 1
+            self._rolar_para(self._primeira + int(quantidade) * passo)
+
+    def _on_mousewheel(self, event):
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            self._rolar_para(self._primeira - self.LINHAS_POR_ROLAGEM)
+        else:
+            self._rolar_para(self._primeira + self.LINHAS_POR_ROLAGEM)
+        return "break"
+
+    def _on_select_virtual(self, event=None):
+        selection = self.tree.selection()
+        # Seleção vazia vem de linhas que saíram da tela: a chave é mantida
+        if selection and selection[0] in self._exibidas:
+            self._selecionada = self._exibidas[selection[0]].get(self.key)
+
+    def _mover_selecao(self, passo):
+        """Setas/PgUp/PgDn: move a seleção pela fonte inteira, rolando se preciso."""
+        if not self._total:
+            return "break"
+        selection = self.tree.selection()
+        if selection and selection[0] in self._exibidas:
+            atual = self._primeira + self.tree.index(selection[0])
+        else:
+            atual = self._primeira - 1 if passo > 0 else self._primeira
+        destino = max(0, min(atual + passo, self._total - 1))
+
+        visiveis = self._linhas_visiveis()
+        if destino < self._primeira:
+            self._primeira = destino
+        elif destino >= self._primeira + visiveis:
+            self._primeira = destino - visiveis + 1
+
+        # Se o bloco do destino ainda não chegou, a seleção é aplicada na chegada
+        linha = self._linha(destino)
+        if linha is not None:
+            self._selecionada = linha.get(self.key)
+            self._selecionar_indice = None
+        else:
+            self._selecionar_indice = destino
+        self._render_virtual()
+        if self.tree.selection():
+            self.tree.focus(self.tree.selection()[0])
+        return "break"
+
 
 class SimpleTable(tk.Frame):
     """
@@ -1,34 +1,67 @@
 import tkinter as tk
-from PIL import Image, ImageTk
-import os
 from src.config.settings import Config
+from src.utils.thumbnail_cache import (
+    COR_ERRO_IMAGEM, COR_SEM_IMAGEM, executor_miniaturas, miniaturas,
+)
 
 
 class ProductCard(tk.Frame):
     """
     Card visual de produto.
     Suporta clique para ver detalhes (on_click) e botão de compra (on_add_cart).
+    Pode ser reaproveitado para outro produto com ``atualizar`` (grade virtual).
+
+    A imagem não atrasa a exibição do card: se a miniatura não estiver na
+    memória, o card mostra um quadro e ela é carregada em segundo plano.
     """
 
+    TAMANHO_IMAGEM = (160, 160)
+
     def __init__(self, parent, produto, on_add_cart=None, on_click=None):
         super().__init__(parent, bg=Config.COLOR_WHITE, relief="raised", bd=1)
         self.produto = produto
         self.on_add_cart = on_add_cart
         self.on_click = on_click
+        self._caminho_imagem = None
+        self._tarefa_imagem = None
 
         self.pack_propagate(False)
         self.configure(width=220, height=340)
 
         self._setup_ui()
+        self._preencher()
 
         # Bind de clique para abrir detalhes (no card todo, exceto botão)
         if self.on_click:
             self._bind_click_events(self)
 
+    def atualizar(self, produto):
+        """Exibe outro produto reaproveitando os widgets do card."""
+        if produto is self.produto:
+            return
+        mesmo_conteudo = self._assinatura(produto) == self._assinatura(self.produto)
+        self.produto = produto
+        # Recarga do catálogo: o mesmo produto sem alterações não é redesenhado
+        if not mesmo_conteudo:
+            self._preencher()
+
     def _get_val(self, key, default=None):
-        if isinstance(self.produto, dict):
-            return self.produto.get(key, default)
-        return getattr(self.produto, key, default)
+        return self._valor(self.produto, key, default)
+
+    @staticmethod
+    def _valor(produto, key, default=None):
+        if isinstance(produto, dict):
+            return produto.get(key, default)
+        return getattr(produto, key, default)
+
+    @classmethod
+    def _assinatura(cls, produto):
+        """O que o card exibe de um produto; igual = nada a redesenhar."""
+        cat = cls._valor(produto, "categoria")
+        return tuple(
+            cls._valor(produto, campo)
+            for campo in ("id", "nome", "preco", "imagem_card", "imagem_principal")
+        ) + (getattr(cat, "nome", None),)
 
     def _setup_ui(self):
         # 1. Área da Imagem (Clicável)
@@ -36,12 +69,7 @@ class ProductCard(tk.Frame):
         self.img_frame.pack(fill="x", pady=10)
         self.img_frame.pack_propagate(False)
 
-        image_path = self._get_image_path()
-        self.photo = self._load_image(image_path)
-
-        self.lbl_img = tk.Label(
-            self.img_frame, image=self.photo, bg="white", cursor="hand2"
-        )
+        self.lbl_img = tk.Label(self.img_frame, bg="white", cursor="hand2")
         self.lbl_img.place(relx=0.5, rely=0.5, anchor="center")
 
         # 2. Área de Conteúdo
@@ -49,24 +77,17 @@ class ProductCard(tk.Frame):
         self.content_frame.pack(fill="both", expand=True)
 
         # Categoria
-        cat = self._get_val("categoria")
-        cat_nome = cat.nome if hasattr(cat, "nome") else "Geral"
-        tk.Label(
+        self.lbl_categoria = tk.Label(
             self.content_frame,
-            text=cat_nome.upper(),
             font=("TkDefaultFont", 8),
             bg=Config.COLOR_WHITE,
             fg=Config.COLOR_TEXT_LIGHT,
-        ).pack(anchor="w")
+        )
+        self.lbl_categoria.pack(anchor="w")
 
         # Nome (Clicável)
-        nome = self._get_val("nome", "Sem Nome")
-        if len(nome) > 22:
-            nome = nome[:19] + "..."
-
         self.lbl_nome = tk.Label(
             self.content_frame,
-            text=nome,
             font=("TkDefaultFont", 11, "bold"),
             bg=Config.COLOR_WHITE,
             fg=Config.COLOR_TEXT,
@@ -77,14 +98,13 @@ class ProductCard(tk.Frame):
         self.lbl_nome.pack(anchor="w", pady=(0, 5))
 
         # Preço
-        preco = self._get_val("preco", 0.0)
-        tk.Label(
+        self.lbl_preco = tk.Label(
             self.content_frame,
-            text=f"R$ {preco:.2f}",
             font=("TkDefaultFont", 14, "bold"),
             bg=Config.COLOR_WHITE,
             fg=Config.COLOR_ACCENT,
-        ).pack(anchor="w")
+        )
+        self.lbl_preco.pack(anchor="w")
 
         # Botão de Ação (Adicionar ao Carrinho)
         btn_frame = tk.Frame(self, bg=Config.COLOR_WHITE, pady=15)
@@ -103,6 +123,22 @@ class ProductCard(tk.Frame):
             ),
         ).pack(fill="x", padx=15)
 
+    def _preencher(self):
+        """Preenche imagem e textos com os dados do produto atual."""
+        self._load_image(self._get_image_path())
+
+        cat = self._get_val("categoria")
+        cat_nome = cat.nome if hasattr(cat, "nome") else "Geral"
+        self.lbl_categoria.configure(text=cat_nome.upper())
+
+        nome = self._get_val("nome", "Sem Nome")
+        if len(nome) > 22:
+            nome = nome[:19] + "..."
+        self.lbl_nome.configure(text=nome)
+
+        preco = self._get_val("preco", 0.0)
+        self.lbl_preco.configure(text=f"R$ {preco:.2f}")
+
     def _bind_click_events(self, widget):
         """Associa o evento de clique aos elementos visuais (Imagem e Nome)."""
         # Vincula na imagem e no frame da imagem
@@ -111,6 +147,10 @@ class ProductCard(tk.Frame):
         self.lbl_nome.bind("<Button-1>", lambda e: self.on_click(self.produto))
 
     def _get_image_path(self):
+        # Variante de 160px gerada no upload; imagens antigas só têm a original
+        img_card = self._get_val("imagem_card")
+        if img_card:
+            return img_card
         img_principal = self._get_val("imagem_principal")
         if img_principal:
             return img_principal
@@ -120,21 +160,42 @@ class ProductCard(tk.Frame):
         return None
 
     def _load_image(self, path):
-        try:
-            final_path = None
-            if path:
-                if os.path.isabs(path):
-                    final_path = path
-                else:
-                    final_path = os.path.join(Config.BASE_DIR, path)
-
-                if os.path.exists(final_path):
-                    original = Image.open(final_path)
-                    original.thumbnail((160, 160))
-                    return ImageTk.PhotoImage(original)
-
-            img = Image.new("RGB", (160, 160), color="#F3F4F6")
-            return ImageTk.PhotoImage(img)
-        except Exception:
-            img = Image.new("RGB", (160, 160), color="#FEE2E2")
-            return ImageTk.PhotoImage(img)
+        """Mostra a miniatura já em memória ou um quadro enquanto ela carrega."""
+        if self._tarefa_imagem is not None:
+            # Card reaproveitado antes de a imagem anterior chegar
+            self._tarefa_imagem.cancelar()
+            self._tarefa_imagem = None
+        self._caminho_imagem = path
+
+        foto = miniaturas.foto_em_memoria(path, self.TAMANHO_IMAGEM)
+        if foto is not None or not path:
+            self._mostrar_imagem(foto or miniaturas.quadro(self.TAMANHO_IMAGEM, COR_SEM_IMAGEM))
+            return
+
+        self._mostrar_imagem(miniaturas.quadro(self.TAMANHO_IMAGEM, COR_SEM_IMAGEM))
+        self._tarefa_imagem = executor_miniaturas.submeter(
+            self,
+            miniaturas.carregar_miniatura,
+            path,
+            self.TAMANHO_IMAGEM,
+            ao_concluir=lambda imagem: self._on_image_loaded(path, imagem),
+            ao_falhar=lambda erro: self._on_image_error(path, erro),
+        )
+
+    def _on_image_loaded(self, path, imagem):
+        """Troca o quadro pela foto (thread do Tk), se o card ainda mostra essa imagem."""
+        if path != self._caminho_imagem:
+            return
+        self._tarefa_imagem = None
+        self._mostrar_imagem(miniaturas.foto_de_imagem(path, self.TAMANHO_IMAGEM, imagem))
+
+    def _on_image_error(self, path, erro):
+        if path != self._caminho_imagem:
+            return
+        self._tarefa_imagem = None
+        self._mostrar_imagem(miniaturas.quadro(self.TAMANHO_IMAGEM, COR_ERRO_IMAGEM))
+
+    def _mostrar_imagem(self, foto):
+        # Guarda a referência: sem ela o Tk descarta a imagem
+        self.photo = foto
+        self.lbl_img.configure(image=foto)
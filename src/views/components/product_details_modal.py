@@ -1,7 +1,7 @@
 import tkinter as tk
-from PIL import Image, ImageTk
 import os
 from src.config.settings import Config
+from src.utils.thumbnail_cache import miniaturas, resolver_caminho
 from src.views.components.custom_button import CustomButton
 
 
@@ -169,24 +169,23 @@ class ProductDetailsModal(tk.Toplevel):
     def _load_image(self, parent):
         try:
             path = None
+            img_d = self._get_val("imagem_detalhe")
             img_p = self._get_val("imagem_principal")
             imgs = self._get_val("imagens", [])
-            if img_p:
+            if img_d:
+                path = img_d
+            elif img_p:
                 path = img_p
             elif imgs:
                 path = imgs[0]
 
-            if path:
-                if not os.path.isabs(path):
-                    path = os.path.join(Config.BASE_DIR, path)
-                if os.path.exists(path):
-                    img = Image.open(path)
-                    img.thumbnail((350, 350))  # Imagem bem grande
-                    self.photo = ImageTk.PhotoImage(img)
-                    tk.Label(parent, image=self.photo, bg=Config.COLOR_WHITE).pack(
-                        expand=True
-                    )
-                    return
+            path = resolver_caminho(path)
+            if path and os.path.exists(path):
+                self.photo = miniaturas.foto(path, (350, 350))  # Imagem bem grande
+                tk.Label(parent, image=self.photo, bg=Config.COLOR_WHITE).pack(
+                    expand=True
+                )
+                return
 
             tk.Label(parent, text="Sem Imagem", bg="#F3F4F6", fg="#9CA3AF").pack(
                 expand=True, fill="both"
@@ -0,0 +1,153 @@
+import math
+import tkinter as tk
+from tkinter import ttk
+from src.config.settings import Config
+from src.views.components.product_card import ProductCard
+
+
+class VirtualProductGrid(tk.Frame):
+    """
+    Grade de produtos virtualizada.
+
+    Só existem cards para as linhas visíveis no canvas (mais LINHAS_EXTRAS
+    acima e abaixo). Ao rolar ou trocar a lista, os cards que saem da área
+    visível são reaproveitados para os que entram (ProductCard.atualizar),
+    então o custo não depende do tamanho do catálogo.
+    """
+
+    # Dimensões do ProductCard + espaçamento (padx/pady 15 de cada lado)
+    CARD_LARGURA = 220
+    CARD_ALTURA = 340
+    ESPACO = 15
+    COLUNAS_MAX = 4
+    # Linhas montadas fora da área visível para a rolagem não mostrar buracos
+    LINHAS_EXTRAS = 1
+
+    def __init__(self, parent, on_add_cart=None, on_click=None):
+        super().__init__(parent, bg=Config.COLOR_BG)
+        self.on_add_cart = on_add_cart
+        self.on_click = on_click
+
+        self.produtos = []
+        self._visiveis = {}  # índice do produto -> (card, item do canvas)
+        self._livres = []    # (card, item) fora da tela, prontos para reuso
+        self._mensagem = None
+
+        self.largura_celula = self.CARD_LARGURA + 2 * self.ESPACO
+        self.altura_celula = self.CARD_ALTURA + 2 * self.ESPACO
+
+        self.canvas = tk.Canvas(self, bg=Config.COLOR_BG, highlightthickness=0)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_scroll)
+
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.canvas.bind("<Configure>", lambda e: self._atualizar_regiao())
+
+    def set_produtos(self, produtos, mensagem_vazia="Nenhum produto encontrado com estes filtros.",
+                     manter_posicao=False):
+        """
+        Troca a lista exibida e volta ao topo (ou mantém a rolagem, numa
+        recarga). Cards cujo produto não mudou não são redesenhados.
+        """
+        self.produtos = list(produtos)
+        self._limpar_mensagem()
+        if not manter_posicao:
+            self.canvas.yview_moveto(0)
+        self._atualizar_regiao()
+        if not self.produtos:
+            self.mostrar_mensagem(mensagem_vazia)
+
+    def mostrar_mensagem(self, texto, cor="gray"):
+        """
+        Mostra um aviso no lugar da grade (lista vazia, erro de carga). A lista
+        é esvaziada para a rolagem ou um redimensionamento não redesenhar os
+        cards antigos por cima do aviso.
+        """
+        self._limpar_mensagem()
+        self.produtos = []
+        for indice in list(self._visiveis):
+            self._liberar(indice)
+        self.canvas.configure(scrollregion=(0, 0, 0, 0))
+        self.canvas.yview_moveto(0)
+        self._mensagem = self.canvas.create_text(
+            max(self.canvas.winfo_width(), self.largura_celula) // 2,
+            50,
+            text=texto,
+            fill=cor,
+            font=Config.FONT_BODY,
+        )
+
+    def rolar(self, unidades):
+        self.canvas.yview_scroll(unidades, "units")
+
+    # --- Métodos privados ---
+
+    def _colunas(self):
+        return max(1, min(self.COLUNAS_MAX, self.canvas.winfo_width() // self.largura_celula))
+
+    def _atualizar_regiao(self):
+        """Ajusta a área rolável ao número de linhas e redesenha."""
+        linhas = math.ceil(len(self.produtos) / self._colunas())
+        self.canvas.configure(
+            scrollregion=(0, 0, self._colunas() * self.largura_celula, linhas * self.altura_celula)
+        )
+        self._renderizar()
+
+    def _on_scroll(self, primeiro, ultimo):
+        self.scrollbar.set(primeiro, ultimo)
+        self._renderizar()
+
+    def _renderizar(self):
+        """Monta os cards da faixa visível, reaproveitando os que saíram dela."""
+        if not self.produtos:
+            return
+
+        colunas = self._colunas()
+        topo = self.canvas.canvasy(0)
+        primeira_visivel = int(topo // self.altura_celula)
+        ultima_visivel = int((topo + self.canvas.winfo_height()) // self.altura_celula)
+        primeira = max(0, primeira_visivel - self.LINHAS_EXTRAS)
+        ultima = ultima_visivel + self.LINHAS_EXTRAS
+        total = len(self.produtos)
+        faixa = range(primeira * colunas, min(total, (ultima + 1) * colunas))
+
+        for indice in [i for i in self._visiveis if i not in faixa]:
+            self._liberar(indice)
+
+        # Linhas visíveis primeiro: as imagens dos cards são carregadas nessa ordem
+        visiveis = range(primeira_visivel * colunas, min(total, (ultima_visivel + 1) * colunas))
+        extras = [i for i in faixa if i not in visiveis]
+        for indice in [*visiveis, *extras]:
+            produto = self.produtos[indice]
+            if indice in self._visiveis:
+                card, item = self._visiveis[indice]
+                card.atualizar(produto)
+            elif self._livres:
+                card, item = self._livres.pop()
+                card.atualizar(produto)
+            else:
+                card = ProductCard(
+                    self.canvas, produto, on_add_cart=self.on_add_cart, on_click=self.on_click
+                )
+                item = self.canvas.create_window(0, 0, window=card, anchor="nw")
+            self._visiveis[indice] = (card, item)
+
+            linha, coluna = divmod(indice, colunas)
+            self.canvas.coords(
+                item,
+                coluna * self.largura_celula + self.ESPACO,
+                linha * self.altura_celula + self.ESPACO,
+            )
+
+    def _liberar(self, indice):
+        """Tira o card da tela e o devolve ao conjunto de reuso."""
+        card, item = self._visiveis.pop(indice)
+        self.canvas.coords(item, -2 * self.largura_celula, -2 * self.altura_celula)
+        self._livres.append((card, item))
+
+    def _limpar_mensagem(self):
+        if self._mensagem is not None:
+            self.canvas.delete(self._mensagem)
+            self._mensagem = None
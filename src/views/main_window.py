@@ -1,5 +1,7 @@
 import tkinter as tk
+from collections import OrderedDict
 from src.config.settings import Config
+from src.utils.ui_watchdog import monitor_travamentos
 
 
 class MainWindow(tk.Tk):
@@ -24,80 +26,147 @@ class MainWindow(tk.Tk):
         self.container.pack(fill="both", expand=True)
 
         self.current_view = None
+        # Views persistentes ocultas, da menos para a mais recente:
+        # nome -> (view, data com que foi criada)
+        self._views_vivas = OrderedDict()
+
+        # Batimento no loop de eventos: mede travamentos da interface por tela
+        monitor_travamentos.iniciar(self)
 
         # Inicia no Login
         self.show_view("LoginView")
 
     def show_view(self, view_name, data=None):
-        # Remove a tela anterior
-        if self.current_view:
-            self.current_view.destroy()
+        """
+        Exibe a tela ``view_name``.
+
+        Views com ``PERSISTENTE = True`` não são destruídas ao sair: ficam
+        ocultas (até Config.VIEWS_EM_CACHE delas) e, ao voltar com os mesmos
+        dados, são reexibidas e recebem ``on_show(data)`` para se atualizar.
+        As demais são recriadas a cada navegação.
+        """
+        self._ocultar_atual()
+        # Travamentos a partir daqui (inclusive a montagem da tela) contam para ela
+        monitor_travamentos.vista = view_name
+
+        # Logout: as telas da sessão anterior não servem mais
+        if view_name == "LoginView":
+            self._descartar_views()
+
+        viva = self._views_vivas.get(view_name)
+        if viva and viva[1] is data and viva[0].winfo_exists():
+            self._views_vivas.move_to_end(view_name)
+            self.current_view = viva[0]
+            self.current_view.pack(fill="both", expand=True)
+            if hasattr(self.current_view, "on_show"):
+                self.current_view.on_show(data)
+            return
+
+        if viva:
+            self._descartar_view(view_name)
+        self.current_view = self._criar_view(view_name, data)
+        if getattr(self.current_view, "PERSISTENTE", False):
+            self._views_vivas[view_name] = (self.current_view, data)
+            self._limitar_views()
+        self.current_view.pack(fill="both", expand=True)
+
+    # --- Métodos privados ---
+
+    def _ocultar_atual(self):
+        view = self.current_view
+        if view is None:
+            return
+        if any(viva is view for viva, _ in self._views_vivas.values()):
+            view.pack_forget()
+            if hasattr(view, "on_hide"):
+                view.on_hide()
+        else:
+            view.destroy()
+        self.current_view = None
 
-        # Roteamento
+    def _limitar_views(self):
+        """Destrói as views ocultas menos usadas além de Config.VIEWS_EM_CACHE."""
+        while len(self._views_vivas) > max(1, Config.VIEWS_EM_CACHE):
+            self._descartar_view(next(iter(self._views_vivas)))
+
+    def _descartar_view(self, view_name):
+        view, _ = self._views_vivas.pop(view_name)
+        if view is not self.current_view:
+            view.destroy()
+
+    def _descartar_views(self):
+        for view_name in list(self._views_vivas):
+            self._descartar_view(view_name)
+
+    def _criar_view(self, view_name, data):
+        """Roteamento: instancia a tela pelo nome."""
         if view_name == "LoginView":
             from src.views.client.login_view import LoginView
 
-            self.current_view = LoginView(self.container, self)
+            return LoginView(self.container, self)
 
         elif view_name == "RegisterView":
             from src.views.client.register_view import RegisterView
 
-            self.current_view = RegisterView(self.container, self)
+            return RegisterView(self.container, self)
 
         elif view_name == "HomeView":
             from src.views.client.home_view import HomeView
 
-            self.current_view = HomeView(self.container, self, data=data)
+            return HomeView(self.container, self, data=data)
 
         elif view_name == "AdminDashboard":
             from src.views.admin.dashboard_view import DashboardView
 
             # Passamos o objeto usuário (data) para o dashboard saber o nome
-            self.current_view = DashboardView(self.container, self, usuario_logado=data)
+            return DashboardView(self.container, self, usuario_logado=data)
 
         elif view_name == "ManageProducts":
             from src.views.admin.manage_products_view import ManageProductsView
 
-            self.current_view = ManageProductsView(self.container, self, data=data)
+            return ManageProductsView(self.container, self, data=data)
 
         elif view_name == "ManageOrders":
             from src.views.admin.manage_orders_view import ManageOrdersView
 
-            self.current_view = ManageOrdersView(self.container, self, data=data)
+            return ManageOrdersView(self.container, self, data=data)
 
         elif view_name == "ManageCategories":
             from src.views.admin.manage_categories_view import ManageCategoriesView
 
-            self.current_view = ManageCategoriesView(self.container, self, data=data)
+            return ManageCategoriesView(self.container, self, data=data)
+
+        elif view_name == "Diagnostics":
+            from src.views.admin.diagnostics_view import DiagnosticsView
+
+            return DiagnosticsView(self.container, self, data=data)
 
         elif view_name == "ProductFormView":
             from src.views.admin.product_form_view import ProductFormView
 
-            self.current_view = ProductFormView(self.container, self, data=data)
+            return ProductFormView(self.container, self, data=data)
 
         elif view_name == "CartView":
             from src.views.client.cart_view import CartView
 
-            self.current_view = CartView(self.container, self, data=data)
+            return CartView(self.container, self, data=data)
 
         elif view_name == "CheckoutView":
             from src.views.client.checkout_view import CheckoutView
 
-            self.current_view = CheckoutView(self.container, self, data=data)
+            return CheckoutView(self.container, self, data=data)
 
         elif view_name == "MyOrdersView":
             from src.views.client.my_orders_view import MyOrdersView
 
-            self.current_view = MyOrdersView(self.container, self, data=data)
+            return MyOrdersView(self.container, self, data=data)
 
         elif view_name == "AddressFormView":
             from src.views.client.address_form_view import AddressFormView
 
-            self.current_view = AddressFormView(self.container, self, data=data)
+            return AddressFormView(self.container, self, data=data)
 
         else:
-            self.current_view = tk.Label(
+            return tk.Label(
                 self.container, text=f"404 - Tela {view_name} não encontrada"
             )
-
-        self.current_view.pack(fill="both", expand=True)
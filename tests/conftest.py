@@ -1,6 +1,7 @@
 """Configurações e fixtures compartilhadas para os testes."""
 import pytest
 import os
+import shutil
 import sys
 from pathlib import Path
 
@@ -11,54 +12,101 @@ sys.path.insert(0, str(root_dir))
 from src.config.database import DatabaseConnection
 from src.config.database_initializer import DatabaseInitializer
 from src.config.database_seeder import DatabaseSeeder
+from src.config.settings import Config
 
 
-@pytest.fixture(scope="function")
-def test_db_path(tmp_path):
-    """Cria um banco de dados temporário para cada teste."""
-    db_path = tmp_path / "test_scee.db"
-    return str(db_path)
+# Modo do banco de teste (variável SCEE_TESTE_BANCO):
+#   "modelo"  - cria e semeia um banco modelo uma vez por sessão e copia o
+#               arquivo para cada teste (padrão)
+#   "recriar" - recria schema, triggers, views e seed a cada teste
+MODO_BANCO = os.getenv("SCEE_TESTE_BANCO", "modelo")
 
+# Perfil de hash barato para os testes (SCEE_TESTE_HASH=real desliga).
+# O seed calcula dois hashes PBKDF2 e cada login mais um; com o custo de
+# produção isso domina o tempo da suíte.
+HASH_RAPIDO = os.getenv("SCEE_TESTE_HASH", "rapido") != "real"
+ITERACOES_HASH_RAPIDO = 10
+SCRYPT_N_RAPIDO = 16
 
-@pytest.fixture(scope="function")
-def db_connection(test_db_path, monkeypatch):
-    """Fornece uma conexão limpa com banco de dados de teste para cada teste."""
-    # Fecha conexão anterior se existir
+
+def _resetar_conexao():
+    """Fecha a conexão do singleton DatabaseConnection e o descarta."""
     if DatabaseConnection._instance is not None:
-        if hasattr(DatabaseConnection._instance, '_conn') and DatabaseConnection._instance._conn:
+        if getattr(DatabaseConnection._instance, '_conn', None):
             DatabaseConnection._instance._conn.close()
         # Força resetar a conexão interna para None
         DatabaseConnection._instance._conn = None
-    
-    # Reseta o singleton DatabaseConnection
     DatabaseConnection._instance = None
-    
-    # Faz monkeypatch DIRETO no Config.DB_PATH (não apenas na variável de ambiente)
-    from src.config.settings import Config
-    monkeypatch.setattr(Config, 'DB_PATH', test_db_path)
-    
-    # Remove o banco se existir
-    if os.path.exists(test_db_path):
-        os.remove(test_db_path)
-    
+
+
+def _criar_banco(db_path):
+    """Cria schema, triggers e views e semeia os dados de teste em db_path."""
+    if os.path.exists(db_path):
+        os.remove(db_path)
+
     # Inicializa o banco
     initializer = DatabaseInitializer()
     initializer.initialize_database()
-    
+
     # Semeia dados de teste
     seeder = DatabaseSeeder()
     seeder.seed_all()
-    
+
+
+@pytest.fixture(scope="session", autouse=True)
+def perfil_hash_teste():
+    """Reduz o custo do hash de senha durante a sessão de testes."""
+    if not HASH_RAPIDO:
+        yield
+        return
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Config, 'SENHA_PBKDF2_ITERACOES', ITERACOES_HASH_RAPIDO)
+        mp.setattr(Config, 'SENHA_SCRYPT_N', SCRYPT_N_RAPIDO)
+        yield
+
+
+@pytest.fixture(scope="session")
+def banco_modelo(tmp_path_factory, perfil_hash_teste):
+    """Banco inicializado e semeado uma única vez; os testes recebem cópias."""
+    db_path = str(tmp_path_factory.mktemp("banco_modelo") / "modelo_scee.db")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Config, 'DB_PATH', db_path)
+        _resetar_conexao()
+        _criar_banco(db_path)
+        _resetar_conexao()
+    return db_path
+
+
+@pytest.fixture(scope="function")
+def test_db_path(tmp_path):
+    """Cria um banco de dados temporário para cada teste."""
+    db_path = tmp_path / "test_scee.db"
+    return str(db_path)
+
+
+@pytest.fixture(scope="function")
+def db_connection(test_db_path, monkeypatch, request):
+    """Fornece uma conexão limpa com banco de dados de teste para cada teste."""
+    # Fecha conexão anterior se existir e reseta o singleton
+    _resetar_conexao()
+
+    # Faz monkeypatch DIRETO no Config.DB_PATH (não apenas na variável de ambiente)
+    monkeypatch.setattr(Config, 'DB_PATH', test_db_path)
+
+    if MODO_BANCO == "recriar":
+        _criar_banco(test_db_path)
+    else:
+        # Cópia do arquivo (e não um banco em memória): threads de segundo
+        # plano abrem conexões próprias pelo caminho em Config.DB_PATH
+        shutil.copyfile(request.getfixturevalue("banco_modelo"), test_db_path)
+
     # Retorna conexão
     conn = DatabaseConnection()
     
     yield conn
     
     # Cleanup - Fecha conexão e reseta singleton
-    if conn._conn:
-        conn._conn.close()
-    conn._conn = None
-    DatabaseConnection._instance = None
+    _resetar_conexao()
     if os.path.exists(test_db_path):
         os.remove(test_db_path)
 
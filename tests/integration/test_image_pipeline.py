@@ -0,0 +1,107 @@
+"""Testes para o processamento das imagens enviadas para os produtos."""
+import hashlib
+import os
+import time
+
+import pytest
+from PIL import Image
+
+from src.services.image_pipeline import PipelineImagens, hash_arquivo
+
+
+@pytest.fixture
+def pipeline(tmp_path):
+    return PipelineImagens(str(tmp_path / "produtos"), max_processos=2, qualidade=80)
+
+
+def _foto_de_camera(caminho, tamanho=(800, 400)):
+    """JPEG 'deitado' com orientação EXIF 6 (girar 90°) e um campo de câmera."""
+    exif = Image.Exif()
+    exif[0x0112] = 6        # Orientation
+    exif[0x010F] = "Camera"  # Make
+    Image.new("RGB", tamanho, color="#9B59B6").save(caminho, "JPEG", exif=exif.tobytes())
+    return str(caminho)
+
+
+class TestPipelineImagens:
+    """Testes das variantes geradas no upload."""
+
+    def test_variantes_sem_metadados(self, pipeline, tmp_path):
+        """Gera card/detalhe/original em WebP, com a rotação aplicada e sem EXIF."""
+        _, variantes = pipeline.processar(_foto_de_camera(tmp_path / "camera.jpg"))
+
+        assert set(variantes) == {"card", "detalhe", "original"}
+        tamanhos = {}
+        for variante, caminho in variantes.items():
+            with Image.open(caminho) as imagem:
+                assert imagem.format == "WEBP"
+                assert "exif" not in imagem.info and "icc_profile" not in imagem.info
+                tamanhos[variante] = imagem.size
+        assert tamanhos == {"card": (80, 160), "detalhe": (175, 350), "original": (400, 800)}
+
+    def test_lote_em_processos_mantem_ordem(self, pipeline, tmp_path):
+        """O lote roda no pool de processos e devolve na ordem de entrada."""
+        caminhos = []
+        for i, lado in enumerate([300, 500, 700]):
+            caminho = tmp_path / f"img{i}.png"
+            Image.new("RGBA", (lado, lado), color=(10, 20, 30, 128)).save(caminho)
+            caminhos.append(str(caminho))
+
+        lote = pipeline.processar_lote(caminhos)
+
+        originais = []
+        for _, variantes in lote:
+            with Image.open(variantes["original"]) as imagem:
+                originais.append(imagem.size[0])
+                assert imagem.mode == "RGBA"
+        assert originais == [300, 500, 700]
+
+    def test_hash_em_blocos(self, tmp_path):
+        """O hash lido em pedaços é o SHA-256 do arquivo inteiro."""
+        conteudo = os.urandom(3 * 1024 * 1024 + 17)
+        caminho = tmp_path / "grande.bin"
+        caminho.write_bytes(conteudo)
+
+        assert hash_arquivo(str(caminho)) == hashlib.sha256(conteudo).hexdigest()
+
+    def test_arquivo_inexistente(self, pipeline, tmp_path):
+        """Arquivo que não existe é recusado antes de qualquer processamento."""
+        with pytest.raises(FileNotFoundError):
+            pipeline.processar_lote([str(tmp_path / "nao_existe.png")])
+
+    def test_conteudo_repetido_reaproveita_arquivos(self, pipeline, tmp_path):
+        """A mesma imagem com outro nome vira o mesmo hash e não é reprocessada."""
+        a = _foto_de_camera(tmp_path / "a.jpg")
+        b = tmp_path / "copia.jpg"
+        b.write_bytes(open(a, "rb").read())
+
+        lote = pipeline.processar_lote([a, str(b), a])
+
+        assert len({chave for chave, _ in lote}) == 1
+        chave, variantes = lote[0]
+        assert variantes["card"].endswith(f"{chave[:2]}/{chave}_card.webp")
+        assert pipeline.estatisticas == {"processadas": 1, "reaproveitadas": 2, "removidas": 0}
+
+    def test_coleta_de_lixo(self, pipeline, tmp_path):
+        """Só os hashes sem referência (e não recentes) são apagados."""
+        usada, _ = pipeline.processar(_foto_de_camera(tmp_path / "usada.jpg", (300, 200)))
+        orfa, _ = pipeline.processar(_foto_de_camera(tmp_path / "orfa.jpg", (200, 300)))
+
+        assert pipeline.coletar_lixo({usada}) == 0  # recentes demais
+        assert pipeline.coletar_lixo({usada}, idade_minima_s=-1) == 1
+
+        assert all(os.path.exists(c) for c in pipeline.arquivos(usada).values())
+        assert not any(os.path.exists(c) for c in pipeline.arquivos(orfa).values())
+
+    def test_remover_sem_uso_respeita_carencia(self, pipeline, tmp_path):
+        """Hash sem referência só é apagado na hora se não foi usado há pouco."""
+        chave, _ = pipeline.processar(_foto_de_camera(tmp_path / "foto.jpg"))
+
+        assert not pipeline.remover_sem_uso(chave)  # recém-gravado
+        assert all(os.path.exists(c) for c in pipeline.arquivos(chave).values())
+
+        antigo = time.time() - pipeline.IDADE_MINIMA_COLETA_S - 10
+        for caminho in pipeline.arquivos(chave).values():
+            os.utime(caminho, (antigo, antigo))
+        assert pipeline.remover_sem_uso(chave)
+        assert not any(os.path.exists(c) for c in pipeline.arquivos(chave).values())
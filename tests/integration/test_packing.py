@@ -0,0 +1,54 @@
+"""Testes para a cubagem e escolha de caixas."""
+from src.integration.shipping.packing import calcular_carga, empacotar
+
+
+class TestPacking:
+    """Testes do cálculo de carga do carrinho."""
+
+    def test_carga_itens_pequenos_em_caixa_unica(self):
+        """Testa que itens pequenos vão para a menor caixa que os comporta."""
+        itens = [
+            {'quantidade': 2, 'peso_kg': 0.2, 'altura_cm': 5, 'largura_cm': 8, 'comprimento_cm': 14},
+            {'quantidade': 1, 'peso_kg': 0.35, 'altura_cm': 8, 'largura_cm': 18, 'comprimento_cm': 20},
+        ]
+
+        carga = calcular_carga(itens)
+
+        assert carga['peso_real_kg'] == 0.75
+        assert [c['caixa'] for c in carga['caixas']] == ['M']
+        # Caixa M (20x25x30) tem peso cubado de 2.5 kg > peso real
+        assert carga['peso_taxavel_kg'] == 2.5
+
+    def test_carga_respeita_peso_maximo_da_caixa(self):
+        """Testa que unidades pesadas são divididas em várias caixas."""
+        itens = [{'quantidade': 4, 'peso_kg': 10.5, 'altura_cm': 12, 'largura_cm': 20, 'comprimento_cm': 30}]
+
+        caixas = empacotar(itens)
+
+        assert len(caixas) == 2
+        assert all(c['peso_kg'] <= 30 for c in caixas)
+        assert sum(c['peso_kg'] for c in caixas) == 42.0
+
+    def test_item_maior_que_todas_as_caixas_segue_avulso(self):
+        """Testa que itens fora do padrão seguem com as próprias dimensões."""
+        itens = [{'quantidade': 1, 'peso_kg': 1.5, 'altura_cm': 5, 'largura_cm': 42, 'comprimento_cm': 62}]
+
+        carga = calcular_carga(itens)
+
+        assert carga['caixas'][0]['caixa'] is None
+        assert carga['peso_taxavel_kg'] == round(5 * 42 * 62 / 6000, 3)
+
+    def test_itens_sem_dimensoes_usam_padrao(self):
+        """Testa valores padrão (1 kg, 10x10x10) para produtos sem cadastro."""
+        carga = calcular_carga([{'quantidade': 3}])
+
+        assert carga['peso_real_kg'] == 3.0
+        assert carga['volume_cm3'] == 3000.0
+
+    def test_peso_e_dimensoes_zero_nao_usam_padrao(self):
+        """Testa que 0 cadastrado é mantido (só None usa o padrão)."""
+        carga = calcular_carga([{'quantidade': 2, 'peso_kg': 0, 'altura_cm': 0,
+                                 'largura_cm': 5, 'comprimento_cm': 5}])
+
+        assert carga['peso_real_kg'] == 0.0
+        assert carga['volume_cm3'] == 0.0
@@ -0,0 +1,102 @@
+"""Testes para a tabela binária de frete."""
+import pytest
+from src.integration.shipping import rate_table
+from src.integration.shipping.rate_table import (
+    TabelaFrete,
+    TabelaFreteCalculator,
+    TabelaFreteError,
+    construir_tabela,
+)
+
+
+CSV_TABELA = """cep_inicio,cep_fim,peso_max_kg,valor,prazo_dias
+01000-000,05999-999,1.0,18.50,3
+01000-000,05999-999,5.0,25.00,3
+20000000,28999999,1.0,22.00,5
+20000000,28999999,5.0,31.90,6
+"""
+
+
+@pytest.fixture
+def tabela_bin(tmp_path):
+    """Gera a tabela binária a partir de um CSV pequeno."""
+    csv_path = tmp_path / "tabela.csv"
+    csv_path.write_text(CSV_TABELA, encoding="utf-8")
+    bin_path = tmp_path / "tabela.bin"
+    construir_tabela(str(csv_path), str(bin_path))
+    return str(bin_path)
+
+
+class TestTabelaFrete:
+    """Testes da construção e consulta da tabela de frete."""
+
+    def test_buscar_por_faixa_de_cep_e_peso(self, tabela_bin):
+        """Testa a busca binária por CEP e faixa de peso."""
+        tabela = TabelaFrete(tabela_bin)
+        try:
+            assert tabela.buscar('01310-100', 0.8) == (18.50, 3)
+            assert tabela.buscar('01310-100', 1.0) == (18.50, 3)
+            assert tabela.buscar('05999-999', 3.2) == (25.00, 3)
+            assert tabela.buscar('22041-001', 4.0) == (31.90, 6)
+        finally:
+            tabela.fechar()
+
+    def test_buscar_fora_da_tabela(self, tabela_bin):
+        """Testa CEP não coberto e peso acima da maior faixa."""
+        tabela = TabelaFrete(tabela_bin)
+        try:
+            assert tabela.buscar('00999-999', 1.0) is None
+            assert tabela.buscar('10000-000', 1.0) is None
+            assert tabela.buscar('99999-999', 1.0) is None
+            assert tabela.buscar('01310-100', 5.1) is None
+        finally:
+            tabela.fechar()
+
+    def test_construir_faixas_sobrepostas(self, tmp_path):
+        """Testa erro com faixas de CEP sobrepostas."""
+        csv_path = tmp_path / "ruim.csv"
+        csv_path.write_text(
+            "cep_inicio,cep_fim,peso_max_kg,valor,prazo_dias\n"
+            "01000000,05999999,1.0,18.50,3\n"
+            "05000000,06999999,1.0,19.50,3\n",
+            encoding="utf-8",
+        )
+
+        with pytest.raises(TabelaFreteError, match="sobreposta"):
+            construir_tabela(str(csv_path), str(tmp_path / "ruim.bin"))
+
+    def test_construir_faixa_de_peso_faltando_nao_deixa_temporario(self, tmp_path):
+        """Testa que a validação falha antes de criar o arquivo temporário."""
+        csv_path = tmp_path / "ruim.csv"
+        csv_path.write_text(
+            "cep_inicio,cep_fim,peso_max_kg,valor,prazo_dias\n"
+            "01000000,05999999,1.0,18.50,3\n"
+            "01000000,05999999,5.0,25.00,3\n"
+            "20000000,28999999,1.0,22.00,5\n",
+            encoding="utf-8",
+        )
+
+        with pytest.raises(TabelaFreteError, match="sem valor"):
+            construir_tabela(str(csv_path), str(tmp_path / "ruim.bin"))
+        assert not (tmp_path / "ruim.bin.tmp").exists()
+        assert not (tmp_path / "ruim.bin").exists()
+
+    def test_buscar_sem_cast_nativo(self, tabela_bin, monkeypatch):
+        """Testa a leitura little-endian explícita usada em hosts big-endian."""
+        monkeypatch.setattr(rate_table, "_NATIVO_LITTLE_UINT32", False)
+        tabela = TabelaFrete(tabela_bin)
+        try:
+            assert tabela.buscar('01310-100', 0.8) == (18.50, 3)
+            assert tabela.buscar('22041-001', 4.0) == (31.90, 6)
+            assert tabela.buscar('99999-999', 1.0) is None
+        finally:
+            tabela.fechar()
+
+    def test_calculator_sem_tarifa(self, tabela_bin):
+        """Testa a calculadora baseada na tabela."""
+        calc = TabelaFreteCalculator(tabela_bin)
+
+        assert calc.calcular('22041-001', 0.5) == 22.00
+        assert calc.prazo_dias('22041-001', 0.5) == 5
+        with pytest.raises(TabelaFreteError):
+            calc.calcular('99999-999', 0.5)
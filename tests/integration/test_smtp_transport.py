@@ -0,0 +1,97 @@
+"""Testes para o PoolSMTP usando o servidor SMTP local."""
+import pytest
+from email.message import EmailMessage
+from src.integration.email.smtp_sink import SMTPSinkLocal
+from src.integration.email.smtp_transport import LimitadorTaxa, PoolSMTP, SMTPTransportError
+from src.services.email_service import EmailService
+
+
+def _mensagem(assunto, corpo='Corpo'):
+    mensagem = EmailMessage()
+    mensagem['From'] = 'loja@scee.com.br'
+    mensagem['To'] = 'cliente@test.com'
+    mensagem['Subject'] = assunto
+    mensagem.set_content(corpo)
+    return mensagem
+
+
+@pytest.fixture
+def sink():
+    with SMTPSinkLocal(usuario='scee', senha='segredo', recusar=['recusado@test.com']) as servidor:
+        yield servidor
+
+
+class TestPoolSMTP:
+    """Testes do transporte SMTP com pool de conexões."""
+
+    def test_lote_reusa_conexoes(self, sink):
+        """Testa que o lote usa no máximo max_conexoes conexões."""
+        envios = [('loja@scee.com.br', ['cliente@test.com'], _mensagem(f'M{i}')) for i in range(60)]
+
+        with PoolSMTP(sink.host, sink.port, usuario='scee', senha='segredo', max_conexoes=3) as pool:
+            resultados = pool.enviar_lote(envios)
+            pool.enviar('loja@scee.com.br', ['cliente@test.com'], _mensagem('Avulso'))
+
+        assert resultados == [None] * 60
+        assert len(sink.mensagens) == 61
+        assert sink.conexoes <= 3
+
+    def test_corpo_com_ponto_no_inicio_de_linha(self, sink):
+        """Testa o escape de linhas iniciadas por ponto no DATA em pipeline."""
+        with PoolSMTP(sink.host, sink.port, usuario='scee', senha='segredo') as pool:
+            pool.enviar('loja@scee.com.br', ['cliente@test.com'], _mensagem('P', '.\n..linha\nfim'))
+
+        assert b'\r\n.\r\n..linha\r\nfim\r\n' in sink.mensagens[0]['dados']
+
+    def test_destinatario_recusado_nao_derruba_lote(self, sink):
+        """Testa que uma recusa afeta só a própria mensagem."""
+        envios = [
+            ('loja@scee.com.br', ['recusado@test.com'], _mensagem('A')),
+            ('loja@scee.com.br', ['cliente@test.com'], _mensagem('B')),
+        ]
+
+        with PoolSMTP(sink.host, sink.port, usuario='scee', senha='segredo', max_conexoes=1) as pool:
+            resultados = pool.enviar_lote(envios)
+
+        assert isinstance(resultados[0], SMTPTransportError)
+        assert resultados[1] is None
+        assert len(sink.mensagens) == 1
+
+    def test_credenciais_invalidas(self, sink):
+        """Testa erro de autenticação."""
+        with PoolSMTP(sink.host, sink.port, usuario='scee', senha='errada') as pool:
+            with pytest.raises(SMTPTransportError):
+                pool.enviar('loja@scee.com.br', ['cliente@test.com'], _mensagem('X'))
+
+    def test_limitador_taxa(self):
+        """Testa que o token bucket espaça os envios além da rajada."""
+        agora = [0.0]
+        esperas = []
+
+        def dormir(segundos):
+            esperas.append(segundos)
+            agora[0] += segundos
+
+        limitador = LimitadorTaxa(10, rajada=2, relogio=lambda: agora[0], dormir=dormir)
+        for _ in range(4):
+            limitador.aguardar()
+
+        assert esperas == pytest.approx([0.1, 0.1])
+
+    def test_email_service_envia_pelo_pool(self, sink):
+        """Testa o EmailService fora do modo mock."""
+        service = EmailService(
+            smtp_host=sink.host, smtp_port=sink.port,
+            smtp_user='scee', smtp_password='segredo', modo_mock=False
+        )
+        try:
+            resultado = service.enviar_lote(
+                ['a@test.com', 'invalido', 'recusado@test.com', 'b@test.com'], 'Promo', 'Corpo'
+            )
+        finally:
+            service.fechar()
+
+        assert resultado['sucessos'] == 2
+        assert resultado['falhas'] == 2
+        assert len(service.historico) == 2
+        assert sorted(m['destinatarios'][0] for m in sink.mensagens) == ['a@test.com', 'b@test.com']
@@ -0,0 +1,76 @@
+"""Testes para o perfil de instruções SQL."""
+import sqlite3
+
+import pytest
+
+from src.utils.sql_profiler import ConexaoPerfilada, PerfilSQL, normalizar_sql
+
+
+@pytest.fixture
+def conexao():
+    """Conexão em memória perfilada por um PerfilSQL próprio (limite 0: sempre captura plano)."""
+    conn = sqlite3.connect(":memory:", factory=ConexaoPerfilada)
+    conn.row_factory = sqlite3.Row
+    conn.perfil = PerfilSQL(limite_ms=0)
+    conn.execute("CREATE TABLE itens (id INTEGER PRIMARY KEY, nome TEXT, grupo INTEGER)")
+    conn.executemany(
+        "INSERT INTO itens (nome, grupo) VALUES (?, ?)",
+        [(f"item {i}", i % 5) for i in range(100)],
+    )
+    conn.perfil.limpar()
+    yield conn
+    conn.close()
+
+
+def _linha(perfil, trecho):
+    return next(linha for linha in perfil.relatorio(limite=None) if trecho in linha["sql"])
+
+
+class TestPerfilSQL:
+    """Testes da coleta por instrução normalizada."""
+
+    def test_normalizar_sql(self):
+        """Literais viram '?', listas IN colapsam e espaços são unificados."""
+        assert normalizar_sql("SELECT *  FROM t\n WHERE a = 'x''y' AND b = 12.5;") == \
+            "SELECT * FROM t WHERE a = ? AND b = ?"
+        assert normalizar_sql("SELECT * FROM t WHERE id IN (?, ?, ?)") == \
+            normalizar_sql("SELECT * FROM t WHERE id IN (?,?)")
+
+    def test_agrega_execucoes_e_linhas(self, conexao):
+        """Mesma instrução com valores diferentes cai na mesma linha; conta as linhas lidas."""
+        for grupo in range(3):
+            conexao.execute(f"SELECT * FROM itens WHERE grupo = {grupo}").fetchall()
+        for linha in conexao.execute("SELECT id FROM itens WHERE id <= ?", (10,)):
+            pass
+
+        grupos = _linha(conexao.perfil, "WHERE grupo = ?")
+        assert grupos["execucoes"] == 3
+        assert grupos["linhas"] == 60
+        assert _linha(conexao.perfil, "WHERE id <= ?")["linhas"] == 10
+
+    def test_dml_conta_linhas_afetadas(self, conexao):
+        """UPDATE/DELETE registram as linhas afetadas."""
+        cursor = conexao.cursor()
+        cursor.execute("UPDATE itens SET nome = ? WHERE grupo = ?", ("x", 1))
+
+        assert _linha(conexao.perfil, "UPDATE itens")["linhas"] == 20
+
+    def test_plano_marca_varredura_completa(self, conexao):
+        """Acima do limite o plano é capturado; SCAN sem índice fica marcado."""
+        conexao.execute("SELECT * FROM itens WHERE nome = ?", ("item 3",)).fetchone()
+        conexao.execute("SELECT * FROM itens WHERE id = ?", (3,)).fetchone()
+
+        varredura = _linha(conexao.perfil, "WHERE nome = ?")
+        assert varredura["varredura"] is True
+        assert any(passo.startswith("SCAN itens") for passo in varredura["plano"])
+        assert _linha(conexao.perfil, "WHERE id = ?")["varredura"] is False
+        assert "varredura completa" in conexao.perfil.formatar_relatorio()
+
+    def test_mesclar_perfis(self, conexao):
+        """O perfil exportado por outro processo soma ao atual."""
+        conexao.execute("SELECT COUNT(*) FROM itens").fetchone()
+        total = PerfilSQL(limite_ms=0)
+        total.mesclar(conexao.perfil.exportar())
+        total.mesclar(conexao.perfil.exportar())
+
+        assert _linha(total, "COUNT(*)")["execucoes"] == 2
@@ -0,0 +1,85 @@
+"""Testes para o gerador de dados sintéticos em volume."""
+from src.config.synthetic_seeder import SyntheticDataSeeder
+from src.repositories.user_repository import UsuarioRepository
+
+
+def _assinatura(conn):
+    """Resumo do conteúdo gerado, para comparar duas execuções."""
+    return conn.execute("""
+        SELECT (SELECT group_concat(produto_id || ':' || quantidade) FROM itens_pedido),
+               (SELECT group_concat(criado_em || ':' || total) FROM pedidos),
+               (SELECT group_concat(nome) FROM usuarios)
+    """).fetchone()
+
+
+class TestSyntheticDataSeeder:
+    """Testes da carga de volume."""
+
+    def test_volume_e_integridade(self, db_connection):
+        """Testa as quantidades geradas e as chaves estrangeiras."""
+        conn = db_connection.get_connection()
+
+        contagens = SyntheticDataSeeder(db_connection).seed_volume(produtos=300, clientes=100, pedidos=1000)
+
+        assert contagens["produtos"] == 315
+        assert contagens["clientes"] == 100
+        assert conn.execute("SELECT COUNT(*) FROM pedidos").fetchone()[0] == 1000
+        assert conn.execute("SELECT COUNT(*) FROM itens_pedido").fetchone()[0] == contagens["itens_pedido"]
+        assert conn.execute("PRAGMA foreign_key_check").fetchall() == []
+        # Todo pedido usa um endereço do próprio cliente
+        assert conn.execute("""
+            SELECT COUNT(*) FROM pedidos p JOIN enderecos e ON e.id = p.endereco_id
+            WHERE e.usuario_id != p.usuario_id
+        """).fetchone()[0] == 0
+
+    def test_indices_e_triggers_recriados(self, db_connection):
+        """Testa que índices e triggers voltam depois da carga."""
+        conn = db_connection.get_connection()
+        antes = conn.execute("SELECT type, name FROM sqlite_master ORDER BY name").fetchall()
+
+        SyntheticDataSeeder(db_connection).seed_volume(produtos=50, clientes=10, pedidos=50)
+
+        depois = conn.execute(
+            "SELECT type, name FROM sqlite_master WHERE name NOT LIKE 'sqlite_stat%' ORDER BY name"
+        ).fetchall()
+        assert depois == antes
+
+    def test_deterministico_pela_semente(self, db_connection):
+        """Testa que a mesma semente gera exatamente os mesmos dados."""
+        conn = db_connection.get_connection()
+        seeder = SyntheticDataSeeder(db_connection, semente=7)
+        seeder.seed_volume(produtos=100, clientes=30, pedidos=200)
+        primeira = _assinatura(conn)
+
+        conn.execute("PRAGMA foreign_keys = OFF")
+        conn.execute("DELETE FROM itens_pedido")
+        conn.execute("DELETE FROM pedidos")
+        conn.execute("DELETE FROM enderecos WHERE id > 1")
+        conn.execute("DELETE FROM clientes_info WHERE usuario_id > 2")
+        conn.execute("DELETE FROM usuarios WHERE id > 2")
+        conn.execute("DELETE FROM produtos WHERE id > 15")
+        conn.execute("DELETE FROM categorias WHERE id > 5")
+        conn.commit()
+        conn.execute("PRAGMA foreign_keys = ON")
+        seeder.seed_volume(produtos=100, clientes=30, pedidos=200)
+
+        assert _assinatura(conn) == primeira
+
+    def test_popularidade_concentrada(self, db_connection):
+        """Testa que poucos produtos concentram a maior parte das vendas (Zipf)."""
+        conn = db_connection.get_connection()
+        SyntheticDataSeeder(db_connection).seed_volume(produtos=1000, clientes=200, pedidos=3000)
+
+        vendas = [row[0] for row in conn.execute(
+            "SELECT COUNT(*) FROM itens_pedido GROUP BY produto_id ORDER BY COUNT(*) DESC"
+        )]
+        top_10_porcento = sum(vendas[:100]) / sum(vendas)
+        assert top_10_porcento > 0.5
+
+    def test_clientes_conseguem_logar(self, db_connection):
+        """Testa que os clientes gerados têm senha válida."""
+        SyntheticDataSeeder(db_connection).seed_volume(produtos=10, clientes=5, pedidos=0)
+
+        from src.services.auth_service import AuthService
+        usuario = UsuarioRepository().listar()[-1]
+        assert AuthService().login(usuario.email, "cliente123") is True
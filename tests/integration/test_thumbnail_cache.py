@@ -0,0 +1,96 @@
+"""Testes para o cache de miniaturas das imagens de produto."""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from PIL import Image
+
+from src.utils.thumbnail_cache import CacheMiniaturas, COR_SEM_IMAGEM
+
+
+@pytest.fixture
+def imagem(tmp_path):
+    """Imagem 'grande' de origem."""
+    caminho = tmp_path / "original.png"
+    Image.new("RGB", (800, 600), color="#3498DB").save(caminho)
+    return str(caminho)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Cache com diretório próprio e 'PhotoImage' falso que conta as decodificações."""
+    decodificadas = []
+
+    def fabrica(img):
+        decodificadas.append(img.size)
+        return ("foto", img.size)
+
+    c = CacheMiniaturas(diretorio=str(tmp_path / "cache"), fabrica_foto=fabrica)
+    c.decodificadas = decodificadas
+    return c
+
+
+class TestCacheMiniaturas:
+    """Testes das camadas de disco e memória."""
+
+    def test_variante_em_disco_reaproveitada(self, cache, imagem):
+        """A variante é gerada uma vez e depois lida do disco."""
+        destino = cache.gerar_miniatura(imagem, (160, 160))
+
+        with Image.open(destino) as miniatura:
+            assert miniatura.size == (160, 120)
+        assert cache.gerar_miniatura(imagem, (160, 160)) == destino
+        assert cache.estatisticas["geradas"] == 1
+        assert cache.estatisticas["disco"] == 1
+
+    def test_redesenho_nao_decodifica(self, cache, imagem):
+        """Da segunda vez em diante a foto vem da memória, sem decodificar."""
+        primeira = cache.foto(imagem, (160, 160))
+        for _ in range(5):
+            assert cache.foto(imagem, (160, 160)) is primeira
+
+        assert cache.decodificadas == [(160, 120)]
+
+    def test_carga_em_segundo_plano(self, cache, imagem):
+        """Os pixels vêm de outra thread; a foto é criada depois e fica em memória."""
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            miniatura = pool.submit(cache.carregar_miniatura, imagem, (160, 160)).result()
+
+        assert cache.foto_em_memoria(imagem, (160, 160)) is None
+        foto = cache.foto_de_imagem(imagem, (160, 160), miniatura)
+        assert cache.foto_em_memoria(imagem, (160, 160)) is foto
+        assert cache.carregar_miniatura(None, (160, 160)) is None
+
+    def test_origem_alterada_gera_nova_variante(self, cache, imagem):
+        """Mudar o arquivo de origem (mtime/tamanho) invalida a variante."""
+        antiga = cache.gerar_miniatura(imagem, (160, 160))
+        Image.new("RGB", (300, 300), color="#E74C3C").save(imagem)
+        os.utime(imagem, ns=(0, os.stat(imagem).st_mtime_ns + 1_000_000))
+
+        nova = cache.gerar_miniatura(imagem, (160, 160))
+        assert nova != antiga
+        with Image.open(nova) as miniatura:
+            assert miniatura.size == (160, 160)
+
+    def test_orcamento_de_memoria(self, tmp_path, imagem):
+        """Acima do orçamento, as fotos menos usadas saem da memória."""
+        cache = CacheMiniaturas(
+            diretorio=str(tmp_path / "cache"),
+            orcamento_bytes=70_000,  # cabem duas miniaturas de ~100x76
+            fabrica_foto=lambda img: object(),
+        )
+        tamanhos = [(100, 100), (101, 101), (102, 102)]
+        for tamanho in tamanhos:
+            cache.foto(imagem, tamanho)
+
+        assert cache.bytes_em_memoria <= cache.orcamento_bytes
+        assert cache.estatisticas["descartadas"] == 1
+        assert cache.foto_em_memoria(imagem, (100, 100)) is None
+        assert cache.foto_em_memoria(imagem, (102, 102)) is not None
+
+    def test_sem_imagem_usa_quadro(self, cache, tmp_path):
+        """Arquivo inexistente devolve o quadro liso, também em cache."""
+        foto = cache.foto(str(tmp_path / "nao_existe.png"), (160, 160))
+
+        assert foto is cache.quadro((160, 160), COR_SEM_IMAGEM)
+        assert cache.decodificadas == [(160, 160)]
@@ -0,0 +1,100 @@
+"""Testes para o monitor de travamentos da interface."""
+import time
+
+import pytest
+
+from src.utils.ui_watchdog import MonitorTravamentos
+
+
+class RaizFalsa:
+    """Substitui o tk.Tk: guarda os agendamentos sem executá-los."""
+
+    def __init__(self):
+        self.agendados = []
+
+    def after(self, ms, funcao):
+        self.agendados.append(funcao)
+        return f"after#{len(self.agendados)}"
+
+    def after_cancel(self, identificador):
+        pass
+
+
+@pytest.fixture
+def monitor():
+    m = MonitorTravamentos(ativo=True, intervalo_ms=10, limite_ms=50)
+    yield m
+    m.encerrar()
+
+
+def _consulta_lenta(segundos):
+    """Simula uma consulta síncrona na thread do Tkinter."""
+    time.sleep(segundos)
+
+
+class TestMonitorTravamentos:
+    """Testes do batimento, da atribuição por tela e da amostragem de pilha."""
+
+    def test_atraso_abaixo_do_limite_nao_e_travamento(self, monitor):
+        """Batimentos no horário só entram na média de atraso."""
+        inicio = monitor._ultimo
+        assert monitor.batimento(inicio + 0.010) == pytest.approx(0.0, abs=1e-6)
+        assert monitor.batimento(inicio + 0.050) == pytest.approx(30.0)
+
+        geral = monitor.responsividade()
+        assert geral["batimentos"] == 2
+        assert geral["travamentos"] == 0
+        assert geral["atraso_max_ms"] == pytest.approx(30.0)
+
+    def test_piores_por_tela(self, monitor):
+        """Travamentos vão para a tela atual; cada tela guarda só os piores."""
+        agora = monitor._ultimo
+        monitor.vista = "HomeView"
+        for atraso_ms in (60, 300, 80, 90, 100, 110, 120):
+            agora += (monitor.intervalo_ms + atraso_ms) / 1000
+            monitor.batimento(agora)
+        monitor.vista = "CartView"
+        agora += (monitor.intervalo_ms + 70) / 1000
+        monitor.batimento(agora)
+
+        resumo = monitor.resumo()
+        assert [linha["vista"] for linha in resumo] == ["HomeView", "CartView"]
+        home = resumo[0]
+        assert home["travamentos"] == 7
+        assert home["max_ms"] == pytest.approx(300, abs=0.1)
+        assert len(home["piores"]) == MonitorTravamentos.MAX_PIORES_POR_VISTA
+        assert [t["duracao_ms"] for t in home["piores"]] == pytest.approx([300, 120, 110, 100, 90], abs=0.1)
+        assert monitor.piores(1)[0]["vista"] == "HomeView"
+
+        monitor.limpar()
+        assert monitor.resumo() == []
+        assert monitor.responsividade()["batimentos"] == 0
+
+    def test_pilha_amostrada_durante_o_travamento(self, monitor):
+        """A thread de amostragem captura onde a thread principal estava parada."""
+        raiz = RaizFalsa()
+        monitor.iniciar(raiz)
+        monitor.vista = "ManageOrdersView"
+
+        _consulta_lenta(0.3)
+        atraso_ms = monitor.batimento()
+
+        travamento = monitor.piores(1)[0]
+        assert atraso_ms >= 250
+        assert travamento["vista"] == "ManageOrdersView"
+        assert travamento["amostras"] >= 1
+        assert "em _consulta_lenta" in travamento["local"]
+        assert any("em test_pilha_amostrada_durante_o_travamento" in q for q in travamento["pilha"])
+        assert "ManageOrdersView" in monitor.formatar_relatorio()
+        # O batimento se reagenda pelo after da janela
+        assert raiz.agendados == [monitor._tique]
+
+    def test_desativado_nao_inicia(self):
+        """Com o monitor desligado nada é agendado nem amostrado."""
+        monitor = MonitorTravamentos(ativo=False)
+        raiz = RaizFalsa()
+
+        monitor.iniciar(raiz)
+
+        assert raiz.agendados == []
+        assert monitor._amostrador is None
@@ -0,0 +1,36 @@
+"""Testes para o VersaoDadosRepository e os triggers de versão."""
+from src.repositories.data_version_repository import VersaoDadosRepository
+from src.repositories.category_repository import CategoryRepository
+from src.repositories.product_repository import ProductRepository
+
+
+class TestVersaoDadosRepository:
+    """Testes das versões por tabela mantidas pelos triggers."""
+    
+    def test_alteracao_incrementa_so_a_tabela_alterada(self, db_connection):
+        """Testa que atualizar um produto muda a versão de produtos e não a de pedidos."""
+        repo = VersaoDadosRepository()
+        antes = repo.versoes(["produtos", "pedidos"])
+        
+        produto = ProductRepository().buscar_por_id(1)
+        produto["preco"] = produto["preco"] + 1
+        ProductRepository().atualizar(produto)
+        
+        depois = repo.versoes(["produtos", "pedidos"])
+        assert depois["produtos"] > antes["produtos"]
+        assert depois["pedidos"] == antes["pedidos"]
+    
+    def test_leitura_nao_altera_versao(self, db_connection):
+        """Testa que consultas não mudam as versões (a tela não recarrega à toa)."""
+        repo = VersaoDadosRepository()
+        antes = repo.versoes(["produtos", "categorias"])
+        
+        ProductRepository().listar()
+        CategoryRepository().listar()
+        
+        assert repo.versoes(["produtos", "categorias"]) == antes
+    
+    def test_tabela_sem_registro(self, db_connection):
+        """Testa que tabela não versionada devolve versão 0."""
+        assert VersaoDadosRepository().versoes(["nao_versionada"]) == {"nao_versionada": 0}
+        assert not hasattr(VersaoDadosRepository(), "salvar")
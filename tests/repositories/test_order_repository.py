@@ -78,6 +78,39 @@ class TestPedidoRepository:
         assert item['pedido_id'] == pedido['id']
         assert item['produto_id'] == 1
     
+    def test_salvar_com_itens(self, db_connection):
+        """Testa salvamento de pedido e itens em uma única transação."""
+        repo = PedidoRepository()
+        
+        novo_pedido = {
+            'usuario_id': 2,
+            'endereco_id': 1,
+            'subtotal': 329.80,
+            'frete': 15.0,
+            'total': 344.80,
+            'status': 'PENDENTE',
+            'tipo_pagamento': 'PIX'
+        }
+        itens = [
+            {'produto_id': 1, 'quantidade': 1, 'preco_unitario': 199.90},
+            {'produto_id': 2, 'quantidade': 1, 'preco_unitario': 129.90}
+        ]
+        
+        statements = []
+        conn = db_connection.get_connection()
+        conn.set_trace_callback(statements.append)
+        try:
+            pedido = repo.salvar_com_itens(novo_pedido, itens)
+        finally:
+            conn.set_trace_callback(None)
+        
+        itens_salvos = repo.listar_itens(pedido['id'])
+        assert [i['nome_produto'] for i in itens_salvos] == [
+            'Fone de Ouvido Bluetooth', 'Mouse Gamer RGB'
+        ]
+        assert sum(1 for s in statements if s.startswith('SELECT')) == 1
+        assert sum(1 for s in statements if s.startswith('COMMIT')) == 1
+    
     def test_listar_por_usuario(self, db_connection):
         """Testa listagem de pedidos por usuário."""
         repo = PedidoRepository()
@@ -190,3 +223,40 @@ class TestPedidoRepository:
         total = repo.contar_por_status('PENDENTE')
         
         assert total >= 2
+    
+    def test_listar_pagina(self, db_connection):
+        """Testa janela de pedidos com cliente e quantidade de itens."""
+        repo = PedidoRepository()
+        
+        pedido = repo.salvar_com_itens(
+            {'usuario_id': 2, 'endereco_id': 1, 'subtotal': 398.0, 'frete': 0.0,
+             'total': 9999.0, 'status': 'PENDENTE', 'tipo_pagamento': 'PIX'},
+            [{'produto_id': 1, 'quantidade': 2, 'preco_unitario': 199.0}]
+        )
+        
+        pagina = repo.listar_pagina(0, 5, 'total', decrescente=True)
+        
+        assert repo.contar() >= 1
+        assert pagina[0]['id'] == pedido['id']
+        assert pagina[0]['total_itens'] == 1
+        assert pagina[0]['cliente_nome']
+        assert [p['total'] for p in pagina] == sorted((p['total'] for p in pagina), reverse=True)
+        with pytest.raises(ValueError):
+            repo.listar_pagina(0, 5, 'cliente_nome')
+    
+    def test_listar_pagina_keyset(self, db_connection):
+        """Testa a janela seguinte buscada por keyset a partir da última linha lida."""
+        repo = PedidoRepository()
+        
+        for total in (150.0, 150.0, 80.0):
+            repo.salvar_com_itens(
+                {'usuario_id': 2, 'endereco_id': 1, 'subtotal': total, 'frete': 0.0,
+                 'total': total, 'status': 'PENDENTE', 'tipo_pagamento': 'PIX'},
+                [{'produto_id': 1, 'quantidade': 1, 'preco_unitario': total}]
+            )
+        
+        primeira = repo.listar_pagina(0, 2, 'total', decrescente=True)
+        esperada = repo.listar_pagina(2, 2, 'total', decrescente=True)
+        
+        assert repo.listar_pagina(2, 2, 'total', True, apos=primeira[-1]) == esperada
+        assert repo.listar_pagina(0, 2, 'total', True, antes=esperada[0]) == primeira
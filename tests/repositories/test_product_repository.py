@@ -115,3 +115,79 @@ class TestProductRepository:
         resultado = repo.deletar(99999)
         
         assert resultado is False
+    
+    def test_atualizar_preserva_peso_e_dimensoes(self, db_connection, sample_product):
+        """Testa que atualizar sem peso/dimensões mantém os valores salvos."""
+        repo = ProductRepository()
+        
+        produto = repo.salvar({**sample_product, 'peso_kg': 2.5, 'altura_cm': 12,
+                               'largura_cm': 20, 'comprimento_cm': 30})
+        repo.atualizar({**sample_product, 'id': produto['id'], 'preco': 89.90})
+        
+        atualizado = repo.buscar_por_id(produto['id'])
+        
+        assert atualizado['preco'] == 89.90
+        assert atualizado['peso_kg'] == 2.5
+        assert (atualizado['altura_cm'], atualizado['largura_cm'],
+                atualizado['comprimento_cm']) == (12, 20, 30)
+    
+    def test_listar_pagina_ordena_no_banco(self, db_connection):
+        """Testa janelas ordenadas por preço que, juntas, cobrem todos os produtos."""
+        repo = ProductRepository()
+        
+        total = repo.contar()
+        paginas = [repo.listar_pagina(inicio, 4, 'preco', decrescente=True)
+                   for inicio in range(0, total, 4)]
+        linhas = [p for pagina in paginas for p in pagina]
+        
+        assert len(paginas[0]) == 4
+        assert len(linhas) == total
+        assert len({p['id'] for p in linhas}) == total
+        assert [p['preco'] for p in linhas] == sorted((p['preco'] for p in linhas), reverse=True)
+        assert 'categoria_nome' in linhas[0]
+    
+    def test_listar_pagina_coluna_nao_permitida(self, db_connection):
+        """Testa que só colunas da lista branca entram no ORDER BY."""
+        repo = ProductRepository()
+        
+        with pytest.raises(ValueError):
+            repo.listar_pagina(0, 10, 'preco; DROP TABLE produtos')
+    
+    def test_listar_pagina_keyset_igual_ao_offset(self, db_connection):
+        """Testa que janelas buscadas a partir da vizinha coincidem com as do OFFSET."""
+        repo = ProductRepository()
+        
+        for coluna, decrescente in (('preco', True), ('nome', False), ('id', True)):
+            anterior = repo.listar_pagina(0, 3, coluna, decrescente)
+            esperada = repo.listar_pagina(3, 3, coluna, decrescente)
+            seguinte = repo.listar_pagina(6, 3, coluna, decrescente)
+            
+            assert esperada
+            assert repo.listar_pagina(3, 3, coluna, decrescente, apos=anterior[-1]) == esperada
+            assert repo.listar_pagina(3, 3, coluna, decrescente, antes=seguinte[0]) == esperada
+    
+    def test_listar_pagina_vizinha_sem_valor_usa_offset(self, db_connection):
+        """Testa que uma vizinha sem valor na coluna de ordenação cai no OFFSET."""
+        repo = ProductRepository()
+        
+        esperada = repo.listar_pagina(2, 3, 'preco')
+        
+        assert repo.listar_pagina(2, 3, 'preco', apos={'id': 1, 'preco': None}) == esperada
+    
+    def test_listar_pagina_keyset_com_estoque_nulo(self, db_connection):
+        """Testa que produtos com estoque NULL não somem ao rolar por keyset."""
+        repo = ProductRepository()
+        conn = db_connection.get_connection()
+        conn.execute("UPDATE produtos SET estoque = NULL WHERE id % 2 = 0")
+        conn.commit()
+        total = repo.contar()
+        
+        for decrescente in (False, True):
+            linhas = repo.listar_pagina(0, 3, 'estoque', decrescente)
+            while len(linhas) < total:
+                pagina = repo.listar_pagina(len(linhas), 3, 'estoque', decrescente, apos=linhas[-1])
+                assert pagina == repo.listar_pagina(len(linhas), 3, 'estoque', decrescente)
+                linhas += pagina
+            
+            assert len({p['id'] for p in linhas}) == total
+            assert any(p['estoque'] is None for p in linhas)
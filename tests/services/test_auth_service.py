@@ -1,7 +1,10 @@
 """Testes para o AuthService."""
+import hashlib
 import pytest
+from src.config.settings import Config
 from src.services.auth_service import AuthService
 from src.repositories.user_repository import UsuarioRepository
+from src.utils.security.password_hasher import PasswordHasher
 
 
 class TestAuthService:
@@ -56,3 +59,64 @@ class TestAuthService:
         # Faz logout
         auth.logout()
         assert auth.get_usuario_atual() is None
+    
+    def test_login_regrava_hash_quando_politica_muda(self, db_connection, sample_client, monkeypatch):
+        """Testa o rehash transparente após mudança de custo."""
+        repo = UsuarioRepository()
+        hash_antigo = repo.buscar_por_email(sample_client["email"]).senha_hash
+        monkeypatch.setattr(Config, 'SENHA_PBKDF2_ITERACOES', 1000)
+        
+        auth = AuthService()
+        assert auth.login(sample_client["email"], sample_client["senha"]) is True
+        
+        hash_novo = repo.buscar_por_email(sample_client["email"]).senha_hash
+        assert hash_novo != hash_antigo
+        assert hash_novo.startswith("pbkdf2_sha256$1000$")
+        assert auth.login(sample_client["email"], sample_client["senha"]) is True
+    
+    def test_login_com_hash_legado(self, db_connection, sample_client):
+        """Testa login com hash no formato antigo (salt$hash) e sua migração."""
+        repo = UsuarioRepository()
+        usuario = repo.buscar_por_email(sample_client["email"])
+        salt = "a" * 32
+        legado = hashlib.pbkdf2_hmac('sha256', sample_client["senha"].encode(), salt.encode(), 100000)
+        repo.atualizar_senha_hash(usuario.id, f"{salt}${legado.hex()}")
+        
+        auth = AuthService()
+        assert auth.login(sample_client["email"], sample_client["senha"]) is True
+        assert not PasswordHasher.needs_rehash(repo.buscar_por_email(sample_client["email"]).senha_hash)
+    
+    def test_iniciar_login_nao_bloqueia(self, db_connection, sample_admin):
+        """Testa que a verificação da senha roda fora da thread chamadora."""
+        auth = AuthService()
+        
+        tentativa = auth.iniciar_login(sample_admin["email"], sample_admin["senha"])
+        
+        assert auth.get_usuario_atual() is None
+        assert auth.concluir_login(tentativa) is True
+        assert auth.get_usuario_atual().email == sample_admin["email"]
+
+
+class TestPasswordHasher:
+    """Testes do formato autodescritivo de hash."""
+    
+    def test_scrypt_configuravel(self, monkeypatch):
+        """Testa hash scrypt e a detecção de troca de algoritmo."""
+        monkeypatch.setattr(Config, 'SENHA_ALGORITMO', 'scrypt')
+        monkeypatch.setattr(Config, 'SENHA_SCRYPT_N', 1024)
+        
+        senha_hash = PasswordHasher.hash_password("segredo")
+        
+        assert senha_hash.startswith("scrypt$1024,8,1$")
+        assert PasswordHasher.verify_password(senha_hash, "segredo")
+        assert not PasswordHasher.verify_password(senha_hash, "outra")
+        assert not PasswordHasher.needs_rehash(senha_hash)
+        
+        monkeypatch.setattr(Config, 'SENHA_ALGORITMO', 'pbkdf2_sha256')
+        assert PasswordHasher.needs_rehash(senha_hash)
+    
+    def test_hash_invalido(self):
+        """Testa que hashes malformados não conferem."""
+        assert PasswordHasher.verify_password("lixo", "senha") is False
+        assert PasswordHasher.verify_password("md5$1$a$b", "senha") is False
+        assert PasswordHasher.verify_and_update(None, "senha") == (False, None)
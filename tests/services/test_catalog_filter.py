@@ -0,0 +1,57 @@
+"""Testes para o FiltroCatalogo."""
+import pytest
+from src.services.catalog_filter import FiltroCatalogo
+from src.models.products.category_model import Categoria
+from src.models.products.product_model import Produto
+
+
+@pytest.fixture
+def produtos():
+    """Catálogo pequeno com duas categorias e um produto inativo."""
+    audio = Categoria(nome="Áudio", id=1)
+    info = Categoria(nome="Informática", id=2)
+    lista = [
+        Produto(nome="Fone Bluetooth", sku="FON-1", preco=50.0, estoque=5, categoria=audio, id=1),
+        Produto(nome="Fone com Fio", sku="FON-2", preco=30.0, estoque=5, categoria=audio, id=2),
+        Produto(nome="Mouse sem Fio", sku="MOU-1", preco=120.0, estoque=5, categoria=info, id=3),
+        Produto(nome="Notebook", sku="NOT-1", preco=3500.0, estoque=5, categoria=info, id=4),
+        Produto(nome="Fone Antigo", sku="FON-3", preco=10.0, estoque=0, categoria=audio, id=5),
+    ]
+    lista[4].ativo = 0
+    return lista
+
+
+def _ids(produtos):
+    return [p.id for p in produtos]
+
+
+class TestFiltroCatalogo:
+    """Testes do filtro em memória do catálogo."""
+
+    def test_filtros_combinados(self, produtos):
+        """Testa busca por nome, categoria e faixa de preço, ignorando inativos."""
+        filtro = FiltroCatalogo(produtos)
+
+        assert _ids(filtro.filtrar("FONE")) == [1, 2]
+        assert _ids(filtro.filtrar("fio", "Informática")) == [3]
+        assert _ids(filtro.filtrar("", "Todas", "Até R$ 50")) == [1, 2]
+        assert _ids(filtro.filtrar("", "", "Acima de R$ 300")) == [4]
+
+    def test_refina_a_partir_da_busca_anterior(self, produtos):
+        """Termo que estende o anterior filtra só o resultado anterior."""
+        filtro = FiltroCatalogo(produtos)
+        filtro.filtrar("fo")
+
+        # Um produto fora do resultado anterior não volta no refinamento
+        filtro._indice[2] = ("fone fantasma",) + filtro._indice[2][1:]
+        assert _ids(filtro.filtrar("fone")) == [1, 2]
+
+        # Mudar a categoria exige percorrer o catálogo de novo
+        assert _ids(filtro.filtrar("fone", "Informática")) == [3]
+
+    def test_mesma_busca_devolve_mesma_lista(self, produtos):
+        """Repetir a busca não recalcula nem cria outra lista."""
+        filtro = FiltroCatalogo(produtos)
+
+        primeira = filtro.filtrar("fone ")
+        assert filtro.filtrar("Fone") is primeira
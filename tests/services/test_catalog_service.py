@@ -1,4 +1,5 @@
 """Testes para o CatalogService."""
+import os
 import pytest
 from src.services.catalog_service import CatalogService
 from src.models.products.category_model import Categoria
@@ -60,6 +61,32 @@ class TestCatalogService:
         produtos = service.listar_produtos()
         assert any(p.nome == "Produto Teste" for p in produtos)
     
+    def test_cadastrar_e_atualizar_peso_e_dimensoes(self, db_connection):
+        """Testa que peso e dimensões do formulário chegam ao banco."""
+        service = CatalogService()
+        
+        service.cadastrar_produto(
+            nome="Produto Medido", sku="MED-001", preco=10.0, estoque=1,
+            nome_categoria="Eletrônicos", peso_kg="0.25", altura_cm=4,
+            largura_cm=12.5, comprimento_cm=0
+        )
+        produto = next(p for p in service.listar_produtos() if p.sku == "MED-001")
+        assert produto.peso_kg == 0.25
+        assert produto.dimensoes_cm == (4.0, 12.5, 0.0)
+        
+        # Medidas não informadas na edição mantêm as salvas
+        service.atualizar_produto(
+            produto.id, "Produto Medido", "MED-001", 10.0, 1, "Eletrônicos", peso_kg=0
+        )
+        produto = next(p for p in service.listar_produtos() if p.sku == "MED-001")
+        assert produto.peso_kg == 0.0
+        assert produto.dimensoes_cm == (4.0, 12.5, 0.0)
+        
+        with pytest.raises(ValueError):
+            service.atualizar_produto(
+                produto.id, "Produto Medido", "MED-001", 10.0, 1, "Eletrônicos", altura_cm=-1
+            )
+    
     def test_cadastrar_produto_categoria_invalida(self, db_connection):
         """Testa erro ao cadastrar produto com categoria inválida."""
         service = CatalogService()
@@ -94,3 +121,73 @@ class TestCatalogService:
         resultado = service.remover_produto(produto.id)
         
         assert resultado is True
+    
+    def test_cadastrar_produto_com_imagem_gera_variantes(self, db_connection, tmp_path):
+        """Testa que o upload grava as variantes card/detalhe/original em WebP."""
+        from PIL import Image
+        from src.services.image_pipeline import PipelineImagens
+        
+        origem = tmp_path / "foto.png"
+        Image.new("RGB", (1200, 900), color="#2ECC71").save(origem)
+        service = CatalogService()
+        service.pipeline = PipelineImagens(str(tmp_path / "produtos"))
+        
+        service.cadastrar_produto(
+            nome="Produto Com Foto",
+            sku="FOTO-001",
+            preco=10.0,
+            estoque=1,
+            nome_categoria="Eletrônicos",
+            imagem_path=str(origem)
+        )
+        
+        produto = next(p for p in service.listar_produtos() if p.nome == "Produto Com Foto")
+        assert produto.imagem_card.endswith("_card.webp")
+        assert produto.imagem_detalhe.endswith("_detalhe.webp")
+        assert service.product_repo.buscar_imagens(produto.id) == [produto.imagem_principal]
+        with Image.open(produto.imagem_card) as card:
+            assert card.format == "WEBP"
+            assert max(card.size) == 160
+    
+    def test_imagem_repetida_e_trocada_sem_duplicar(self, db_connection, tmp_path):
+        """Testa a deduplicação por conteúdo e a remoção do arquivo sem referências."""
+        from PIL import Image
+        from src.services.image_pipeline import PipelineImagens
+        
+        azul, verde = tmp_path / "azul.png", tmp_path / "verde.png"
+        Image.new("RGB", (400, 400), color="#3498DB").save(azul)
+        Image.new("RGB", (400, 400), color="#2ECC71").save(verde)
+        service = CatalogService()
+        service.pipeline = PipelineImagens(str(tmp_path / "produtos"))
+        
+        for sku in ("DUP-001", "DUP-002"):
+            service.cadastrar_produto(
+                nome=f"Produto {sku}", sku=sku, preco=10.0, estoque=1,
+                nome_categoria="Eletrônicos", imagem_path=str(azul)
+            )
+        produtos = {p.sku: p for p in service.listar_produtos() if p.sku.startswith("DUP")}
+        assert produtos["DUP-001"].imagem_card == produtos["DUP-002"].imagem_card
+        chave_azul = service.product_repo.hashes_do_produto(produtos["DUP-001"].id)[0]
+        
+        # Editar com a mesma imagem não acumula linhas
+        for _ in range(2):
+            service.atualizar_produto(
+                produtos["DUP-001"].id, "Produto DUP-001", "DUP-001", 10.0, 1,
+                "Eletrônicos", imagem_path=str(azul)
+            )
+        assert service.product_repo.contar_referencias(chave_azul) == 6
+        
+        # Trocar a imagem nos dois produtos libera a antiga, mas arquivos
+        # recentes ficam na carência até a coleta de órfãs
+        for produto in produtos.values():
+            service.atualizar_produto(
+                produto.id, produto.nome, produto.sku, 10.0, 1,
+                "Eletrônicos", imagem_path=str(verde)
+            )
+        assert service.product_repo.contar_referencias(chave_azul) == 0
+        assert os.path.exists(service.pipeline.arquivos(chave_azul)["original"])
+        service.pipeline.IDADE_MINIMA_COLETA_S = -1
+        assert service.coletar_imagens_orfas() == 1
+        assert not os.path.exists(service.pipeline.arquivos(chave_azul)["original"])
+        assert service.pipeline.estatisticas["processadas"] == 2
+
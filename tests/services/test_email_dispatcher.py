@@ -0,0 +1,150 @@
+"""Testes para o EmailDispatcher e a caixa de saída de emails."""
+import time
+import pytest
+from src.repositories.email_outbox_repository import EmailOutboxRepository
+from src.services.email_service import EmailService
+from src.services.email_dispatcher import EmailDispatcher
+
+
+class EmailServiceFalho(EmailService):
+    """EmailService cujo envio falha nas primeiras ``falhas`` tentativas."""
+
+    def __init__(self, falhas):
+        super().__init__(modo_mock=True)
+        self.falhas = falhas
+        self.enviados = []
+
+    def _enviar_real(self, email_data):
+        if self.falhas > 0:
+            self.falhas -= 1
+            raise ConnectionError("SMTP indisponível")
+        self.enviados.append(email_data['assunto'])
+        return True
+
+
+class TestEmailDispatcher:
+    """Testes do envio em segundo plano da caixa de saída."""
+
+    def test_enfileirar_confirmacao_persiste_sem_enviar(self, db_connection):
+        """Testa que o checkout só grava o email na caixa de saída."""
+        outbox = EmailOutboxRepository()
+        service = EmailServiceFalho(falhas=0)
+        service.outbox = outbox
+
+        email_id = service.enfileirar_confirmacao_pedido(
+            {'nome': 'Maria', 'email': 'maria@test.com'}, {'id': 42, 'valor_total': 99.9}
+        )
+
+        salvo = outbox.buscar_por_id(email_id)
+        assert salvo['status'] == 'PENDENTE'
+        assert 'Pedido #42' in salvo['assunto']
+        assert salvo['prioridade'] == EmailService.PRIORIDADE_TRANSACIONAL
+        assert service.enviados == []
+
+    def test_drenar_por_prioridade(self, db_connection):
+        """Testa que a caixa de saída é drenada do mais urgente ao menos urgente."""
+        outbox = EmailOutboxRepository()
+        service = EmailServiceFalho(falhas=0)
+        service.outbox = outbox
+        service.enfileirar_email('a@test.com', 'Promoção', 'Corpo', prioridade=9)
+        service.enfileirar_email('b@test.com', 'Pedido', 'Corpo', prioridade=1)
+
+        resultado = EmailDispatcher(service, outbox).drenar()
+
+        assert resultado['enviados'] == 2
+        assert service.enviados == ['Pedido', 'Promoção']
+        assert outbox.contar_por_status() == {'ENVIADO': 2}
+
+    def test_falha_reagenda_com_backoff(self, db_connection):
+        """Testa reagendamento com atraso exponencial após falha."""
+        agora = [1000.0]
+        outbox = EmailOutboxRepository()
+        service = EmailServiceFalho(falhas=2)
+        service.outbox = outbox
+        email_id = service.enfileirar_email('a@test.com', 'Assunto', 'Corpo')
+        dispatcher = EmailDispatcher(service, outbox, max_tentativas=5, relogio=lambda: agora[0])
+
+        assert dispatcher.drenar()['reagendados'] == 1
+        assert outbox.buscar_por_id(email_id)['proxima_tentativa_em'] == 1030.0
+
+        # Ainda não venceu: nada a enviar
+        assert dispatcher.drenar() == {'enviados': 0, 'reagendados': 0, 'desistidos': 0}
+
+        agora[0] = 1030.0
+        dispatcher.drenar()
+        assert outbox.buscar_por_id(email_id)['proxima_tentativa_em'] == 1090.0
+
+        agora[0] = 1090.0
+        assert dispatcher.drenar()['enviados'] == 1
+        assert outbox.buscar_por_id(email_id)['tentativas'] == 3
+
+    def test_desiste_apos_max_tentativas(self, db_connection):
+        """Testa que o email é marcado como FALHOU ao esgotar as tentativas."""
+        outbox = EmailOutboxRepository()
+        service = EmailServiceFalho(falhas=10)
+        service.outbox = outbox
+        email_id = service.enfileirar_email('a@test.com', 'Assunto', 'Corpo')
+        dispatcher = EmailDispatcher(service, outbox, max_tentativas=1)
+
+        assert dispatcher.drenar()['desistidos'] == 1
+
+        salvo = outbox.buscar_por_id(email_id)
+        assert salvo['status'] == 'FALHOU'
+        assert 'SMTP' in salvo['ultimo_erro']
+
+    def test_thread_envia_com_conexao_propria(self, db_connection):
+        """Testa a thread de envio com conexão SQLite dedicada."""
+        outbox = EmailOutboxRepository()
+        service = EmailServiceFalho(falhas=0)
+        service.outbox = outbox
+        email_id = service.enfileirar_email('a@test.com', 'Assunto', 'Corpo')
+
+        dispatcher = EmailDispatcher(service)
+        dispatcher.iniciar()
+        try:
+            dispatcher.notificar()
+            for _ in range(100):
+                if service.enviados:
+                    break
+                time.sleep(0.02)
+        finally:
+            dispatcher.encerrar()
+
+        assert service.enviados == ['Assunto']
+        assert outbox.buscar_por_id(email_id)['status'] == 'ENVIADO'
+
+    def test_avisos_de_status_agrupados(self, db_connection):
+        """Testa que status do mesmo pedido na janela viram um único email."""
+        outbox = EmailOutboxRepository()
+        service = EmailServiceFalho(falhas=0)
+        service.outbox = outbox
+        cliente = {'nome': 'Maria', 'email': 'maria@test.com'}
+
+        ids = {
+            service.enfileirar_atualizacao_pedido(cliente, {'id': 7}, status, janela_segundos=0)
+            for status in ('PROCESSANDO', 'ENVIADO', 'ENVIADO')
+        }
+        service.enfileirar_atualizacao_pedido(cliente, {'id': 8}, 'PROCESSANDO', janela_segundos=0)
+
+        assert len(ids) == 1
+        email = outbox.buscar_por_id(ids.pop())
+        assert 'enviado' in email['assunto'].lower()
+        assert 'PROCESSANDO → ENVIADO' in email['corpo']
+
+        EmailDispatcher(service, outbox).drenar()
+        assert len(service.enviados) == 2
+
+    def test_aviso_apos_reserva_gera_novo_email(self, db_connection):
+        """Testa que um status novo não é mesclado em email já reservado."""
+        outbox = EmailOutboxRepository()
+        service = EmailServiceFalho(falhas=0)
+        service.outbox = outbox
+        cliente = {'nome': 'Maria', 'email': 'maria@test.com'}
+
+        primeiro = service.enfileirar_atualizacao_pedido(cliente, {'id': 7}, 'PROCESSANDO', janela_segundos=0)
+        outbox.reservar_lote(10)
+        segundo = service.enfileirar_atualizacao_pedido(cliente, {'id': 7}, 'ENVIADO', janela_segundos=60)
+
+        assert segundo != primeiro
+        assert outbox.buscar_por_id(segundo)['metadados'] == {'status': ['ENVIADO']}
+        assert outbox.reservar_lote(10) == []
@@ -173,3 +173,28 @@ class TestEmailService:
         historico = service.obter_historico(limite=3)
         
         assert len(historico) == 3
+    
+    def test_fila_ordenada_por_prioridade(self):
+        """Testa que a fila respeita prioridade e ordem de chegada."""
+        service = EmailService(modo_mock=True)
+        
+        service.adicionar_a_fila('a@test.com', 'Normal 1', 'Corpo', prioridade=5)
+        service.adicionar_a_fila('b@test.com', 'Urgente', 'Corpo', prioridade=1)
+        service.adicionar_a_fila('c@test.com', 'Normal 2', 'Corpo', prioridade=5)
+        
+        assunto = [email['assunto'] for email in service.fila_emails]
+        assert assunto == ['Urgente', 'Normal 1', 'Normal 2']
+        
+        service.processar_fila(limite=1)
+        assert service.historico[0]['assunto'] == 'Urgente'
+        assert len(service.fila_emails) == 2
+    
+    def test_historico_limitado(self):
+        """Testa que o histórico em memória é limitado."""
+        service = EmailService(modo_mock=True)
+        
+        for i in range(service.MAX_HISTORICO + 10):
+            service.despachar({'destinatario': 'a@test.com', 'assunto': f'A{i}', 'corpo': 'C'})
+        
+        assert len(service.historico) == service.MAX_HISTORICO
+        assert service.obter_historico(limite=1)[0]['assunto'] == f'A{service.MAX_HISTORICO + 9}'
@@ -0,0 +1,110 @@
+"""Testes para o CotacaoFreteService."""
+import time
+import pytest
+from src.integration.shipping.shipping_calculator import ShippingCalculator
+from src.integration.shipping.correios_calculator import CorreiosCalculator
+from src.integration.shipping.transportadora_calculator import TransportadoraCalculator
+from src.services.freight_quote_service import CotacaoFreteService, CotacaoFreteError
+
+
+class CalculadoraFake(ShippingCalculator):
+    """Calculadora controlável para os testes."""
+
+    def __init__(self, nome, valor, prazo, atraso=0.0, erro=None):
+        self.nome = nome
+        self.valor = valor
+        self.prazo = prazo
+        self.atraso = atraso
+        self.erro = erro
+        self.chamadas = 0
+
+    def calcular(self, cep_destino, peso_total):
+        self.chamadas += 1
+        if self.atraso:
+            time.sleep(self.atraso)
+        if self.erro:
+            raise self.erro
+        return self.valor
+
+    def prazo_dias(self, cep_destino, peso_total):
+        return self.prazo
+
+
+class TestCotacaoFreteService:
+    """Testes do serviço de cotação de frete."""
+
+    def test_cotar_mais_barata_e_mais_rapida(self):
+        """Testa seleção da opção mais barata e da mais rápida."""
+        service = CotacaoFreteService([CorreiosCalculator(), TransportadoraCalculator()])
+
+        cotacao = service.cotar('01234-567', 20.0)
+
+        assert cotacao['mais_barata']['transportadora'] == 'Transportadora'
+        assert cotacao['mais_rapida']['transportadora'] == 'Correios'
+        assert len(cotacao['cotacoes']) == 2
+        assert service.calcular('01234-567', 20.0) == cotacao['mais_barata']['valor']
+
+    def test_cotar_ignora_transportadora_lenta(self):
+        """Testa que transportadoras fora do prazo limite são descartadas."""
+        rapida = CalculadoraFake('Rápida', 30.0, 2)
+        lenta = CalculadoraFake('Lenta', 10.0, 5, atraso=0.5)
+        service = CotacaoFreteService([rapida, lenta], prazo_limite=0.05)
+
+        inicio = time.perf_counter()
+        cotacao = service.cotar('01234-567', 1.0)
+
+        assert time.perf_counter() - inicio < 0.4
+        assert cotacao['mais_barata']['transportadora'] == 'Rápida'
+        assert cotacao['sem_resposta'] == ['Lenta']
+
+    def test_cotar_todas_falham(self):
+        """Testa erro quando nenhuma transportadora responde."""
+        falha = CalculadoraFake('Falha', 10.0, 1, erro=RuntimeError('fora do ar'))
+        service = CotacaoFreteService([falha])
+
+        with pytest.raises(CotacaoFreteError):
+            service.cotar('01234-567', 1.0)
+
+    def test_cache_por_prefixo_cep_e_faixa_peso(self):
+        """Testa que CEPs do mesmo prefixo e pesos da mesma faixa usam o cache."""
+        calc = CalculadoraFake('Fake', 20.0, 3)
+        service = CotacaoFreteService([calc])
+
+        service.cotar('01234-567', 1.1)
+        service.cotar('01234-999', 1.4)
+        assert calc.chamadas == 1
+
+        service.cotar('01235-000', 1.1)
+        service.cotar('01234-567', 2.0)
+        assert calc.chamadas == 3
+
+    def test_cache_expira_apos_ttl(self):
+        """Testa expiração das cotações em cache."""
+        agora = [0.0]
+        calc = CalculadoraFake('Fake', 20.0, 3)
+        service = CotacaoFreteService([calc], ttl=60, relogio=lambda: agora[0])
+
+        service.cotar('01234-567', 1.0)
+        agora[0] = 59.0
+        service.cotar('01234-567', 1.0)
+        assert calc.chamadas == 1
+
+        agora[0] = 61.0
+        service.cotar('01234-567', 1.0)
+        assert calc.chamadas == 2
+
+    def test_transportadora_travada_nao_atrasa_cotacoes_seguintes(self):
+        """Testa que uma chamada travada não prende as próximas cotações."""
+        rapida = CalculadoraFake('Rápida', 30.0, 2)
+        travada = CalculadoraFake('Travada', 10.0, 5, atraso=1.0)
+        service = CotacaoFreteService([rapida, travada], prazo_limite=0.1)
+
+        service.cotar('01234-567', 1.0)
+        inicio = time.perf_counter()
+        cotacao = service.cotar('98765-432', 1.0)
+
+        assert time.perf_counter() - inicio < 0.1
+        assert travada.chamadas == 1
+        assert cotacao['mais_barata']['transportadora'] == 'Rápida'
+        assert cotacao['sem_resposta'] == ['Travada']
+        service.encerrar()
@@ -0,0 +1,148 @@
+"""Testes para o limite de tentativas de login."""
+import pytest
+from src.config.settings import Config
+from src.services.auth_service import AuthService
+from src.services.login_throttle_service import LoginBloqueadoError, TentativasLoginService
+from src.utils.security.password_hasher import PasswordHasher
+
+
+class RelogioFalso:
+    """Relógio controlado pelo teste."""
+
+    def __init__(self, inicio: float = 1_000_000.0):
+        self.agora = inicio
+
+    def __call__(self) -> float:
+        return self.agora
+
+
+class TestTentativasLoginService:
+    """Testes da janela de falhas e do bloqueio exponencial."""
+
+    def test_bloqueia_apos_max_falhas(self, db_connection):
+        """A N-ésima falha bloqueia o email."""
+        relogio = RelogioFalso()
+        servico = TentativasLoginService(relogio=relogio)
+
+        for _ in range(Config.LOGIN_MAX_FALHAS - 1):
+            servico.registrar_falha("a@b.com")
+        servico.verificar("a@b.com")
+
+        servico.registrar_falha("a@b.com")
+        with pytest.raises(LoginBloqueadoError) as erro:
+            servico.verificar("A@B.com ")
+        assert erro.value.segundos_restantes == Config.LOGIN_BLOQUEIO_BASE_SEGUNDOS
+
+        relogio.agora += Config.LOGIN_BLOQUEIO_BASE_SEGUNDOS
+        servico.verificar("a@b.com")
+
+    def test_bloqueio_dobra_a_cada_reincidencia(self, db_connection):
+        """Cada novo bloqueio dura o dobro do anterior."""
+        relogio = RelogioFalso()
+        servico = TentativasLoginService(relogio=relogio)
+        duracoes = []
+
+        for _ in range(3):
+            for _ in range(Config.LOGIN_MAX_FALHAS):
+                servico.registrar_falha("a@b.com", "10.0.0.1")
+            with pytest.raises(LoginBloqueadoError) as erro:
+                servico.verificar("a@b.com", "10.0.0.1")
+            duracoes.append(erro.value.segundos_restantes)
+            relogio.agora += erro.value.segundos_restantes
+
+        base = Config.LOGIN_BLOQUEIO_BASE_SEGUNDOS
+        assert duracoes == [base, base * 2, base * 4]
+
+    def test_falhas_antigas_saem_da_janela(self, db_connection):
+        """Falhas espalhadas por mais de duas janelas não acumulam."""
+        relogio = RelogioFalso()
+        servico = TentativasLoginService(relogio=relogio)
+
+        for _ in range(Config.LOGIN_MAX_FALHAS * 2):
+            servico.registrar_falha("a@b.com")
+            relogio.agora += Config.LOGIN_JANELA_SEGUNDOS
+        servico.verificar("a@b.com")
+
+    def test_origem_bloqueada_para_qualquer_email(self, db_connection):
+        """Falhas em emails diferentes da mesma origem bloqueiam a origem."""
+        servico = TentativasLoginService(relogio=RelogioFalso())
+
+        for i in range(Config.LOGIN_MAX_FALHAS):
+            servico.registrar_falha(f"usuario{i}@b.com", "10.0.0.9")
+
+        with pytest.raises(LoginBloqueadoError):
+            servico.verificar("outro@b.com", "10.0.0.9")
+        servico.verificar("outro@b.com", "10.0.0.10")
+
+    def test_estado_persistido_entre_instancias(self, db_connection):
+        """O bloqueio sobrevive a um reinício (nova instância, cache vazio)."""
+        relogio = RelogioFalso()
+        servico = TentativasLoginService(relogio=relogio)
+        for _ in range(Config.LOGIN_MAX_FALHAS):
+            servico.registrar_falha("a@b.com")
+
+        with pytest.raises(LoginBloqueadoError):
+            TentativasLoginService(relogio=relogio).verificar("a@b.com")
+
+
+class TestAuthServiceLimiteTentativas:
+    """Integração do limite de tentativas com o AuthService."""
+
+    def test_bloqueado_nao_calcula_hash(self, db_connection, sample_admin, monkeypatch):
+        """Com o email bloqueado, nem a senha correta dispara o hash."""
+        auth = AuthService(TentativasLoginService(relogio=RelogioFalso()))
+        for _ in range(Config.LOGIN_MAX_FALHAS):
+            assert auth.login(sample_admin["email"], "senha_errada") is False
+
+        chamadas = []
+        original = PasswordHasher.verify_and_update_async
+        monkeypatch.setattr(
+            PasswordHasher, "verify_and_update_async",
+            staticmethod(lambda *args: chamadas.append(args) or original(*args))
+        )
+
+        with pytest.raises(LoginBloqueadoError):
+            auth.login(sample_admin["email"], sample_admin["senha"])
+        assert chamadas == []
+        assert auth.get_usuario_atual() is None
+
+    def test_sucesso_zera_falhas_do_email(self, db_connection, sample_admin):
+        """Um login correto limpa as falhas acumuladas do email."""
+        auth = AuthService(TentativasLoginService(relogio=RelogioFalso()))
+        for _ in range(Config.LOGIN_MAX_FALHAS - 1):
+            auth.login(sample_admin["email"], "senha_errada")
+
+        assert auth.login(sample_admin["email"], sample_admin["senha"]) is True
+        auth.login(sample_admin["email"], "senha_errada")
+        auth.tentativas.verificar(sample_admin["email"], "outra-origem")
+
+    def test_falhas_em_outros_emails_nao_bloqueiam_login_local(self, db_connection, sample_admin):
+        """No app (origem local) falhas em emails inventados não bloqueiam outra conta."""
+        auth = AuthService(TentativasLoginService(relogio=RelogioFalso()))
+        for i in range(Config.LOGIN_MAX_FALHAS * 2):
+            assert auth.login(f"inventado{i}@b.com", "senha_errada") is False
+
+        assert auth.login(sample_admin["email"], sample_admin["senha"]) is True
+
+    def test_sucesso_reduz_falhas_da_origem(self, db_connection, sample_admin):
+        """Um login correto reduz à metade as falhas da origem."""
+        servico = TentativasLoginService(relogio=RelogioFalso())
+        auth = AuthService(servico)
+        for i in range(Config.LOGIN_MAX_FALHAS - 1):
+            auth.login(f"inventado{i}@b.com", "senha_errada", "10.0.0.7")
+
+        assert auth.login(sample_admin["email"], sample_admin["senha"], "10.0.0.7") is True
+        auth.login("mais_um@b.com", "senha_errada", "10.0.0.7")
+        servico.verificar("outro@b.com", "10.0.0.7")
+
+    def test_chaves_inativas_sao_apagadas(self, db_connection):
+        """Chaves antigas sem bloqueio saem da tabela na limpeza periódica."""
+        relogio = RelogioFalso()
+        servico = TentativasLoginService(relogio=relogio)
+        servico.registrar_falha("antigo@b.com")
+
+        relogio.agora += max(2 * Config.LOGIN_JANELA_SEGUNDOS, Config.LOGIN_BLOQUEIO_MAX_SEGUNDOS) + 1
+        servico.registrar_falha("novo@b.com")
+
+        chaves = [estado["chave"] for estado in servico.repo.listar()]
+        assert chaves == ["email:novo@b.com"]
@@ -0,0 +1,114 @@
+"""
+Testes para as métricas de ações
+================================
+
+Testa a instrumentação automática dos controllers e o log de ações lentas.
+"""
+import json
+import pytest
+from unittest.mock import Mock
+
+from src.controllers.base_controller import BaseController
+from src.utils.action_metrics import MetricasAcoes, metricas
+
+
+class ControllerExemplo(BaseController):
+    """Controller mínimo para exercitar a instrumentação."""
+
+    def acao_ok(self):
+        return self._success_response("ok")
+
+    def acao_falha(self):
+        return self._error_response("falhou")
+
+    def acao_erro(self):
+        raise RuntimeError("quebrou")
+
+    def _auxiliar(self):
+        return 42
+
+
+@pytest.fixture
+def coleta():
+    """Métricas globais zeradas e ativas durante o teste."""
+    ativo, limite = metricas.ativo, metricas.limite_lento_ms
+    metricas.limpar()
+    metricas.ativo = True
+    yield metricas
+    metricas.ativo, metricas.limite_lento_ms = ativo, limite
+    metricas.limpar()
+
+
+def _por_acao(resumo):
+    return {linha["acao"]: linha for linha in resumo}
+
+
+class TestInstrumentacaoControllers:
+    """Testes da instrumentação via BaseController."""
+
+    def test_metodos_publicos_sao_cronometrados(self, coleta):
+        """Cada chamada pública conta para a ação 'Classe.metodo'."""
+        ctrl = ControllerExemplo(Mock())
+        ctrl.acao_ok()
+        ctrl.acao_ok()
+        ctrl._auxiliar()
+
+        resumo = _por_acao(coleta.resumo())
+        assert resumo["ControllerExemplo.acao_ok"]["chamadas"] == 2
+        assert "ControllerExemplo._auxiliar" not in resumo
+
+    def test_falha_e_erro_sao_contados(self, coleta):
+        """success=False conta como falha; exceção conta como erro e é repassada."""
+        ctrl = ControllerExemplo(Mock())
+        ctrl.acao_falha()
+        with pytest.raises(RuntimeError):
+            ctrl.acao_erro()
+
+        resumo = _por_acao(coleta.resumo())
+        assert resumo["ControllerExemplo.acao_falha"]["falhas"] == 1
+        assert resumo["ControllerExemplo.acao_erro"]["erros"] == 1
+
+    def test_coleta_desligada_nao_registra(self, coleta):
+        """Com a coleta desligada nada é registrado."""
+        coleta.ativo = False
+        ControllerExemplo(Mock()).acao_ok()
+        assert coleta.resumo() == []
+
+
+class TestMetricasAcoes:
+    """Testes do agregador de métricas."""
+
+    def test_log_de_acoes_lentas(self):
+        """Só entram no log as chamadas acima do limite."""
+        m = MetricasAcoes(ativo=True, limite_lento_ms=100)
+        m.registrar("A.rapida", 3)
+        m.registrar("A.lenta", 400, falha=True)
+
+        lentas = m.lentas()
+        assert len(lentas) == 1
+        assert lentas[0]["acao"] == "A.lenta"
+        assert lentas[0]["resultado"] == "falha"
+
+    def test_percentis_e_histograma(self):
+        """Percentis são o limite superior da faixa do histograma."""
+        m = MetricasAcoes(ativo=True, limite_lento_ms=10_000)
+        for _ in range(9):
+            m.registrar("A.x", 0.5)
+        m.registrar("A.x", 150)
+
+        linha = m.resumo()[0]
+        assert linha["p50_ms"] == 1
+        assert linha["p99_ms"] == 150
+        assert linha["histograma"]["<=1"] == 9
+        assert linha["histograma"]["<=200"] == 1
+
+    def test_exportar_json(self, tmp_path):
+        """Exporta resumo e ações lentas em JSON."""
+        m = MetricasAcoes(ativo=True, limite_lento_ms=1)
+        m.registrar("A.x", 5)
+        caminho = tmp_path / "metricas.json"
+        m.exportar_json(str(caminho))
+
+        documento = json.loads(caminho.read_text(encoding="utf-8"))
+        assert documento["acoes"][0]["acao"] == "A.x"
+        assert len(documento["lentas"]) == 1
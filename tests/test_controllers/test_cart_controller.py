@@ -18,8 +18,8 @@ def mock_main_window():
 
 
 @pytest.fixture
-def controller(mock_main_window):
-    """Fixture do CartController."""
+def controller(mock_main_window, db_connection):
+    """Fixture do CartController (no banco de teste, não no SCEE.db da aplicação)."""
     ctrl = CartController(mock_main_window)
     ctrl.set_current_user(1)  # Define usuário logado
     return ctrl
@@ -0,0 +1,140 @@
+"""
+Testes para as tarefas em segundo plano
+=======================================
+
+Testa BaseController.run_in_background e o ExecutorTarefas sem Tkinter:
+um widget falso guarda os callbacks de after() e o teste os dispara.
+"""
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.controllers.base_controller import BaseController
+from src.repositories.product_repository import ProductRepository
+from src.utils.task_runner import ExecutorTarefas
+
+
+class WidgetFalso:
+    """Imita o necessário de um widget Tk: after(), winfo_exists() e bind()."""
+
+    def __init__(self):
+        self.agendados = []
+        self.existe = True
+        self.ao_destruir = []
+
+    def after(self, ms, funcao, *args):
+        self.agendados.append((funcao, args))
+        return f"after#{len(self.agendados)}"
+
+    def winfo_exists(self):
+        return self.existe
+
+    def bind(self, evento, funcao, add=None):
+        self.ao_destruir.append(funcao)
+
+    def destruir(self):
+        self.existe = False
+        for funcao in self.ao_destruir:
+            funcao(Mock(widget=self))
+
+    def rodar_loop(self, tempo_max=5.0):
+        """Executa os after() agendados até não sobrar nenhum."""
+        limite = time.monotonic() + tempo_max
+        while self.agendados and time.monotonic() < limite:
+            funcao, args = self.agendados.pop(0)
+            funcao(*args)
+            time.sleep(0.005)
+
+
+class ControllerExemplo(BaseController):
+    pass
+
+
+@pytest.fixture
+def executor():
+    ex = ExecutorTarefas(max_threads=2, intervalo_ms=1)
+    yield ex
+    ex.encerrar()
+
+
+class TestExecutorTarefas:
+    """Testes da entrega de resultados na thread que roda o loop."""
+
+    def test_resultado_entregue_na_thread_do_loop(self, executor):
+        """A função roda em outra thread; o callback, na thread do loop."""
+        widget = WidgetFalso()
+        threads = {}
+        resultados = []
+
+        def trabalho():
+            threads["trabalho"] = threading.get_ident()
+            return 42
+
+        def concluir(valor):
+            threads["callback"] = threading.get_ident()
+            resultados.append(valor)
+
+        executor.submeter(widget, trabalho, ao_concluir=concluir)
+        widget.rodar_loop()
+
+        assert resultados == [42]
+        assert threads["callback"] == threading.get_ident()
+        assert threads["trabalho"] != threading.get_ident()
+
+    def test_erro_e_estado_de_carregamento(self, executor):
+        """Exceções vão para ao_falhar; carregando recebe True e depois False."""
+        widget = WidgetFalso()
+        estados, erros = [], []
+
+        def falhar():
+            raise ValueError("sem banco")
+
+        executor.submeter(widget, falhar, ao_falhar=erros.append, carregando=estados.append)
+        widget.rodar_loop()
+
+        assert estados == [True, False]
+        assert isinstance(erros[0], ValueError)
+
+    def test_destruir_dono_cancela_entrega(self, executor):
+        """Com a view destruída, o resultado é descartado."""
+        widget = WidgetFalso()
+        liberar = threading.Event()
+        resultados = []
+
+        executor.submeter(widget, liberar.wait, ao_concluir=resultados.append)
+        widget.destruir()
+        liberar.set()
+        time.sleep(0.05)
+        executor.processar_resultados()
+
+        assert resultados == []
+
+    def test_dono_reaproveitado_vincula_destroy_uma_vez(self, executor):
+        """Um card que carrega várias imagens seguidas não acumula binds."""
+        widget = WidgetFalso()
+
+        for valor in range(3):
+            executor.submeter(widget, lambda v=valor: v)
+            widget.rodar_loop()
+
+        assert len(widget.ao_destruir) == 1
+
+
+class TestRunInBackground:
+    """Testes da integração com BaseController e o banco."""
+
+    def test_repositorio_em_segundo_plano(self, db_connection):
+        """Repositórios funcionam na thread da tarefa (conexão própria da thread)."""
+        widget = WidgetFalso()
+        ctrl = ControllerExemplo(Mock())
+        esperado = len(ProductRepository().listar())
+        resultados = []
+
+        ctrl.run_in_background(
+            widget, lambda: len(ProductRepository().listar()), on_success=resultados.append
+        )
+        widget.rodar_loop()
+
+        assert resultados == [esperado]